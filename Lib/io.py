@@ -2533,3 +2533,17 @@ class StringIO(TextIOWrapper):
     def detach(self):
         # This doesn't make sense on StringIO.
         self._unsupported("detach")
+
+
+# Use the Java implementations of the buffered, text and in-memory streams,
+# registering them with the ABCs above as CPython's io.py does for _io.
+from _io import (BytesIO, StringIO, BufferedReader, BufferedWriter,
+                 BufferedRWPair, BufferedRandom, TextIOWrapper)
+
+for klass in (BytesIO, BufferedReader, BufferedWriter, BufferedRandom,
+              BufferedRWPair):
+    BufferedIOBase.register(klass)
+
+for klass in (StringIO, TextIOWrapper):
+    TextIOBase.register(klass)
+del klass
@@ -53,10 +53,33 @@ class TestGetValueAfterClose(unittest.TestCase):
         else:
             self.fail("cStringIO.StringIO: getvalue() after close() should have raised ValueError")
 
+class TestIteration(unittest.TestCase):
+
+    def test_universal_newlines(self):
+        f = io.StringIO("a\rb\r\nc\nd", newline=None)
+        self.assertEqual(list(f), ["a\n", "b\n", "c\n", "d"])
+        self.assertEqual(f.newlines, ("\r", "\n", "\r\n"))
+
+    def test_subclass_iteration(self):
+        # Iterating a subclass must not recurse between __next__ and readline
+        class MyStringIO(io.StringIO):
+            pass
+        class MyBytesIO(io.BytesIO):
+            pass
+        self.assertEqual(list(MyStringIO("x\ny\n")), ["x\n", "y\n"])
+        self.assertEqual(list(MyBytesIO(b"x\ny")), [b"x\n", b"y"])
+
+    def test_text_wrapper_lines(self):
+        raw = io.BytesIO("caf\xe9\nline two\n".encode("utf-8"))
+        f = io.TextIOWrapper(io.BufferedReader(raw), encoding="utf-8")
+        self.assertEqual(f.readline(), "caf\xe9\n")
+        self.assertEqual(f.readlines(), ["line two\n"])
+
 def test_main():
     support.run_unittest(TestUnicodeInput)
     support.run_unittest(TestWrite)
     support.run_unittest(TestGetValueAfterClose)
+    support.run_unittest(TestIteration)
 
 if __name__ == '__main__':
     test_main()
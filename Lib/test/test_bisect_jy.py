@@ -0,0 +1,59 @@
+"""Misc bisect tests
+
+Made for Jython, for the Java _bisect module.
+"""
+import bisect
+import unittest
+from test import support
+
+
+class Raises:
+
+    def __lt__(self, other):
+        raise ZeroDivisionError
+
+    __gt__ = __lt__
+
+
+class Clears:
+    """Empties a list when compared."""
+
+    def __init__(self, l):
+        self.l = l
+
+    def __lt__(self, other):
+        del self.l[:]
+        return True
+
+    __gt__ = __lt__
+
+
+class BisectTestCase(unittest.TestCase):
+
+    def test_lt_raises(self):
+        a = [1, 2, 3]
+        for f in bisect.bisect_left, bisect.bisect_right, bisect.insort_left, bisect.insort:
+            self.assertRaises(ZeroDivisionError, f, a, Raises())
+        self.assertEqual(a, [1, 2, 3])
+
+    def test_mutated_during_comparison(self):
+        a = [1, 2, 3]
+        self.assertRaises(IndexError, bisect.bisect_right, a, Clears(a))
+        a = [1, 2, 3]
+        self.assertRaises(IndexError, bisect.bisect_left, a, Clears(a))
+
+    def test_lo_hi(self):
+        a = [1, 2, 2, 2, 3]
+        self.assertEqual(bisect.bisect_left(a, 2), 1)
+        self.assertEqual(bisect.bisect_right(a, 2), 4)
+        self.assertEqual(bisect.bisect_left(a, 2, 2, 3), 2)
+        self.assertEqual(bisect.bisect_right(a, 2, hi=2), 2)
+        self.assertRaises(ValueError, bisect.bisect, a, 2, -1)
+
+
+def test_main():
+    support.run_unittest(BisectTestCase)
+
+
+if __name__ == "__main__":
+    test_main()
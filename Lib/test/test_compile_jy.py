@@ -97,8 +97,65 @@ class TestCompileall(unittest.TestCase):
                 "Hello world!")
 
 
+class TestInvokedynamic(unittest.TestCase):
+
+    SOURCE = textwrap.dedent("""
+        class Point:
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+            def __add__(self, other):
+                return Point(self.x + other.x, self.y + other.y)
+
+        def run(objs):
+            result = []
+            for o in objs:
+                result.append((o + o, o < o, o == o))
+            p = Point(1, 2)
+            for i in range(10):
+                p = p + Point(i, 1)
+            q = Point(0, 0)
+            q.x = 5
+            Point.scale = lambda self: self.x * 10
+            d = {'k': [1, 2, 3]}
+            return result, (p.x, p.y), q.scale(), d['k'][2]
+        """)
+
+    def setUp(self):
+        from org.python.core import Options
+        self.saved = Options.compileInvokedynamic
+        Options.compileInvokedynamic = True
+
+    def tearDown(self):
+        from org.python.core import Options
+        Options.compileInvokedynamic = self.saved
+
+    def test_inline_caches_agree_with_generic_dispatch(self):
+        ns = {}
+        exec(compile(self.SOURCE, "<indy>", "exec"), ns)
+        objs = [1, 2.5, "a", 1, 2 ** 70, "b", [1], (2,), 3.0]
+        expected = [(o + o, o < o, o == o) for o in objs]
+        result, p, scaled, item = ns['run'](objs)
+        self.assertEqual(result, expected)
+        self.assertEqual(p, (46, 12))
+        self.assertEqual(scaled, 50)
+        self.assertEqual(item, 3)
+
+    def test_getattr_of_types_overriding_findattr(self):
+        # BaseException looks in its __dict__ before the type, unlike object.__getattribute__
+        ns = {}
+        exec(compile("def get(objs):\n    return [o.args for o in objs]", "<indy>", "exec"), ns)
+        e = ValueError(1)
+        e.__dict__['args'] = 'shadowed'
+        objs = [e, KeyError(2), e]
+        self.assertEqual(ns['get'](objs), [getattr(o, 'args') for o in objs])
+
+
 def test_main():
-    run_unittest(TestMtime, TestCompileall)
+    tests = [TestMtime, TestCompileall]
+    if is_jython:
+        tests.append(TestInvokedynamic)
+    run_unittest(*tests)
 
 
 if __name__ == "__main__":
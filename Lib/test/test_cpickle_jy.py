@@ -3,6 +3,8 @@
 Made for Jython.
 """
 import builtins
+import collections
+import pickletools
 import sys
 import pickle
 import pickle
@@ -90,6 +92,48 @@ class CPickleTestCase(unittest.TestCase):
             builtins.__import__ = original_import
 
 
+    def test_protocols_3_and_4(self):
+        shared = [1]
+        data = [b"ab", b"x" * 300, "caf\xe9", "y" * 300, {3}, frozenset([4]),
+                {"k": shared, 2: shared}, (1, 2.5, None, True), MyClass,
+                list(range(2500)), 2**100]
+        for proto in 3, 4:
+            result = pickle.loads(pickle.dumps(data, proto))
+            self.assertEqual(result, data)
+            self.assertIs(result[6]["k"], result[6][2])
+
+    def test_recursive_containers(self):
+        l = []
+        l.append(l)
+        result = pickle.loads(pickle.dumps(l, 4))
+        self.assertIs(result[0], result)
+        m = MyClass()
+        m.s = frozenset([m])
+        result = pickle.loads(pickle.dumps(m, 4))
+        self.assertIs(next(iter(result.s)).s, result.s)
+
+    def test_frames(self):
+        data = ["item %d" % i for i in range(50000)]
+        s = pickle.dumps(data, 4)
+        frames = [arg for op, arg, pos in pickletools.genops(s) if op.name == "FRAME"]
+        self.assertGreater(len(frames), 1)
+        self.assertEqual(sum(frames) + 9 * len(frames) + 2, len(s))
+        self.assertEqual(pickle.loads(s), data)
+
+    def test_load_cpython_protocol_4(self):
+        # pickle.dumps([b'ab', 'caf\xe9', {3}, frozenset([4]), collections.OrderedDict,
+        #               (1, 2.5, None, True)], 4) on CPython
+        s = (b'\x80\x04\x95K\x00\x00\x00\x00\x00\x00\x00]\x94(C\x02ab\x94\x8c\x05caf'
+             b'\xc3\xa9\x94\x8f\x94(K\x03\x90(K\x04\x91\x94\x8c\x0bcollections\x94\x8c'
+             b'\x0bOrderedDict\x94\x93\x94(K\x01G@\x04\x00\x00\x00\x00\x00\x00N\x88t\x94e.')
+        self.assertEqual(pickle.loads(s),
+                         [b'ab', 'caf\xe9', {3}, frozenset([4]), collections.OrderedDict,
+                          (1, 2.5, None, True)])
+
+    def test_highest_protocol(self):
+        self.assertEqual(pickle.HIGHEST_PROTOCOL, 4)
+        self.assertRaises(ValueError, pickle.dumps, 1, 5)
+
 
 def test_main():
     support.run_unittest(CPickleTestCase)
@@ -0,0 +1,93 @@
+"""Misc cProfile tests
+
+Made for Jython, where _lsprof is implemented in Java.
+"""
+import cProfile
+import pstats
+import sys
+import unittest
+from test import support
+
+
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+
+def fail():
+    raise ValueError()
+
+def main():
+    fib(5)
+    try:
+        fail()
+    except ValueError:
+        pass
+
+
+class ProfilerTestCase(unittest.TestCase):
+
+    def profile(self, func):
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            func()
+        finally:
+            prof.disable()
+        return prof
+
+    def entries(self, prof):
+        return dict((e.code.co_name, e) for e in prof.getstats()
+                    if not isinstance(e.code, str))
+
+    def test_counts(self):
+        entries = self.entries(self.profile(main))
+        self.assertEqual(entries['main'].callcount, 1)
+        self.assertEqual(entries['fib'].callcount, 15)
+        self.assertEqual(entries['fib'].reccallcount, 14)
+        # A frame ended by an exception is still a completed call
+        self.assertEqual(entries['fail'].callcount, 1)
+        main_entry = entries['main']
+        self.assertGreaterEqual(main_entry.totaltime, main_entry.inlinetime)
+        callees = dict((s.code.co_name, s) for s in main_entry.calls)
+        self.assertEqual(callees['fib'].callcount, 1)
+        self.assertEqual(callees['fail'].callcount, 1)
+
+    def test_getprofile(self):
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            self.assertIs(sys.getprofile(), prof)
+        finally:
+            prof.disable()
+        self.assertIsNone(sys.getprofile())
+
+    def test_custom_timer(self):
+        ticks = iter(range(1000000))
+        prof = cProfile.Profile(lambda: next(ticks), 1.0)
+        prof.enable()
+        fib(3)
+        prof.disable()
+        entries = self.entries(prof)
+        self.assertEqual(entries['fib'].callcount, 5)
+        self.assertTrue(entries['fib'].totaltime > 0)
+
+    def test_pstats(self):
+        prof = self.profile(main)
+        stats = pstats.Stats(prof)
+        names = set(func[2] for func in stats.stats)
+        self.assertIn('fib', names)
+        self.assertIn('main', names)
+
+    def test_clear(self):
+        prof = self.profile(main)
+        prof.clear()
+        self.assertEqual(prof.getstats(), [])
+
+
+def test_main():
+    support.run_unittest(ProfilerTestCase)
+
+
+if __name__ == '__main__':
+    test_main()
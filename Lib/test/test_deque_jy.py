@@ -69,8 +69,53 @@ class ThreadSafetyTestCase(unittest.TestCase):
         self.run_threads(tester)
 
 
+class RingBufferTestCase(unittest.TestCase):
+
+    def test_wraparound(self):
+        # Exercise growth, shrinking and wrapping of the circular array
+        d = deque()
+        model = []
+        for i in range(100):
+            d.appendleft(i)
+            d.append(-i)
+            model[:0] = [i]
+            model.append(-i)
+        self.assertEqual(list(d), model)
+        for i in range(90):
+            self.assertEqual(d.popleft(), model.pop(0))
+            self.assertEqual(d.pop(), model.pop())
+        self.assertEqual(list(d), model)
+        for i in range(len(model)):
+            self.assertEqual(d[i], model[i])
+            self.assertEqual(d[-i - 1], model[-i - 1])
+
+    def test_delitem_rotate(self):
+        d = deque(range(20))
+        model = list(range(20))
+        for i in (0, 3, 15, 7, -1):
+            del d[i]
+            del model[i]
+            self.assertEqual(list(d), model)
+        for n in (1, 5, -3, 17, -40):
+            d.rotate(n)
+            n %= len(model)
+            model = model[-n:] + model[:-n]
+            self.assertEqual(list(d), model)
+
+    def test_bounded(self):
+        d = deque(range(10), maxlen=4)
+        self.assertEqual(list(d), [6, 7, 8, 9])
+        d.appendleft(5)
+        self.assertEqual(list(d), [5, 6, 7, 8])
+        d.rotate(1)
+        self.assertEqual(list(d), [8, 5, 6, 7])
+        d.remove(5)
+        d.extend([1, 2])
+        self.assertEqual(list(d), [6, 7, 1, 2])
+
+
 def test_main():
-    support.run_unittest(ThreadSafetyTestCase)
+    support.run_unittest(ThreadSafetyTestCase, RingBufferTestCase)
 
 if __name__ == "__main__":
     test_main()
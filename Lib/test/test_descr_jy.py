@@ -553,13 +553,68 @@ class BinopCombinationsTestCase(unittest.TestCase):
         self.assertTrue(not fail)
 
 
+class SpecialMethodTestCase(unittest.TestCase):
+
+    def test_redefined_after_use(self):
+        class Vector(object):
+            def __init__(self, x):
+                self.x = x
+            def __add__(self, other):
+                return Vector(self.x + other.x)
+            def __eq__(self, other):
+                return self.x == other.x
+            __hash__ = None
+            def __len__(self):
+                return 1
+
+        v = Vector(1)
+        self.assertEqual((v + v).x, 2)
+        self.assertTrue(v == Vector(1))
+        self.assertEqual(len(v), 1)
+        self.assertRaises(TypeError, hash, v)
+
+        Vector.__add__ = lambda self, other: "added"
+        Vector.__hash__ = lambda self: 42
+        del Vector.__len__
+        self.assertEqual(v + v, "added")
+        self.assertEqual(hash(v), 42)
+        self.assertRaises(TypeError, len, v)
+
+    def test_redefined_in_base(self):
+        class Money(object):
+            def __mul__(self, other):
+                return "base"
+        class Euro(Money):
+            pass
+
+        e = Euro()
+        self.assertEqual(e * 2, "base")
+        Money.__mul__ = lambda self, other: "changed"
+        self.assertEqual(e * 2, "changed")
+        Euro.__mul__ = lambda self, other: "subclass"
+        self.assertEqual(e * 2, "subclass")
+
+    def test_descriptors_as_special_methods(self):
+        class Number(int):
+            __neg__ = staticmethod(lambda: "static")
+            __pos__ = classmethod(lambda cls: cls.__name__)
+            __call__ = lambda self, *args, **kw: (args, kw)
+
+        n = Number(3)
+        self.assertEqual(-n, "static")
+        self.assertEqual(+n, "Number")
+        self.assertEqual(n + 1, 4)
+        self.assertEqual(n(1, a=2), ((1,), {"a": 2}))
+
+
 def test_main():
     support.run_unittest(TestDescrTestCase,
                               SubclassDescrTestCase,
                               InPlaceTestCase,
                               DescrExceptionsTestCase,
                               GetAttrTestCase,
-                              BinopCombinationsTestCase)
+                              BinopCombinationsTestCase,
+                              SpecialMethodTestCase)
 
 
 if __name__ == '__main__':
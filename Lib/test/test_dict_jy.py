@@ -257,6 +257,60 @@ class PyStringMapTest(test_dict.DictTest):
         return newdict
 
 
+class InstanceDictTest(unittest.TestCase):
+    # Instances of a class share the keys of their __dict__ until given
+    # unusual keys
+
+    def test_shared_keys(self):
+        class Point(object):
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+
+        points = [Point(i, -i) for i in range(10)]
+        self.assertEqual([(p.x, p.y) for p in points], [(i, -i) for i in range(10)])
+        points[3].z = 3
+        del points[4].x
+        self.assertEqual(points[3].__dict__, {"x": 3, "y": -3, "z": 3})
+        self.assertEqual(points[4].__dict__, {"y": -4})
+        self.assertFalse(hasattr(points[4], "x"))
+        self.assertFalse(hasattr(points[5], "z"))
+        points[4].x = 4
+        self.assertEqual(sorted(vars(points[4])), ["x", "y"])
+
+    def test_unusual_keys(self):
+        class C(object):
+            pass
+
+        c = C()
+        c.a = 1
+        vars(c)[1] = "one"
+        self.assertEqual(vars(c), {"a": 1, 1: "one"})
+        c.b = 2
+        self.assertEqual(c.a + c.b, 3)
+
+        many = C()
+        for i in range(100):
+            setattr(many, "attr%d" % i, i)
+        self.assertEqual(len(vars(many)), 100)
+        self.assertEqual(many.attr99, 99)
+        self.assertEqual(C().__dict__, {})
+
+    def test_iteration(self):
+        class C(object):
+            pass
+
+        c = C()
+        c.a, c.b, c.c = 1, 2, 3
+        del c.b
+        self.assertEqual(sorted(c.__dict__.items()), [("a", 1), ("c", 3)])
+        with self.assertRaises(RuntimeError):
+            for key in c.__dict__:
+                c.d = 4
+        self.assertEqual(c.__dict__.popitem()[0] in "acd", True)
+        self.assertEqual(len(c.__dict__), 2)
+
+
 def test_main():
     support.run_unittest(
         DictInitTest,
@@ -265,7 +319,8 @@ def test_main():
         DerivedDictTest,
         JavaIntegrationTest,
         JavaDictTest,
-        PyStringMapTest)
+        PyStringMapTest,
+        InstanceDictTest)
 
 if __name__ == '__main__':
     test_main()
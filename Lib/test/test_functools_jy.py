@@ -1,4 +1,5 @@
-from functools import partial
+from functools import lru_cache, partial
+import threading
 import unittest
 
 from test import support
@@ -13,8 +14,85 @@ class PartialDictTest(unittest.TestCase):
         A(lambda: None).somevar = 1
 
 
+class LruCacheTest(unittest.TestCase):
+
+    def test_is_java_wrapper(self):
+        import _functools
+        f = lru_cache()(lambda x: x)
+        self.assertIsInstance(f, _functools._lru_cache_wrapper)
+        self.assertEqual(f.__wrapped__(3), 3)
+
+    def test_keys_and_info(self):
+        calls = []
+        @lru_cache(maxsize=2)
+        def f(*args, **kwds):
+            calls.append((args, kwds))
+            return len(calls)
+        self.assertEqual(f(1), 1)
+        self.assertEqual(f(1), 1)
+        self.assertEqual(f(1, b=2, a=1), 2)
+        self.assertEqual(f(1, a=1, b=2), 2)
+        self.assertEqual(f.cache_info(), (2, 2, 2, 2))
+        f('x')  # evicts the least recently used, f(1)
+        self.assertEqual(f(1, a=1, b=2), 2)
+        self.assertEqual(f(1), 4)
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), (0, 0, 2, 0))
+
+    def test_eviction_order(self):
+        calls = []
+        @lru_cache(maxsize=8)
+        def f(x):
+            calls.append(x)
+            return x
+        for i in range(8):
+            f(i)
+        for _ in range(3):
+            f(0)  # keep 0 the most recently used
+        for i in range(8, 15):
+            f(i)  # evicts 1 to 7, in the order they were used
+        del calls[:]
+        f(0)
+        self.assertEqual(calls, [])
+        f(1)
+        self.assertEqual(calls, [1])
+        self.assertEqual(f.cache_info().currsize, 8)
+
+    def test_typed(self):
+        f = lru_cache(typed=True)(lambda x: type(x))
+        self.assertIs(f(1), int)
+        self.assertIs(f(1.0), float)
+        self.assertEqual(f.cache_info().currsize, 2)
+
+    def test_unhashable(self):
+        f = lru_cache()(lambda x: x)
+        self.assertRaises(TypeError, f, [])
+
+    def test_method(self):
+        class C:
+            @lru_cache()
+            def m(self, x):
+                return x * 2
+        self.assertEqual(C().m(2), 4)
+        self.assertEqual(C.m.cache_info().misses, 1)
+
+    def test_threads(self):
+        f = lru_cache(maxsize=None)(lambda x: x * x)
+        def worker():
+            for i in range(1000):
+                self.assertEqual(f(i % 10), (i % 10) ** 2)
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        info = f.cache_info()
+        self.assertEqual(info.hits + info.misses, 8000)
+        self.assertEqual(info.currsize, 10)
+
+
 def test_main():
-    support.run_unittest(PartialDictTest)
+    support.run_unittest(PartialDictTest, LruCacheTest)
 
 if __name__ == "__main__":
     test_main()
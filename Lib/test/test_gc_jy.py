@@ -785,5 +785,51 @@ class GCTests_Misc(unittest.TestCase):
         self.assertTrue(ref == ref)
 
 
+class GCTests_Jy_FinalizerThreads(unittest.TestCase):
+
+    # Run in a fresh interpreter, as the finalizer threads are set at startup
+    SCRIPT = """
+import threading
+import time
+from java.lang import System
+
+started = threading.Event()
+release = threading.Event()
+ran = []
+
+class Slow(object):
+    def __del__(self):
+        started.set()
+        release.wait(30)
+
+class Quick(object):
+    def __del__(self):
+        ran.append(not release.is_set())
+        release.set()
+
+def collect_until(condition):
+    for _ in range(100):
+        System.gc()
+        if condition():
+            return
+        time.sleep(0.05)
+
+Slow()
+collect_until(started.is_set)
+Quick()
+collect_until(lambda: ran)
+print(started.is_set(), ran)
+"""
+
+    @unittest.skipUnless(support.is_jython, "Jython finalizer threads")
+    def test_blocked_finalizer_does_not_hold_up_others(self):
+        import subprocess
+        import sys
+        output = subprocess.check_output(
+            [sys.executable, "-J-Dpython.finalization.threads=2", "-c", self.SCRIPT],
+            universal_newlines=True)
+        self.assertEqual(output.strip(), "True [True]")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,6 @@
 
+import gc
+import time
 import unittest
 
 # tests for deeply nested try/except/finally's
@@ -168,5 +170,49 @@ class TestThrowTestCase(unittest.TestCase):
         self.assertEqual(genexp.gi_frame, None)
         self.assertRaises(StopIteration, genexp.__next__)
 
+class FinalizationTestCase(unittest.TestCase):
+
+    def collect_until(self, condition):
+        # The JVM may take a few collections to get round to the generator
+        for _ in range(100):
+            gc.collect()
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_finished_generator_releases_trigger(self):
+        from org.python.core.finalization import FinalizeTrigger
+        genexp = (i for i in range(2))
+        self.assertTrue(FinalizeTrigger.hasActiveTrigger(genexp))
+        self.assertEqual(list(genexp), [0, 1])
+        self.assertEqual(genexp.gi_frame, None)
+        self.assertFalse(FinalizeTrigger.hasActiveTrigger(genexp))
+
+    def test_finished_generator_keeps_trigger_if_disabled(self):
+        from org.python.core import Options
+        from org.python.core.finalization import FinalizeTrigger
+        saved = Options.releaseFinishedGenerators
+        Options.releaseFinishedGenerators = False
+        try:
+            genexp = (i for i in range(2))
+            self.assertEqual(list(genexp), [0, 1])
+            self.assertTrue(FinalizeTrigger.hasActiveTrigger(genexp))
+        finally:
+            Options.releaseFinishedGenerators = saved
+
+    def test_unfinished_generator_is_closed(self):
+        closed = []
+        def gen():
+            try:
+                yield 1
+                yield 2
+            finally:
+                closed.append(True)
+        g = gen()
+        self.assertEqual(next(g), 1)
+        del g
+        self.assertTrue(self.collect_until(lambda: closed))
+
 if __name__ == "__main__":
     unittest.main()
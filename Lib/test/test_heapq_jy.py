@@ -0,0 +1,60 @@
+"""Misc heapq tests
+
+Made for Jython, for the Java _heapq module.
+"""
+import heapq
+import unittest
+from test import support
+
+
+class Raises:
+
+    def __lt__(self, other):
+        raise ZeroDivisionError
+
+
+class Clears:
+    """Empties a list when compared."""
+
+    def __init__(self, l):
+        self.l = l
+
+    def __lt__(self, other):
+        del self.l[:]
+        return True
+
+    __gt__ = __lt__
+
+
+class HeapqTestCase(unittest.TestCase):
+
+    def test_lt_raises(self):
+        heap = [1, 2, 3]
+        self.assertRaises(ZeroDivisionError, heapq.heappush, heap, Raises())
+        self.assertEqual(len(heap), 4)
+        self.assertRaises(ZeroDivisionError, heapq.heapify, [Raises(), Raises()])
+        self.assertRaises(ZeroDivisionError, heapq.heappop, [Raises(), Raises(), Raises()])
+        self.assertRaises(ZeroDivisionError, heapq.heappushpop, [Raises()], 1)
+
+    def test_mutated_during_comparison(self):
+        heap = [1, 2]
+        self.assertRaises(RuntimeError, heapq.heappush, heap, Clears(heap))
+        heap = [0]
+        self.assertRaises(IndexError, heapq.heappushpop, heap, Clears(heap))
+        heap = [0, 1, 2]
+        self.assertRaises(RuntimeError, heapq.heapreplace, heap, Clears(heap))
+
+    def test_heappushpop(self):
+        heap = [1, 3, 5]
+        self.assertEqual(heapq.heappushpop(heap, 0), 0)
+        self.assertEqual(heapq.heappushpop(heap, 4), 1)
+        self.assertEqual(heap, [3, 4, 5])
+        self.assertEqual(heapq.heappushpop([], 7), 7)
+
+
+def test_main():
+    support.run_unittest(HeapqTestCase)
+
+
+if __name__ == "__main__":
+    test_main()
@@ -217,6 +217,116 @@ class ImpTestCase(unittest.TestCase):
         __import__("os", [], level=-1)
 
 
+class TempPathTestCase(unittest.TestCase):
+    """Base for tests importing modules written to a directory on sys.path"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        sys.path.insert(0, self.dir)
+        self.orig_modules = set(sys.modules)
+
+    def tearDown(self):
+        sys.path.remove(self.dir)
+        for name in set(sys.modules) - self.orig_modules:
+            del sys.modules[name]
+        shutil.rmtree(self.dir)
+
+    def write(self, name, source):
+        path = os.path.join(self.dir, *name.split('/'))
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as f:
+            f.write(source)
+
+
+class LoadedModuleImportTestCase(TempPathTestCase):
+    """Imports of modules already in sys.modules"""
+
+    def test_reimport(self):
+        self.write('loaded_a.py', 'X = 1\n')
+        import loaded_a
+        first = loaded_a
+        del loaded_a
+        import loaded_a
+        self.assertIs(loaded_a, first)
+        self.assertIs(__import__('loaded_a'), first)
+
+    def test_fromlist_submodule(self):
+        self.write('loaded_pkg/__init__.py', '')
+        self.write('loaded_pkg/sub.py', 'Y = 2\n')
+        import loaded_pkg
+        self.assertFalse(hasattr(loaded_pkg, 'sub'))
+        from loaded_pkg import sub
+        self.assertEqual(sub.Y, 2)
+        from loaded_pkg import sub as sub2
+        self.assertIs(sub2, sub)
+
+    def test_dotted_top(self):
+        self.write('loaded_pkg2/__init__.py', '')
+        self.write('loaded_pkg2/sub.py', '')
+        import loaded_pkg2.sub
+        pkg = loaded_pkg2
+        del loaded_pkg2
+        import loaded_pkg2.sub
+        self.assertIs(loaded_pkg2, pkg)
+        self.assertIs(__import__('loaded_pkg2.sub', fromlist=['x']), pkg.sub)
+
+    def test_relative(self):
+        self.write('loaded_pkg3/__init__.py', '')
+        self.write('loaded_pkg3/a.py', 'def f():\n    from . import b\n    return b\n')
+        self.write('loaded_pkg3/b.py', '')
+        from loaded_pkg3 import a
+        self.assertIs(a.f(), a.f())
+        self.assertIs(a.f(), sys.modules['loaded_pkg3.b'])
+
+    def test_circular(self):
+        self.write('loaded_c1.py', 'import loaded_c2\nX = 1\n')
+        self.write('loaded_c2.py', 'import loaded_c1\ndef f():\n    return loaded_c1.X\n')
+        import loaded_c1
+        self.assertEqual(loaded_c1.loaded_c2.f(), 1)
+
+    def test_replaced_entry(self):
+        fake = object()
+        sys.modules['loaded_fake'] = fake
+        import loaded_fake
+        self.assertIs(loaded_fake, fake)
+
+
+class FileFinderTestCase(TempPathTestCase):
+    """Finding modules through the cached directory listings"""
+
+    def test_package_and_module(self):
+        self.write('finder_pkg/__init__.py', 'P = 1\n')
+        self.write('finder_pkg/mod.py', 'M = 2\n')
+        self.write('finder_pkg.py', 'P = 0\n')
+        import finder_pkg.mod
+        self.assertEqual(finder_pkg.P, 1)
+        self.assertEqual(finder_pkg.__path__, [os.path.join(self.dir, 'finder_pkg')])
+        self.assertEqual(finder_pkg.mod.M, 2)
+
+    def test_namespace_package(self):
+        self.write('finder_ns/mod.py', 'M = 3\n')
+        import finder_ns.mod
+        self.assertEqual(finder_ns.mod.M, 3)
+        self.assertIsNone(finder_ns.__spec__.origin)
+
+    def test_new_module_after_invalidate(self):
+        import importlib
+        self.write('finder_a.py', '')
+        import finder_a
+        with self.assertRaises(ImportError):
+            import finder_b
+        self.write('finder_b.py', 'B = 4\n')
+        importlib.invalidate_caches()
+        import finder_b
+        self.assertEqual(finder_b.B, 4)
+
+    def test_directory_without_module(self):
+        os.mkdir(os.path.join(self.dir, 'finder_empty.py'))
+        with self.assertRaises(ImportError):
+            import finder_empty
+
+
 class UnicodeNamesTestCase(unittest.TestCase):
 
     def test_import_unicode_module(self):
@@ -231,6 +341,8 @@ def test_main():
     support.run_unittest(MislabeledImportTestCase,
                               OverrideBuiltinsImportTestCase,
                               ImpTestCase,
+                              LoadedModuleImportTestCase,
+                              FileFinderTestCase,
                               UnicodeNamesTestCase)
 
 if __name__ == '__main__':
@@ -293,8 +293,78 @@ class ChainedIterationTest(unittest.TestCase):
         self.assertEqual(list(obj), list(obj.__iter__()))
 
 
+class EndOfIterationTestCase(unittest.TestCase):
+
+    # Builtin iterators end loops without raising StopIteration; those
+    # defined in Python still raise it, and both must end the same way.
+
+    class Countdown(object):
+        def __init__(self, n):
+            self.n = n
+        def __iter__(self):
+            return self
+        def __next__(self):
+            if self.n == 0:
+                raise StopIteration
+            self.n -= 1
+            return self.n
+
+    def test_loops(self):
+        def gen():
+            yield 1
+            yield 2
+            return 3
+        for it, expected in [(gen(), [1, 2]), (enumerate("ab"), [(0, "a"), (1, "b")]),
+                             (iter([1, 2, 3].pop, 1), [3, 2]), (self.Countdown(2), [1, 0])]:
+            got = []
+            for x in it:
+                got.append(x)
+            else:
+                got.append("else")
+            self.assertEqual(got, expected + ["else"])
+            self.assertRaises(StopIteration, next, it)
+
+    def test_builtins(self):
+        def gen(n):
+            yield from range(n)
+        self.assertEqual(list(gen(3)), [0, 1, 2])
+        self.assertEqual(tuple(enumerate(gen(2))), ((0, 0), (1, 1)))
+        self.assertEqual(sum(gen(4)), 6)
+        self.assertEqual(sorted(self.Countdown(3)), [0, 1, 2])
+        self.assertEqual([x * 2 for x in self.Countdown(2)], [2, 0])
+
+    def test_generator_return_value(self):
+        def gen():
+            yield 1
+            return "done"
+        def outer():
+            result = yield from gen()
+            yield result
+        self.assertEqual(list(outer()), [1, "done"])
+        g = gen()
+        next(g)
+        with self.assertRaises(StopIteration) as cm:
+            next(g)
+        self.assertEqual(cm.exception.value, "done")
+
+    def test_chain(self):
+        self.assertEqual(list(itertools.chain()), [])
+        self.assertEqual(list(itertools.chain([], (), [1], [], self.Countdown(2), iter([]))),
+                         [1, 1, 0])
+        self.assertEqual(list(itertools.chain.from_iterable(self.Countdown(3) for _ in range(2))),
+                         [2, 1, 0, 2, 1, 0])
+        it = itertools.chain([1])
+        self.assertEqual(next(it), 1)
+        self.assertRaises(StopIteration, next, it)
+
+    def test_itertools_with_python_iterators(self):
+        self.assertEqual(list(itertools.zip_longest(self.Countdown(2), "abc")),
+                         [(1, "a"), (0, "b"), (None, "c")])
+        self.assertEqual(list(itertools.islice(self.Countdown(5), 2)), [4, 3])
+
+
 def test_main():
-    support.run_unittest(IterTestCase, ChainedIterationTest)
+    support.run_unittest(IterTestCase, ChainedIterationTest, EndOfIterationTestCase)
 
 
 if __name__ == '__main__':
@@ -165,6 +165,41 @@ class ComplexOverloadingTests(unittest.TestCase):
         self.assertEqual(o(1+2j), "class org.python.core.PyComplex=(1+2j)")
 
 
+class CachedDispatchTests(unittest.TestCase):
+    # Calls are dispatched through a cache of the overloads matched before,
+    # which has to tell apart values of one type that convert differently
+
+    def check_same_as_fresh(self, name, values):
+        meths = [m for m in java.lang.Class.getDeclaredMethods(JOverload) if m.name == name]
+        cached = PyReflectedFunction(meths)
+        for value in values * 2:
+            fresh = PyReflectedFunction(meths)
+            self.assertEqual(cached(jo, value), fresh(jo, value), (name, value))
+
+    def test_int_widths(self):
+        for name in ['ov_scal1', 'ov_scal2']:
+            self.check_same_as_fresh(name, [0, 300, 2**20, 2**40, 2**70, -1])
+
+    def test_str_lengths(self):
+        for name in ['ov_scal1', 'ov_scal2']:
+            self.check_same_as_fresh(name, ['a', 'ab', '', 'b', 1.5, None, True])
+
+    def test_bound_calls(self):
+        sb = java.lang.StringBuilder()
+        for value in ['a', 'bc', 1, 2**40, 2.5, True] * 2:
+            sb.append(value)
+        self.assertEqual(sb.toString(), 'abc110995116277762.5true' * 2)
+
+    def test_super_method_of_proxy(self):
+        class CountingList(ArrayList):
+            def size(self):
+                return ArrayList.size(self) + 1
+
+        for i in range(3):
+            l = CountingList()
+            l.add(i)
+            self.assertEqual(l.size(), 2)
+
 
 def printout(meth_dict, lbl, rng, args):
     for i in rng:
@@ -177,4 +212,5 @@ if __name__ == '__main__' and not sys.argv[1:] == ['break-out']:
     except ImportError:
         unittest.main()
     else:
-        support.run_unittest(OverloadedDispatchTests, VarargsDispatchTests, ComplexOverloadingTests)
+        support.run_unittest(OverloadedDispatchTests, VarargsDispatchTests, ComplexOverloadingTests,
+                             CachedDispatchTests)
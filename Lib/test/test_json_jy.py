@@ -0,0 +1,143 @@
+"""Misc json tests
+
+Made for Jython, for the encoder in the _json module.
+"""
+import collections
+import enum
+import io
+import json
+import unittest
+from test import support
+
+
+class Colour(enum.IntEnum):
+    RED = 1
+
+
+class EncoderTestCase(unittest.TestCase):
+
+    def test_dumps(self):
+        self.assertEqual(json.dumps([None, True, False, 1, 2**70, 1.5, "a\"b\né"]),
+                         '[null, true, false, 1, 1180591620717411303424, 1.5, "a\\"b\\n\\u00e9"]')
+        self.assertEqual(json.dumps("\U0001f600"), '"\\ud83d\\ude00"')
+        self.assertEqual(json.dumps(["é"], ensure_ascii=False), '["é"]')
+
+    def test_dict_keys(self):
+        self.assertEqual(json.dumps([{2: 1}, {1.5: 2}, {None: 3}, {True: 4}]),
+                         '[{"2": 1}, {"1.5": 2}, {"null": 3}, {"true": 4}]')
+        self.assertEqual(json.dumps({"b": 1, "a": [], "c": {}}, sort_keys=True),
+                         '{"a": [], "b": 1, "c": {}}')
+        self.assertEqual(json.dumps({(1,): 1, "a": 2}, skipkeys=True), '{"a": 2}')
+        self.assertRaises(TypeError, json.dumps, {(1,): 1})
+
+    def test_int_subclass(self):
+        # Encoded with int.__repr__, not that of the subclass
+        self.assertEqual(json.dumps([Colour.RED, {Colour.RED: 1}]), '[1, {"1": 1}]')
+
+    def test_dict_subclasses(self):
+        items = [("z", 1), ("a", 2), ("m", 3), ("b", 4)]
+        self.assertEqual(json.dumps(collections.OrderedDict(items)),
+                         '{"z": 1, "a": 2, "m": 3, "b": 4}')
+        self.assertEqual(json.dumps(collections.OrderedDict(items), sort_keys=True),
+                         '{"a": 2, "b": 4, "m": 3, "z": 1}')
+
+    def test_not_serializable(self):
+        self.assertRaises(TypeError, json.dumps, b"bytes")
+        self.assertRaises(TypeError, json.dumps, object())
+        self.assertEqual(json.dumps(object(), default=lambda o: "x"), '"x"')
+
+    def test_circular(self):
+        l = []
+        l.append(l)
+        self.assertRaises(ValueError, json.dumps, l)
+
+    def test_dump_chunks(self):
+        # Large enough that the encoder writes it out in several chunks
+        doc = [{"key %d" % i: ["value", i, i / 2.0, None]} for i in range(20000)]
+        writes = []
+
+        class Writer(io.StringIO):
+            def write(self, s):
+                writes.append(len(s))
+                return super().write(s)
+
+        fp = Writer()
+        json.dump(doc, fp)
+        output = fp.getvalue()
+        self.assertEqual(output, json.dumps(doc))
+        self.assertEqual(json.loads(output), doc)
+        # Written by the Java encoder, in chunks of at least its CHUNK_SIZE, where the
+        # pure-Python iterencode would write each small piece on its own
+        self.assertGreater(len(writes), 1)
+        self.assertTrue(all(n >= 65536 for n in writes[:-1]), writes)
+        self.assertLessEqual(len(writes), len(output) // 65536 + 1)
+        self.assertTrue(json.JSONEncoder()._dump(doc, io.StringIO()))
+
+    def test_dump_options(self):
+        fp = io.StringIO()
+        json.dump({"b": [1, 2], "a": "é"}, fp, sort_keys=True, ensure_ascii=False,
+                  separators=(",", ":"))
+        self.assertEqual(fp.getvalue(), '{"a":"é","b":[1,2]}')
+        fp = io.StringIO()
+        json.dump({"a": [1]}, fp, indent=1)
+        self.assertEqual(fp.getvalue(), '{\n "a": [\n  1\n ]\n}')
+
+
+class DecoderTestCase(unittest.TestCase):
+
+    def test_loads(self):
+        self.assertEqual(json.loads(' {"a": [1, -2.5e1, "x\\n\\u00e9", null, true, false, {}, []]} '),
+                         {"a": [1, -25.0, "x\né", None, True, False, {}, []]})
+        self.assertEqual(json.loads('[12345678901234567890123]'), [12345678901234567890123])
+        self.assertEqual(json.loads('{"a": 1, "a": 2}'), {"a": 2})
+
+    def test_repeated_keys_are_shared(self):
+        rows = json.loads('[{"name": 1}, {"name": 2}]')
+        k1, = rows[0]
+        k2, = rows[1]
+        self.assertIs(k1, k2)
+
+    def test_hooks(self):
+        self.assertEqual(json.loads('{"a": 1, "b": 2}', object_pairs_hook=list),
+                         [("a", 1), ("b", 2)])
+        self.assertEqual(json.loads('{"a": 1.5}', parse_float=str, parse_int=str), {"a": "1.5"})
+        self.assertEqual(json.loads('[NaN, 7]', parse_constant=str, parse_int=float), ["NaN", 7.0])
+
+    def test_surrogates(self):
+        self.assertEqual(json.loads('"\\ud83d\\ude00"'), "\U0001f600")
+        self.assertEqual(json.loads('"\\ud83d"'), "\ud83d")
+
+    def test_supplementary_indexes(self):
+        # Indexes count code points, not UTF-16 units
+        decoder = json.JSONDecoder()
+        self.assertEqual(decoder.raw_decode('["\U0001f600", 1] tail'), (["\U0001f600", 1], 8))
+        self.assertEqual(decoder.raw_decode('"\U0001f600" 1', 4), (1, 5))
+        with self.assertRaises(json.JSONDecodeError) as cm:
+            json.loads('["\U0001f600", x]')
+        self.assertEqual(cm.exception.pos, 6)
+
+    def test_errors(self):
+        for doc, pos in [('[1, 2', 5), ('{"a" 1}', 5), ('{"a": 1,}', 8), ('"abc', 0),
+                         ('[1,]', 3), ('"\\x"', 1)]:
+            with self.assertRaises(json.JSONDecodeError) as cm:
+                json.loads(doc)
+            self.assertEqual(cm.exception.pos, pos, doc)
+
+    def test_bytes(self):
+        doc = '{"a": ["\u00e9\U0001f600"]}'
+        for encoding in ["utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be",
+                         "utf-32", "utf-32-le", "utf-32-be"]:
+            self.assertEqual(json.loads(doc.encode(encoding)), json.loads(doc), encoding)
+        self.assertEqual(json.loads(bytearray(b"[1]")), [1])
+        self.assertRaises(TypeError, json.loads, 1)
+
+    def test_load_binary_file(self):
+        self.assertEqual(json.load(io.BytesIO(b'{"a": [1, 2]}')), {"a": [1, 2]})
+
+
+def test_main():
+    support.run_unittest(EncoderTestCase, DecoderTestCase)
+
+
+if __name__ == "__main__":
+    test_main()
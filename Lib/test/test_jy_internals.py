@@ -268,6 +268,71 @@ class FrameTest(unittest.TestCase):
         foo()
         Bar().baz()
 
+class GlobalCacheTest(unittest.TestCase):
+
+    SOURCE = """
+def read():
+    return helper(), len('ab')
+"""
+
+    def namespace(self, source):
+        # Only module dicts (PyStringMap) take the cached path
+        import types
+        from org.python.core import PyStringMap
+        ns = types.ModuleType('_jy_global_cache').__dict__
+        self.assertIsInstance(ns, PyStringMap)
+        exec(source, ns)
+        return ns
+
+    def cache_entries(self, func):
+        from org.python.core import PyBaseCode
+        return list(getField(PyBaseCode, 'globalCache').get(func.__code__))
+
+    def test_builtin_stays_cached(self):
+        ns = self.namespace("def size(s):\n    return len(s)\n")
+        size = ns['size']
+        self.assertEqual(size('ab'), 2)
+        entries = self.cache_entries(size)
+        self.assertTrue(any(entry is not None for entry in entries))
+        for i in range(10):
+            self.assertEqual(size('abc'), 3)
+        # Each call has a new frame, which must hit the entries made by the first
+        self.assertEqual(self.cache_entries(size), entries)
+
+    def test_rebound_global_is_seen(self):
+        ns = self.namespace(self.SOURCE)
+        ns['helper'] = lambda: 1
+        for i in range(3):
+            self.assertEqual(ns['read'](), (1, 2))
+        ns['helper'] = lambda: 2
+        self.assertEqual(ns['read'](), (2, 2))
+        del ns['helper']
+        self.assertRaises(NameError, ns['read'])
+
+    def test_shadowed_builtin_is_seen(self):
+        ns = self.namespace(self.SOURCE)
+        ns['helper'] = lambda: 1
+        for i in range(3):
+            self.assertEqual(ns['read'](), (1, 2))
+        # A global shadowing a builtin that has already been cached
+        ns['len'] = lambda s: -1
+        self.assertEqual(ns['read'](), (1, -1))
+        del ns['len']
+        self.assertEqual(ns['read'](), (1, 2))
+
+    def test_builtins_change_is_seen(self):
+        import builtins
+        ns = self.namespace("def get():\n    return _jy_cache_probe\n")
+        builtins._jy_cache_probe = 1
+        try:
+            for i in range(3):
+                self.assertEqual(ns['get'](), 1)
+            builtins._jy_cache_probe = 2
+            self.assertEqual(ns['get'](), 2)
+        finally:
+            del builtins._jy_cache_probe
+        self.assertRaises(NameError, ns['get'])
+
 class ModuleTest(unittest.TestCase):
     def test_create_module(self):
         from org.python.core import PyModule, PyInstance
@@ -0,0 +1,105 @@
+"""Misc mmap tests
+
+Made for Jython, where the mmap module is implemented on java.nio.
+"""
+import mmap
+import os
+import struct
+import unittest
+from test import support
+
+
+class MmapTestCase(unittest.TestCase):
+
+    def setUp(self):
+        with open(support.TESTFN, 'wb') as f:
+            f.write(b'spam\neggs\n' + struct.pack('<iq', 42, -7) + b'\0' * 100)
+
+    def tearDown(self):
+        support.unlink(support.TESTFN)
+
+    def test_read_and_find(self):
+        with open(support.TESTFN, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.assertEqual(m.readline(), b'spam\n')
+                self.assertEqual(m.read(4), b'eggs')
+                self.assertEqual(m.find(b'eggs'), -1)
+                self.assertEqual(m.find(b'eggs', 0), 5)
+                self.assertEqual(m.rfind(b's', 0), 8)
+                self.assertEqual(m[0], ord('s'))
+                self.assertEqual(m[-1], 0)
+                self.assertEqual(m[5:9], b'eggs')
+                self.assertRaises(TypeError, m.write, b'x')
+                self.assertRaises(TypeError, m.__setitem__, 0, 1)
+            self.assertTrue(m.closed)
+            self.assertRaises(ValueError, len, m)
+
+    def test_iteration(self):
+        with open(support.TESTFN, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                # Iteration yields bytes of length 1, while indexing gives ints
+                self.assertEqual(list(m)[:5], [b's', b'p', b'a', b'm', b'\n'])
+                self.assertEqual(len(list(m)), len(m))
+                self.assertIn(b'e', m)
+                self.assertEqual(m[0], ord('s'))
+                it = iter(m)
+            self.assertRaises(ValueError, next, it)
+
+    def test_write_shared(self):
+        with open(support.TESTFN, 'r+b') as f:
+            m = mmap.mmap(f.fileno(), 0)
+            m[0:4] = b'SPAM'
+            m.seek(5)
+            m.write(b'EGGS')
+            m.flush()
+            m.close()
+        with open(support.TESTFN, 'rb') as f:
+            self.assertEqual(f.read(10), b'SPAM\nEGGS\n')
+
+    def test_copy_on_write(self):
+        with open(support.TESTFN, 'r+b') as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            m[0] = ord('X')
+            self.assertEqual(m[0:4], b'Xpam')
+            self.assertRaises(TypeError, m.resize, 10)
+            m.close()
+        with open(support.TESTFN, 'rb') as f:
+            self.assertEqual(f.read(4), b'spam')
+
+    def test_buffer_export(self):
+        with open(support.TESTFN, 'r+b') as f:
+            m = mmap.mmap(f.fileno(), 0)
+            self.assertEqual(struct.unpack_from('<iq', m, 10), (42, -7))
+            v = memoryview(m)
+            self.assertEqual(v[:4].tobytes(), b'spam')
+            v[0] = ord('S')
+            self.assertEqual(m[0], ord('S'))
+            self.assertRaises(BufferError, m.close)
+            v.release()
+            m.close()
+
+    def test_anonymous(self):
+        m = mmap.mmap(-1, 16)
+        self.assertEqual(len(m), 16)
+        m.write_byte(1)
+        m.move(1, 0, 1)
+        self.assertEqual(m[:3], b'\x01\x01\x00')
+        m.resize(32)
+        self.assertEqual(len(m), 32)
+        self.assertEqual(m[:2], b'\x01\x01')
+        m.close()
+
+    def test_empty_file(self):
+        with open(support.TESTFN, 'wb') as f:
+            pass
+        with open(support.TESTFN, 'rb') as f:
+            self.assertRaises(ValueError, mmap.mmap, f.fileno(), 0,
+                              access=mmap.ACCESS_READ)
+
+
+def test_main():
+    support.run_unittest(MmapTestCase)
+
+
+if __name__ == '__main__':
+    test_main()
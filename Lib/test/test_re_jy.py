@@ -71,9 +71,99 @@ class ReTest(unittest.TestCase):
                 self.assertNotRegexpMatches(c, ws_re)
                 self.assertRegex(c, not_ws_re)
 
+    def test_subject_kinds(self):
+        # BMP and non-BMP str, bytes and buffers are each read differently
+        m = re.search(r'b(\w+)d', 'a\u20acbcd\u20ac')
+        self.assertEqual((m.span(), m.group(1)), ((2, 5), 'c'))
+        m = re.search(r'b(\w+)d', 'a\U0001f600bcd\U0001f600')
+        self.assertEqual((m.span(), m.group(1)), ((2, 5), 'c'))
+        self.assertEqual(re.findall('.', '\U0001f600x'), ['\U0001f600', 'x'])
+        for subject in (b'a\xffbcd', bytearray(b'a\xffbcd'),
+                        memoryview(b'_a\xffbcd')[1:]):
+            m = re.search(b'\xff(b+)c', subject)
+            self.assertEqual(m.span(), (1, 4))
+            self.assertEqual(m.group(1), b'b')
+
+    def test_bytearray_resizable_after_match(self):
+        data = bytearray(b'abc')
+        self.assertTrue(re.match(b'a', data))
+        data.extend(b'def')
+        self.assertEqual(data, b'abcdef')
+
+    def test_literal_search(self):
+        # Searches accelerated by a prefix, a branch of literals or a
+        # literal every match must contain
+        text = 'xx abab ababc foofoo barbaz \U0001f600qux end'
+        self.assertEqual(re.search('ababc', text).span(), (8, 13))
+        self.assertEqual(re.search('abab(c)', text).span(), (8, 13))
+        self.assertEqual(re.search('foo|bar|baz', text).span(), (14, 17))
+        self.assertEqual(re.findall('baz|foo|bar', text),
+                         ['foo', 'foo', 'bar', 'baz'])
+        self.assertEqual(re.search('(az|barb)+', text).group(), 'barbaz')
+        self.assertEqual(re.search('r(?:ba|b)z', text).span(), (23, 27))
+        self.assertEqual(re.search(r'\w+baz', text).group(), 'barbaz')
+        self.assertIsNone(re.search(r'\w+bazz', text))
+        self.assertEqual(re.search('\U0001f600q|end', text).span(), (28, 30))
+        self.assertEqual(re.search('qux|\U0001f600', text).span(), (28, 29))
+        self.assertEqual(re.search(b'ab(?:c|d)', b'abd abc').span(), (0, 3))
+        self.assertIsNone(re.compile('foo|bar').search(text, 0, 16))
+        self.assertEqual(re.compile('foo|bar').search(text, 0, 17).span(),
+                         (14, 17))
+
+
+class CompiledPatternTest(unittest.TestCase):
+    """Patterns compiled to bytecode must match exactly as interpreted."""
+
+    cases = [
+        (r'abc', 'xxabcxx', 0),
+        (r'a.c', 'a\nc abc', 0),
+        (r'a.c', 'a\nc', re.DOTALL),
+        (r'(\w+)@(\w+)\.com', 'mail bob@example.com now', 0),
+        (r'^\d{3}-\d{4}$', '555-1234', 0),
+        (r'^\d{3}-\d{4}$', '555-12345', 0),
+        (r'a*?b', 'aaab', 0),
+        (r'x[a-c]+y', 'xabcabcy xy', 0),
+        (r'[^a-c]+', 'abcdefabc', 0),
+        (r'(foo|bar|baz)+?z', 'barbazfoo barz', 0),
+        (r'(a|ab)(c|bcd)(d*)', 'abcd', 0),
+        (r'HELLO\s+(\S+)', 'hello   World', re.IGNORECASE),
+        (r'[A-Z]+', 'abcDEF', re.IGNORECASE),
+        (r'\bword\b', 'a word here', 0),
+        (r'(a)|(b)', 'b', 0),
+        (r'(x+)(y?)$', 'xxxy\n', re.MULTILINE),
+        (r'.{2,4}c', 'abcabcabc', 0),
+        (r'\u20ac+[\u0100-\u0200]', '\u20ac\u20ac\u0150', 0),
+        (rb'[\x80-\xff]+', b'ab\x81\xfecd', 0),
+    ]
+
+    def setUp(self):
+        from org.python.core import Options
+        self.threshold = Options.sreCompileThreshold
+
+    def tearDown(self):
+        from org.python.core import Options
+        Options.sreCompileThreshold = self.threshold
+        re.purge()
+
+    def results(self, threshold):
+        from org.python.core import Options
+        Options.sreCompileThreshold = threshold
+        re.purge()
+        results = []
+        for pattern, string, flags in self.cases:
+            p = re.compile(pattern, flags)
+            for m in (p.match(string), p.search(string), p.fullmatch(string)):
+                results.append(m and (m.span(), m.groups(), m.lastindex))
+            results.append(p.findall(string))
+            results.append(p.sub(string[:0], string))
+        return results
+
+    def test_compiled_matches_interpreted(self):
+        self.assertEqual(self.results(0), self.results(-1))
+
 
 def test_main():
-    test.support.run_unittest(ReTest)
+    test.support.run_unittest(ReTest, CompiledPatternTest)
 
 if __name__ == "__main__":
     test_main()
@@ -88,9 +88,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyUnicode __str__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__str__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__str__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__();
+            PyObject res=Deriveds.callSpecial(impl,this,self_type);
             if (res instanceof PyUnicode)
                 return(PyUnicode)res;
             throw Py.TypeError("__str__"+" returned non-"+"unicode"+" (type "+res.getType().fastGetName()+")");
@@ -100,9 +100,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyUnicode __repr__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__repr__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__repr__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__();
+            PyObject res=Deriveds.callSpecial(impl,this,self_type);
             if (res instanceof PyUnicode)
                 return(PyUnicode)res;
             throw Py.TypeError("__repr__"+" returned non-"+"unicode"+" (type "+res.getType().fastGetName()+")");
@@ -112,9 +112,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyFloat __float__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__float__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__float__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__();
+            PyObject res=Deriveds.callSpecial(impl,this,self_type);
             if (res instanceof PyFloat)
                 return(PyFloat)res;
             throw Py.TypeError("__float__"+" returned non-"+"float"+" (type "+res.getType().fastGetName()+")");
@@ -124,9 +124,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyComplex __complex__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__complex__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__complex__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__();
+            PyObject res=Deriveds.callSpecial(impl,this,self_type);
             if (res instanceof PyComplex)
                 return(PyComplex)res;
             throw Py.TypeError("__complex__"+" returned non-"+"complex"+" (type "+res.getType().fastGetName()+")");
@@ -136,57 +136,57 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __pos__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__pos__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__pos__);
         if (impl!=null)
-            return impl.__get__(this,self_type).__call__();
+            return Deriveds.callSpecial(impl,this,self_type);
         return super.__pos__();
     }
 
     public PyObject __neg__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__neg__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__neg__);
         if (impl!=null)
-            return impl.__get__(this,self_type).__call__();
+            return Deriveds.callSpecial(impl,this,self_type);
         return super.__neg__();
     }
 
     public PyObject __abs__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__abs__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__abs__);
         if (impl!=null)
-            return impl.__get__(this,self_type).__call__();
+            return Deriveds.callSpecial(impl,this,self_type);
         return super.__abs__();
     }
 
     public PyObject __invert__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__invert__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__invert__);
         if (impl!=null)
-            return impl.__get__(this,self_type).__call__();
+            return Deriveds.callSpecial(impl,this,self_type);
         return super.__invert__();
     }
 
     public PyObject __reduce__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__reduce__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__reduce__);
         if (impl!=null)
-            return impl.__get__(this,self_type).__call__();
+            return Deriveds.callSpecial(impl,this,self_type);
         return super.__reduce__();
     }
 
     public PyObject __dir__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__dir__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__dir__);
         if (impl!=null)
-            return impl.__get__(this,self_type).__call__();
+            return Deriveds.callSpecial(impl,this,self_type);
         return super.__dir__();
     }
 
     public PyObject __add__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__add__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__add__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -196,9 +196,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __radd__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__radd__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__radd__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -208,9 +208,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __sub__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__sub__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__sub__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -220,9 +220,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rsub__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rsub__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rsub__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -232,9 +232,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __mul__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__mul__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__mul__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -244,9 +244,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rmul__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rmul__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rmul__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -256,9 +256,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __matmul__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__matmul__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__matmul__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -268,9 +268,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rmatmul__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rmatmul__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rmatmul__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -280,9 +280,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __floordiv__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__floordiv__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__floordiv__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -292,9 +292,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rfloordiv__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rfloordiv__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rfloordiv__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -304,9 +304,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __truediv__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__truediv__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__truediv__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -316,9 +316,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rtruediv__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rtruediv__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rtruediv__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -328,9 +328,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __mod__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__mod__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__mod__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -340,9 +340,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rmod__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rmod__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rmod__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -352,9 +352,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __divmod__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__divmod__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__divmod__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -364,9 +364,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rdivmod__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rdivmod__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rdivmod__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -376,9 +376,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rpow__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rpow__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rpow__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -388,9 +388,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __lshift__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__lshift__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__lshift__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -400,9 +400,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rlshift__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rlshift__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rlshift__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -412,9 +412,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rshift__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rshift__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rshift__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -424,9 +424,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rrshift__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rrshift__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rrshift__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -436,9 +436,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __and__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__and__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__and__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -448,9 +448,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rand__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rand__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rand__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -460,9 +460,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __or__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__or__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__or__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -472,9 +472,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __ror__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__ror__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__ror__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -484,9 +484,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __xor__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__xor__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__xor__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -496,9 +496,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __rxor__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__rxor__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__rxor__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -508,9 +508,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __format__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__format__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__format__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -520,9 +520,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __iadd__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__iadd__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__iadd__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -532,9 +532,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __isub__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__isub__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__isub__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -544,9 +544,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __imul__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__imul__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__imul__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -556,9 +556,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __imatmul__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__imatmul__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__imatmul__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -568,9 +568,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __idiv__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__idiv__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__idiv__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -580,9 +580,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __ifloordiv__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__ifloordiv__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__ifloordiv__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -592,9 +592,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __itruediv__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__itruediv__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__itruediv__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -604,9 +604,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __imod__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__imod__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__imod__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -616,9 +616,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __ipow__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__ipow__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__ipow__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -628,9 +628,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __ilshift__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__ilshift__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__ilshift__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -640,9 +640,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __irshift__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__irshift__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__irshift__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -652,9 +652,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __iand__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__iand__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__iand__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -664,9 +664,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __ior__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__ior__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__ior__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -676,9 +676,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __ixor__(PyObject other) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__ixor__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__ixor__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(other);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,other);
             if (res==Py.NotImplemented)
                 return null;
             return res;
@@ -688,9 +688,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __int__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__int__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__int__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__();
+            PyObject res=Deriveds.callSpecial(impl,this,self_type);
             if (res instanceof PyLong||res instanceof PyInteger)
                 return res;
             throw Py.TypeError("__int__"+" returned non-"+"long"+" (type "+res.getType().fastGetName()+")");
@@ -700,9 +700,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public int hashCode() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__hash__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__hash__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__();
+            PyObject res=Deriveds.callSpecial(impl,this,self_type);
             if (res instanceof PyInteger) {
                 return((PyInteger)res).getValue();
             } else
@@ -711,7 +711,7 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
                 }
             throw Py.TypeError("__hash__ should return a int");
         }
-        if (self_type.lookup("__eq__")!=null) {
+        if (self_type.lookupSpecial(SpecialMethod.__eq__)!=null) {
             throw Py.TypeError(String.format("unhashable type: '%.200s'",getType().fastGetName()));
         }
         return super.hashCode();
@@ -719,13 +719,13 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public boolean __bool__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__bool__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__bool__);
         if (impl==null) {
-            impl=self_type.lookup("__len__");
+            impl=self_type.lookupSpecial(SpecialMethod.__len__);
             if (impl==null)
                 return super.__bool__();
         }
-        PyObject o=impl.__get__(this,self_type).__call__();
+        PyObject o=Deriveds.callSpecial(impl,this,self_type);
         Class c=o.getClass();
         if (c!=PyLong.class&&c!=PyBoolean.class) {
             throw Py.TypeError(String.format("__bool__ should return bool or int, returned %s",self_type.getName()));
@@ -735,17 +735,17 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public boolean __contains__(PyObject o) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__contains__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__contains__);
         if (impl==null)
             return super.__contains__(o);
-        return impl.__get__(this,self_type).__call__(o).__bool__();
+        return Deriveds.callSpecial(impl,this,self_type,o).__bool__();
     }
 
     public int __len__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__len__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__len__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__();
+            PyObject res=Deriveds.callSpecial(impl,this,self_type);
             if (res instanceof PyInteger||res instanceof PyLong) {
                 return res.asInt();
             }
@@ -756,10 +756,10 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __iter__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__iter__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__iter__);
         if (impl!=null)
-            return impl.__get__(this,self_type).__call__();
-        impl=self_type.lookup("__getitem__");
+            return Deriveds.callSpecial(impl,this,self_type);
+        impl=self_type.lookupSpecial(SpecialMethod.__getitem__);
         if (impl==null)
             return super.__iter__();
         return new PySequenceIter(this);
@@ -767,19 +767,19 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __next__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__next__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__next__);
         if (impl!=null) {
-            return impl.__get__(this,self_type).__call__();
+            return Deriveds.callSpecial(impl,this,self_type);
         }
         return super.__next__(); // ???
     }
 
     public PyObject __finditem__(PyObject key) { // ???
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__getitem__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__getitem__);
         if (impl!=null)
             try {
-                return impl.__get__(this,self_type).__call__(key);
+                return Deriveds.callSpecial(impl,this,self_type,key);
             } catch (PyException exc) {
                 if (exc.match(Py.LookupError))
                     return null;
@@ -790,10 +790,10 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __finditem__(int key) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__getitem__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__getitem__);
         if (impl!=null)
             try {
-                return impl.__get__(this,self_type).__call__(new PyInteger(key));
+                return Deriveds.callSpecial(impl,this,self_type,new PyInteger(key));
             } catch (PyException exc) {
                 if (exc.match(Py.LookupError))
                     return null;
@@ -822,17 +822,17 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
         // __getitem__ -> super.__getitem__ -> __finditem__ -> super.__finditem__
 
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__getitem__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__getitem__);
         if (impl!=null)
-            return impl.__get__(this,self_type).__call__(key);
+            return Deriveds.callSpecial(impl,this,self_type,key);
         return super.__getitem__(key);
     }
 
     public void __setitem__(PyObject key,PyObject value) { // ???
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__setitem__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__setitem__);
         if (impl!=null) {
-            impl.__get__(this,self_type).__call__(key,value);
+            Deriveds.callSpecial(impl,this,self_type,key,value);
             return;
         }
         super.__setitem__(key,value);
@@ -840,9 +840,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public void __delitem__(PyObject key) { // ???
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__delitem__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__delitem__);
         if (impl!=null) {
-            impl.__get__(this,self_type).__call__(key);
+            Deriveds.callSpecial(impl,this,self_type,key);
             return;
         }
         super.__delitem__(key);
@@ -850,9 +850,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __call__(PyObject args[],String keywords[]) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__call__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__call__);
         if (impl!=null) {
-            return impl.__get__(this,self_type).__call__(args,keywords);
+            return Deriveds.callSpecial(impl,this,self_type,args,keywords);
         }
         return super.__call__(args,keywords);
     }
@@ -863,9 +863,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public void __setattr__(String name,PyObject value) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__setattr__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__setattr__);
         if (impl!=null) {
-            impl.__get__(this,self_type).__call__(PyUnicode.fromInterned(name),value);
+            Deriveds.callSpecial(impl,this,self_type,PyUnicode.fromInterned(name),value);
             //CPython does not support instance-acquired finalizers.
             //So we don't check for __del__ here.
             return;
@@ -875,9 +875,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public void __delattr__(String name) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__delattr__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__delattr__);
         if (impl!=null) {
-            impl.__get__(this,self_type).__call__(PyUnicode.fromInterned(name));
+            Deriveds.callSpecial(impl,this,self_type,PyUnicode.fromInterned(name));
             return;
         }
         super.__delattr__(name);
@@ -885,22 +885,22 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __get__(PyObject obj,PyObject type) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__get__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__get__);
         if (impl!=null) {
             if (obj==null)
                 obj=Py.None;
             if (type==null)
                 type=Py.None;
-            return impl.__get__(this,self_type).__call__(obj,type);
+            return Deriveds.callSpecial(impl,this,self_type,obj,type);
         }
         return super.__get__(obj,type);
     }
 
     public void __set__(PyObject obj,PyObject value) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__set__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__set__);
         if (impl!=null) {
-            impl.__get__(this,self_type).__call__(obj,value);
+            Deriveds.callSpecial(impl,this,self_type,obj,value);
             return;
         }
         super.__set__(obj,value);
@@ -908,9 +908,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public void __delete__(PyObject obj) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__delete__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__delete__);
         if (impl!=null) {
-            impl.__get__(this,self_type).__call__(obj);
+            Deriveds.callSpecial(impl,this,self_type,obj);
             return;
         }
         super.__delete__(obj);
@@ -918,13 +918,13 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __pow__(PyObject other,PyObject modulo) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__pow__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__pow__);
         if (impl!=null) {
             PyObject res;
             if (modulo==null) {
-                res=impl.__get__(this,self_type).__call__(other);
+                res=Deriveds.callSpecial(impl,this,self_type,other);
             } else {
-                res=impl.__get__(this,self_type).__call__(other,modulo);
+                res=Deriveds.callSpecial(impl,this,self_type,other,modulo);
             }
             if (res==Py.NotImplemented)
                 return null;
@@ -939,8 +939,8 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject richCompare(PyObject other,CompareOp op) {
         PyType type=getType();
-        PyObject meth=type.lookup(op.meth());
-        PyObject res=meth.__get__(this,type).__call__(other);
+        PyObject meth=type.lookupSpecial(op.special());
+        PyObject res=Deriveds.callSpecial(meth,this,type,other);
         if (res!=Py.NotImplemented) {
             return res;
         }
@@ -949,9 +949,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public PyObject __index__() {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__index__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__index__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__();
+            PyObject res=Deriveds.callSpecial(impl,this,self_type);
             if (res instanceof PyInteger||res instanceof PyLong) {
                 return res;
             }
@@ -971,9 +971,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
         }
         // Otherwise, we call the derived __tojava__, if it exists:
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__tojava__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__tojava__);
         if (impl!=null) {
-            PyObject delegate=impl.__get__(this,self_type).__call__(Py.java2py(c));
+            PyObject delegate=Deriveds.callSpecial(impl,this,self_type,Py.java2py(c));
             if (delegate!=this)
                 return delegate.__tojava__(Object.class);
         }
@@ -982,9 +982,9 @@ public class AsyncWithDerived extends AsyncWith implements Slotted,FinalizablePy
 
     public Object __coerce_ex__(PyObject o) {
         PyType self_type=getType();
-        PyObject impl=self_type.lookup("__coerce__");
+        PyObject impl=self_type.lookupSpecial(SpecialMethod.__coerce__);
         if (impl!=null) {
-            PyObject res=impl.__get__(this,self_type).__call__(o);
+            PyObject res=Deriveds.callSpecial(impl,this,self_type,o);
             if (res==Py.NotImplemented)
                 return Py.None;
             if (!(res instanceof PyTuple))
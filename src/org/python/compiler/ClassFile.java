@@ -29,6 +29,7 @@ public class ClassFile
     String superclass;
     String sfilename;
     String[] interfaces;
+    int version = Opcodes.V1_5;
     List<MethodVisitor> methodVisitors;
     List<FieldVisitor> fieldVisitors;
     List<AnnotationVisitor> annotationVisitors;
@@ -92,6 +93,18 @@ public class ClassFile
         annotationVisitors = Collections.synchronizedList(new ArrayList<AnnotationVisitor>());
     }
 
+    /**
+     * Set the class file version, which must be at least Java 7 for classes using
+     * <code>invokedynamic</code>.
+     */
+    public void setVersion(int version) {
+        this.version = version;
+    }
+
+    public int getVersion() {
+        return version;
+    }
+
     public void setSource(String name) {
         sfilename = name;
     }
@@ -191,7 +204,7 @@ public class ClassFile
     }
 
     public void write(OutputStream stream) throws IOException {
-        cw.visit(Opcodes.V1_5, Opcodes.ACC_PUBLIC + Opcodes.ACC_SUPER, this.name, null, this.superclass, interfaces);
+        cw.visit(version, Opcodes.ACC_PUBLIC + Opcodes.ACC_SUPER, this.name, null, this.superclass, interfaces);
         AnnotationVisitor av = cw.visitAnnotation("Lorg/python/compiler/APIVersion;", true);
         // XXX: should imp.java really house this value or should imp.java point into
         // org.python.compiler?
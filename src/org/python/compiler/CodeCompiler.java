@@ -12,6 +12,7 @@ import java.util.Vector;
 
 import org.antlr.runtime.CommonToken;
 import org.antlr.runtime.Token;
+import org.objectweb.asm.Handle;
 import org.objectweb.asm.Label;
 import org.objectweb.asm.Opcodes;
 import org.objectweb.asm.Type;
@@ -30,6 +31,7 @@ import org.python.core.CompareOp;
 import org.python.core.CompilerFlags;
 import org.python.core.ContextGuard;
 import org.python.core.ContextManager;
+import org.python.core.IndyBootstrap;
 import org.python.core.PyCoroutine;
 import org.python.core.PyGenerator;
 import org.python.core.imp;
@@ -53,9 +55,13 @@ import org.python.core.ThreadState;
 import org.python.core.imp;
 
 import java.io.IOException;
+import java.lang.invoke.CallSite;
+import java.lang.invoke.MethodHandles;
+import java.lang.invoke.MethodType;
 import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.Collection;
+import java.util.HashMap;
 import java.util.ListIterator;
 import java.util.Map;
 import java.util.Stack;
@@ -84,6 +90,27 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
     private Stack<Label> continueLabels, breakLabels;
     private Stack<ExceptionHandler> exceptionHandlers;
     private Vector<Label> yields = new Vector<Label>();
+    /** Global cache slots assigned to the names this code looks up, see PyFrame.getglobal. */
+    private Map<String, Integer> globalSlots = new HashMap<String, Integer>();
+    /** Whether to emit invokedynamic sites rather than calling PyObject methods directly. */
+    private final boolean invokedynamic;
+
+    /** Bootstrap method signature for sites without static arguments. */
+    private final static String INDY_SIG = sig(CallSite.class, MethodHandles.Lookup.class,
+            String.class, MethodType.class);
+    /** Bootstrap method signature for attribute sites, which take the name as an argument. */
+    private final static String INDY_ATTR_SIG = sig(CallSite.class, MethodHandles.Lookup.class,
+            String.class, MethodType.class, String.class);
+    final static Handle INDY_GETATTR =
+            new Handle(H_INVOKESTATIC, p(IndyBootstrap.class), "getattr", INDY_ATTR_SIG);
+    final static Handle INDY_SETATTR =
+            new Handle(H_INVOKESTATIC, p(IndyBootstrap.class), "setattr", INDY_ATTR_SIG);
+    final static Handle INDY_BINARY =
+            new Handle(H_INVOKESTATIC, p(IndyBootstrap.class), "binary", INDY_SIG);
+    final static Handle INDY_COMPARE =
+            new Handle(H_INVOKESTATIC, p(IndyBootstrap.class), "compare", INDY_SIG);
+    final static Handle INDY_GETITEM =
+            new Handle(H_INVOKESTATIC, p(IndyBootstrap.class), "getitem", INDY_SIG);
 
     final static Method contextGuard_getManager =
             Method.getMethod("org.python.core.ContextManager getManager (org.python.core.PyObject)");
@@ -105,6 +132,7 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
     public CodeCompiler(Module module, boolean print_results) {
         this.module = module;
         this.print_results = print_results;
+        invokedynamic = module.classfile.getVersion() >= V1_7;
 
         continueLabels = new Stack<Label>();
         breakLabels = new Stack<Label>();
@@ -247,8 +275,7 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
             code.ldc("__module__");
 
             loadFrame();
-            code.ldc("__name__");
-            code.invokevirtual(p(PyFrame.class), "getname", sig(PyObject.class, String.class));
+            emitGetName("__name__");
             code.invokevirtual(p(PyFrame.class), "setlocal",
                     sig(Void.TYPE, String.class, PyObject.class));
 
@@ -1405,7 +1432,8 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
         code.astore(expr_tmp);
         // if no more elements then fall through
         code.aload(expr_tmp);
-        // this is still necessary before all builtin __next__ methods throw StopIteration
+        // builtin iterators and generators return null at the end; only iterators defined in
+        // Python raise StopIteration, for the handler below
         code.ifnull(finish_loop);
         code.goto_(start_loop);
         code.label(end);
@@ -1735,6 +1763,11 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
                     name = "GE";
                     break;
             }
+            if (invokedynamic) {
+                code.visitInvokeDynamicInsn(name,
+                        sig(PyObject.class, PyObject.class, PyObject.class), INDY_COMPARE);
+                return;
+            }
             code.getstatic(p(CompareOp.class), name, ci(CompareOp.class));
             code.invokevirtual(p(PyObject.class), "do_richCompare", sig(PyObject.class, PyObject.class, CompareOp.class));
         }
@@ -1792,6 +1825,11 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
 //        if (node.getInternalOp() == operatorType.Div && module.getFutures().areDivisionOn()) {
 //            name = "_truediv";
 //        }
+        if (invokedynamic) {
+            code.visitInvokeDynamicInsn(name, sig(PyObject.class, PyObject.class, PyObject.class),
+                    INDY_BINARY);
+            return null;
+        }
         code.invokevirtual(p(PyObject.class), name, sig(PyObject.class, PyObject.class));
         return null;
     }
@@ -1913,7 +1951,7 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
         visit(node.getInternalValue());
         stackProduce();
         code.ldc(name);
-        code.invokevirtual(p(PyObject.class), "__getattr__", sig(PyObject.class, String.class));
+        getattr(name);
         loadThreadState();
         stackProduce(p(ThreadState.class));
 
@@ -2187,8 +2225,13 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
                 code.invokevirtual(p(PyObject.class), "__delitem__", sig(Void.TYPE, PyObject.class));
                 return null;
             case Load:
-                code.invokevirtual(p(PyObject.class), "__getitem__",
-                        sig(PyObject.class, PyObject.class));
+                if (invokedynamic) {
+                    code.visitInvokeDynamicInsn("getitem",
+                            sig(PyObject.class, PyObject.class, PyObject.class), INDY_GETITEM);
+                } else {
+                    code.invokevirtual(p(PyObject.class), "__getitem__",
+                            sig(PyObject.class, PyObject.class));
+                }
                 return null;
             case Param:
             case Store:
@@ -2240,19 +2283,38 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
                 code.invokevirtual(p(PyObject.class), "__delattr__", sig(Void.TYPE, String.class));
                 return null;
             case Load:
-                code.invokevirtual(p(PyObject.class), "__getattr__",
-                        sig(PyObject.class, String.class));
+                getattr(getName(node.getInternalAttr()));
                 return null;
             case Param:
             case Store:
                 code.aload(temporary);
-                code.invokevirtual(p(PyObject.class), "__setattr__",
-                        sig(Void.TYPE, String.class, PyObject.class));
+                if (invokedynamic) {
+                    code.visitInvokeDynamicInsn("setattr",
+                            sig(Void.TYPE, PyObject.class, String.class, PyObject.class),
+                            INDY_SETATTR, getName(node.getInternalAttr()));
+                } else {
+                    code.invokevirtual(p(PyObject.class), "__setattr__",
+                            sig(Void.TYPE, String.class, PyObject.class));
+                }
                 return null;
         }
         return null;
     }
 
+    /**
+     * Emit an attribute load of name from the object below it on the stack, which is also
+     * pushed on the stack.
+     */
+    private void getattr(String name) {
+        if (invokedynamic) {
+            code.visitInvokeDynamicInsn("getattr",
+                    sig(PyObject.class, PyObject.class, String.class), INDY_GETATTR, name);
+        } else {
+            code.invokevirtual(p(PyObject.class), "__getattr__",
+                    sig(PyObject.class, String.class));
+        }
+    }
+
     public Object seqSet(java.util.List<expr> nodes) throws Exception {
         return seqSet(nodes, nodes.size(), -1);
     }
@@ -2740,9 +2802,30 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
         return name;
     }
 
+    /**
+     * The cache slot for a global name in the PyCode being compiled.
+     */
+    private int globalSlot(String name) {
+        Integer slot = globalSlots.get(name);
+        if (slot == null) {
+            slot = globalSlots.size();
+            globalSlots.put(name, slot);
+        }
+        return slot;
+    }
+
     void emitGetGlobal(String name) throws Exception {
         code.ldc(name);
-        code.invokevirtual(p(PyFrame.class), "getglobal", sig(PyObject.class, String.class));
+        code.iconst(globalSlot(name));
+        code.invokevirtual(p(PyFrame.class), "getglobal",
+                sig(PyObject.class, String.class, Integer.TYPE));
+    }
+
+    void emitGetName(String name) throws Exception {
+        code.ldc(name);
+        code.iconst(globalSlot(name));
+        code.invokevirtual(p(PyFrame.class), "getname",
+                sig(PyObject.class, String.class, Integer.TYPE));
     }
 
     @Override
@@ -2809,8 +2892,7 @@ public class CodeCompiler extends Visitor implements Opcodes, ClassConstants {
                         return null;
                     }
                 }
-                code.ldc(name);
-                code.invokevirtual(p(PyFrame.class), "getname", sig(PyObject.class, String.class));
+                emitGetName(name);
                 return null;
 
             case Param:
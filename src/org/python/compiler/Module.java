@@ -15,6 +15,7 @@ import org.python.core.CodeBootstrap;
 import org.python.core.CodeFlag;
 import org.python.core.CodeLoader;
 import org.python.core.CompilerFlags;
+import org.python.core.Options;
 import org.python.core.Py;
 import org.python.core.PyBytes;
 import org.python.core.PyCode;
@@ -473,6 +474,9 @@ public class Module implements Opcodes, ClassConstants, CompilationContext {
         this.mtime = mtime;
         classfile =
                 new ClassFile(name, p(PyFunctionTable.class), ACC_SYNCHRONIZED | ACC_PUBLIC, mtime);
+        if (Options.compileInvokedynamic) {
+            classfile.setVersion(V1_7);
+        }
         constants = new Hashtable<Constant, Constant>();
         sfilename = filename;
         if (filename != null) {
@@ -11,6 +11,12 @@ import org.python.util.Generic;
 
 /**
  * Utility class for loading compiled python modules and java classes defined in python modules.
+ * <p>
+ * The classes of imported modules are defined in one {@link Loader} per system state (see
+ * {@link PySystemState#getModuleLoader()}), rather than a loader each, unless
+ * {@link Options#sharedModuleLoader} is false. Code compiled by <code>exec</code> and
+ * <code>compile</code>, proxy classes, and a module class defined again when the module is
+ * reloaded, still get a loader of their own, so that they can be unloaded.
  */
 public class BytecodeLoader {
 
@@ -67,7 +73,13 @@ public class BytecodeLoader {
      */
     public static PyCode makeCode(String name, byte[] data, String filename) {
         try {
-            Class<?> c = makeClass(name, data);
+            Class<?> c = null;
+            if (Options.sharedModuleLoader && name.endsWith(Version.PY_CACHE_TAG)) {
+                c = makeModuleClass(name, data);
+            }
+            if (c == null) {
+                c = makeClass(name, data);
+            }
             Object o = c.getConstructor(new Class[] {String.class})
                     .newInstance(new Object[] {filename});
             return ((PyRunnable)o).getMain();
@@ -76,13 +88,38 @@ public class BytecodeLoader {
         }
     }
 
+    /**
+     * Define the class of an imported module in the module loader of the current system state.
+     *
+     * @return the class, or <code>null</code> if that loader already has a class of the name
+     */
+    private static Class<?> makeModuleClass(String name, byte[] data) {
+        Class<?> c = Py.getSystemState().getModuleLoader().loadClassFromBytesIfAbsent(name, data);
+        if (c != null) {
+            BytecodeNotification.notify(name, data, c);
+        }
+        return c;
+    }
+
     public static class Loader extends URLClassLoader {
 
+        static {
+            registerAsParallelCapable();
+        }
+
         private List<ClassLoader> parents = Generic.list();
 
         public Loader() {
+            this(imp.getSyspathJavaLoader());
+        }
+
+        /**
+         * Create a loader that finds the classes its classes refer to through
+         * <code>syspathLoader</code>.
+         */
+        public Loader(ClassLoader syspathLoader) {
             super(new URL[0]);
-            parents.add(imp.getSyspathJavaLoader());
+            parents.add(syspathLoader);
         }
 
         public void addParent(ClassLoader referent) {
@@ -107,6 +144,32 @@ public class BytecodeLoader {
         }
 
         public Class<?> loadClassFromBytes(String name, byte[] data) {
+            return define(className(name, data), data);
+        }
+
+        /**
+         * As {@link #loadClassFromBytes(String, byte[])}, unless this loader has already defined
+         * a class of the name.
+         *
+         * @return the new class, or <code>null</code> if there is already one of the name
+         */
+        public Class<?> loadClassFromBytesIfAbsent(String name, byte[] data) {
+            name = className(name, data);
+            synchronized (getClassLoadingLock(name)) {
+                if (findLoadedClass(name) != null) {
+                    return null;
+                }
+                return define(name, data);
+            }
+        }
+
+        private Class<?> define(String name, byte[] data) {
+            Class<?> c = defineClass(name, data, 0, data.length, getClass().getProtectionDomain());
+            resolveClass(c);
+            return c;
+        }
+
+        private static String className(String name, byte[] data) {
             if (name.endsWith(Version.PY_CACHE_TAG)) {
                 try {
                     // Get the real class name: we might request a 'bar'
@@ -119,9 +182,7 @@ public class BytecodeLoader {
                     // specified name
                 }
             }
-            Class<?> c = defineClass(name, data, 0, data.length, getClass().getProtectionDomain());
-            resolveClass(c);
-            return c;
+            return name;
         }
     }
 }
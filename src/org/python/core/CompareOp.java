@@ -13,6 +13,10 @@ public enum CompareOp {
     private static final String[] methOps = new String[] {
         "__lt__", "__le__", "__eq__", "__ne__", "__gt__", "__ge__"
     };
+    private static final SpecialMethod[] specialOps = new SpecialMethod[] {
+        SpecialMethod.__lt__, SpecialMethod.__le__, SpecialMethod.__eq__,
+        SpecialMethod.__ne__, SpecialMethod.__gt__, SpecialMethod.__ge__
+    };
 
     CompareOp(int n) {
         this.n = n;
@@ -67,4 +71,8 @@ public enum CompareOp {
     public String meth() {
         return methOps[n];
     }
+
+    public SpecialMethod special() {
+        return specialOps[n];
+    }
 }
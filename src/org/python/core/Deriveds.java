@@ -24,6 +24,42 @@ public class Deriveds {
         self.proxyInit();
     }
 
+    /**
+     * Call the special method <code>impl</code>, found by {@link PyType#lookupSpecial}, on
+     * <code>self</code>. A Python function is called with <code>self</code> as its first
+     * argument rather than through a bound method.
+     */
+    public static PyObject callSpecial(PyObject impl, PyObject self, PyType type) {
+        if (impl instanceof PyFunction) {
+            return impl.__call__(self);
+        }
+        return impl.__get__(self, type).__call__();
+    }
+
+    public static PyObject callSpecial(PyObject impl, PyObject self, PyType type,
+                                       PyObject arg) {
+        if (impl instanceof PyFunction) {
+            return impl.__call__(self, arg);
+        }
+        return impl.__get__(self, type).__call__(arg);
+    }
+
+    public static PyObject callSpecial(PyObject impl, PyObject self, PyType type,
+                                       PyObject arg0, PyObject arg1) {
+        if (impl instanceof PyFunction) {
+            return impl.__call__(self, arg0, arg1);
+        }
+        return impl.__get__(self, type).__call__(arg0, arg1);
+    }
+
+    public static PyObject callSpecial(PyObject impl, PyObject self, PyType type,
+                                       PyObject[] args, String[] keywords) {
+        if (impl instanceof PyFunction) {
+            return impl.__call__(self, args, keywords);
+        }
+        return impl.__get__(self, type).__call__(args, keywords);
+    }
+
     /**
      * Deriveds' __findattr_ex__ implementation.
      *
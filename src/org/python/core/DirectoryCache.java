@@ -0,0 +1,192 @@
+/* Copyright (c) Jython Developers */
+package org.python.core;
+
+import java.io.File;
+import java.io.IOException;
+import java.nio.file.DirectoryStream;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.HashSet;
+import java.util.Locale;
+import java.util.Map;
+import java.util.Set;
+
+import org.python.core.util.PlatformUtil;
+
+import com.google.common.cache.CacheBuilder;
+
+/**
+ * The listings of directories on <code>sys.path</code>, shared by the importlib
+ * <code>FileFinder</code> of every path entry, so that finding a module costs a lookup in the
+ * listing rather than a stat of each candidate file.
+ * <p>
+ * A listing is read again when the modification time of its directory changes, or after
+ * {@link #invalidate(String)} (from <code>importlib.invalidate_caches()</code>). At most
+ * {@link #MAX_LISTINGS} are kept, the least recently used being dropped first.
+ */
+public final class DirectoryCache {
+
+    /** Most listings kept: a listing evicted for space is only read again when next needed. */
+    static final int MAX_LISTINGS = 1024;
+
+    /**
+     * Listings by absolute directory path, bounded so that a process that imports from many
+     * directories over its life does not keep a listing of each of them.
+     */
+    private static final Map<String, Listing> listings =
+            CacheBuilder.newBuilder().maximumSize(MAX_LISTINGS).<String, Listing> build().asMap();
+
+    private DirectoryCache() {}
+
+    /**
+     * Look for the module <code>name</code> in the directory <code>dir</code>, as a package
+     * (<code>name/__init__</code> with one of the suffixes), then as a file (<code>name</code>
+     * with one of the suffixes), and last as a namespace package portion (a directory
+     * <code>name</code>).
+     *
+     * @param dir the directory (relative to the current working directory if not absolute)
+     * @param name the last component of the module name
+     * @param suffixes file suffixes in order of preference
+     * @param relaxCase whether names are to be compared case-insensitively
+     * @return the index of the suffix found and the path of the file, with the package
+     *         directory or <code>null</code>; index -1, no file and the directory for a namespace
+     *         portion; or <code>null</code> if there is no module
+     */
+    public static PyObject find(String dir, String name, String[] suffixes, boolean relaxCase) {
+        Listing listing = listing(dir);
+        if (listing == null) {
+            return null;
+        }
+        boolean namespace = false;
+        String packageDir = join(dir, name);
+        if (listing.contains(name, relaxCase)) {
+            Listing packageListing = listing(packageDir);
+            if (packageListing != null) {
+                for (int i = 0; i < suffixes.length; i++) {
+                    String init = "__init__" + suffixes[i];
+                    if (packageListing.contains(init, relaxCase)
+                            && isFile(join(packageDir, init))) {
+                        return found(i, join(packageDir, init), packageDir);
+                    }
+                }
+                namespace = true;
+            }
+        }
+        for (int i = 0; i < suffixes.length; i++) {
+            String file = name + suffixes[i];
+            if (listing.contains(file, relaxCase) && isFile(join(dir, file))) {
+                return found(i, join(dir, file), null);
+            }
+        }
+        if (namespace) {
+            return new PyTuple(Py.newInteger(-1), Py.None, Py.newUnicode(packageDir));
+        }
+        return null;
+    }
+
+    /** Forget the listings of <code>dir</code> and the directories under it. */
+    public static void invalidate(String dir) {
+        String path = PySystemState.getPathLazy(dir);
+        String prefix = path.endsWith(File.separator) ? path : path + File.separator;
+        for (String key : listings.keySet()) {
+            if (key.equals(path) || key.startsWith(prefix)) {
+                listings.remove(key);
+            }
+        }
+    }
+
+    private static PyObject found(int index, String path, String packageDir) {
+        return new PyTuple(Py.newInteger(index), Py.newUnicode(path),
+                packageDir == null ? Py.None : Py.newUnicode(packageDir));
+    }
+
+    /** The current listing of <code>dir</code>, or <code>null</code> if it is not a directory. */
+    private static Listing listing(String dir) {
+        File file = new File(PySystemState.getPathLazy(dir));
+        long mtime = file.lastModified();
+        if (mtime == 0L) {
+            // No such file, or the file system cannot say: read the directory if there is one
+            mtime = -1L;
+        }
+        String key = file.getPath();
+        Listing listing = listings.get(key);
+        if (listing != null && listing.mtime == mtime && mtime != -1L) {
+            return listing;
+        }
+        listing = Listing.read(file.toPath(), mtime);
+        if (listing == null) {
+            listings.remove(key);
+        } else {
+            listings.put(key, listing);
+        }
+        return listing;
+    }
+
+    private static boolean isFile(String path) {
+        return new File(PySystemState.getPathLazy(path)).isFile();
+    }
+
+    private static String join(String dir, String name) {
+        int end = dir.length();
+        while (end > 0 && (dir.charAt(end - 1) == '/' || dir.charAt(end - 1) == File.separatorChar)) {
+            end--;
+        }
+        return dir.substring(0, end) + File.separator + name;
+    }
+
+    /** The names in a directory, as read at a given modification time. */
+    private static final class Listing {
+
+        final long mtime;
+        private final Set<String> names;
+        /** The names in lower case, made on first use where names may differ in case. */
+        private volatile Set<String> relaxedNames;
+
+        private Listing(long mtime, Set<String> names) {
+            this.mtime = mtime;
+            this.names = names;
+        }
+
+        static Listing read(Path dir, long mtime) {
+            Set<String> names = new HashSet<>();
+            try (DirectoryStream<Path> stream = Files.newDirectoryStream(dir)) {
+                for (Path entry : stream) {
+                    names.add(normalize(entry.getFileName().toString()));
+                }
+            } catch (IOException | SecurityException e) {
+                // Removed, not a directory, or unreadable: nothing can be imported from it
+                return null;
+            }
+            return new Listing(mtime, names);
+        }
+
+        /**
+         * On Windows, suffixes match whatever their case (as in CPython), so they are kept in
+         * lower case.
+         */
+        private static String normalize(String name) {
+            if (PlatformUtil.isCaseInsensitive() && File.separatorChar == '\\') {
+                int dot = name.indexOf('.');
+                if (dot >= 0) {
+                    return name.substring(0, dot) + name.substring(dot).toLowerCase(Locale.ROOT);
+                }
+            }
+            return name;
+        }
+
+        boolean contains(String name, boolean relaxCase) {
+            if (!relaxCase) {
+                return names.contains(name);
+            }
+            Set<String> relaxed = relaxedNames;
+            if (relaxed == null) {
+                relaxed = new HashSet<>();
+                for (String n : names) {
+                    relaxed.add(n.toLowerCase(Locale.ROOT));
+                }
+                relaxedNames = relaxed;
+            }
+            return relaxed.contains(name.toLowerCase(Locale.ROOT));
+        }
+    }
+}
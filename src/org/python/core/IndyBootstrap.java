@@ -0,0 +1,401 @@
+/* Copyright (c) Jython Developers */
+package org.python.core;
+
+import java.lang.invoke.CallSite;
+import java.lang.invoke.MethodHandle;
+import java.lang.invoke.MethodHandles;
+import java.lang.invoke.MethodType;
+import java.lang.invoke.MutableCallSite;
+
+/**
+ * Bootstrap methods for the <code>invokedynamic</code> instructions emitted by the compiler when
+ * {@link Options#compileInvokedynamic} is set.
+ *
+ * Each call site starts out linked to a fallback that performs the operation the slow way and
+ * then installs an inline cache entry: a guard on the Java class and {@link PyType} of the
+ * operands (and, where the result depends on the contents of the type's dict, its method cache
+ * version tag) in front of a target specialized for those types. Up to {@link #MAX_DEPTH}
+ * entries are chained per site; beyond that, or when the operands are not cacheable, the site
+ * is relinked to the generic operation, which is what non-indy code calls.
+ */
+public class IndyBootstrap {
+
+    /** Maximum number of inline cache entries chained at a polymorphic site. */
+    static final int MAX_DEPTH = 4;
+
+    private static final MethodHandles.Lookup LOOKUP = MethodHandles.lookup();
+
+    private static final MethodType GETATTR_TYPE =
+            MethodType.methodType(PyObject.class, PyObject.class, String.class);
+    private static final MethodType SETATTR_TYPE =
+            MethodType.methodType(void.class, PyObject.class, String.class, PyObject.class);
+    private static final MethodType BINARY_TYPE =
+            MethodType.methodType(PyObject.class, PyObject.class, PyObject.class);
+
+    private static final MethodHandle CHECK_VERSION;
+    private static final MethodHandle CHECK_BINARY;
+    private static final MethodHandle GETATTR_FALLBACK;
+    private static final MethodHandle GETATTR_CACHED;
+    private static final MethodHandle GETATTR_GENERIC;
+    private static final MethodHandle SETATTR_FALLBACK;
+    private static final MethodHandle SETATTR_CACHED;
+    private static final MethodHandle SETATTR_GENERIC;
+    private static final MethodHandle BINARY_FALLBACK;
+    private static final MethodHandle COMPARE_FALLBACK;
+    private static final MethodHandle COMPARE_SCALAR;
+    private static final MethodHandle COMPARE_GENERIC;
+    private static final MethodHandle GETITEM_FALLBACK;
+
+    static {
+        try {
+            Class<?> me = IndyBootstrap.class;
+            CHECK_VERSION = LOOKUP.findStatic(me, "checkVersion", MethodType.methodType(
+                    boolean.class, Class.class, PyType.class, Object.class, PyObject.class));
+            CHECK_BINARY = LOOKUP.findStatic(me, "checkBinary", MethodType.methodType(
+                    boolean.class, Class.class, PyType.class, Class.class, PyType.class,
+                    PyObject.class, PyObject.class));
+            GETATTR_FALLBACK = LOOKUP.findStatic(me, "getattrFallback",
+                    GETATTR_TYPE.insertParameterTypes(0, InlineCacheCallSite.class));
+            GETATTR_CACHED = LOOKUP.findStatic(me, "getattrCached",
+                    GETATTR_TYPE.insertParameterTypes(0, PyObject.class, SharedKeyMap.Hint.class));
+            GETATTR_GENERIC = LOOKUP.findVirtual(PyObject.class, "__getattr__",
+                    MethodType.methodType(PyObject.class, String.class));
+            SETATTR_FALLBACK = LOOKUP.findStatic(me, "setattrFallback",
+                    SETATTR_TYPE.insertParameterTypes(0, InlineCacheCallSite.class));
+            SETATTR_CACHED = LOOKUP.findStatic(me, "setattrCached",
+                    SETATTR_TYPE.insertParameterTypes(0, PyObject.class));
+            SETATTR_GENERIC = LOOKUP.findVirtual(PyObject.class, "__setattr__",
+                    MethodType.methodType(void.class, String.class, PyObject.class));
+            BINARY_FALLBACK = LOOKUP.findStatic(me, "binaryFallback",
+                    BINARY_TYPE.insertParameterTypes(0, InlineCacheCallSite.class));
+            COMPARE_FALLBACK = LOOKUP.findStatic(me, "compareFallback",
+                    BINARY_TYPE.insertParameterTypes(0, InlineCacheCallSite.class));
+            COMPARE_SCALAR = LOOKUP.findStatic(me, "compareScalar",
+                    BINARY_TYPE.insertParameterTypes(0, CompareOp.class));
+            COMPARE_GENERIC = LOOKUP.findVirtual(PyObject.class, "do_richCompare",
+                    MethodType.methodType(PyObject.class, PyObject.class, CompareOp.class));
+            GETITEM_FALLBACK = LOOKUP.findStatic(me, "getitemFallback",
+                    BINARY_TYPE.insertParameterTypes(0, InlineCacheCallSite.class));
+        } catch (ReflectiveOperationException e) {
+            throw new ExceptionInInitializerError(e);
+        }
+    }
+
+    /** object.__getattribute__, the only __getattribute__ for which getattr sites cache. */
+    private static final PyObject OBJECT_GETATTRIBUTE = PyObject.TYPE.lookup("__getattribute__");
+
+    /** object.__setattr__, the only __setattr__ for which setattr sites cache. */
+    private static final PyObject OBJECT_SETATTR = PyObject.TYPE.lookup("__setattr__");
+
+    /**
+     * A call site holding a chain of inline cache entries in front of its fallback.
+     */
+    static class InlineCacheCallSite extends MutableCallSite {
+
+        /** The attribute name or operator method name this site was linked for. */
+        final String name;
+
+        /** The uncached operation, installed once the site becomes megamorphic. */
+        final MethodHandle generic;
+
+        /** The fallback, always at the end of the chain. */
+        MethodHandle fallback;
+
+        /** Number of cache entries installed so far. */
+        private int depth;
+
+        InlineCacheCallSite(MethodType type, String name, MethodHandle generic) {
+            super(type);
+            this.name = name;
+            this.generic = generic.asType(type);
+        }
+
+        void setFallback(MethodHandle fallback) {
+            this.fallback = fallback.bindTo(this).asType(type());
+            setTarget(this.fallback);
+        }
+
+        /**
+         * Put a new entry at the front of the chain, or give up on caching if the operands are
+         * not cacheable (guard is null) or the site has become megamorphic.
+         */
+        synchronized void addEntry(MethodHandle guard, MethodHandle target) {
+            if (guard == null || depth >= MAX_DEPTH) {
+                setTarget(generic);
+                return;
+            }
+            depth++;
+            setTarget(MethodHandles.guardWithTest(guard, target.asType(type()), getTarget()));
+        }
+    }
+
+    // Bootstrap methods
+
+    public static CallSite getattr(MethodHandles.Lookup lookup, String name, MethodType type,
+            String attr) {
+        InlineCacheCallSite site = new InlineCacheCallSite(type, attr.intern(), GETATTR_GENERIC);
+        site.setFallback(GETATTR_FALLBACK);
+        return site;
+    }
+
+    public static CallSite setattr(MethodHandles.Lookup lookup, String name, MethodType type,
+            String attr) {
+        InlineCacheCallSite site = new InlineCacheCallSite(type, attr.intern(), SETATTR_GENERIC);
+        site.setFallback(SETATTR_FALLBACK);
+        return site;
+    }
+
+    /**
+     * Bootstrap a binary operator site. The site name is the name of the PyObject method
+     * implementing the operator, such as <code>_add</code>.
+     */
+    public static CallSite binary(MethodHandles.Lookup lookup, String name, MethodType type)
+            throws ReflectiveOperationException {
+        MethodHandle generic =
+                LOOKUP.findVirtual(PyObject.class, name, BINARY_TYPE.dropParameterTypes(0, 1));
+        InlineCacheCallSite site = new InlineCacheCallSite(type, name, generic);
+        site.setFallback(BINARY_FALLBACK);
+        return site;
+    }
+
+    /**
+     * Bootstrap a rich comparison site. The site name is the name of the {@link CompareOp}.
+     */
+    public static CallSite compare(MethodHandles.Lookup lookup, String name, MethodType type) {
+        CompareOp op = CompareOp.valueOf(name);
+        MethodHandle generic = MethodHandles.insertArguments(COMPARE_GENERIC, 2, op);
+        InlineCacheCallSite site = new InlineCacheCallSite(type, name, generic);
+        site.setFallback(COMPARE_FALLBACK);
+        return site;
+    }
+
+    public static CallSite getitem(MethodHandles.Lookup lookup, String name, MethodType type)
+            throws ReflectiveOperationException {
+        MethodHandle generic = LOOKUP.findVirtual(PyObject.class, "__getitem__",
+                BINARY_TYPE.dropParameterTypes(0, 1));
+        InlineCacheCallSite site = new InlineCacheCallSite(type, name, generic);
+        site.setFallback(GETITEM_FALLBACK);
+        return site;
+    }
+
+    // Guards
+
+    static boolean checkVersion(Class<?> c, PyType type, Object versionTag, PyObject obj) {
+        return obj.getClass() == c && obj.getType() == type
+                && type.getVersionTag() == versionTag;
+    }
+
+    static boolean checkBinary(Class<?> c1, PyType t1, Class<?> c2, PyType t2, PyObject o1,
+            PyObject o2) {
+        return o1.getClass() == c1 && o2.getClass() == c2 && o1.getType() == t1
+                && o2.getType() == t2;
+    }
+
+    /**
+     * A guard on the class and type of the first argument, valid for the type's current
+     * version.
+     */
+    private static MethodHandle versionGuard(InlineCacheCallSite site, PyObject obj, PyType type,
+            Object versionTag) {
+        MethodHandle guard = MethodHandles.insertArguments(CHECK_VERSION, 0, obj.getClass(),
+                type, versionTag);
+        return MethodHandles.dropArguments(guard, 1,
+                site.type().dropParameterTypes(0, 1).parameterList());
+    }
+
+    /**
+     * A handle with the site's type that invokes target with the receiver cast to its exact
+     * class, so that the JIT can devirtualize calls made on it behind the guard.
+     */
+    private static MethodHandle exactReceiver(MethodHandle target, Class<?> c) {
+        return target.asType(target.type().changeParameterType(0, c));
+    }
+
+    // Attribute access
+
+    static PyObject getattrFallback(InlineCacheCallSite site, PyObject obj, String name) {
+        PyType type = obj.getType();
+        MethodHandle guard = null;
+        MethodHandle target = null;
+        // Only the behaviour of object.__getattribute__ is known here; it consults the type
+        // before anything the instance can override.
+        if (!(obj instanceof PyType) && type.lookup("__getattribute__") == OBJECT_GETATTRIBUTE
+                && usesObjectFindattr(obj.getClass())) {
+            Object versionTag = type.getVersionTag();
+            PyObject descr = type.lookup(site.name);
+            guard = versionGuard(site, obj, type, versionTag);
+            target = MethodHandles.insertArguments(GETATTR_CACHED, 0, descr,
+                    new SharedKeyMap.Hint());
+        }
+        site.addEntry(guard, target);
+        return obj.__getattr__(name);
+    }
+
+    /**
+     * Whether the Java class reaches object.__getattribute__ from __findattr_ex__, given that its
+     * type does not override __getattribute__: true for classes inheriting PyObject's
+     * implementation and for the generated Derived classes.
+     */
+    private static boolean usesObjectFindattr(Class<?> c) {
+        if (Slotted.class.isAssignableFrom(c)) {
+            return true;
+        }
+        try {
+            return c.getMethod("__findattr_ex__", String.class)
+                    .getDeclaringClass() == PyObject.class;
+        } catch (NoSuchMethodException e) {
+            return false;
+        }
+    }
+
+    /**
+     * object.__getattribute__ with the type lookup already done: descr is the result of looking
+     * up name on the type at the version tag the guard checks. An instance dict with shared keys
+     * is looked in first at the index where the name was found last.
+     */
+    static PyObject getattrCached(PyObject descr, SharedKeyMap.Hint hint, PyObject obj,
+            String name) {
+        boolean get = false;
+        if (descr != null) {
+            get = descr.implementsDescrGet();
+            if (get && descr.isDataDescr()) {
+                return descr.__get__(obj, obj.getType());
+            }
+        }
+
+        PyObject objDict = obj.fastGetDict();
+        if (objDict != null) {
+            PyObject res = objDict instanceof PyStringMap
+                    ? ((PyStringMap)objDict).__finditem__(name, hint)
+                    : objDict.__finditem__(name);
+            if (res != null) {
+                return res;
+            }
+        }
+
+        if (get) {
+            return descr.__get__(obj, obj.getType());
+        }
+        if (descr != null) {
+            return descr;
+        }
+        // __getattr__ hooks and the AttributeError are left to the full protocol
+        return obj.__getattr__(name);
+    }
+
+    static void setattrFallback(InlineCacheCallSite site, PyObject obj, String name,
+            PyObject value) {
+        PyType type = obj.getType();
+        MethodHandle guard = null;
+        MethodHandle target = null;
+        if (!(obj instanceof PyType) && type.lookup("__setattr__") == OBJECT_SETATTR
+                && usesObjectSetattr(obj.getClass())) {
+            Object versionTag = type.getVersionTag();
+            PyObject descr = type.lookup(site.name);
+            guard = versionGuard(site, obj, type, versionTag);
+            target = MethodHandles.insertArguments(SETATTR_CACHED, 0, descr);
+        }
+        site.addEntry(guard, target);
+        obj.__setattr__(name, value);
+    }
+
+    /**
+     * Whether the Java class reaches object.__setattr__ from __setattr__(String, PyObject), given
+     * that its type does not override __setattr__: true for classes inheriting PyObject's
+     * implementation and for the generated Derived classes.
+     */
+    private static boolean usesObjectSetattr(Class<?> c) {
+        if (Slotted.class.isAssignableFrom(c)) {
+            return true;
+        }
+        try {
+            return c.getMethod("__setattr__", String.class, PyObject.class)
+                    .getDeclaringClass() == PyObject.class;
+        } catch (NoSuchMethodException e) {
+            return false;
+        }
+    }
+
+    /**
+     * object.__setattr__ with the type lookup already done, as for {@link #getattrCached}.
+     */
+    static void setattrCached(PyObject descr, PyObject obj, String name, PyObject value) {
+        if (descr != null && descr.implementsDescrSet() && descr.isDataDescr()) {
+            descr.__set__(obj, value);
+            return;
+        }
+
+        PyObject objDict = obj.fastGetDict();
+        if (objDict != null) {
+            objDict.__setitem__(name, value);
+            return;
+        }
+        // Read-only and missing attribute errors
+        obj.object___setattr__(name, value);
+    }
+
+    // Operators
+
+    static PyObject binaryFallback(InlineCacheCallSite site, PyObject o1, PyObject o2)
+            throws Throwable {
+        PyType t1 = o1.getType();
+        PyType t2 = o2.getType();
+        MethodHandle target;
+        if (t1 == t2 || t1.builtin && t2.builtin) {
+            // The same dispatch PyObject._add and friends make before calling _basic_add
+            target = exactReceiver(LOOKUP.findVirtual(PyObject.class,
+                    "_basic" + site.name, BINARY_TYPE.dropParameterTypes(0, 1)), o1.getClass());
+        } else {
+            target = site.generic;
+        }
+        site.addEntry(binaryGuard(o1, t1, o2, t2), target);
+        return (PyObject)site.generic.invokeExact(o1, o2);
+    }
+
+    private static MethodHandle binaryGuard(PyObject o1, PyType t1, PyObject o2, PyType t2) {
+        return MethodHandles.insertArguments(CHECK_BINARY, 0, o1.getClass(), t1, o2.getClass(),
+                t2);
+    }
+
+    /**
+     * Classes whose richCompare cannot recurse and does not depend on the comparison nesting
+     * state kept by do_richCompare.
+     */
+    private static boolean isScalar(Class<?> c) {
+        return c == PyLong.class || c == PyFloat.class || c == PyUnicode.class
+                || c == PyBytes.class;
+    }
+
+    static PyObject compareFallback(InlineCacheCallSite site, PyObject o1, PyObject o2)
+            throws Throwable {
+        CompareOp op = CompareOp.valueOf(site.name);
+        MethodHandle target;
+        // With operands of the same exact type there is no reflected operation to try first
+        if (o1.getClass() == o2.getClass() && isScalar(o1.getClass())) {
+            target = MethodHandles.insertArguments(COMPARE_SCALAR, 0, op);
+        } else {
+            target = site.generic;
+        }
+        site.addEntry(binaryGuard(o1, o1.getType(), o2, o2.getType()), target);
+        return (PyObject)site.generic.invokeExact(o1, o2);
+    }
+
+    /**
+     * Compare two builtin scalars without the recursion bookkeeping of do_richCompare, which
+     * is still used when neither operand implements the comparison.
+     */
+    static PyObject compareScalar(CompareOp op, PyObject o1, PyObject o2) {
+        PyObject res = o1.richCompare(o2, op);
+        if (res != Py.NotImplemented) {
+            return res;
+        }
+        return o1.do_richCompare(o2, op);
+    }
+
+    static PyObject getitemFallback(InlineCacheCallSite site, PyObject o1, PyObject o2)
+            throws Throwable {
+        MethodHandle target = exactReceiver(site.generic, o1.getClass());
+        site.addEntry(binaryGuard(o1, o1.getType(), o2, o2.getType()), target);
+        return (PyObject)site.generic.invokeExact(o1, o2);
+    }
+}
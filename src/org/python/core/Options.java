@@ -112,11 +112,69 @@ public class Options {
     /**
      * Cache spec for the SRE_STATE code point cache. The value maps to the
      * CacheBuilderSpec string and affects how the SRE_STATE cache will behave/evict
-     * cached PyBytes -> int[] code points.
+     * cached PyUnicode -> int[] code points (only needed for strings containing
+     * supplementary characters).
      */
     public static final String sreCacheSpecDefault = "weakKeys,concurrencyLevel=4,maximumWeight=2621440,expireAfterAccess=30s";
     public static String sreCacheSpec = sreCacheSpecDefault;
 
+    /**
+     * The number of times a regular expression pattern is used before its program is compiled to
+     * JVM bytecode, instead of being interpreted. A negative value disables the compilation.
+     */
+    public static int sreCompileThreshold = 1000;
+
+    /**
+     * Cache spec for the JSR 223 compiled-script cache. The value maps to the CacheBuilderSpec
+     * string and affects how many compiled scripts <code>PyScriptEngine.eval(String)</code> keeps
+     * for re-use. A spec of <code>maximumSize=0</code> disables the cache.
+     */
+    public static final String jsr223CacheSpecDefault = "concurrencyLevel=4,maximumSize=1000";
+    public static String jsr223CacheSpec = jsr223CacheSpecDefault;
+
+    /**
+     * If true, the compiler emits <code>invokedynamic</code> instructions with per-site inline
+     * caches (see {@link IndyBootstrap}) for attribute access, binary operators, comparisons and
+     * subscripts, instead of calling the generic PyObject methods.
+     */
+    public static boolean compileInvokedynamic = false;
+
+    /**
+     * If true, the classes of imported modules are all defined in one class loader per system
+     * state, instead of each in a class loader of its own.
+     */
+    public static boolean sharedModuleLoader = true;
+
+    /**
+     * A zip of the library modules with their compiled classes (as made by the
+     * <code>startup-snapshot</code> build target), put on <code>sys.path</code> ahead of
+     * <code>Lib</code>, or <code>null</code> for none. A relative name is resolved against
+     * <code>python.home</code>. The <code>--snapshot</code> option sets the default name.
+     */
+    public static String startupArchive = null;
+    public static final String startupArchiveDefault = "jython-lib.zip";
+
+    /**
+     * The number of threads that run finalizers (<code>__del__</code> methods and the closing of
+     * generators), or 0 to run them on the JVM finalizer thread. The JVM has only one finalizer
+     * thread, shared with the finalizers of all Java objects, so a slow <code>__del__</code>
+     * holds up every other finalizer behind it.
+     */
+    public static int finalizerThreads = 0;
+
+    /**
+     * If true, a generator that runs to its end releases its finalize trigger, so that it is
+     * reclaimed in one collection rather than being kept until the finalizer has run.
+     */
+    public static boolean releaseFinishedGenerators = true;
+
+    /**
+     * If true, the instance dicts of a class share the keys the instances are given (as a
+     * {@link SharedKeyMap}), so that each instance stores only an array of values until it is
+     * given a key that is not a string or a great many attributes.
+     */
+    public static boolean sharedInstanceKeys = true;
+
     //
     // ####### END OF OPTIONS
     //
@@ -133,6 +191,18 @@ public class Options {
         return prop.equalsIgnoreCase("true") || prop.equalsIgnoreCase("yes");
     }
 
+    private static int getIntOption(String name, int defaultValue) {
+        String prop = PySystemState.registry.getProperty("python." + name);
+        if (prop == null) {
+            return defaultValue;
+        }
+        try {
+            return Integer.parseInt(prop.trim());
+        } catch (NumberFormatException e) {
+            throw Py.ValueError("Illegal " + name + " option setting: '" + prop + "'");
+        }
+    }
+
     private static String getStringOption(String name, String defaultValue) {
         String prop = PySystemState.registry.getProperty("python." + name);
         if (prop == null) {
@@ -202,6 +272,28 @@ public class Options {
 
         Options.sreCacheSpec = getStringOption("sre.cachespec", Options.sreCacheSpec);
 
+        Options.sreCompileThreshold = getIntOption("sre.compile.threshold",
+                Options.sreCompileThreshold);
+
+        Options.jsr223CacheSpec = getStringOption("jsr223.cachespec", Options.jsr223CacheSpec);
+
         Options.importSite = getBooleanOption("import.site", Options.importSite);
+
+        Options.sharedModuleLoader = getBooleanOption("import.sharedLoader",
+                Options.sharedModuleLoader);
+
+        Options.startupArchive = getStringOption("startup.archive", Options.startupArchive);
+
+        Options.compileInvokedynamic = getBooleanOption("compile.invokedynamic",
+                Options.compileInvokedynamic);
+
+        Options.finalizerThreads = getIntOption("finalization.threads",
+                Options.finalizerThreads);
+
+        Options.releaseFinishedGenerators = getBooleanOption(
+                "finalization.releaseFinishedGenerators", Options.releaseFinishedGenerators);
+
+        Options.sharedInstanceKeys = getBooleanOption("instance.sharedKeys",
+                Options.sharedInstanceKeys);
     }
 }
@@ -716,27 +716,27 @@ public final class Py {
     }
 
     public static final PyLong newInteger(int i) {
-        return new PyLong(i);
+        return PyLong.valueOf(i);
     }
 
     public static PyObject newInteger(long i) {
-        return new PyLong(i);
+        return PyLong.valueOf(i);
     }
 
     public static PyLong newLong(String s) {
-        return new PyLong(s);
+        return PyLong.valueOf(new java.math.BigInteger(s));
     }
 
     public static PyLong newLong(java.math.BigInteger i) {
-        return new PyLong(i);
+        return PyLong.valueOf(i);
     }
 
     public static PyLong newLong(int i) {
-        return new PyLong(i);
+        return PyLong.valueOf(i);
     }
 
     public static PyLong newLong(long l) {
-        return new PyLong(l);
+        return PyLong.valueOf(l);
     }
 
     public static PyComplex newImaginary(double v) {
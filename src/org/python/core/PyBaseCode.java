@@ -27,6 +27,55 @@ public abstract class PyBaseCode extends PyCode {
     public int co_nlocals;
     public boolean varargs,  varkwargs;
 
+    /**
+     * Cached global lookups, indexed by the slots the compiler assigns to the global names this
+     * code reads. Grown on demand; entries are immutable so races only lose cache fills.
+     */
+    private volatile GlobalCacheEntry[] globalCache = new GlobalCacheEntry[0];
+
+    /**
+     * The value a global name had, and the versions of the globals and builtins it was found in
+     * at the time. The builtins are null when the name was found in the globals.
+     */
+    static final class GlobalCacheEntry {
+
+        final PyStringMap globals;
+        final long globalsVersion;
+        final PyStringMap builtins;
+        final long builtinsVersion;
+        final PyObject value;
+
+        GlobalCacheEntry(PyStringMap globals, long globalsVersion, PyStringMap builtins,
+                long builtinsVersion, PyObject value) {
+            this.globals = globals;
+            this.globalsVersion = globalsVersion;
+            this.builtins = builtins;
+            this.builtinsVersion = builtinsVersion;
+            this.value = value;
+        }
+
+        boolean isValid(PyObject globals, PyObject builtins) {
+            return this.globals == globals && globalsVersion == this.globals.getVersion()
+                    && (this.builtins == null || this.builtins == builtins
+                            && builtinsVersion == this.builtins.getVersion());
+        }
+    }
+
+    GlobalCacheEntry getGlobalCacheEntry(int slot) {
+        GlobalCacheEntry[] cache = globalCache;
+        return slot < cache.length ? cache[slot] : null;
+    }
+
+    void setGlobalCacheEntry(int slot, GlobalCacheEntry entry) {
+        GlobalCacheEntry[] cache = globalCache;
+        if (slot >= cache.length) {
+            GlobalCacheEntry[] grown = new GlobalCacheEntry[slot + 1];
+            System.arraycopy(cache, 0, grown, 0, cache.length);
+            globalCache = cache = grown;
+        }
+        cache[slot] = entry;
+    }
+
 
     public boolean hasFreevars() {
         return co_freevars != null && co_freevars.length > 0;
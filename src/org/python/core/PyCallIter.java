@@ -20,14 +20,14 @@ public class PyCallIter extends PyIterator {
 
     public PyObject __next__() {
         if (callable == null) {
-            throw Py.StopIteration();
+            return null;
         }
 
         PyObject result;
         result = callable.__call__();
         if (result == null || sentinel.richCompare(result, CompareOp.EQ).__bool__()) {
             callable = null;
-            throw Py.StopIteration();
+            return null;
         }
         return result;
     }
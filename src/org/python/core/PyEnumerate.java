@@ -61,20 +61,29 @@ public class PyEnumerate extends PyIterator {
     }
 
     public PyObject __next__() {
-        return enumerate___next__();
+        return enumerate_next();
     }
 
     @ExposedMethod(doc = BuiltinDocs.enumerate___next___doc)
     final PyObject enumerate___next__() {
-        PyObject nextItem;
-
-        nextItem = sit.__next__();
-        if (nextItem == null) {
+        PyObject next = enumerate_next();
+        if (next == null) {
             if (sit instanceof PyIterator && ((PyIterator)sit).stopException != null) {
                 throw ((PyIterator)sit).stopException;
             }
             throw Py.StopIteration();
         }
+        return next;
+    }
+
+    /** The next pair, or <code>null</code> at the end (without raising StopIteration). */
+    private PyObject enumerate_next() {
+        PyObject nextItem;
+
+        nextItem = sit.__next__();
+        if (nextItem == null) {
+            return null;
+        }
 
         PyObject next = new PyTuple(index, nextItem);
         index = index.__radd__(Py.newInteger(1));
@@ -417,17 +417,23 @@ public class PyFile extends PyObject implements FinalizableBuiltin, Traverseproc
 
     @Override
     public PyObject __next__() {
-        return file___next__();
+        return file_next();
     }
 
     @ExposedMethod(doc = BuiltinDocs.TextIOBase___next___doc)
     final PyObject file___next__() {
-        checkClosed();
-        String next = file.readline(-1);
-        if (next.length() == 0) {
+        PyObject next = file_next();
+        if (next == null) {
             throw Py.StopIteration();
         }
-        return new PyBytes(next);
+        return next;
+    }
+
+    /** The next line, or <code>null</code> at the end (without raising StopIteration). */
+    private PyObject file_next() {
+        checkClosed();
+        String next = file.readline(-1);
+        return next.length() == 0 ? null : new PyBytes(next);
     }
 
     @ExposedMethod(names = {"__enter__", "__iter__", "xreadlines"},
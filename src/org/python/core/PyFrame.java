@@ -282,6 +282,20 @@ public class PyFrame extends PyObject implements Traverseproc {
         throw Py.NameError(String.format(NAME_ERROR_MSG, index));
     }
 
+    /**
+     * Variant of {@link #getname(String)} used by compiled code, which passes the slot it assigned
+     * to the name in this frame's code for caching the global lookup.
+     */
+    public PyObject getname(String index, int slot) {
+        if (f_locals != null && f_locals != f_globals) {
+            PyObject ret = f_locals.__finditem__(index);
+            if (ret != null) {
+                return ret;
+            }
+        }
+        return getglobal(index, slot);
+    }
+
     public PyObject getglobal(String index) {
         PyObject ret = doGetglobal(index);
         if (ret != null) {
@@ -290,6 +304,49 @@ public class PyFrame extends PyObject implements Traverseproc {
         throw Py.NameError(String.format(NAME_ERROR_MSG, index));
     }
 
+    /**
+     * Variant of {@link #getglobal(String)} used by compiled code, which passes the slot it
+     * assigned to the name in this frame's code. While the globals and builtins are the ones a
+     * previous lookup was made in and have not been modified since, the cached value is
+     * returned without looking up the name.
+     */
+    public PyObject getglobal(String index, int slot) {
+        // Function frames start without builtins; resolve them so cached builtins stay valid
+        if (f_builtins == null) {
+            f_builtins = Py.getThreadState().systemState.builtins;
+        }
+        PyBaseCode.GlobalCacheEntry entry = f_code.getGlobalCacheEntry(slot);
+        if (entry != null && entry.isValid(f_globals, f_builtins)) {
+            return entry.value;
+        }
+        if (!(f_globals instanceof PyStringMap)) {
+            return getglobal(index);
+        }
+
+        // Versions are read before the lookups so that a concurrent change invalidates the entry
+        PyStringMap globals = (PyStringMap)f_globals;
+        long globalsVersion = globals.getVersion();
+        PyObject ret = globals.__finditem__(index);
+        if (ret != null) {
+            f_code.setGlobalCacheEntry(slot,
+                    new PyBaseCode.GlobalCacheEntry(globals, globalsVersion, null, 0, ret));
+            return ret;
+        }
+
+        if (!(f_builtins instanceof PyStringMap)) {
+            return getglobal(index);
+        }
+        PyStringMap builtins = (PyStringMap)f_builtins;
+        long builtinsVersion = builtins.getVersion();
+        ret = builtins.__finditem__(index);
+        if (ret != null) {
+            f_code.setGlobalCacheEntry(slot, new PyBaseCode.GlobalCacheEntry(globals,
+                    globalsVersion, builtins, builtinsVersion, ret));
+            return ret;
+        }
+        throw Py.NameError(String.format(NAME_ERROR_MSG, index));
+    }
+
     private PyObject doGetglobal(String index) {
         PyObject ret = f_globals.__finditem__(index);
         if (ret != null) {
@@ -227,7 +227,7 @@ public class PyGenerator extends PyIterator implements FinalizableBuiltin {
     @Override
     public PyObject __next__() {
         try {
-            return gen_send_ex(Py.getThreadState(), Py.None);
+            return gen_send_ex(Py.getThreadState(), Py.None, true);
         } catch (PyException e) {
             if (e.match(Py.StopIteration)) {
                 return null;
@@ -251,18 +251,46 @@ public class PyGenerator extends PyIterator implements FinalizableBuiltin {
         return gi_frame.f_yieldfrom;
     }
 
+    /**
+     * Drop the frame of a generator that has run to its end. There is nothing left for the
+     * builtin finalizer to close, so the finalize trigger is released (see
+     * {@link Options#releaseFinishedGenerators}).
+     */
+    private void finished() {
+        gi_frame = null;
+        if (Options.releaseFinishedGenerators) {
+            FinalizeTrigger.releaseBuiltinTrigger(this);
+        }
+    }
+
     private PyObject gen_send_ex(ThreadState state, Object value) {
+        return gen_send_ex(state, value, false);
+    }
+
+    /**
+     * Resume the generator with <code>value</code>. When it is (or becomes) exhausted, this
+     * raises <code>StopIteration</code>, with the return value of the generator if there is
+     * one, or if <code>stopWithNull</code>, returns <code>null</code> and creates no exception
+     * (for {@link #__next__()}, which loops call).
+     */
+    private PyObject gen_send_ex(ThreadState state, Object value, boolean stopWithNull) {
         if (gi_running) {
             throw Py.ValueError(tp() + " already executing");
         }
         if (gi_frame == null) {
+            if (stopWithNull) {
+                return null;
+            }
             throw Py.StopIteration();
         }
         if (gi_frame.previousException != null) {
             state.exceptions.offerFirst(gi_frame.previousException);
         }
         if (gi_frame.f_lasti == -1) {
-            gi_frame = null;
+            finished();
+            if (stopWithNull) {
+                return null;
+            }
             throw Py.StopIteration();
         }
         // if value is null, means the input is passed implicitly by frame, don't reset to None
@@ -274,7 +302,7 @@ public class PyGenerator extends PyIterator implements FinalizableBuiltin {
         try {
             result = gi_frame.f_code.call(state, gi_frame, closure);
         } catch (PyException pye) {
-            gi_frame = null;
+            finished();
             if (this instanceof PyCoroutine && pye.match(Py.StopIteration)) {
 //                PyException stop = pye;
                 pye = Py.RuntimeError("coroutine raised StopIteration"); // PEP-479
@@ -289,11 +317,14 @@ public class PyGenerator extends PyIterator implements FinalizableBuiltin {
         if (result == null && gi_frame.f_yieldfrom != null) {
             gi_frame.f_yieldfrom = null;
             gi_frame.f_lasti++;
-            return gen_send_ex(state, value);
+            return gen_send_ex(state, value, stopWithNull);
         }
 
         if (gi_frame.f_lasti == -1) {
-            gi_frame = null;
+            finished();
+            if (stopWithNull) {
+                return null;
+            }
             if (result != Py.None) {
                 throw Py.StopIteration(result);
             } else {
@@ -22,7 +22,9 @@ import java.math.BigInteger;
 import java.nio.ByteOrder;
 
 /**
- * A builtin python long. This is implemented as a java.math.BigInteger.
+ * A builtin python long. Values that fit in a Java {@code long} are held in a primitive field and
+ * operated on with overflow-checked arithmetic; only values outside that range are held as a
+ * java.math.BigInteger.
  */
 @Untraversable
 @ExposedType(name = "long", doc = BuiltinDocs.int_doc)
@@ -45,15 +47,64 @@ public class PyLong extends PyObject {
     @Deprecated
     public static final BigInteger maxULong = MAX_ULONG;
 
+    /** Smallest value held in the small-integer cache. */
+    private static final int CACHE_MIN = -5;
+    /** Largest value held in the small-integer cache. */
+    private static final int CACHE_MAX = 1024;
+    /** Preallocated instances for the values CACHE_MIN..CACHE_MAX. */
+    private static final PyLong[] SMALL_VALUES = new PyLong[CACHE_MAX - CACHE_MIN + 1];
+
+    static {
+        for (int i = 0; i < SMALL_VALUES.length; i++) {
+            SMALL_VALUES[i] = new PyLong(TYPE, (long)(i + CACHE_MIN));
+        }
+    }
+
+    /** The value if it does not fit in a Java long, otherwise null. */
     private final BigInteger value;
 
+    /** The value if it fits in a Java long (only meaningful when {@link #value} is null). */
+    private final long lvalue;
+
     public BigInteger getValue() {
-        return value;
+        return value != null ? value : BigInteger.valueOf(lvalue);
+    }
+
+    /**
+     * Return a long for the given value, sharing a cached instance for small values.
+     */
+    public static PyLong valueOf(long v) {
+        if (v >= CACHE_MIN && v <= CACHE_MAX) {
+            return SMALL_VALUES[(int)v - CACHE_MIN];
+        }
+        return new PyLong(TYPE, v);
+    }
+
+    /**
+     * Return a long for the given value, using the primitive representation if it fits.
+     */
+    public static PyLong valueOf(BigInteger v) {
+        if (v.bitLength() < 64) {
+            return valueOf(v.longValue());
+        }
+        return new PyLong(TYPE, v);
     }
 
     public PyLong(PyType subType, BigInteger v) {
         super(subType);
-        value = v;
+        if (v.bitLength() < 64) {
+            value = null;
+            lvalue = v.longValue();
+        } else {
+            value = v;
+            lvalue = 0;
+        }
+    }
+
+    public PyLong(PyType subType, long v) {
+        super(subType);
+        value = null;
+        lvalue = v;
     }
 
     public PyLong(BigInteger v) {
@@ -65,7 +116,7 @@ public class PyLong extends PyObject {
     }
 
     public PyLong(long v) {
-        this(BigInteger.valueOf(v));
+        this(TYPE, v);
     }
 
     public PyLong(String s) {
@@ -235,7 +286,7 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(defaults={"false"}, doc = BuiltinDocs.int_to_bytes_doc)
     final PyObject long_to_bytes(int length, String byteorder, boolean signed) {
-        byte[] origin = value.toByteArray();
+        byte[] origin = getValue().toByteArray();
         if (origin[0] == 0) {
             byte[] tmp = origin;
             origin = new byte[tmp.length - 1];
@@ -282,7 +333,7 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(names = "__repr__", doc = BuiltinDocs.int___repr___doc)
     final String long_toString() {
-        return getValue().toString();
+        return value == null ? Long.toString(lvalue) : value.toString();
     }
 
     @Override
@@ -292,7 +343,19 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(doc = BuiltinDocs.int___hash___doc)
     final int long___hash__() {
-        return getValue().hashCode();
+        return value == null ? hashLong(lvalue) : value.hashCode();
+    }
+
+    /**
+     * Compute the hash a BigInteger of the same value would have, so that the hash of a long does
+     * not depend on its representation (and agrees with {@link PyFloat} for integral values).
+     */
+    private static int hashLong(long v) {
+        long mag = v < 0 ? -v : v; // Long.MIN_VALUE stays negative but has the right bit pattern
+        int hi = (int)(mag >>> 32);
+        int lo = (int)mag;
+        int h = hi != 0 ? 31 * hi + lo : lo;
+        return v < 0 ? -h : h;
     }
 
     @Override
@@ -302,11 +365,14 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(doc = BuiltinDocs.int___bool___doc)
     public boolean long___bool__() {
-        return !getValue().equals(BigInteger.ZERO);
+        return value == null ? lvalue != 0 : value.signum() != 0;
     }
 
     public double doubleValue() {
-        double v = getValue().doubleValue();
+        if (value == null) {
+            return lvalue;
+        }
+        double v = value.doubleValue();
         if (Double.isInfinite(v)) {
             throw Py.OverflowError("long int too large to convert to float");
         }
@@ -349,12 +415,27 @@ public class PyLong extends PyObject {
         return getLong(min, max, "long int too large to convert");
     }
 
+    /**
+     * The narrowest Java integral type the value converts to in {@link #__tojava__(Class)}: 0
+     * for byte, 1 for short, 2 for int, 3 for long, or 4 if the value is too large for a long.
+     */
+    int javaWidth() {
+        if (value != null) {
+            return 4;
+        } else if (lvalue >= Byte.MIN_VALUE && lvalue <= 0xFF) {
+            return 0;
+        } else if (lvalue >= Short.MIN_VALUE && lvalue <= Short.MAX_VALUE) {
+            return 1;
+        } else if (lvalue >= Integer.MIN_VALUE && lvalue <= Integer.MAX_VALUE) {
+            return 2;
+        }
+        return 3;
+    }
+
     public long getLong(long min, long max, String overflowMsg) {
-        if (getValue().compareTo(MAX_LONG) <= 0 && getValue().compareTo(MIN_LONG) >= 0) {
-            long v = getValue().longValue();
-            if (v >= min && v <= max) {
-                return v;
-            }
+        // A BigInteger value is always outside the range of a Java long
+        if (value == null && lvalue >= min && lvalue <= max) {
+            return lvalue;
         }
         throw Py.OverflowError(overflowMsg);
     }
@@ -432,6 +513,27 @@ public class PyLong extends PyObject {
         return other instanceof PyLong || other instanceof PyInteger;
     }
 
+    /**
+     * Whether other is an integer whose value is held in a Java long, making it eligible for the
+     * primitive fast paths.
+     */
+    private static final boolean isSmall(PyObject other) {
+        if (other instanceof PyLong) {
+            return ((PyLong)other).value == null;
+        }
+        return other instanceof PyInteger;
+    }
+
+    /**
+     * The value of an integer for which {@link #isSmall(PyObject)} is true.
+     */
+    private static final long smallValue(PyObject other) {
+        if (other instanceof PyLong) {
+            return ((PyLong)other).lvalue;
+        }
+        return ((PyInteger)other).getValue();
+    }
+
     private static final BigInteger coerce(PyObject other) {
         if (other instanceof PyLong) {
             return ((PyLong)other).getValue();
@@ -449,6 +551,13 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___add___doc)
     final PyObject long___add__(PyObject right) {
+        if (value == null && isSmall(right)) {
+            try {
+                return Py.newLong(Math.addExact(lvalue, smallValue(right)));
+            } catch (ArithmeticException e) {
+                // overflow: fall through to BigInteger arithmetic
+            }
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -472,6 +581,13 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___sub___doc)
     final PyObject long___sub__(PyObject right) {
+        if (value == null && isSmall(right)) {
+            try {
+                return Py.newLong(Math.subtractExact(lvalue, smallValue(right)));
+            } catch (ArithmeticException e) {
+                // overflow: fall through to BigInteger arithmetic
+            }
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -485,6 +601,13 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___rsub___doc)
     final PyObject long___rsub__(PyObject left) {
+        if (value == null && isSmall(left)) {
+            try {
+                return Py.newLong(Math.subtractExact(smallValue(left), lvalue));
+            } catch (ArithmeticException e) {
+                // overflow: fall through to BigInteger arithmetic
+            }
+        }
         if (!canCoerce(left)) {
             throw Py.TypeError(String.format("unsupported operand type(s) for -: '%s' and '%s'",
                     left.getType().getName(), getType().getName()));
@@ -503,6 +626,13 @@ public class PyLong extends PyObject {
             return ((PySequence)right).repeat(coerceInt(this));
         }
 
+        if (value == null && isSmall(right)) {
+            try {
+                return Py.newLong(Math.multiplyExact(lvalue, smallValue(right)));
+            } catch (ArithmeticException e) {
+                // overflow: fall through to BigInteger arithmetic
+            }
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -519,6 +649,13 @@ public class PyLong extends PyObject {
         if (left instanceof PySequence) {
             return ((PySequence)left).repeat(coerceInt(this));
         }
+        if (value == null && isSmall(left)) {
+            try {
+                return Py.newLong(Math.multiplyExact(smallValue(left), lvalue));
+            } catch (ArithmeticException e) {
+                // overflow: fall through to BigInteger arithmetic
+            }
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -545,6 +682,14 @@ public class PyLong extends PyObject {
         return x.divide(y);
     }
 
+    /**
+     * Whether x // y may be computed in long arithmetic: y must be non-zero (so that the
+     * BigInteger path raises ZeroDivisionError) and the quotient must not overflow.
+     */
+    private static boolean canDivideSmall(long x, long y) {
+        return y != 0 && !(x == Long.MIN_VALUE && y == -1);
+    }
+
     @Override
     public PyObject __floordiv__(PyObject right) {
         return long___floordiv__(right);
@@ -552,6 +697,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___floordiv___doc)
     final PyObject long___floordiv__(PyObject right) {
+        if (value == null && isSmall(right) && canDivideSmall(lvalue, smallValue(right))) {
+            return Py.newLong(Math.floorDiv(lvalue, smallValue(right)));
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -565,6 +713,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___rfloordiv___doc)
     final PyObject long___rfloordiv__(PyObject left) {
+        if (value == null && isSmall(left) && canDivideSmall(smallValue(left), lvalue)) {
+            return Py.newLong(Math.floorDiv(smallValue(left), lvalue));
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -601,6 +752,21 @@ public class PyLong extends PyObject {
         return new PyFloat(ad);
     }
 
+    /** Largest magnitude of a long that converts exactly to a double. */
+    private static final long MAX_EXACT_DOUBLE = 1L << 53;
+
+    /**
+     * Divide two longs as floats when both convert exactly, so that the result is correctly
+     * rounded; otherwise return null to take the BigInteger path.
+     */
+    private static PyFloat true_divide(long a, long b) {
+        if (b == 0 || a > MAX_EXACT_DOUBLE || a < -MAX_EXACT_DOUBLE || b > MAX_EXACT_DOUBLE
+                || b < -MAX_EXACT_DOUBLE) {
+            return null;
+        }
+        return new PyFloat((double)a / (double)b);
+    }
+
     @Override
     public PyObject __truediv__(PyObject right) {
         return long___truediv__(right);
@@ -608,6 +774,12 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___truediv___doc)
     final PyObject long___truediv__(PyObject right) {
+        if (value == null && isSmall(right)) {
+            PyFloat result = true_divide(lvalue, smallValue(right));
+            if (result != null) {
+                return result;
+            }
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -621,6 +793,12 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___rtruediv___doc)
     final PyObject long___rtruediv__(PyObject left) {
+        if (value == null && isSmall(left)) {
+            PyFloat result = true_divide(smallValue(left), lvalue);
+            if (result != null) {
+                return result;
+            }
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -638,6 +816,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___mod___doc)
     final PyObject long___mod__(PyObject right) {
+        if (value == null && isSmall(right) && canDivideSmall(lvalue, smallValue(right))) {
+            return Py.newLong(Math.floorMod(lvalue, smallValue(right)));
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -652,6 +833,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___rmod___doc)
     final PyObject long___rmod__(PyObject left) {
+        if (value == null && isSmall(left) && canDivideSmall(smallValue(left), lvalue)) {
+            return Py.newLong(Math.floorMod(smallValue(left), lvalue));
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -666,6 +850,11 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___divmod___doc)
     final PyObject long___divmod__(PyObject right) {
+        if (value == null && isSmall(right) && canDivideSmall(lvalue, smallValue(right))) {
+            long rightv = smallValue(right);
+            return new PyTuple(Py.newLong(Math.floorDiv(lvalue, rightv)),
+                    Py.newLong(Math.floorMod(lvalue, rightv)));
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -682,6 +871,11 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___rdivmod___doc)
     final PyObject long___rdivmod__(PyObject left) {
+        if (value == null && isSmall(left) && canDivideSmall(smallValue(left), lvalue)) {
+            long leftv = smallValue(left);
+            return new PyTuple(Py.newLong(Math.floorDiv(leftv, lvalue)),
+                    Py.newLong(Math.floorMod(leftv, lvalue)));
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -708,6 +902,13 @@ public class PyLong extends PyObject {
             return null;
         }
 
+        if (modulo == null && value == null && isSmall(right)) {
+            PyObject result = pow(lvalue, smallValue(right));
+            if (result != null) {
+                return result;
+            }
+        }
+
         return _pow(getValue(), coerce(right), modulo, this, right);
     }
 
@@ -718,6 +919,12 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___rpow___doc)
     final PyObject long___rpow__(PyObject left) {
+        if (value == null && isSmall(left)) {
+            PyObject result = pow(smallValue(left), lvalue);
+            if (result != null) {
+                return result;
+            }
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -725,6 +932,31 @@ public class PyLong extends PyObject {
         return _pow(coerce(left), getValue(), null, left, this);
     }
 
+    /**
+     * Raise a long to a non-negative long power by repeated squaring, or return null if the
+     * exponent is negative or the result overflows, to take the general path.
+     */
+    private static PyObject pow(long base, long exp) {
+        if (exp < 0) {
+            return null;
+        }
+        long result = 1;
+        try {
+            while (exp > 0) {
+                if ((exp & 1) != 0) {
+                    result = Math.multiplyExact(result, base);
+                }
+                exp >>= 1;
+                if (exp > 0) {
+                    base = Math.multiplyExact(base, base);
+                }
+            }
+        } catch (ArithmeticException e) {
+            return null;
+        }
+        return Py.newLong(result);
+    }
+
     public static PyObject _pow(BigInteger value, BigInteger y, PyObject modulo, PyObject left,
             PyObject right) {
         if (y.compareTo(BigInteger.ZERO) < 0) {
@@ -795,6 +1027,12 @@ public class PyLong extends PyObject {
         if (rightv < 0) {
             throw Py.ValueError("negative shift count");
         }
+        if (value == null && rightv < 63) {
+            long result = lvalue << rightv;
+            if (result >> rightv == lvalue) {
+                return Py.newLong(result);
+            }
+        }
         return Py.newLong(getValue().shiftLeft(rightv));
     }
 
@@ -823,6 +1061,9 @@ public class PyLong extends PyObject {
         if (rightv < 0) {
             throw Py.ValueError("negative shift count");
         }
+        if (value == null) {
+            return Py.newLong(lvalue >> Math.min(rightv, 63));
+        }
         return Py.newLong(getValue().shiftRight(rightv));
     }
 
@@ -844,6 +1085,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___and___doc)
     final PyObject long___and__(PyObject right) {
+        if (value == null && isSmall(right)) {
+            return Py.newLong(lvalue & smallValue(right));
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -857,6 +1101,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___rand___doc)
     final PyObject long___rand__(PyObject left) {
+        if (value == null && isSmall(left)) {
+            return Py.newLong(smallValue(left) & lvalue);
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -870,6 +1117,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___xor___doc)
     final PyObject long___xor__(PyObject right) {
+        if (value == null && isSmall(right)) {
+            return Py.newLong(lvalue ^ smallValue(right));
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -883,6 +1133,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___rxor___doc)
     final PyObject long___rxor__(PyObject left) {
+        if (value == null && isSmall(left)) {
+            return Py.newLong(smallValue(left) ^ lvalue);
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -896,6 +1149,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___or___doc)
     final PyObject long___or__(PyObject right) {
+        if (value == null && isSmall(right)) {
+            return Py.newLong(lvalue | smallValue(right));
+        }
         if (!canCoerce(right)) {
             return null;
         }
@@ -909,6 +1165,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(type = MethodType.BINARY, doc = BuiltinDocs.int___ror___doc)
     final PyObject long___ror__(PyObject left) {
+        if (value == null && isSmall(left)) {
+            return Py.newLong(smallValue(left) | lvalue);
+        }
         if (!canCoerce(left)) {
             return null;
         }
@@ -922,6 +1181,9 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(doc = BuiltinDocs.int___neg___doc)
     final PyObject long___neg__() {
+        if (value == null && lvalue != Long.MIN_VALUE) {
+            return Py.newLong(-lvalue);
+        }
         return Py.newLong(getValue().negate());
     }
 
@@ -942,7 +1204,7 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(doc = BuiltinDocs.int___abs___doc)
     final PyObject long___abs__() {
-        if (getValue().signum() == -1) {
+        if (value == null ? lvalue < 0 : value.signum() == -1) {
             return long___neg__();
         }
         return long___int__();
@@ -955,7 +1217,10 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(doc = BuiltinDocs.int___invert___doc)
     final PyObject long___invert__() {
-        return Py.newLong(getValue().not());
+        if (value == null) {
+            return Py.newLong(~lvalue);
+        }
+        return Py.newLong(value.not());
     }
 
     @Override
@@ -965,7 +1230,10 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(doc = BuiltinDocs.int___int___doc)
     final PyObject long___int__() {
-        return getType() == TYPE ? this : Py.newLong(getValue());
+        if (getType() == TYPE) {
+            return this;
+        }
+        return value == null ? Py.newLong(lvalue) : Py.newLong(value);
     }
 
     @Override
@@ -974,14 +1242,17 @@ public class PyLong extends PyObject {
     }
 
     private int long_compare(PyObject other) {
+        if (value == null && isSmall(other)) {
+            return Long.compare(lvalue, smallValue(other));
+        }
         if (other instanceof PyInteger) {
-            return value.compareTo(BigInteger.valueOf(((PyInteger) other).getValue()));
+            return getValue().compareTo(BigInteger.valueOf(((PyInteger) other).getValue()));
         }
         if (other instanceof PyLong) {
-            return value.compareTo(((PyLong) other).getValue());
+            return getValue().compareTo(((PyLong) other).getValue());
         }
         if (other instanceof PyFloat) {
-            return new BigDecimal(value).compareTo(new BigDecimal(((PyFloat) other).getValue()));
+            return new BigDecimal(getValue()).compareTo(new BigDecimal(((PyFloat) other).getValue()));
         }
         if (other instanceof PyComplex) {
             PyComplex complex = (PyComplex) other;
@@ -1034,7 +1305,7 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(doc = BuiltinDocs.int___str___doc)
     public PyUnicode long___str__() {
-        return new PyUnicode(getValue().toString());
+        return new PyUnicode(long_toString());
     }
 
     @Override
@@ -1069,6 +1340,10 @@ public class PyLong extends PyObject {
 
     @ExposedMethod(doc = BuiltinDocs.int_bit_length_doc)
     final int long_bit_length() {
+        if (value == null) {
+            // Long.MIN_VALUE negates to itself, whose 64 significant bits are the right answer
+            return 64 - Long.numberOfLeadingZeros(lvalue < 0 ? -lvalue : lvalue);
+        }
         BigInteger v = value;
         if (v.compareTo(BigInteger.ZERO) == -1) {
             v = v.negate();
@@ -1094,7 +1369,7 @@ public class PyLong extends PyObject {
             // Bytes mode if formatSpec argument is not unicode.
             fi.setBytes(!(formatSpec instanceof PyUnicode));
             // Convert as per specification.
-            fi.format(value);
+            fi.format(getValue());
             f = fi;
 
         } else {
@@ -1104,7 +1379,7 @@ public class PyLong extends PyObject {
                 // Bytes mode if formatSpec argument is not unicode.
                 ff.setBytes(!(formatSpec instanceof PyUnicode));
                 // Convert as per specification.
-                ff.format(value.doubleValue());
+                ff.format(doubleValue());
                 f = ff;
 
             } else {
@@ -1124,6 +1399,9 @@ public class PyLong extends PyObject {
 
     @Override
     public int asIndex(PyObject err) {
+        if (value == null && lvalue >= Integer.MIN_VALUE && lvalue <= Integer.MAX_VALUE) {
+            return (int)lvalue;
+        }
         boolean tooLow = getValue().compareTo(PyInteger.MIN_INT) < 0;
         boolean tooHigh = getValue().compareTo(PyInteger.MAX_INT) > 0;
         if (tooLow || tooHigh) {
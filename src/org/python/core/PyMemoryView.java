@@ -71,8 +71,19 @@ public class PyMemoryView extends PySequence implements BufferProtocol, Traverse
          * are necessary for navigation, but only ask for read access. If the object is writable,
          * the PyBuffer will be writable.
          */
-        int flag = pybuf instanceof PyBytes ? PyBUF.FULL_RO : PyBUF.FULL;
-        backing = pybuf.getBuffer(flag);
+        if (pybuf instanceof PyBytes) {
+            backing = pybuf.getBuffer(PyBUF.FULL_RO);
+        } else {
+            try {
+                backing = pybuf.getBuffer(PyBUF.FULL);
+            } catch (PyException pye) {
+                // The object may only be able to offer read-only access (e.g. a read-only mmap)
+                if (!pye.match(Py.BufferError)) {
+                    throw pye;
+                }
+                backing = pybuf.getBuffer(PyBUF.FULL_RO);
+            }
+        }
         view = backing.getNIOByteBuffer().order(ByteOrder.nativeOrder());
     }
 
@@ -1,10 +1,12 @@
 // Copyright (c) Corporation for National Research Initiatives
 package org.python.core;
 
-import java.lang.reflect.InvocationTargetException;
+import java.lang.invoke.MethodHandle;
 import java.lang.reflect.Method;
 import java.lang.reflect.Modifier;
 import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentMap;
 
 import org.python.util.Generic;
 
@@ -21,6 +23,19 @@ public class PyReflectedFunction extends PyObject implements Traverseproc {
     /** Whether __call__ should act as if this is called as a static method. */
     private boolean calledStatically;
 
+    /** The overloads chosen for earlier calls, shared with copies having the same argslist. */
+    private volatile OverloadCache overloads = new OverloadCache();
+
+    /** The handles of the super__ methods of proxy classes, by the method each stands for. */
+    private static final ClassValue<ConcurrentMap<Method, MethodHandle>> superMethods =
+            new ClassValue<ConcurrentMap<Method, MethodHandle>>() {
+
+                @Override
+                protected ConcurrentMap<Method, MethodHandle> computeValue(Class<?> type) {
+                    return new ConcurrentHashMap<Method, MethodHandle>();
+                }
+            };
+
     protected PyReflectedFunction(String name) {
         __name__ = name;
     }
@@ -68,6 +83,7 @@ public class PyReflectedFunction extends PyObject implements Traverseproc {
         func.nargs = nargs;
         func.argslist = new ReflectedArgs[nargs];
         System.arraycopy(argslist, 0, func.argslist, 0, nargs);
+        func.overloads = overloads;
         return func;
     }
 
@@ -152,47 +168,169 @@ public class PyReflectedFunction extends PyObject implements Traverseproc {
         }
         argslist[i] = args;
         nargs = nn;
+        overloads = new OverloadCache();
     }
 
     @Override
     public PyObject __call__(PyObject self, PyObject[] args, String[] keywords) {
         ReflectedCallData callData = new ReflectedCallData();
-        ReflectedArgs match = null;
-        for (int i = 0; i < nargs && match == null; i++) {
-            // System.err.println(rargs.toString());
-            if (argslist[i].matches(self, args, keywords, callData)) {
-                match = argslist[i];
-            }
+        OverloadCache cache = overloads;
+        ReflectedArgs match = keywords.length == 0 ? cache.lookup(self, args) : null;
+        if (match != null && !match.matches(self, args, keywords, callData)) {
+            match = null;
+            callData = new ReflectedCallData();
         }
         if (match == null) {
-            throwError(callData.errArg, args.length, self != null, keywords.length != 0);
-        }
-        Object cself = callData.self;
-        Method m = (Method)match.data;
-
-        // If this is a direct call to a Java class instance method with a PyProxy instance as the
-        // arg, use the super__ version to actually route this through the method on the class.
-        if (self == null && cself != null && cself instanceof PyProxy
-                && !__name__.startsWith("super__")
-                && match.declaringClass != cself.getClass()) {
-            String mname = ("super__" + __name__);
-            try {
-                m = cself.getClass().getMethod(mname, m.getParameterTypes());
-            } catch (Exception e) {
-                throw Py.JavaError(e);
+            for (int i = 0; i < nargs && match == null; i++) {
+                if (argslist[i].matches(self, args, keywords, callData)) {
+                    match = argslist[i];
+                }
+            }
+            if (match == null) {
+                throwError(callData.errArg, args.length, self != null, keywords.length != 0);
+            }
+            if (keywords.length == 0) {
+                cache.add(self, args, match);
             }
         }
+        Object cself = callData.self;
+
         Object o;
         try {
-            o = m.invoke(cself, callData.getArgsArray());
-        } catch (InvocationTargetException e) {
-            throw Py.JavaError(e.getTargetException());
+            // If this is a direct call to a Java class instance method with a PyProxy instance
+            // as the arg, use the super__ version to actually route this through the method on
+            // the class.
+            if (self == null && cself != null && cself instanceof PyProxy
+                    && !__name__.startsWith("super__")
+                    && match.declaringClass != cself.getClass()) {
+                MethodHandle superMethod = superMethod(cself.getClass(), (Method)match.data);
+                o = (Object)superMethod.invokeExact(cself, callData.getArgsArray());
+            } else {
+                o = match.invoke(cself, callData.getArgsArray());
+            }
         } catch (Throwable t) {
             throw Py.JavaError(t);
         }
         return Py.java2py(o);
     }
 
+    /** The handle of the super__ method of the proxy class c standing for m. */
+    private MethodHandle superMethod(Class<?> c, Method m) {
+        ConcurrentMap<Method, MethodHandle> methods = superMethods.get(c);
+        MethodHandle h = methods.get(m);
+        if (h == null) {
+            Method superMethod;
+            try {
+                superMethod = c.getMethod("super__" + __name__, m.getParameterTypes());
+            } catch (Exception e) {
+                throw Py.JavaError(e);
+            }
+            h = ReflectedArgs.invoker(superMethod);
+            methods.put(m, h);
+        }
+        return h;
+    }
+
+    /**
+     * The overloads matched by earlier calls, by what determines the match: the Java classes of
+     * self and the arguments (or, for int and str, a class standing for the Java types the value
+     * converts to). Calls with other arguments, or with keywords, always try every overload.
+     */
+    private static final class OverloadCache {
+
+        /** Most argument lists remembered. */
+        private static final int MAX_ENTRIES = 8;
+
+        /** Key of a call without self. */
+        private static final Object NO_SELF = new Object();
+
+        /** Keys of int values, by the narrowest Java integral type holding them. */
+        private static final Object[] LONG_KEYS = {
+            Byte.TYPE, Short.TYPE, Integer.TYPE, Long.TYPE
+        };
+
+        /** Key of a str of one UTF-16 unit, which converts to a char. */
+        private static final Object CHAR_KEY = Character.TYPE;
+
+        private static final Entry[] EMPTY = new Entry[0];
+
+        private volatile Entry[] entries = EMPTY;
+
+        private static final class Entry {
+
+            final Object[] key;
+            final ReflectedArgs match;
+
+            Entry(Object[] key, ReflectedArgs match) {
+                this.key = key;
+                this.match = match;
+            }
+        }
+
+        /**
+         * What decides whether arg converts to a Java type, or null if that may depend on more
+         * than is kept here.
+         */
+        private static Object argKey(PyObject arg) {
+            if (arg == null) {
+                return NO_SELF;
+            }
+            Class<?> c = arg.getClass();
+            if (c == PyLong.class) {
+                int width = ((PyLong)arg).javaWidth();
+                return width < LONG_KEYS.length ? LONG_KEYS[width] : null;
+            } else if (c == PyUnicode.class) {
+                return ((PyUnicode)arg).getString().length() == 1 ? CHAR_KEY : c;
+            } else if (c == PyFloat.class || c == PyBoolean.class || c == PyNone.class) {
+                return c;
+            } else if (c == PyObjectDerived.class && arg.getType() instanceof PyJavaType) {
+                // An instance of a Java class
+                Object proxy = arg.getJavaProxy();
+                return proxy == null ? null : proxy.getClass();
+            }
+            return null;
+        }
+
+        ReflectedArgs lookup(PyObject self, PyObject[] args) {
+            next:
+            for (Entry entry : entries) {
+                Object[] key = entry.key;
+                if (key.length != args.length + 1 || key[0] != argKey(self)) {
+                    continue;
+                }
+                for (int i = 0; i < args.length; i++) {
+                    if (key[i + 1] != argKey(args[i])) {
+                        continue next;
+                    }
+                }
+                return entry.match;
+            }
+            return null;
+        }
+
+        void add(PyObject self, PyObject[] args, ReflectedArgs match) {
+            Entry[] current = entries;
+            if (current.length >= MAX_ENTRIES) {
+                return;
+            }
+            Object[] key = new Object[args.length + 1];
+            key[0] = argKey(self);
+            for (int i = 0; i < args.length; i++) {
+                key[i + 1] = argKey(args[i]);
+            }
+            for (Object k : key) {
+                if (k == null) {
+                    return;
+                }
+            }
+            Entry[] updated = new Entry[current.length + 1];
+            System.arraycopy(current, 0, updated, 0, current.length);
+            updated[current.length] = new Entry(key, match);
+            // Racing additions may lose an entry, to be added again by a later call
+            entries = updated;
+        }
+    }
+
     @Override
     public PyObject __call__(PyObject[] args, String[] keywords) {
         PyObject self;
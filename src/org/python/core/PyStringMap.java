@@ -17,6 +17,7 @@ import java.util.Map.Entry;
 import java.util.Set;
 import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.ConcurrentMap;
+import java.util.concurrent.atomic.AtomicLongFieldUpdater;
 
 /**
  * Special fast dict implementation for __dict__ instances. Allows interned String keys in addition
@@ -34,10 +35,37 @@ public class PyStringMap extends PyObject implements Traverseproc {
 
     private final ConcurrentMap<Object, PyObject> table;
 
+    /** Modification version, see {@link #getVersion()}. */
+    private volatile long version;
+
+    private static final AtomicLongFieldUpdater<PyStringMap> VERSION =
+            AtomicLongFieldUpdater.newUpdater(PyStringMap.class, "version");
+
+    /**
+     * The underlying map. Changes made directly to it are not reflected in {@link #getVersion()},
+     * so callers that modify it must call {@link #modified()}.
+     */
     public ConcurrentMap<Object, PyObject> getMap() {
         return table;
     }
 
+    /**
+     * A number that changes whenever an entry is added, replaced or removed. Caches of values
+     * looked up in this map (such as the global caches of {@link PyFrame}) remain valid for as
+     * long as the version they were filled at is current.
+     */
+    public long getVersion() {
+        return version;
+    }
+
+    /**
+     * Record a modification of the contents, invalidating caches made at earlier versions. The
+     * change to the table must be complete before this is called.
+     */
+    public void modified() {
+        VERSION.incrementAndGet(this);
+    }
+
     public PyStringMap() {
         this(4);
     }
@@ -48,6 +76,15 @@ public class PyStringMap extends PyObject implements Traverseproc {
                                                         Generic.CHM_CONCURRENCY_LEVEL);
     }
 
+    /**
+     * An instance <code>__dict__</code> whose keys are shared with the other instances of a
+     * type, starting from the layout <code>keys</code> (see {@link SharedKeyMap}).
+     */
+    PyStringMap(SharedKeyMap.Keys keys) {
+        super(getLazyType());
+        table = new SharedKeyMap(keys);
+    }
+
     public PyStringMap(Map<Object, PyObject> map) {
         this(Math.max((int) (map.size() / Generic.CHM_LOAD_FACTOR) + 1,
                       Generic.CHM_INITIAL_CAPACITY));
@@ -116,6 +153,17 @@ public class PyStringMap extends PyObject implements Traverseproc {
         return table.get(key);
     }
 
+    /**
+     * As {@link #__finditem__(String)}, where the map has shared keys trying first the index at
+     * which the caller found the key before.
+     */
+    PyObject __finditem__(String key, SharedKeyMap.Hint hint) {
+        if (table instanceof SharedKeyMap) {
+            return ((SharedKeyMap)table).get(key, hint);
+        }
+        return __finditem__(key);
+    }
+
     @Override
     public PyObject __finditem__(PyObject key) {
         if (key instanceof PyUnicode) {
@@ -169,6 +217,7 @@ public class PyStringMap extends PyObject implements Traverseproc {
         } else {
             table.put(key, value);
         }
+        modified();
     }
 
     @Override
@@ -180,10 +229,12 @@ public class PyStringMap extends PyObject implements Traverseproc {
     final void stringmap___setitem__(PyObject key, PyObject value) {
         if (value == null) {
             table.remove(pyToKey(key));
+            modified();
         } else if (key instanceof PyUnicode) {
             __setitem__(((PyUnicode)key).internedString(), value);
         } else {
             table.put(key, value);
+            modified();
         }
     }
 
@@ -193,6 +244,7 @@ public class PyStringMap extends PyObject implements Traverseproc {
         if (ret == null) {
             throw Py.KeyError(key);
         }
+        modified();
     }
 
     @Override
@@ -209,6 +261,7 @@ public class PyStringMap extends PyObject implements Traverseproc {
             if (ret == null) {
                 throw Py.KeyError(key);
             }
+            modified();
         }
     }
 
@@ -237,6 +290,7 @@ public class PyStringMap extends PyObject implements Traverseproc {
     @ExposedMethod(doc = BuiltinDocs.dict_clear_doc)
     final void stringmap_clear() {
         table.clear();
+        modified();
     }
 
     @Override
@@ -357,6 +411,7 @@ public class PyStringMap extends PyObject implements Traverseproc {
     private void merge(PyObject other) {
         if (other instanceof PyStringMap) {
             table.putAll(((PyStringMap)other).table);
+            modified();
         } else if (other instanceof PyDictionary) {
             mergeFromKeys(other, ((PyDictionary)other).keys_as_list());
         } else {
@@ -433,7 +488,11 @@ public class PyStringMap extends PyObject implements Traverseproc {
     final PyObject stringmap_setdefault(PyObject key, PyObject failobj) {
         Object internedKey = (key instanceof PyUnicode) ? ((PyUnicode)key).internedString() : key;
         PyObject oldValue = table.putIfAbsent(internedKey, failobj);
-        return oldValue == null ? failobj : oldValue;
+        if (oldValue == null) {
+            modified();
+            return failobj;
+        }
+        return oldValue;
     }
 
     /**
@@ -451,6 +510,7 @@ public class PyStringMap extends PyObject implements Traverseproc {
         }
         PyTuple tuple = itemTuple(it.next());
         it.remove();
+        modified();
         return tuple;
     }
 
@@ -476,6 +536,7 @@ public class PyStringMap extends PyObject implements Traverseproc {
                 return failobj;
             }
         }
+        modified();
         return value;
     }
 
@@ -48,6 +48,7 @@ import java.util.StringTokenizer;
 import java.util.concurrent.Callable;
 import java.util.concurrent.ConcurrentMap;
 import java.util.concurrent.locks.ReentrantLock;
+import java.util.concurrent.locks.ReentrantReadWriteLock;
 import java.util.jar.JarEntry;
 import java.util.jar.JarFile;
 
@@ -137,6 +138,7 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
     public Map<String, PyModule> modules_reloading;
     private ReentrantLock importLock;
     private ClassLoader syspathJavaLoader;
+    private BytecodeLoader.Loader moduleLoader;
     public PyList path;
 
     public PyList warnoptions = new PyList();
@@ -389,6 +391,14 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
         return syspathJavaLoader;
     }
 
+    /** The loader in which the classes of modules imported into this system state are defined. */
+    public synchronized BytecodeLoader.Loader getModuleLoader() {
+        if (moduleLoader == null) {
+            moduleLoader = new BytecodeLoader.Loader(syspathJavaLoader);
+        }
+        return moduleLoader;
+    }
+
     // xxx fix this accessors
     @Override
     public PyObject __findattr_ex__(String name) {
@@ -485,7 +495,7 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
         if (ts.tracefunc == null) {
             return Py.None;
         } else {
-            return ((PythonTraceFunction)ts.tracefunc).tracefunc;
+            return ts.tracefunc.getTraceObject();
         }
     }
 
@@ -503,7 +513,7 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
         if (ts.profilefunc == null) {
             return Py.None;
         } else {
-            return ((PythonTraceFunction)ts.profilefunc).tracefunc;
+            return ts.profilefunc.getTraceObject();
         }
     }
 
@@ -1395,6 +1405,10 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
     private static PyList initPath(Properties props, boolean standalone, String jarFileName) {
         PyList path = new PyList();
         addPaths(path, props.getProperty("python.path", ""));
+        File archive = getStartupArchive();
+        if (archive != null) {
+            path.append(new PyUnicode(archive.toString()));
+        }
         if (prefix != null) {
             String libpath = new File(prefix.toString(), "Lib").toString();
             path.append(new PyUnicode(libpath));
@@ -1407,6 +1421,25 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
         return path;
     }
 
+    /**
+     * The zip of precompiled library modules named by {@link Options#startupArchive}, or
+     * <code>null</code> if there is none.
+     */
+    private static File getStartupArchive() {
+        if (Options.startupArchive == null) {
+            return null;
+        }
+        File archive = new File(Options.startupArchive);
+        if (!archive.isAbsolute() && prefix != null) {
+            archive = new File(prefix.toString(), Options.startupArchive);
+        }
+        if (!archive.isFile()) {
+            Py.writeWarning("initializer", "Startup archive not found: " + archive);
+            return null;
+        }
+        return archive;
+    }
+
     /**
      * Check if we are in standalone mode.
      *
@@ -1653,6 +1686,13 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
 
     public static class PySystemStateCloser {
 
+        /**
+         * Held for reading while a finalizer runs, and for writing while resources are closed,
+         * so that finalizers run in parallel with each other but not with the closing.
+         */
+        public static final ReentrantReadWriteLock finalizationLock =
+                new ReentrantReadWriteLock();
+
         private final Set<Callable<Void>> resourceClosers = new LinkedHashSet<Callable<Void>>();
         private volatile boolean isCleanup = false;
         private final Thread shutdownHook;
@@ -1687,7 +1727,32 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
             }
         }
 
+        /**
+         * Wait for running finalizers to finish and keep new ones out, unless called from a
+         * finalizer, which cannot wait for itself.
+         *
+         * @return whether the write lock was taken and must be released by the caller
+         */
+        private static boolean lockOutFinalizers() {
+            if (finalizationLock.getReadHoldCount() > 0) {
+                return false;
+            }
+            finalizationLock.writeLock().lock();
+            return true;
+        }
+
         private synchronized void cleanup() {
+            boolean locked = lockOutFinalizers();
+            try {
+                cleanupLocked();
+            } finally {
+                if (locked) {
+                    finalizationLock.writeLock().unlock();
+                }
+            }
+        }
+
+        private void cleanupLocked() {
             synchronized (PySystemStateCloser.class) {
                 if (isCleanup) {
                     return;
@@ -1752,9 +1817,16 @@ public class PySystemState extends PyObject implements AutoCloseable, Closeable,
 
             @Override
             public void run() {
-                synchronized (PySystemStateCloser.class) {
-                    runClosers();
-                    resourceClosers.clear();
+                boolean locked = lockOutFinalizers();
+                try {
+                    synchronized (PySystemStateCloser.class) {
+                        runClosers();
+                        resourceClosers.clear();
+                    }
+                } finally {
+                    if (locked) {
+                        finalizationLock.writeLock().unlock();
+                    }
                 }
             }
         }
@@ -92,9 +92,21 @@ public class PyType extends PyObject implements Serializable, Traverseproc {
     /** MethodCacheEntry version tag. */
     private volatile Object versionTag = new Object();
 
+    /**
+     * Special methods as resolved through the mro, by {@link SpecialMethod} ordinal, filled in by
+     * {@link #lookupSpecial(SpecialMethod)} and dropped by {@link #invalidateMethodCache()}.
+     */
+    private volatile Object[] specialMethods;
+
+    /** Marks in specialMethods a special method the type does not have. */
+    private static final Object NO_SPECIAL_METHOD = new Object();
+
     /** The number of __slots__ defined. */
     private int numSlots;
 
+    /** The empty layout of the instance dicts of this type, made by the first instDict(). */
+    private transient SharedKeyMap.Keys instanceKeys;
+
     private transient ReferenceQueue<PyType> subclasses_refq = new ReferenceQueue<PyType>();
     private Set<WeakReference<PyType>> subclasses = Generic.set();
 
@@ -859,6 +871,13 @@ public class PyType extends PyObject implements Serializable, Traverseproc {
 
     public PyObject instDict() {
         if (needs_userdict) {
+            if (Options.sharedInstanceKeys) {
+                SharedKeyMap.Keys keys = instanceKeys;
+                if (keys == null) {
+                    instanceKeys = keys = new SharedKeyMap.Keys();
+                }
+                return new PyStringMap(keys);
+            }
             return new PyStringMap();
         }
         return null;
@@ -1156,6 +1175,30 @@ public class PyType extends PyObject implements Serializable, Traverseproc {
         return lookup_where(name, null);
     }
 
+    /**
+     * Lookup of a special method through mro objects' dicts, for the Derived classes. Results
+     * are kept in a table on the type, so this costs an array access once the method has been
+     * found.
+     *
+     * @param method the special method
+     * @return found object or null
+     */
+    public PyObject lookupSpecial(SpecialMethod method) {
+        Object[] table = specialMethods;
+        if (table == null) {
+            specialMethods = table = new Object[SpecialMethod.values().length];
+        }
+        int index = method.ordinal();
+        Object impl = table[index];
+        if (impl == null) {
+            // A lookup racing with invalidateMethodCache() fills a table already dropped
+            PyObject found = lookup(method.name());
+            table[index] = found == null ? NO_SPECIAL_METHOD : found;
+            return found;
+        }
+        return impl == NO_SPECIAL_METHOD ? null : (PyObject)impl;
+    }
+
     /**
      * Attribute lookup for name directly through mro objects' dicts. This isn't cached,
      * and should generally only be used during the bootstrapping of a type.
@@ -1616,6 +1659,7 @@ public class PyType extends PyObject implements Serializable, Traverseproc {
         traverse_hierarchy(false, new OnType() {
                 public boolean onType(PyType type) {
                     type.versionTag = new Object();
+                    type.specialMethods = null;
                     return false;
                 }
             });
@@ -1736,6 +1780,14 @@ public class PyType extends PyObject implements Serializable, Traverseproc {
         return doc.__get__(null, this);
     }
 
+    /**
+     * The current method cache version tag, replaced whenever anything affecting attribute
+     * lookups on this type changes. Inline caches compare it by identity.
+     */
+    Object getVersionTag() {
+        return versionTag;
+    }
+
     boolean getUsesObjectGetattribute() {
         return usesObjectGetattribute;
     }
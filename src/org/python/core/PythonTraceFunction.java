@@ -39,6 +39,11 @@ class PythonTraceFunction extends TraceFunction implements Traverseproc {
         }
     }
 
+    @Override
+    public PyObject getTraceObject() {
+        return tracefunc;
+    }
+
     public TraceFunction traceCall(PyFrame frame) {
         return safeCall(frame, "call", Py.None);
     }
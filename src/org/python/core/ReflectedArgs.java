@@ -1,6 +1,12 @@
 // Copyright (c) Corporation for National Research Initiatives
 package org.python.core;
 
+import java.lang.invoke.MethodHandle;
+import java.lang.invoke.MethodHandles;
+import java.lang.invoke.MethodType;
+import java.lang.reflect.Method;
+import java.lang.reflect.Modifier;
+
 public class ReflectedArgs {
     public Class<?>[] args;
 
@@ -20,6 +26,23 @@ public class ReflectedArgs {
 
     public static final int PyArgsKeywordsCall = 2;
 
+    private static final MethodHandles.Lookup LOOKUP = MethodHandles.lookup();
+
+    /** Method.invoke, for the methods that cannot be called through a handle of their own. */
+    private static final MethodHandle REFLECTIVE_INVOKE;
+
+    static {
+        try {
+            REFLECTIVE_INVOKE = LOOKUP.findVirtual(Method.class, "invoke",
+                    MethodType.methodType(Object.class, Object.class, Object[].class));
+        } catch (ReflectiveOperationException e) {
+            throw new ExceptionInInitializerError(e);
+        }
+    }
+
+    /** The handle calling data, a Method, made on the first call; see {@link #invoker(Method)}. */
+    private MethodHandle handle;
+
     public ReflectedArgs(Object data, Class<?>[] args, Class<?> declaringClass, boolean isStatic) {
         this(data, args, declaringClass, isStatic, false);
     }
@@ -164,6 +187,38 @@ public class ReflectedArgs {
         return true;
     }
 
+    /**
+     * Call the method in data (a <code>Method</code>) on self, which is ignored by a static
+     * method, with the converted arguments of a call matched by this.
+     */
+    Object invoke(Object self, Object[] args) throws Throwable {
+        MethodHandle h = handle;
+        if (h == null) {
+            handle = h = invoker((Method)data);
+        }
+        return (Object)h.invokeExact(self, args);
+    }
+
+    /**
+     * A handle of type <code>(Object, Object[])Object</code> that calls m on its first argument
+     * with the elements of the array as arguments, converted as by reflection. Where no handle
+     * may be had for m, as when it is not accessible, the handle calls it by reflection (which
+     * raises the error).
+     */
+    static MethodHandle invoker(Method m) {
+        MethodHandle h;
+        try {
+            h = LOOKUP.unreflect(m).asFixedArity();
+        } catch (IllegalAccessException e) {
+            return REFLECTIVE_INVOKE.bindTo(m);
+        }
+        int n = m.getParameterTypes().length;
+        if (Modifier.isStatic(m.getModifiers())) {
+            h = MethodHandles.dropArguments(h, 0, Object.class);
+        }
+        return h.asType(MethodType.genericMethodType(n + 1)).asSpreader(Object[].class, n);
+    }
+
     public static int precedence(Class<?> arg) {
         if (arg == Object.class) {
             return 3000;
@@ -0,0 +1,419 @@
+/* Copyright (c) Jython Developers */
+package org.python.core;
+
+import java.io.Serializable;
+import java.util.AbstractMap;
+import java.util.AbstractSet;
+import java.util.Arrays;
+import java.util.HashMap;
+import java.util.Iterator;
+import java.util.Map;
+import java.util.NoSuchElementException;
+import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentMap;
+import java.util.concurrent.atomic.AtomicInteger;
+
+import org.python.util.Generic;
+
+/**
+ * The table of an instance <code>__dict__</code> whose keys are shared with the other instances
+ * of its type. Maps that had the same keys added in the same order share one {@link Keys}
+ * layout, so that each holds no more than an array of values, indexed as the layout's names.
+ * <p>
+ * A map changes to a <code>ConcurrentHashMap</code> of its own when it is given a key that is
+ * not a string, when it would hold more than {@link #MAX_KEYS} keys, when its layout already
+ * leads to {@link #MAX_TRANSITIONS} others (instances given attributes of many names), or when
+ * the type already has {@link #MAX_LAYOUTS} layouts (attributes set in many orders). Layouts live
+ * as long as their type, so this bounds the memory they hold.
+ * <p>
+ * Changes are made holding the lock of the map. Lookups take no lock: a new layout is published
+ * after the values array it needs, and a lookup reads the layout before the values.
+ */
+final class SharedKeyMap extends AbstractMap<Object, PyObject>
+        implements ConcurrentMap<Object, PyObject>, Serializable {
+
+    /** Most keys a map holds before changing to a hash table. */
+    static final int MAX_KEYS = 32;
+
+    /** Most layouts that may follow from one layout by the addition of a key. */
+    static final int MAX_TRANSITIONS = 16;
+
+    /** Most layouts that may be reached from the empty layout of a type, that one included. */
+    static final int MAX_LAYOUTS = 256;
+
+    private static final PyObject[] EMPTY = new PyObject[0];
+
+    /** The layout, or null once changed to a hash table. */
+    private volatile Keys keys;
+
+    /** The values, null where a key has been removed, or null once changed to a hash table. */
+    private volatile PyObject[] values;
+
+    /** The number of values that are not null. */
+    private volatile int count;
+
+    /** The hash table holding the entries instead, once the map has changed to one. */
+    private volatile ConcurrentMap<Object, PyObject> table;
+
+    SharedKeyMap(Keys keys) {
+        this.keys = keys;
+        int capacity = keys.root.capacity;
+        values = capacity == 0 ? EMPTY : new PyObject[capacity];
+    }
+
+    /**
+     * The names of the keys of shared-key maps, for one sequence of additions from the empty
+     * layout of a type ({@link PyType#instDict()}).
+     */
+    static final class Keys {
+
+        /** The empty layout this one was reached from. */
+        final Keys root;
+
+        /** Interned names, in order of addition. */
+        final String[] names;
+
+        /** In the root, the length of the values array of a new map. */
+        private volatile int capacity;
+
+        /** In the root, the number of layouts reached from it, or null in other layouts. */
+        final AtomicInteger layouts;
+
+        /** The layouts that follow from this one by name added, guarded by this. */
+        private Map<String, Keys> next;
+
+        Keys() {
+            root = this;
+            names = new String[0];
+            layouts = new AtomicInteger(1);
+        }
+
+        private Keys(Keys previous, String name) {
+            root = previous.root;
+            int n = previous.names.length;
+            names = Arrays.copyOf(previous.names, n + 1);
+            names[n] = name;
+            layouts = null;
+        }
+
+        int indexOf(String key) {
+            String[] names = this.names;
+            for (int i = 0; i < names.length; i++) {
+                if (names[i] == key) {
+                    return i;
+                }
+            }
+            // Keys from Java need not be interned
+            for (int i = 0; i < names.length; i++) {
+                if (names[i].equals(key)) {
+                    return i;
+                }
+            }
+            return -1;
+        }
+
+        /** The layout with name added, or null if the map should change to a hash table. */
+        synchronized Keys add(String name) {
+            if (names.length >= MAX_KEYS) {
+                return null;
+            }
+            if (next == null) {
+                next = new HashMap<String, Keys>(2);
+            }
+            Keys keys = next.get(name);
+            if (keys == null) {
+                if (next.size() >= MAX_TRANSITIONS || !root.countLayout()) {
+                    return null;
+                }
+                keys = new Keys(this, name.intern());
+                next.put(keys.names[names.length], keys);
+            }
+            return keys;
+        }
+
+        /** In the root, count a new layout, unless there are already {@link #MAX_LAYOUTS}. */
+        private boolean countLayout() {
+            int n;
+            do {
+                n = layouts.get();
+                if (n >= MAX_LAYOUTS) {
+                    return false;
+                }
+            } while (!layouts.compareAndSet(n, n + 1));
+            return true;
+        }
+    }
+
+    /**
+     * The index at which a caller (an inline cache) last found its key, to be tried before a
+     * search of the layout. Any index is checked against the layout before it is used.
+     */
+    static final class Hint {
+        int index;
+    }
+
+    @Override
+    public PyObject get(Object key) {
+        if (table == null) {
+            Keys k = keys;
+            PyObject[] v = values;
+            if (k != null && v != null) {
+                if (!(key instanceof String)) {
+                    return null;
+                }
+                int i = k.indexOf((String)key);
+                return i < 0 ? null : v[i];
+            }
+        }
+        return table.get(key);
+    }
+
+    /** As {@link #get(Object)} for an interned name, trying first the index in hint. */
+    PyObject get(String key, Hint hint) {
+        if (table == null) {
+            Keys k = keys;
+            PyObject[] v = values;
+            if (k != null && v != null) {
+                int i = hint.index;
+                String[] names = k.names;
+                if (i >= names.length || names[i] != key) {
+                    i = k.indexOf(key);
+                    if (i < 0) {
+                        return null;
+                    }
+                    hint.index = i;
+                }
+                return v[i];
+            }
+        }
+        return table.get(key);
+    }
+
+    @Override
+    public boolean containsKey(Object key) {
+        return get(key) != null;
+    }
+
+    @Override
+    public int size() {
+        ConcurrentMap<Object, PyObject> t = table;
+        return t != null ? t.size() : count;
+    }
+
+    @Override
+    public synchronized PyObject put(Object key, PyObject value) {
+        if (value == null) {
+            throw new NullPointerException();
+        }
+        if (table != null || !(key instanceof String)) {
+            return toTable().put(key, value);
+        }
+        Keys k = keys;
+        PyObject[] v = values;
+        int i = k.indexOf((String)key);
+        if (i < 0) {
+            Keys added = k.add((String)key);
+            if (added == null) {
+                return toTable().put(key, value);
+            }
+            i = k.names.length;
+            if (i >= v.length) {
+                Keys root = k.root;
+                int capacity = Math.max(i + 1, root.capacity);
+                v = Arrays.copyOf(v, capacity);
+                if (capacity > root.capacity) {
+                    root.capacity = capacity;
+                }
+            }
+            v[i] = value;
+            count++;
+            values = v;
+            keys = added;
+            return null;
+        }
+        PyObject old = v[i];
+        v[i] = value;
+        if (old == null) {
+            count++;
+        }
+        // A volatile write, so that lookups see the store
+        values = v;
+        return old;
+    }
+
+    @Override
+    public synchronized PyObject remove(Object key) {
+        if (table != null) {
+            return table.remove(key);
+        }
+        if (!(key instanceof String)) {
+            return null;
+        }
+        PyObject[] v = values;
+        int i = keys.indexOf((String)key);
+        if (i < 0 || v[i] == null) {
+            return null;
+        }
+        PyObject old = v[i];
+        v[i] = null;
+        count--;
+        values = v;
+        return old;
+    }
+
+    @Override
+    public synchronized void clear() {
+        if (table != null) {
+            table.clear();
+            return;
+        }
+        values = new PyObject[values.length];
+        count = 0;
+    }
+
+    @Override
+    public synchronized PyObject putIfAbsent(Object key, PyObject value) {
+        PyObject old = get(key);
+        if (old == null) {
+            put(key, value);
+        }
+        return old;
+    }
+
+    @Override
+    public synchronized boolean remove(Object key, Object value) {
+        PyObject old = get(key);
+        if (old != null && old.equals(value)) {
+            remove(key);
+            return true;
+        }
+        return false;
+    }
+
+    @Override
+    public synchronized boolean replace(Object key, PyObject oldValue, PyObject newValue) {
+        PyObject old = get(key);
+        if (old != null && old.equals(oldValue)) {
+            put(key, newValue);
+            return true;
+        }
+        return false;
+    }
+
+    @Override
+    public synchronized PyObject replace(Object key, PyObject value) {
+        PyObject old = get(key);
+        if (old != null) {
+            put(key, value);
+        }
+        return old;
+    }
+
+    /** Change to a hash table holding the current entries (if not done already). */
+    private ConcurrentMap<Object, PyObject> toTable() {
+        ConcurrentMap<Object, PyObject> t = table;
+        if (t == null) {
+            Keys k = keys;
+            PyObject[] v = values;
+            t = new ConcurrentHashMap<Object, PyObject>(
+                    Math.max((int)(k.names.length / Generic.CHM_LOAD_FACTOR) + 1,
+                             Generic.CHM_INITIAL_CAPACITY),
+                    Generic.CHM_LOAD_FACTOR, Generic.CHM_CONCURRENCY_LEVEL);
+            for (int i = 0; i < k.names.length; i++) {
+                if (v[i] != null) {
+                    t.put(k.names[i], v[i]);
+                }
+            }
+            // Lookups that find keys or values null go to the table
+            table = t;
+            keys = null;
+            values = null;
+        }
+        return t;
+    }
+
+    @Override
+    public Set<Map.Entry<Object, PyObject>> entrySet() {
+        return new AbstractSet<Map.Entry<Object, PyObject>>() {
+
+            @Override
+            public Iterator<Map.Entry<Object, PyObject>> iterator() {
+                if (table == null) {
+                    Keys k = keys;
+                    PyObject[] v = values;
+                    if (k != null && v != null) {
+                        return new EntryIterator(k.names, v);
+                    }
+                }
+                return table.entrySet().iterator();
+            }
+
+            @Override
+            public int size() {
+                return SharedKeyMap.this.size();
+            }
+        };
+    }
+
+    /** An iterator over the names of a layout and the values in the map as it goes. */
+    private class EntryIterator implements Iterator<Map.Entry<Object, PyObject>> {
+
+        private final String[] names;
+        private final PyObject[] values;
+        private int index = -1;
+        private PyObject value;
+        private String last;
+
+        EntryIterator(String[] names, PyObject[] values) {
+            this.names = names;
+            this.values = values;
+            advance();
+        }
+
+        /** Move to the next name that has a value. */
+        private void advance() {
+            value = null;
+            while (value == null && ++index < names.length) {
+                value = values[index];
+            }
+        }
+
+        @Override
+        public boolean hasNext() {
+            return value != null;
+        }
+
+        @Override
+        public Map.Entry<Object, PyObject> next() {
+            if (value == null) {
+                throw new NoSuchElementException();
+            }
+            last = names[index];
+            Map.Entry<Object, PyObject> entry = new SimpleEntry<Object, PyObject>(last, value) {
+
+                @Override
+                public PyObject setValue(PyObject value) {
+                    put(getKey(), value);
+                    return super.setValue(value);
+                }
+            };
+            advance();
+            return entry;
+        }
+
+        @Override
+        public void remove() {
+            if (last == null) {
+                throw new IllegalStateException();
+            }
+            SharedKeyMap.this.remove(last);
+            last = null;
+        }
+    }
+
+    /** Serialized as a hash table, since the layouts belong to the types of this JVM. */
+    private Object writeReplace() {
+        return new ConcurrentHashMap<Object, PyObject>(this);
+    }
+}
@@ -0,0 +1,37 @@
+/* Copyright (c) Jython Developers */
+package org.python.core;
+
+/**
+ * The special methods the generated <code>*Derived</code> classes dispatch to, each naming a slot
+ * in the table kept by {@link PyType#lookupSpecial(SpecialMethod)}.
+ * <p>
+ * The templates in <code>src/templates</code> refer to these constants by the method name, so a
+ * special method dispatched by a template has to be listed here too.
+ */
+public enum SpecialMethod {
+
+    // Unary
+    __abs__, __complex__, __dir__, __enter__, __float__, __index__, __int__, __invert__,
+    __iter__, __len__, __neg__, __next__, __pos__, __reduce__, __repr__, __str__, __bool__,
+    __hash__,
+
+    // Binary
+    __add__, __radd__, __sub__, __rsub__, __mul__, __rmul__, __matmul__, __rmatmul__,
+    __floordiv__, __rfloordiv__, __truediv__, __rtruediv__, __mod__, __rmod__,
+    __divmod__, __rdivmod__, __pow__, __rpow__, __lshift__, __rlshift__, __rshift__,
+    __rrshift__, __and__, __rand__, __or__, __ror__, __xor__, __rxor__, __format__,
+
+    // In-place
+    __iadd__, __isub__, __imul__, __imatmul__, __idiv__, __ifloordiv__, __itruediv__,
+    __imod__, __ipow__, __ilshift__, __irshift__, __iand__, __ior__, __ixor__,
+
+    // Comparison
+    __lt__, __le__, __eq__, __ne__, __gt__, __ge__,
+
+    // Containers, calls, attributes and descriptors
+    __contains__, __getitem__, __setitem__, __delitem__, __call__, __setattr__, __delattr__,
+    __get__, __set__, __delete__, __tojava__, __coerce__,
+
+    // Methods of the io classes
+    fileno, readall;
+}
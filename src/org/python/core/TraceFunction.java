@@ -9,4 +9,13 @@ public abstract class TraceFunction {
     public abstract TraceFunction traceLine(PyFrame frame, int line);
 
     public abstract TraceFunction traceException(PyFrame frame, PyException exc);
+
+    /**
+     * The object <code>sys.gettrace()</code> or <code>sys.getprofile()</code> reports while this
+     * function is installed. A trace function implemented in Java (such as the
+     * <code>_lsprof</code> profiler) should return the Python object that installed it.
+     */
+    public PyObject getTraceObject() {
+        return Py.java2py(this);
+    }
 }
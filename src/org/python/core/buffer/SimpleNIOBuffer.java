@@ -0,0 +1,312 @@
+package org.python.core.buffer;
+
+import java.nio.ByteBuffer;
+
+import org.python.core.PyBuffer;
+import org.python.core.PyException;
+import org.python.core.util.StringUtil;
+
+/**
+ * Buffer API over a one-dimensional sequence of one-byte items held in a
+ * <code>java.nio.ByteBuffer</code>, rather than in a <code>byte[]</code>. This allows an exporter
+ * to share storage that is not on the Java heap, such as a <code>MappedByteBuffer</code> or a
+ * direct buffer, without copying it.
+ * <p>
+ * Since there is no array, this buffer does not offer the {@link #AS_ARRAY} feature:
+ * {@link #hasArray()} returns <code>false</code> and {@link #getBuf()} and the
+ * <code>getPointer</code> methods raise a <code>BufferError</code>. Consumers must use the
+ * abstract API ({@link #byteAt(int)}, {@link #copyTo(int, byte[], int, int)},
+ * {@link #getNIOByteBuffer()} and so on). The items may be strided, so that the same class can
+ * represent a sliced view of itself: item <i>i</i> is at absolute position
+ * <code>index0+i*stride</code> in the <code>ByteBuffer</code>. The position and limit of the
+ * <code>ByteBuffer</code> given to the constructor are not used or changed.
+ */
+public class SimpleNIOBuffer extends BaseBuffer {
+
+    /** The storage shared with the exporter, indexed absolutely. */
+    protected final ByteBuffer bb;
+
+    /** Step size between items in {@link #bb}. */
+    protected int stride;
+
+    /**
+     * Provide an instance of <code>SimpleNIOBuffer</code> with navigation variables initialised,
+     * for sub-class use. The feature flags depend on whether the items are contiguous and whether
+     * the buffer is to be writable.
+     *
+     * @param bb the storage shared with the exporter
+     * @param index0 absolute index in <code>bb</code> of item[0]
+     * @param length number of items
+     * @param stride between successive items in <code>bb</code>
+     * @param readonly if true, the buffer will not be writable
+     * @throws IndexOutOfBoundsException if the items do not all lie within <code>bb</code>
+     */
+    protected SimpleNIOBuffer(ByteBuffer bb, int index0, int length, int stride,
+            boolean readonly) throws IndexOutOfBoundsException {
+        super((stride == 1 || length <= 1) ? CONTIGUITY | SIMPLE : STRIDES);
+        // There is no array to give the consumer
+        setFeatureFlags(getFeatureFlags() & ~AS_ARRAY | (readonly ? 0 : WRITABLE));
+        this.bb = bb;
+        this.index0 = index0;
+        this.stride = stride;
+        this.shape = new int[] {length};
+
+        if (length > 0) {
+            // Check lowest and highest index using the "all non-negative" trick
+            int lo = stride < 0 ? index0 + (length - 1) * stride : index0;
+            int hi = stride < 0 ? index0 + 1 : index0 + (length - 1) * stride + 1;
+            int cap = bb.capacity();
+            if ((length | lo | (cap - lo) | hi | (cap - hi)) < 0) {
+                throw new IndexOutOfBoundsException();
+            }
+        }
+    }
+
+    /**
+     * Provide an instance of <code>SimpleNIOBuffer</code> on the whole capacity of a
+     * <code>ByteBuffer</code>, meeting the consumer's expectations as expressed in the
+     * <code>flags</code> argument, which is checked against the capabilities of the buffer.
+     *
+     * @param flags consumer requirements
+     * @param bb the storage shared with the exporter
+     * @param readonly if true, the buffer will not be writable
+     * @throws PyException (BufferError) when expectations do not correspond with the type
+     */
+    public SimpleNIOBuffer(int flags, ByteBuffer bb, boolean readonly) throws PyException {
+        this(bb, 0, bb.capacity(), 1, readonly);
+        checkRequestFlags(flags);
+    }
+
+    @Override
+    public int getLen() {
+        return shape[0];
+    }
+
+    @Override
+    public byte byteAt(int index) throws IndexOutOfBoundsException {
+        return bb.get(calcIndex(index));
+    }
+
+    @Override
+    public byte byteAt(int... indices) throws IndexOutOfBoundsException {
+        return bb.get(calcIndex(indices));
+    }
+
+    @Override
+    public void storeAt(byte value, int index) throws IndexOutOfBoundsException, PyException {
+        if (isReadonly()) {
+            throw notWritable();
+        }
+        bb.put(calcIndex(index), value);
+    }
+
+    @Override
+    public void storeAt(byte value, int... indices) throws IndexOutOfBoundsException,
+            PyException {
+        if (isReadonly()) {
+            throw notWritable();
+        }
+        bb.put(calcIndex(indices), value);
+    }
+
+    @Override
+    protected int calcIndex(int index) throws IndexOutOfBoundsException {
+        if (index < 0 || index >= shape[0]) {
+            throw new IndexOutOfBoundsException();
+        }
+        return index0 + index * stride;
+    }
+
+    @Override
+    protected int calcIndex(int... indices) throws IndexOutOfBoundsException {
+        // BaseBuffer implementation can be simplified since if indices.length!=1 we error.
+        checkDimension(indices.length); // throws if != 1
+        return calcIndex(indices[0]);
+    }
+
+    /**
+     * {@inheritDoc}
+     * <p>
+     * <code>SimpleNIOBuffer</code> provides a bulk copy from contiguous storage.
+     */
+    @Override
+    public void copyTo(int srcIndex, byte[] dest, int destPos, int length)
+            throws IndexOutOfBoundsException {
+        if (length <= 0) {
+            return;
+        }
+        checkRange(srcIndex, length);
+        int s = index0 + srcIndex * stride;
+        if (stride == 1) {
+            // Use a duplicate so as not to disturb (or be disturbed by) other users of bb
+            ByteBuffer src = bb.duplicate();
+            src.limit(s + length).position(s);
+            src.get(dest, destPos, length);
+        } else {
+            int limit = s + length * stride;
+            for (int d = destPos; s != limit; s += stride) {
+                dest[d++] = bb.get(s);
+            }
+        }
+    }
+
+    /**
+     * {@inheritDoc}
+     * <p>
+     * <code>SimpleNIOBuffer</code> provides a bulk copy to contiguous storage.
+     */
+    @Override
+    public void copyFrom(byte[] src, int srcPos, int destIndex, int length)
+            throws IndexOutOfBoundsException, PyException {
+        if (isReadonly()) {
+            throw notWritable();
+        } else if (length <= 0) {
+            return;
+        }
+        checkRange(destIndex, length);
+        int d = index0 + destIndex * stride;
+        if (stride == 1) {
+            ByteBuffer dest = bb.duplicate();
+            dest.limit(d + length).position(d);
+            dest.put(src, srcPos, length);
+        } else {
+            int limit = d + length * stride;
+            for (int s = srcPos; d != limit; d += stride) {
+                bb.put(d, src[s++]);
+            }
+        }
+    }
+
+    @Override
+    public void copyFrom(PyBuffer src) throws IndexOutOfBoundsException, PyException {
+        if (isReadonly()) {
+            throw notWritable();
+        } else if (src.getLen() != getLen() || src.getItemsize() != getItemsize()) {
+            throw differentStructure();
+        }
+        // Go via an array, since src may share our storage
+        byte[] t = new byte[src.getLen()];
+        src.copyTo(t, 0);
+        copyFrom(t, 0, 0, t.length);
+    }
+
+    /** Check that items <code>[index:index+length]</code> are all within the buffer. */
+    private void checkRange(int index, int length) throws IndexOutOfBoundsException {
+        if ((index | length | (shape[0] - (index + length))) < 0) {
+            throw new IndexOutOfBoundsException();
+        }
+    }
+
+    /**
+     * {@inheritDoc}
+     * <p>
+     * <code>SimpleNIOBuffer</code> returns a view on the same <code>ByteBuffer</code>, as a
+     * slice beginning at item[0].
+     */
+    @Override
+    public PyBuffer getBufferSlice(int flags, int start, int length, int stride) {
+        if (length > 0) {
+            // Translate start and stride relative to the underlying ByteBuffer
+            int compIndex0 = index0 + start * this.stride;
+            int compStride = this.stride * stride;
+            return new SlicedView(getRoot(), flags, bb, compIndex0, length, compStride,
+                    isReadonly());
+        } else {
+            // Special case for length==0 where above logic would fail. Efficient too.
+            return new ZeroByteBuffer.View(getRoot(), flags);
+        }
+    }
+
+    /**
+     * {@inheritDoc}
+     * <p>
+     * <code>SimpleNIOBuffer</code> returns a duplicate of the shared <code>ByteBuffer</code>
+     * positioned at item[0], in which no data have been copied.
+     */
+    @Override
+    public ByteBuffer getNIOByteBuffer() {
+        ByteBuffer b = bb.duplicate();
+        if (shape[0] > 0) {
+            b.limit(calcGreatestIndex() + 1).position(index0);
+        } else {
+            b.limit(0);
+        }
+        return isReadonly() ? b.asReadOnlyBuffer() : b;
+    }
+
+    @Override
+    public Pointer getBuf() {
+        throw bufferIsNot("accessible as a Java array");
+    }
+
+    @Override
+    public Pointer getPointer(int index) {
+        throw bufferIsNot("accessible as a Java array");
+    }
+
+    @Override
+    public Pointer getPointer(int... indices) {
+        throw bufferIsNot("accessible as a Java array");
+    }
+
+    @Override
+    public int[] getStrides() {
+        if (strides == null) {
+            strides = new int[] {stride};
+        }
+        return strides;
+    }
+
+    @Override
+    public boolean isContiguous(char order) {
+        return stride == 1 || shape[0] <= 1;
+    }
+
+    @Override
+    public String toString() {
+        byte[] b = new byte[shape[0]];
+        copyTo(b, 0);
+        return StringUtil.fromBytes(b);
+    }
+
+    /**
+     * A <code>SimpleNIOBuffer.SlicedView</code> represents a (possibly strided) subsequence of
+     * another <code>SimpleNIOBuffer</code>, sharing the same <code>ByteBuffer</code>.
+     */
+    static class SlicedView extends SimpleNIOBuffer {
+
+        /** The buffer on which this is a slice view */
+        PyBuffer root;
+
+        /**
+         * Construct a slice of a <code>SimpleNIOBuffer</code>.
+         *
+         * @param root on which release must be called when this is released
+         * @param flags consumer requirements
+         * @param bb the storage shared with the exporter
+         * @param index0 absolute index in <code>bb</code> of item[0]
+         * @param length number of items in the slice
+         * @param stride between successive items in <code>bb</code>
+         * @param readonly if true, the slice will not be writable
+         * @throws PyException (BufferError) when expectations do not correspond with the type
+         */
+        public SlicedView(PyBuffer root, int flags, ByteBuffer bb, int index0, int length,
+                int stride, boolean readonly) throws PyException {
+            super(bb, index0, length, stride, readonly);
+            checkRequestFlags(flags);
+            // Get a lease on the root PyBuffer (read-only)
+            this.root = root.getBuffer(FULL_RO);
+        }
+
+        @Override
+        protected PyBuffer getRoot() {
+            return root;
+        }
+
+        @Override
+        public void releaseAction() {
+            // We have to release the root too if ours was final.
+            root.release();
+        }
+    }
+}
@@ -1,5 +1,11 @@
 package org.python.core.finalization;
 
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.locks.Lock;
+
+import org.python.core.Options;
 import org.python.core.PyObject;
 import org.python.core.JyAttribute;
 import org.python.core.PySystemState;
@@ -76,7 +82,10 @@ public class FinalizeTrigger {
     }
 
     public static void runFinalizer(PyObject toFinalize, boolean runBuiltinOnly) {
-        synchronized (PySystemState.PySystemStateCloser.class) {
+        // Finalizers may run together, but not while the system state closes its resources
+        Lock lock = PySystemState.PySystemStateCloser.finalizationLock.readLock();
+        lock.lock();
+        try {
             if (!runBuiltinOnly) {
                 if (toFinalize instanceof FinalizablePyObjectDerived) {
                     try {
@@ -96,6 +105,27 @@ public class FinalizeTrigger {
                 } catch (Exception e) {
                 }
             }
+        } finally {
+            lock.unlock();
+        }
+    }
+
+    /**
+     * Deactivate the trigger of an object whose builtin finalizer has nothing left to do, such
+     * as a generator that has run to its end. The object is then reclaimed as soon as it is
+     * unreachable, instead of being kept for a finalizer that does nothing. Objects that may
+     * have a <code>__del__</code>, or whose trigger {@link gc} has marked, are left alone.
+     */
+    public static void releaseBuiltinTrigger(PyObject obj) {
+        if (obj instanceof FinalizablePyObject || obj instanceof FinalizablePyObjectDerived) {
+            return;
+        }
+        Object fn = JyAttribute.getAttr(obj, JyAttribute.FINALIZE_TRIGGER_ATTR);
+        if (fn != null) {
+            FinalizeTrigger ft = (FinalizeTrigger) fn;
+            if (ft.flags == 0) {
+                ft.clear();
+            }
         }
     }
 
@@ -199,16 +229,58 @@ public class FinalizeTrigger {
 
     protected void finalize() throws Throwable {
         flags |= FINALIZED_FLAG;
+        if (toFinalize == null && (flags & NOTIFY_GC_FLAG) == 0 && factory == null) {
+            // Cleared or released: there is nothing to finalize and nobody to notify.
+            return;
+        }
+        // Counted as pending from here, so that gc waits for it even while it is queued
         gc.notifyPreFinalization();
-        if (gc.delayedFinalizationEnabled() && toFinalize != null) {
-            if ((gc.getJythonGCFlags() & gc.VERBOSE_FINALIZE) != 0) {
-                gc.writeDebug("gc", "delayed finalization for "+toFinalize);
+        if (Options.finalizerThreads > 0) {
+            try {
+                Workers.executor.execute(this::runFinalization);
+            } catch (Throwable t) {
+                gc.notifyPostFinalization();
+                throw t;
             }
-            gc.registerForDelayedFinalization(toFinalize);
         } else {
-            performFinalization();
+            runFinalization();
+        }
+    }
+
+    /**
+     * Finalize the object (or register it for delayed finalization), and then make the
+     * notification {@link gc} expects after each finalizer. The matching
+     * {@link gc#notifyPreFinalization()} is made by {@link #finalize()}.
+     */
+    protected void runFinalization() {
+        try {
+            if (gc.delayedFinalizationEnabled() && toFinalize != null) {
+                if ((gc.getJythonGCFlags() & gc.VERBOSE_FINALIZE) != 0) {
+                    gc.writeDebug("gc", "delayed finalization for "+toFinalize);
+                }
+                gc.registerForDelayedFinalization(toFinalize);
+            } else {
+                performFinalization();
+            }
+        } finally {
+            gc.notifyPostFinalization();
         }
-        gc.notifyPostFinalization();
+    }
+
+    /**
+     * The daemon threads that run finalizers when {@link Options#finalizerThreads} is positive,
+     * so that the JVM finalizer thread only hands triggers over. Created on first use.
+     */
+    private static final class Workers {
+
+        private static final AtomicInteger count = new AtomicInteger();
+
+        static final ExecutorService executor =
+                Executors.newFixedThreadPool(Options.finalizerThreads, r -> {
+                    Thread t = new Thread(r, "Jython Finalizer-" + count.incrementAndGet());
+                    t.setDaemon(true);
+                    return t;
+                });
     }
 
     public boolean isFinalized() {
@@ -37,7 +37,7 @@ public class imp {
 
     private static final String UNKNOWN_SOURCEFILE = "<unknown>";
 
-    private static final int APIVersion = 37;
+    private static final int APIVersion = 38;
 
     public static final int NO_MTIME = -1;
 
@@ -970,6 +970,95 @@ public class imp {
         }
     }
 
+    /**
+     * Satisfy an import from <code>sys.modules</code> alone, without taking the import lock or
+     * entering importlib, when everything it names is already loaded. This is the case for most
+     * imports executed after the first, such as imports local to a function.
+     *
+     * @return the module {@link #import_module_level} would return, or <code>null</code> if the
+     *         import has to take the full path: because a module is not in
+     *         <code>sys.modules</code> or is still initializing, or a name in
+     *         <code>fromlist</code> is not yet an attribute of the package
+     */
+    private static PyObject importLoaded(String name, boolean top, PyObject modDict,
+            PyObject fromlist, int level) {
+        String fullName;
+        if (level == 0) {
+            if (name.length() == 0) {
+                return null;
+            }
+            fullName = name;
+        } else if (level > 0 && !top) {
+            String pkgName = loadedPackageName(modDict, level);
+            if (pkgName == null) {
+                return null;
+            }
+            fullName = name.length() == 0 ? pkgName : pkgName + "." + name;
+        } else {
+            return null;
+        }
+
+        PyObject modules = Py.getSystemState().modules;
+        PyObject mod = loadedModule(modules, fullName);
+        if (mod == null) {
+            return null;
+        }
+        if (top) {
+            int dot = name.indexOf('.');
+            return dot == -1 ? mod : loadedModule(modules, name.substring(0, dot));
+        }
+
+        if (fromlist != null && fromlist != Py.None && mod.__findattr__("__path__") != null) {
+            // Names not yet set on a package may be submodules ensureFromList has to import
+            for (PyObject item : fromlist.asIterable()) {
+                if (!(item instanceof PyUnicode) || item.toString().equals("*")
+                        || mod.__findattr__((PyUnicode)item) == null) {
+                    return null;
+                }
+            }
+        }
+        return mod;
+    }
+
+    /** The module of the name in <code>modules</code>, if it is there and initialized. */
+    private static PyObject loadedModule(PyObject modules, String name) {
+        PyObject mod = modules.__finditem__(name);
+        if (mod == null || mod == Py.None) {
+            return null;
+        }
+        PyObject spec = mod.__findattr__("__spec__");
+        if (spec != null && spec != Py.None) {
+            PyObject initializing = spec.__findattr__("_initializing");
+            if (initializing != null && initializing.__bool__()) {
+                return null;
+            }
+        }
+        return mod;
+    }
+
+    /**
+     * The package a relative import of the given level is from, taken from
+     * <code>__package__</code>, or <code>null</code> if that is not set.
+     */
+    private static String loadedPackageName(PyObject modDict, int level) {
+        if (modDict == null) {
+            return null;
+        }
+        PyObject pkg = modDict.__finditem__("__package__");
+        if (!(pkg instanceof PyUnicode)) {
+            return null;
+        }
+        String pkgName = pkg.toString();
+        for (; level > 1; level--) {
+            int dot = pkgName.lastIndexOf('.');
+            if (dot == -1) {
+                return null;
+            }
+            pkgName = pkgName.substring(0, dot);
+        }
+        return pkgName.length() == 0 ? null : pkgName;
+    }
+
     /**
      * Import a module by name.
      *
@@ -1000,6 +1089,10 @@ public class imp {
     public static PyObject importName(String name, boolean top, PyObject modDict,
             PyObject fromlist, int level) {
         PyUnicode.checkEncoding(name);
+        PyObject loaded = importLoaded(name, top, modDict, fromlist, level);
+        if (loaded != null) {
+            return loaded;
+        }
         ReentrantLock importLock = Py.getSystemState().getImportLock();
         importLock.lock();
         try {
@@ -1044,18 +1137,21 @@ public class imp {
      */
     public static PyObject[] importFromAs(String mod, String[] names, String[] asnames,
             PyFrame frame, int level) {
-        PyObject module;
-        ReentrantLock importLock = Py.getSystemState().getImportLock();
-        importLock.lock();
-        try {
-            PyObject[] fromList = new PyObject[names.length];
-            for (int i = 0; i < names.length; i++) {
-                fromList[i] = new PyUnicode(names[i]);
+        PyObject[] fromList = new PyObject[names.length];
+        for (int i = 0; i < names.length; i++) {
+            fromList[i] = new PyUnicode(names[i]);
+        }
+        PyTuple fromTuple = new PyTuple(fromList);
+        PyObject module = importLoaded(mod, false, frame.f_globals, fromTuple, level);
+        if (module == null) {
+            ReentrantLock importLock = Py.getSystemState().getImportLock();
+            importLock.lock();
+            try {
+                module = import_module_level(mod, false, frame.f_globals, fromTuple, level);
+            } finally {
+                if (importLock.isLocked())
+                    importLock.unlock();
             }
-            module = import_module_level(mod, false, frame.f_globals, new PyTuple(fromList), level);
-        } finally {
-            if (importLock.isLocked())
-                importLock.unlock();
         }
         PyObject[] submods = new PyObject[names.length];
         for (int i = 0; i < names.length; i++) {
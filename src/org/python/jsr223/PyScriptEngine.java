@@ -19,6 +19,13 @@ import org.python.util.PythonInterpreter;
 
 public class PyScriptEngine extends AbstractScriptEngine implements Compilable, Invocable, AutoCloseable {
 
+    /**
+     * Attribute that, when set to <code>false</code> (a <code>Boolean</code> or the string
+     * "false") in the script context, stops this engine using the factory's cache of compiled
+     * scripts, so that every script passed as a string is compiled afresh.
+     */
+    public static final String COMPILE_CACHE = "jython.compile.cache";
+
     private final PythonInterpreter interp;
     private final ScriptEngineFactory factory;
 
@@ -66,16 +73,39 @@ public class PyScriptEngine extends AbstractScriptEngine implements Compilable,
     private PyCode compileScript(String script, ScriptContext context) throws ScriptException {
         try {
             String filename = (String) context.getAttribute(ScriptEngine.FILENAME);
-            if (filename == null) {
-                return interp.compile(script);
-            } else {
-                return interp.compile(script, filename);
+            if (!useCompileCache(context)) {
+                return compileScript(script, filename);
             }
+            // The code depends on the source, the file name and any __future__ flags in force
+            PyScriptEngineFactory cache = (PyScriptEngineFactory) factory;
+            int cflags = interp.getCompilerFlags().toBits();
+            PyCode code = cache.getCompiled(script, filename, cflags);
+            if (code == null) {
+                code = compileScript(script, filename);
+                cache.putCompiled(script, filename, cflags, code);
+            }
+            return code;
         } catch (PyException pye) {
             throw scriptException(pye);
         }
     }
 
+    private PyCode compileScript(String script, String filename) {
+        if (filename == null) {
+            return interp.compile(script);
+        } else {
+            return interp.compile(script, filename);
+        }
+    }
+
+    private boolean useCompileCache(ScriptContext context) {
+        if (!(factory instanceof PyScriptEngineFactory)) {
+            return false;
+        }
+        Object enabled = context.getAttribute(COMPILE_CACHE);
+        return enabled == null || !(Boolean.FALSE.equals(enabled) || "false".equals(enabled));
+    }
+
     private PyCode compileScript(Reader reader, ScriptContext context) throws ScriptException {
         try {
             String filename = (String) context.getAttribute(ScriptEngine.FILENAME);
@@ -6,10 +6,38 @@ import java.util.List;
 import javax.script.ScriptEngine;
 import javax.script.ScriptEngineFactory;
 import org.python.Version;
+import org.python.core.Options;
 import org.python.core.Py;
+import org.python.core.PyCode;
+
+import com.google.common.cache.Cache;
+import com.google.common.cache.CacheBuilder;
 
 public class PyScriptEngineFactory implements ScriptEngineFactory {
 
+    /**
+     * Compiled scripts, shared by the engines this factory creates, so that evaluating the same
+     * source text again does not parse it and generate a new class. See
+     * <code>python.jsr223.cachespec</code> in the registry.
+     */
+    private final Cache<CompileKey, PyCode> compileCache = createCompileCache();
+
+    private static Cache<CompileKey, PyCode> createCompileCache() {
+        String spec = Options.jsr223CacheSpec;
+        CacheBuilder<Object, Object> builder;
+        try {
+            builder = CacheBuilder.from(spec);
+        } catch (IllegalArgumentException iae) {
+            Py.writeWarning("jsr223",
+                    String.format("Incompatible options in python.jsr223.cachespec '%s' due to: %s",
+                            spec, iae.getMessage()));
+            Py.writeMessage("jsr223", String.format("Defaulting python.jsr223.cachespec to '%s'",
+                    Options.jsr223CacheSpecDefault));
+            builder = CacheBuilder.from(Options.jsr223CacheSpecDefault);
+        }
+        return builder.recordStats().build();
+    }
+
     public String getEngineName() {
         return "jython";
     }
@@ -94,4 +122,72 @@ public class PyScriptEngineFactory implements ScriptEngineFactory {
         return Collections.unmodifiableList(Arrays.asList("python", "jython"));
     }
 
+    /** The number of compiled scripts currently held by the cache. */
+    public long getCompileCacheSize() {
+        return compileCache.size();
+    }
+
+    /** The number of times a script was found already compiled in the cache. */
+    public long getCompileCacheHitCount() {
+        return compileCache.stats().hitCount();
+    }
+
+    /** The number of times a script had to be compiled because it was not in the cache. */
+    public long getCompileCacheMissCount() {
+        return compileCache.stats().missCount();
+    }
+
+    /** Discard all compiled scripts held by the cache. */
+    public void clearCompileCache() {
+        compileCache.invalidateAll();
+    }
+
+    /** Return the script compiled previously with the same arguments, or <code>null</code>. */
+    PyCode getCompiled(String script, String filename, int cflags) {
+        return compileCache.getIfPresent(new CompileKey(script, filename, cflags));
+    }
+
+    /** Retain the compiled form of a script for {@link #getCompiled(String, String, int)}. */
+    void putCompiled(String script, String filename, int cflags, PyCode code) {
+        compileCache.put(new CompileKey(script, filename, cflags), code);
+    }
+
+    /**
+     * Key for the compiled-script cache: the source text itself (so that equal hashes never
+     * return the wrong code), the file name it was compiled under, and the compiler flags.
+     */
+    private static final class CompileKey {
+
+        private final String script;
+        private final String filename;
+        private final int cflags;
+        private final int hash;
+
+        CompileKey(String script, String filename, int cflags) {
+            this.script = script;
+            this.filename = filename;
+            this.cflags = cflags;
+            this.hash = (script.hashCode() * 31 + (filename == null ? 0 : filename.hashCode()))
+                    * 31 + cflags;
+        }
+
+        @Override
+        public int hashCode() {
+            return hash;
+        }
+
+        @Override
+        public boolean equals(Object obj) {
+            if (this == obj) {
+                return true;
+            } else if (!(obj instanceof CompileKey)) {
+                return false;
+            }
+            CompileKey other = (CompileKey)obj;
+            return hash == other.hash && cflags == other.cflags
+                    && (filename == null ? other.filename == null : filename.equals(other.filename))
+                    && script.equals(other.script);
+        }
+    }
+
 }
@@ -1,6 +1,7 @@
 package org.python.modules;
 
 import org.python.core.ArgParser;
+import org.python.core.BufferProtocol;
 import org.python.core.Py;
 import org.python.core.PyArray;
 import org.python.core.PyNewWrapper;
@@ -81,9 +82,12 @@ public class PyStruct extends PyObject {
         return struct.unpack(format_def, size, format, new struct.ByteStream(s));
     }
     
-    // xxx - also support byte[], java.nio.(Byte)Buffer at some point?
     @ExposedMethod(defaults = {"0"})
     public PyTuple unpack_from(PyObject string, int offset) {
+        if (string instanceof BufferProtocol) {
+            // Read through the buffer API: no copy of the whole object
+            return struct.unpack_from(format_def, size, format, string, offset);
+        }
         String s = string.toString();
         if (size >= (s.length() - offset + 1))
             throw struct.StructError("unpack_from str size does not match format");
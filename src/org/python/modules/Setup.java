@@ -56,6 +56,7 @@ public class Setup {
 
     public static String[] newbuiltinModules = {
             "_ast:org.python.antlr.ast.AstModule",
+            "_bisect",
             "_bz2:org.python.modules.bz2.bz2",
             "_codecs",
             "_codecs_cn:org.python.modules.cjkcodecs._codecs_cn",
@@ -67,7 +68,9 @@ public class Setup {
             "_csv:org.python.modules._csv._csv",
             "_datetime:org.python.modules._datetime.DatetimeModule",
             "_functools:org.python.modules._functools._functools",
+            "_heapq",
             "_imp:org.python.modules._imp",
+            "_lsprof:org.python.modules._lsprof._lsprof",
             "_multibytecodec:org.python.modules.cjkcodecs._multibytecodec",
             "_multiprocessing:org.python.modules._multiprocessing._multiprocessing",
             "_posixsubprocess",
@@ -81,6 +84,7 @@ public class Setup {
             "binascii",
             "faulthandler:org.python.modules.FaultHandler",
             "itertools:org.python.modules.itertools.itertools",
+            "mmap:org.python.modules.mmap.MmapModule",
             "posix:org.python.modules.posix.PosixModule",
             "subprocess:org.python.modules.subprocess.SubprocessModule",
             "sys:org.python.modules.sys.SysModule",
@@ -0,0 +1,138 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules;
+
+import org.python.core.ArgParser;
+import org.python.core.Py;
+import org.python.core.PyList;
+import org.python.core.PyObject;
+import org.python.expose.ExposedFunction;
+import org.python.expose.ExposedModule;
+
+/**
+ * The Python <code>_bisect</code> module: bisection algorithms, following CPython's
+ * <code>Modules/_bisectmodule.c</code>. A <code>list</code> is read and updated directly;
+ * any other sequence is indexed, and updated by calling its <code>insert</code> method.
+ */
+@ExposedModule(doc = _bisect.__doc__)
+public class _bisect {
+
+    public static final String __doc__ = "Bisection algorithms.\n\n"
+            + "This module provides support for maintaining a list in sorted order without\n"
+            + "having to sort the list after each insertion. For long lists of items with\n"
+            + "expensive comparison operations, this can be an improvement over the more\n"
+            + "common approach.\n";
+
+    private static final String[] kwlist = {"a", "x", "lo", "hi"};
+
+    @ExposedFunction(doc = "bisect_right(a, x[, lo[, hi]]) -> index\n\n"
+            + "Return the index where to insert item x in list a, assuming a is sorted.\n\n"
+            + "The return value i is such that all e in a[:i] have e <= x, and all e in\n"
+            + "a[i:] have e > x.  So if x already appears in the list, i points just\n"
+            + "beyond the rightmost x already there\n\n"
+            + "Optional args lo (default 0) and hi (default len(a)) bound the\n"
+            + "slice of a to be searched.\n")
+    public static int bisect_right(PyObject[] args, String[] keywords) {
+        ArgParser ap = new ArgParser("bisect_right", args, keywords, kwlist, 2);
+        return search(ap, true);
+    }
+
+    @ExposedFunction(doc = "insort_right(a, x[, lo[, hi]])\n\n"
+            + "Insert item x in list a, and keep it sorted assuming a is sorted.\n\n"
+            + "If x is already in a, insert it to the right of the rightmost x.\n\n"
+            + "Optional args lo (default 0) and hi (default len(a)) bound the\n"
+            + "slice of a to be searched.\n")
+    public static void insort_right(PyObject[] args, String[] keywords) {
+        ArgParser ap = new ArgParser("insort_right", args, keywords, kwlist, 2);
+        insert(ap, search(ap, true));
+    }
+
+    @ExposedFunction(doc = "bisect_left(a, x[, lo[, hi]]) -> index\n\n"
+            + "Return the index where to insert item x in list a, assuming a is sorted.\n\n"
+            + "The return value i is such that all e in a[:i] have e < x, and all e in\n"
+            + "a[i:] have e >= x.  So if x already appears in the list, i points just\n"
+            + "before the leftmost x already there.\n\n"
+            + "Optional args lo (default 0) and hi (default len(a)) bound the\n"
+            + "slice of a to be searched.\n")
+    public static int bisect_left(PyObject[] args, String[] keywords) {
+        ArgParser ap = new ArgParser("bisect_left", args, keywords, kwlist, 2);
+        return search(ap, false);
+    }
+
+    @ExposedFunction(doc = "insort_left(a, x[, lo[, hi]])\n\n"
+            + "Insert item x in list a, and keep it sorted assuming a is sorted.\n\n"
+            + "If x is already in a, insert it to the left of the leftmost x.\n\n"
+            + "Optional args lo (default 0) and hi (default len(a)) bound the\n"
+            + "slice of a to be searched.\n")
+    public static void insort_left(PyObject[] args, String[] keywords) {
+        ArgParser ap = new ArgParser("insort_left", args, keywords, kwlist, 2);
+        insert(ap, search(ap, false));
+    }
+
+    @ExposedFunction(doc = "Alias for bisect_right().\n")
+    public static int bisect(PyObject[] args, String[] keywords) {
+        ArgParser ap = new ArgParser("bisect", args, keywords, kwlist, 2);
+        return search(ap, true);
+    }
+
+    @ExposedFunction(doc = "Alias for insort_right().\n")
+    public static void insort(PyObject[] args, String[] keywords) {
+        ArgParser ap = new ArgParser("insort", args, keywords, kwlist, 2);
+        insert(ap, search(ap, true));
+    }
+
+    /**
+     * Binary search of <code>a[lo:hi]</code> for <code>x</code>, where the arguments come from
+     * <code>ap</code>.
+     *
+     * @param right whether to return the position after any items equal to <code>x</code>
+     */
+    private static int search(ArgParser ap, boolean right) {
+        PyObject a = ap.getPyObject(0);
+        PyObject x = ap.getPyObject(1);
+        int lo = ap.getIndex(2, 0);
+        PyObject hiArg = ap.getPyObject(3, Py.None);
+        if (lo < 0) {
+            throw Py.ValueError("lo must be non-negative");
+        }
+        int hi = hiArg == Py.None ? a.__len__() : hiArg.asIndex();
+
+        if (a instanceof PyList) {
+            // Read the backing list directly, without the sequence protocol
+            PyList list = (PyList)a;
+            while (lo < hi) {
+                // (lo + hi) / 2 without overflow
+                int mid = (lo + hi) >>> 1;
+                if (mid >= list.size()) {
+                    throw Py.IndexError("list index out of range");
+                }
+                PyObject item = list.pyget(mid);
+                if (right ? _heapq.lessThan(x, item) : !_heapq.lessThan(item, x)) {
+                    hi = mid;
+                } else {
+                    lo = mid + 1;
+                }
+            }
+        } else {
+            while (lo < hi) {
+                int mid = (lo + hi) >>> 1;
+                PyObject item = a.__getitem__(mid);
+                if (right ? _heapq.lessThan(x, item) : !_heapq.lessThan(item, x)) {
+                    hi = mid;
+                } else {
+                    lo = mid + 1;
+                }
+            }
+        }
+        return lo;
+    }
+
+    private static void insert(ArgParser ap, int index) {
+        PyObject a = ap.getPyObject(0);
+        PyObject x = ap.getPyObject(1);
+        if (a.getType() == PyList.TYPE) {
+            ((PyList)a).pyadd(index, x);
+        } else {
+            a.invoke("insert", Py.newInteger(index), x);
+        }
+    }
+}
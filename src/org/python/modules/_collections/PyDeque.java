@@ -1,5 +1,7 @@
 package org.python.modules._collections;
 
+import java.util.Arrays;
+
 import org.python.core.ArgParser;
 import org.python.core.CompareOp;
 import org.python.core.PyIterator;
@@ -34,18 +36,34 @@ import org.python.expose.MethodType;
  * If maxlen is not specified or is None, deques may grow to an arbitrary length. Otherwise, the
  * deque is bounded to the specified maximum length. Once a bounded length deque is full, when new
  * items are added, a corresponding number of items are discarded from the opposite end.
+ *
+ * The elements are held in a circular array whose capacity is a power of two, so that appends
+ * and pops at either end are amortised O(1) and do not allocate, indexing is O(1), and
+ * <code>rotate(n)</code> moves at most <code>min(n, len-n)</code> elements (none when the array
+ * is full, which is the usual state of a bounded deque).
  */
 @ExposedType(name = "collections.deque")
 public class PyDeque extends PyObject implements Traverseproc {
 
     public static final PyType TYPE = PyType.fromClass(PyDeque.class);
 
+    /** Smallest capacity of {@link #elements} (a power of two). */
+    private static final int MIN_CAPACITY = 8;
+
+    /** Largest bounded deque for which we allocate the whole capacity at the start. */
+    private static final int MAX_PRESIZE = 1 << 16;
+
+    /** Incremented on every change of size or order, so iterators can detect mutation. */
     private long state = 0;
     private int size = 0;
 
     private int maxlen = -1;
 
-    private Node header = new Node(null, null, null);
+    /** Circular array of elements: its length is always a power of two. */
+    private PyObject[] elements = new PyObject[MIN_CAPACITY];
+
+    /** Index in {@link #elements} of the leftmost element. */
+    private int head = 0;
 
     public PyDeque() {
         this(TYPE);
@@ -53,7 +71,6 @@ public class PyDeque extends PyObject implements Traverseproc {
 
     public PyDeque(PyType subType) {
         super(subType);
-        header.left = header.right = header;
     }
 
     @ExposedNew
@@ -81,10 +98,24 @@ public class PyDeque extends PyObject implements Traverseproc {
                 // initializing a deque with an iterator when this deque is not empty means that we discard to empty first
                 deque_clear();
             }
+            if (maxlen > 0 && maxlen <= MAX_PRESIZE && elements.length < maxlen) {
+                // Make room for the whole deque now, so it never has to grow
+                elements = new PyObject[capacityFor(maxlen)];
+                head = 0;
+            }
             deque_extend(iterable);
         }
     }
 
+    /** The smallest power of two at least <code>n</code> (and at least the minimum capacity). */
+    private static int capacityFor(int n) {
+        int c = MIN_CAPACITY;
+        while (c < n) {
+            c <<= 1;
+        }
+        return c;
+    }
+
     /**
      * If maxlen is not specified or is None, deques may grow to an arbitrary length.
      * Otherwise, the deque is bounded to the specified maximum length.
@@ -117,10 +148,16 @@ public class PyDeque extends PyObject implements Traverseproc {
                 // do nothing; this deque will always be empty
                 return;
             } else if (size == maxlen) {
-                deque_popleft();
+                // Full: the new element replaces the leftmost one
+                int mask = elements.length - 1;
+                elements[head] = null;
+                elements[(head + size) & mask] = obj;
+                head = (head + 1) & mask;
+                state++;
+                return;
             }
         }
-        addBefore(obj, header);
+        addLast(obj);
     }
 
     /**
@@ -134,20 +171,113 @@ public class PyDeque extends PyObject implements Traverseproc {
                 // do nothing; this deque will always be empty
                 return;
             } else if (size == maxlen) {
-                deque_pop();
+                // Full: the new element replaces the rightmost one
+                int mask = elements.length - 1;
+                elements[(head + size - 1) & mask] = null;
+                head = (head - 1) & mask;
+                elements[head] = obj;
+                state++;
+                return;
             }
         }
-        addBefore(obj, header.right);
+        addFirst(obj);
     }
 
-    private Node addBefore(PyObject obj, Node node) {
-        // should ALWAYS be called inside a synchronized block
-        Node newNode = new Node(obj, node, node.left);
-        newNode.left.right = newNode;
-        newNode.right.left = newNode;
+    /*
+     * The following helpers should ALWAYS be called inside a synchronized block.
+     */
+
+    /** The element at position <code>i</code> (from the left), with no range check. */
+    private PyObject get(int i) {
+        return elements[(head + i) & (elements.length - 1)];
+    }
+
+    private void addLast(PyObject obj) {
+        if (size == elements.length) {
+            resize(size << 1);
+        }
+        elements[(head + size) & (elements.length - 1)] = obj;
+        size++;
+        state++;
+    }
+
+    private void addFirst(PyObject obj) {
+        if (size == elements.length) {
+            resize(size << 1);
+        }
+        head = (head - 1) & (elements.length - 1);
+        elements[head] = obj;
         size++;
         state++;
-        return newNode;
+    }
+
+    private PyObject removeFirst() {
+        if (size == 0) {
+            throw Py.IndexError("pop from an empty deque");
+        }
+        PyObject obj = elements[head];
+        elements[head] = null;
+        head = (head + 1) & (elements.length - 1);
+        size--;
+        state++;
+        shrinkIfSparse();
+        return obj;
+    }
+
+    private PyObject removeLast() {
+        if (size == 0) {
+            throw Py.IndexError("pop from an empty deque");
+        }
+        int last = (head + size - 1) & (elements.length - 1);
+        PyObject obj = elements[last];
+        elements[last] = null;
+        size--;
+        state++;
+        shrinkIfSparse();
+        return obj;
+    }
+
+    /** Remove the element at position <code>i</code>, moving whichever side is shorter. */
+    private PyObject removeAt(int i) {
+        int mask = elements.length - 1;
+        PyObject obj = get(i);
+        if (i < (size >> 1)) {
+            // Shift the elements left of i one place right
+            for (int j = i; j > 0; j--) {
+                elements[(head + j) & mask] = elements[(head + j - 1) & mask];
+            }
+            elements[head] = null;
+            head = (head + 1) & mask;
+        } else {
+            // Shift the elements right of i one place left
+            for (int j = i; j < size - 1; j++) {
+                elements[(head + j) & mask] = elements[(head + j + 1) & mask];
+            }
+            elements[(head + size - 1) & mask] = null;
+        }
+        size--;
+        state++;
+        shrinkIfSparse();
+        return obj;
+    }
+
+    /** Copy the elements to a new array of the given capacity, with the leftmost at index 0. */
+    private void resize(int capacity) {
+        PyObject[] a = new PyObject[capacity];
+        int n = Math.min(size, elements.length - head);
+        System.arraycopy(elements, head, a, 0, n);
+        System.arraycopy(elements, 0, a, n, size - n);
+        elements = a;
+        head = 0;
+    }
+
+    /** Release storage once the deque is much smaller than its capacity. */
+    private void shrinkIfSparse() {
+        int capacity = elements.length;
+        if (capacity > MIN_CAPACITY && size <= (capacity >> 2)
+                && (maxlen < 0 || maxlen > MAX_PRESIZE)) {
+            resize(capacity >> 1);
+        }
     }
 
     /**
@@ -155,17 +285,14 @@ public class PyDeque extends PyObject implements Traverseproc {
      */
     @ExposedMethod
     public synchronized final void deque_clear() {
-        Node node = header.right;
-        while (node != header) {
-            Node right = node.right;
-            node.left = null;
-            node.right = null;
-            node.data = null;
-            node = right;
-            state++;
-        }
-        header.right = header.left = header;
+        if (maxlen < 0 || maxlen > MAX_PRESIZE) {
+            elements = new PyObject[MIN_CAPACITY];
+        } else {
+            Arrays.fill(elements, null);
+        }
+        head = 0;
         size = 0;
+        state++;
     }
 
     /**
@@ -207,7 +334,7 @@ public class PyDeque extends PyObject implements Traverseproc {
      */
     @ExposedMethod
     public synchronized final PyObject deque_pop() {
-        return removeNode(header.left);
+        return removeLast();
     }
 
     /**
@@ -216,25 +343,9 @@ public class PyDeque extends PyObject implements Traverseproc {
      */
     @ExposedMethod
     public synchronized final PyObject deque_popleft() {
-        return removeNode(header.right);
+        return removeFirst();
     }
 
-    private PyObject removeNode(Node node) {
-        // should ALWAYS be called inside a synchronized block
-        if (node == header) {
-            throw Py.IndexError("pop from an empty deque");
-        }
-        PyObject obj = node.data;
-        node.left.right = node.right;
-        node.right.left = node.left;
-        node.right = null;
-        node.left = null;
-        node.data = null;
-        size--;
-        state++;
-        return obj;
-    } 
-
     /**
      * Removed the first occurrence of value. If not found, raises a 
      * ValueError.
@@ -242,20 +353,16 @@ public class PyDeque extends PyObject implements Traverseproc {
     @ExposedMethod
     public synchronized final PyObject deque_remove(PyObject value) {
         int n = size;
-        Node tmp = header.right;
-        boolean match = false;
         long startState = state;
         for (int i = 0; i < n; i++) {
-            if (tmp.data.equals(value)) {
-                match = true;
-            }
+            boolean match = get(i).equals(value);
             if (startState != state) {
                 throw Py.IndexError("deque mutated during remove().");
             }
             if (match) {
-                return removeNode(tmp);
+                removeAt(i);
+                return Py.None;
             }
-            tmp = tmp.right;
         }
         throw Py.ValueError("deque.remove(x): x not in deque");
     }
@@ -267,16 +374,14 @@ public class PyDeque extends PyObject implements Traverseproc {
     public synchronized final PyObject deque_count(PyObject x) {
         int n = size;
         int count = 0;
-        Node tmp = header.right;
         long startState = state;
         for (int i = 0; i < n; i++) {
-            if (tmp.data.equals(x)) {
+            if (get(i).equals(x)) {
                 count++;
             }
             if (startState != state) {
                 throw Py.RuntimeError("deque mutated during count().");
             }
-            tmp = tmp.right;
         }
         return Py.newInteger(count);
     }
@@ -301,14 +406,28 @@ public class PyDeque extends PyObject implements Traverseproc {
             }
         }
 
-        //rotate right
-        for (int i = 0; i < steps; i++) {
-            deque_appendleft(deque_pop());
-        }
-        //rotate left
-        for (int i = 0; i > steps; i--) {
-            deque_append(deque_popleft());
+        int mask = elements.length - 1;
+        if (size == elements.length) {
+            // No gap to move elements across: rotating only moves the head
+            head = (head - steps) & mask;
+        } else if (steps > 0) {
+            // rotate right: move elements from the right end to the left
+            for (int i = 0; i < steps; i++) {
+                head = (head - 1) & mask;
+                int last = (head + size) & mask;
+                elements[head] = elements[last];
+                elements[last] = null;
+            }
+        } else {
+            // rotate left: move elements from the left end to the right
+            for (int i = 0; i > steps; i--) {
+                int end = (head + size) & mask;
+                elements[end] = elements[head];
+                elements[head] = null;
+                head = (head + 1) & mask;
+            }
         }
+        state++;
     }
 
     /**
@@ -317,18 +436,13 @@ public class PyDeque extends PyObject implements Traverseproc {
      */
     @ExposedMethod
     public synchronized final PyObject deque_reverse() {
-        Node headerRight = header.right;
-        Node headerLeft = header.left;
-        Node node = header.right;
-        while (node != header) {
-            Node right = node.right;
-            Node left = node.left;
-            node.right = left;
-            node.left = right;
-            node = right;
-        }
-        header.right = headerLeft;
-        header.left = headerRight;
+        int mask = elements.length - 1;
+        for (int i = 0, j = size - 1; i < j; i++, j--) {
+            int a = (head + i) & mask, b = (head + j) & mask;
+            PyObject t = elements[a];
+            elements[a] = elements[b];
+            elements[b] = t;
+        }
         state++;
         return Py.None;
     }
@@ -346,12 +460,12 @@ public class PyDeque extends PyObject implements Traverseproc {
         }
         long startState = state;
         StringBuilder buf = new StringBuilder("deque").append("([");
-        for (Node tmp = header.right; tmp != header; tmp = tmp.right) {
-            buf.append(tmp.data.__repr__().toString());
+        for (int i = 0; i < size; i++) {
+            buf.append(get(i).__repr__().toString());
             if (startState != state) {
                 throw Py.RuntimeError("deque mutated during iteration.");
             }
-            if (tmp.right != header) {
+            if (i < size - 1) {
                 buf.append(", ");
             }
         }
@@ -399,7 +513,7 @@ public class PyDeque extends PyObject implements Traverseproc {
 
     @ExposedMethod
     synchronized final PyObject deque___getitem__(PyObject index) {
-        return getNode(index).data;
+        return get(getIndex(index));
     }
 
     @Override
@@ -409,9 +523,7 @@ public class PyDeque extends PyObject implements Traverseproc {
 
     @ExposedMethod
     synchronized final void deque___setitem__(PyObject index, PyObject value) {
-        Node node = getNode(index).right;
-        removeNode(node.left);
-        addBefore(value, node);
+        elements[(head + getIndex(index)) & (elements.length - 1)] = value;
     }
 
     @Override
@@ -421,10 +533,10 @@ public class PyDeque extends PyObject implements Traverseproc {
 
     @ExposedMethod
     synchronized final void deque___delitem__(PyObject key) {
-            removeNode(getNode(key));
+        removeAt(getIndex(key));
     }
 
-    private Node getNode(PyObject index) {
+    private int getIndex(PyObject index) {
         // must ALWAYS be called inside a synchronized block
         int pos = 0;
         if (!index.isIndex()) {
@@ -439,18 +551,7 @@ public class PyDeque extends PyObject implements Traverseproc {
         if (pos < 0 || pos >= size) {
             throw Py.IndexError("index out of range: " + index);
         }
-
-        Node tmp = header;
-        if (pos < (size >> 1)) {
-            for (int i = 0; i <= pos; i++) {
-                tmp = tmp.right;
-            }
-        } else {
-            for (int i = size - 1; i >= pos; i--) {
-                tmp = tmp.left;
-            }
-        }
-        return tmp;
+        return pos;
     }
 
     @Override
@@ -643,21 +744,10 @@ public class PyDeque extends PyObject implements Traverseproc {
         return true;
     }
 
-    private static class Node {
-        private Node left;
-        private Node right;
-        private PyObject data;
-
-        Node(PyObject data, Node right, Node left) {
-            this.data = data;
-            this.right = right;
-            this.left = left;
-        }
-    }
-
     private class PyDequeIter extends PyIterator {
 
-        private Node lastReturned = header;
+        /** Position (from the left) of the next element to return. */
+        private int next = 0;
         private long startState;
 
         public PyDequeIter() {
@@ -670,9 +760,8 @@ public class PyDeque extends PyObject implements Traverseproc {
                 if (startState != state) {
                     throw Py.RuntimeError("deque changed size during iteration");
                 }
-                if (lastReturned.right != header) {
-                    lastReturned = lastReturned.right;
-                    return lastReturned.data;
+                if (next < size) {
+                    return get(next++);
                 }
                 return null;
             }
@@ -686,11 +775,8 @@ public class PyDeque extends PyObject implements Traverseproc {
             if (retVal != 0) {
                 return retVal;
             }
-            /* On first thought one would traverse the circular list
-             * starting with lastReturned. However due to synchronization
-             * it is guaranteed that this would traverse the same objects
-             * as starting with header would do. So we can simply call the
-             * traverse-method of PyDeque.this.
+            /* The iterator refers to the elements through PyDeque.this, so we
+             * can simply call the traverse-method of PyDeque.this.
              */
             return PyDeque.this.traverse(visit, arg);
         }
@@ -711,25 +797,15 @@ public class PyDeque extends PyObject implements Traverseproc {
     /* Traverseproc implementation */
     @Override
     public synchronized int traverse(Visitproc visit, Object arg) {
-    	if (header == null) {
-            return 0;
-        }
         int retVal = 0;
-        if (header.data != null) {
-            retVal = visit.visit(header.data, arg);
-            if (retVal != 0) {
-                return retVal;
-            }
-        }
-        Node tmp = header.right;
-        while (tmp != header) {
-            if (tmp.data != null) {
-                retVal = visit.visit(tmp.data, arg);
+        for (int i = 0; i < size; i++) {
+            PyObject obj = get(i);
+            if (obj != null) {
+                retVal = visit.visit(obj, arg);
                 if (retVal != 0) {
                     return retVal;
                 }
             }
-            tmp = tmp.right;
         }
         return retVal;
     }
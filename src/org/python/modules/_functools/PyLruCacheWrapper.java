@@ -0,0 +1,377 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._functools;
+
+import java.util.Arrays;
+import java.util.concurrent.atomic.AtomicLong;
+
+import org.python.core.ArgParser;
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyFrozenSet;
+import org.python.core.PyLong;
+import org.python.core.PyMethod;
+import org.python.core.PyNewWrapper;
+import org.python.core.PyObject;
+import org.python.core.PyStringMap;
+import org.python.core.PyType;
+import org.python.core.PyUnicode;
+import org.python.core.Traverseproc;
+import org.python.core.Visitproc;
+import org.python.expose.ExposedGet;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedSet;
+import org.python.expose.ExposedType;
+
+import com.google.common.cache.Cache;
+import com.google.common.cache.CacheBuilder;
+
+/**
+ * The callable returned by <code>functools.lru_cache</code>: a wrapper that memoizes the results
+ * of a user function, replacing the Python version in <code>functools</code>.
+ * <p>
+ * Results are held in a Guava cache, which is safe for concurrent use without a global lock.
+ * When bounded, it has a single segment, so that it evicts exactly the least-recently-used entry
+ * across the whole cache; an unbounded cache is split into segments for concurrency. As in CPython, the user function is called
+ * without any lock held, so two threads missing on the same key at once may both call it.
+ * <p>
+ * A call with only positional arguments is keyed by the argument array itself, without building
+ * a tuple, and a single <code>int</code>, <code>str</code>, <code>frozenset</code> or
+ * <code>None</code> argument is its own key.
+ */
+@ExposedType(name = "functools._lru_cache_wrapper", isBaseType = false,
+        doc = PyLruCacheWrapper.lru_cache_doc)
+public class PyLruCacheWrapper extends PyObject implements Traverseproc {
+
+    public static final PyType TYPE = PyType.fromClass(PyLruCacheWrapper.class);
+
+    static final String lru_cache_doc = "Create a cached callable that wraps another function.\n\n"
+            + "user_function:      the function being cached\n\n"
+            + "maxsize:  0         for no caching\n"
+            + "          None      for unlimited cache size\n"
+            + "          n         for a bounded cache\n\n"
+            + "typed:    False     cache f(3) and f(3.0) as identical calls\n"
+            + "          True      cache f(3) and f(3.0) as distinct calls\n\n"
+            + "cache_info_type:    namedtuple class with the fields:\n"
+            + "                        hits misses currsize maxsize\n";
+
+    /** Separates positional from keyword arguments in a key (as in <code>_make_key</code>). */
+    private static final PyObject KWD_MARK = new PyObject();
+
+    /** The wrapped callable. */
+    private final PyObject func;
+
+    /** The maximum size, or -1 if unbounded. */
+    private final int maxsize;
+
+    /** Whether arguments of different types are cached separately. */
+    private final boolean typed;
+
+    /** Type of the named tuple returned by <code>cache_info()</code>. */
+    private final PyObject cacheInfoType;
+
+    /** The cache of results, or <code>null</code> if <code>maxsize</code> is 0. */
+    private final Cache<Object, PyObject> cache;
+
+    private final AtomicLong hits = new AtomicLong();
+    private final AtomicLong misses = new AtomicLong();
+
+    /** Lazily created dict for extra attributes (such as <code>__wrapped__</code>). */
+    private PyObject __dict__;
+
+    PyLruCacheWrapper(PyObject func, int maxsize, boolean typed, PyObject cacheInfoType) {
+        super(TYPE);
+        this.func = func;
+        this.maxsize = maxsize;
+        this.typed = typed;
+        this.cacheInfoType = cacheInfoType;
+        if (maxsize == 0) {
+            cache = null;
+        } else {
+            CacheBuilder<Object, Object> builder = CacheBuilder.newBuilder();
+            if (maxsize > 0) {
+                // Each segment evicts on its own, so only one keeps the order LRU
+                builder.concurrencyLevel(1).maximumSize(maxsize);
+            } else {
+                builder.concurrencyLevel(4);
+            }
+            cache = builder.build();
+        }
+    }
+
+    @ExposedNew
+    static PyObject _lru_cache_wrapper___new__(PyNewWrapper new_, boolean init, PyType subtype,
+            PyObject[] args, String[] keywords) {
+        ArgParser ap = new ArgParser("_lru_cache_wrapper", args, keywords,
+                "user_function", "maxsize", "typed", "cache_info_type");
+        PyObject func = ap.getPyObject(0);
+        PyObject maxsizeObj = ap.getPyObject(1);
+        boolean typed = ap.getPyObject(2).__bool__();
+        PyObject cacheInfoType = ap.getPyObject(3);
+
+        if (!func.isCallable()) {
+            throw Py.TypeError("the first argument must be callable");
+        }
+        int maxsize;
+        if (maxsizeObj == Py.None) {
+            maxsize = -1;
+        } else if (maxsizeObj.isIndex()) {
+            // Negative sizes mean no caching
+            maxsize = Math.max(maxsizeObj.asInt(), 0);
+        } else {
+            throw Py.TypeError("maxsize should be integer or None");
+        }
+        return new PyLruCacheWrapper(func, maxsize, typed, cacheInfoType);
+    }
+
+    @Override
+    public PyObject __call__(PyObject[] args, String[] keywords) {
+        return _lru_cache_wrapper___call__(args, keywords);
+    }
+
+    @ExposedMethod
+    final PyObject _lru_cache_wrapper___call__(PyObject[] args, String[] keywords) {
+        if (cache == null) {
+            misses.incrementAndGet();
+            return func.__call__(args, keywords);
+        }
+        Object key = makeKey(args, keywords);
+        PyObject result = cache.getIfPresent(key);
+        if (result != null) {
+            hits.incrementAndGet();
+            return result;
+        }
+        misses.incrementAndGet();
+        result = func.__call__(args, keywords);
+        cache.put(key, result);
+        return result;
+    }
+
+    /**
+     * Make the cache key for a call, equivalent to <code>functools._make_key</code>.
+     *
+     * @param args positional then keyword argument values (Jython calling convention)
+     * @param keywords names of the keyword arguments at the end of <code>args</code>
+     * @return key with Python equality and hash
+     */
+    private Object makeKey(PyObject[] args, String[] keywords) {
+        int nkw = keywords.length;
+        if (nkw == 0 && !typed) {
+            if (args.length == 1) {
+                PyObject arg = args[0];
+                PyType t = arg.getType();
+                if (t == PyLong.TYPE || t == PyUnicode.TYPE || t == PyFrozenSet.TYPE
+                        || arg == Py.None) {
+                    // Types that cache their hash: the argument is its own key
+                    return arg;
+                }
+            }
+            // No tuple: the key refers to the argument array
+            return new Key(args);
+        }
+
+        int argc = args.length - nkw;
+        int n = argc + (nkw > 0 ? 1 + 2 * nkw : 0);
+        PyObject[] items = new PyObject[typed ? n + argc + nkw : n];
+        System.arraycopy(args, 0, items, 0, argc);
+
+        int[] order = null;
+        if (nkw > 0) {
+            // Keyword arguments in name order, as sorted(kwds.items())
+            order = kwdOrder(keywords);
+            int j = argc;
+            items[j++] = KWD_MARK;
+            for (int i : order) {
+                items[j++] = Py.newUnicode(keywords[i]);
+                items[j++] = args[argc + i];
+            }
+        }
+        if (typed) {
+            int j = n;
+            for (int i = 0; i < argc; i++) {
+                items[j++] = args[i].getType();
+            }
+            for (int i = 0; i < nkw; i++) {
+                items[j++] = args[argc + order[i]].getType();
+            }
+        }
+        return new Key(items);
+    }
+
+    /** The indices of the keyword names in sorted order. */
+    private static int[] kwdOrder(final String[] keywords) {
+        Integer[] order = new Integer[keywords.length];
+        for (int i = 0; i < order.length; i++) {
+            order[i] = i;
+        }
+        if (order.length > 1) {
+            Arrays.sort(order, (a, b) -> keywords[a].compareTo(keywords[b]));
+        }
+        int[] result = new int[order.length];
+        for (int i = 0; i < order.length; i++) {
+            result[i] = order[i];
+        }
+        return result;
+    }
+
+    @ExposedMethod(doc = "Report cache statistics")
+    final PyObject _lru_cache_wrapper_cache_info() {
+        PyObject max = maxsize < 0 ? Py.None : Py.newInteger(maxsize);
+        int currsize = cache == null ? 0 : (int)cache.size();
+        return cacheInfoType.__call__(new PyObject[] {Py.newInteger(hits.get()),
+                Py.newInteger(misses.get()), max, Py.newInteger(currsize)});
+    }
+
+    @ExposedMethod(doc = "Clear the cache and cache statistics")
+    final void _lru_cache_wrapper_cache_clear() {
+        if (cache != null) {
+            cache.invalidateAll();
+        }
+        hits.set(0);
+        misses.set(0);
+    }
+
+    @Override
+    public PyObject __get__(PyObject obj, PyObject type) {
+        return _lru_cache_wrapper___get__(obj, type);
+    }
+
+    @ExposedMethod(defaults = "null")
+    final PyObject _lru_cache_wrapper___get__(PyObject obj, PyObject type) {
+        if (obj == null || obj == Py.None) {
+            return this;
+        }
+        return new PyMethod(this, obj, type);
+    }
+
+    @ExposedMethod
+    final PyObject _lru_cache_wrapper___reduce__() {
+        // Pickled by reference, like the function it wraps
+        return __getattr__("__qualname__");
+    }
+
+    @ExposedMethod
+    final PyObject _lru_cache_wrapper___copy__() {
+        return this;
+    }
+
+    @ExposedMethod
+    final PyObject _lru_cache_wrapper___deepcopy__(PyObject memo) {
+        return this;
+    }
+
+    @Override
+    public void __setattr__(String name, PyObject value) {
+        _lru_cache_wrapper___setattr__(name, value);
+    }
+
+    @ExposedMethod
+    final void _lru_cache_wrapper___setattr__(String name, PyObject value) {
+        ensureDict();
+        super.__setattr__(name, value);
+    }
+
+    @Override
+    public PyObject fastGetDict() {
+        return __dict__;
+    }
+
+    @Override
+    @ExposedGet(name = "__dict__")
+    public PyObject getDict() {
+        ensureDict();
+        return __dict__;
+    }
+
+    @Override
+    @ExposedSet(name = "__dict__")
+    public void setDict(PyObject val) {
+        if (!(val instanceof PyStringMap) && !(val instanceof PyDictionary)) {
+            throw Py.TypeError("setting _lru_cache_wrapper object's dictionary to a non-dict");
+        }
+        __dict__ = val;
+    }
+
+    private void ensureDict() {
+        if (__dict__ == null) {
+            __dict__ = new PyStringMap();
+        }
+    }
+
+    /**
+     * A cache key made from several objects, compared as a tuple of them would be. The hash is
+     * computed once, as by <code>functools._HashedSeq</code>.
+     */
+    private static final class Key {
+
+        private final PyObject[] items;
+        private final int hash;
+
+        Key(PyObject[] items) {
+            this.items = items;
+            // The tuple hash algorithm
+            int x = 0x345678, mult = 1000003;
+            for (int i = items.length - 1; i >= 0; i--) {
+                x = (x ^ items[i].hashCode()) * mult;
+                mult += 82520 + i + i;
+            }
+            this.hash = x + 97531;
+        }
+
+        @Override
+        public int hashCode() {
+            return hash;
+        }
+
+        @Override
+        public boolean equals(Object obj) {
+            if (this == obj) {
+                return true;
+            } else if (!(obj instanceof Key)) {
+                return false;
+            }
+            Key other = (Key)obj;
+            if (hash != other.hash || items.length != other.items.length) {
+                return false;
+            }
+            for (int i = 0; i < items.length; i++) {
+                PyObject a = items[i], b = other.items[i];
+                if (a != b && !a.equals(b)) {
+                    return false;
+                }
+            }
+            return true;
+        }
+    }
+
+    /* Traverseproc implementation */
+    @Override
+    public int traverse(Visitproc visit, Object arg) {
+        int retVal = visit.visit(func, arg);
+        if (retVal != 0) {
+            return retVal;
+        }
+        retVal = visit.visit(cacheInfoType, arg);
+        if (retVal != 0) {
+            return retVal;
+        }
+        if (cache != null) {
+            for (PyObject value : cache.asMap().values()) {
+                retVal = visit.visit(value, arg);
+                if (retVal != 0) {
+                    return retVal;
+                }
+            }
+        }
+        return __dict__ != null ? visit.visit(__dict__, arg) : 0;
+    }
+
+    @Override
+    public boolean refersDirectlyTo(PyObject ob) {
+        if (ob == null) {
+            return false;
+        }
+        return ob == func || ob == cacheInfoType || ob == __dict__
+                || (cache != null && cache.asMap().containsValue(ob));
+    }
+}
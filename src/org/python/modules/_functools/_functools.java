@@ -19,6 +19,7 @@ public class _functools {
     @ModuleInit
     public static void classDictInit(PyObject dict) {
         dict.__setitem__("partial", PyPartial.TYPE);
+        dict.__setitem__("_lru_cache_wrapper", PyLruCacheWrapper.TYPE);
     }
 
     public static final String __doc__reduce =
@@ -0,0 +1,219 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules;
+
+import org.python.core.CompareOp;
+import org.python.core.Py;
+import org.python.core.PyBytes;
+import org.python.core.PyFloat;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyType;
+import org.python.core.PyUnicode;
+import org.python.expose.ExposedFunction;
+import org.python.expose.ExposedModule;
+
+/**
+ * The Python <code>_heapq</code> module: the heap queue algorithm, operating directly on the
+ * elements of a <code>list</code>. This follows CPython's <code>Modules/_heapqmodule.c</code>,
+ * including the <code>_max</code> variants used by <code>heapq.nlargest</code> and
+ * <code>heapq.merge</code>.
+ */
+@ExposedModule(doc = _heapq.__doc__)
+public class _heapq {
+
+    public static final String __doc__ = "Heap queue algorithm (a.k.a. priority queue).\n\n"
+            + "Heaps are arrays for which a[k] <= a[2*k+1] and a[k] <= a[2*k+2] for\n"
+            + "all k, counting elements from 0.  For the sake of comparison,\n"
+            + "non-existing elements are considered to be infinite.  The interesting\n"
+            + "property of a heap is that a[0] is always its smallest element.\n\n"
+            + "Usage:\n\n"
+            + "heap = []            # creates an empty heap\n"
+            + "heappush(heap, item) # pushes a new item on the heap\n"
+            + "item = heappop(heap) # pops the smallest item from the heap\n"
+            + "item = heap[0]       # smallest item on the heap without popping it\n"
+            + "heapify(x)           # transforms list into a heap, in-place, in linear time\n"
+            + "item = heapreplace(heap, item) # pops and returns smallest item, and adds\n"
+            + "                               # new item; the heap size is unchanged\n";
+
+    @ExposedFunction(doc = "heappush(heap, item) -> None. Push item onto heap, maintaining the "
+            + "heap invariant.")
+    public static void heappush(PyObject heap, PyObject item) {
+        PyList list = asList(heap);
+        list.pyadd(item);
+        siftDown(list, 0, list.size() - 1, false);
+    }
+
+    @ExposedFunction(doc = "Pop the smallest item off the heap, maintaining the heap invariant.")
+    public static PyObject heappop(PyObject heap) {
+        return pop(asList(heap), false);
+    }
+
+    @ExposedFunction(doc = "heapreplace(heap, item) -> value. Pop and return the current "
+            + "smallest value, and add the new item.\n\n"
+            + "This is more efficient than heappop() followed by heappush(), and can be\n"
+            + "more appropriate when using a fixed-size heap.  Note that the value\n"
+            + "returned may be larger than item!  That constrains reasonable uses of\n"
+            + "this routine unless written as part of a conditional replacement:\n\n"
+            + "    if item > heap[0]:\n" + "        item = heapreplace(heap, item)\n")
+    public static PyObject heapreplace(PyObject heap, PyObject item) {
+        return replace(asList(heap), item, false);
+    }
+
+    @ExposedFunction(doc = "heappushpop(heap, item) -> value. Push item on the heap, then pop "
+            + "and return the smallest item\n"
+            + "from the heap. The combined action runs more efficiently than\n"
+            + "heappush() followed by a separate call to heappop().")
+    public static PyObject heappushpop(PyObject heap, PyObject item) {
+        PyList list = asList(heap);
+        if (list.size() == 0) {
+            return item;
+        }
+        if (!lessThan(list.pyget(0), item)) {
+            return item;
+        }
+        // The comparison may have changed the list: replace checks it is not empty
+        return replace(list, item, false);
+    }
+
+    @ExposedFunction(doc = "Transform list into a heap, in-place, in O(len(heap)) time.")
+    public static void heapify(PyObject heap) {
+        heapify(asList(heap), false);
+    }
+
+    @ExposedFunction(doc = "Maxheap variant of heappop.")
+    public static PyObject _heappop_max(PyObject heap) {
+        return pop(asList(heap), true);
+    }
+
+    @ExposedFunction(doc = "Maxheap variant of heapreplace")
+    public static PyObject _heapreplace_max(PyObject heap, PyObject item) {
+        return replace(asList(heap), item, true);
+    }
+
+    @ExposedFunction(doc = "Maxheap variant of heapify.")
+    public static void _heapify_max(PyObject heap) {
+        heapify(asList(heap), true);
+    }
+
+    private static PyList asList(PyObject heap) {
+        if (!(heap instanceof PyList)) {
+            throw Py.TypeError("heap argument must be a list");
+        }
+        return (PyList)heap;
+    }
+
+    private static PyObject pop(PyList heap, boolean max) {
+        int n = heap.size();
+        if (n == 0) {
+            throw Py.IndexError("index out of range");
+        }
+        PyObject last = (PyObject)heap.remove(n - 1);
+        if (--n == 0) {
+            return last;
+        }
+        PyObject result = heap.pyget(0);
+        heap.pyset(0, last);
+        siftUp(heap, 0, max);
+        return result;
+    }
+
+    private static PyObject replace(PyList heap, PyObject item, boolean max) {
+        if (heap.size() == 0) {
+            throw Py.IndexError("index out of range");
+        }
+        PyObject result = heap.pyget(0);
+        heap.pyset(0, item);
+        siftUp(heap, 0, max);
+        return result;
+    }
+
+    private static void heapify(PyList heap, boolean max) {
+        /*
+         * Transform bottom-up. The largest index there's any point to looking at is the largest
+         * with a child index in-range, so must have 2*i + 1 < n, or i < (n-1)/2.
+         */
+        int n = heap.size();
+        for (int i = n / 2 - 1; i >= 0; i--) {
+            siftUp(heap, i, max);
+        }
+    }
+
+    /**
+     * Follow the path to the root from <code>pos</code>, moving parents down until finding a place
+     * the item at <code>pos</code> fits. <code>startpos</code> is the index of a leaf with a
+     * possibly out-of-order value.
+     */
+    private static void siftDown(PyList heap, int startpos, int pos, boolean max) {
+        int size = heap.size();
+        if (pos >= size) {
+            throw Py.IndexError("index out of range");
+        }
+        PyObject newitem = heap.pyget(pos);
+        while (pos > startpos) {
+            int parentpos = (pos - 1) >> 1;
+            PyObject parent = heap.pyget(parentpos);
+            boolean lt = max ? lessThan(parent, newitem) : lessThan(newitem, parent);
+            if (size != heap.size()) {
+                throw Py.RuntimeError("list changed size during iteration");
+            }
+            if (!lt) {
+                break;
+            }
+            heap.pyset(pos, parent);
+            pos = parentpos;
+        }
+        heap.pyset(pos, newitem);
+    }
+
+    /**
+     * Bubble the smaller child up until hitting a leaf, then put the item from <code>pos</code>
+     * there and sift it back into place with {@link #siftDown(PyList, int, int, boolean)}. This
+     * makes fewer comparisons than sifting each level, since the item usually belongs near the
+     * bottom.
+     */
+    private static void siftUp(PyList heap, int pos, boolean max) {
+        int endpos = heap.size();
+        int startpos = pos;
+        if (pos >= endpos) {
+            throw Py.IndexError("index out of range");
+        }
+        PyObject newitem = heap.pyget(pos);
+        int childpos = 2 * pos + 1;
+        while (childpos < endpos) {
+            int rightpos = childpos + 1;
+            if (rightpos < endpos) {
+                PyObject left = heap.pyget(childpos), right = heap.pyget(rightpos);
+                boolean lt = max ? lessThan(right, left) : lessThan(left, right);
+                if (endpos != heap.size()) {
+                    throw Py.RuntimeError("list changed size during iteration");
+                }
+                if (!lt) {
+                    childpos = rightpos;
+                }
+            }
+            heap.pyset(pos, heap.pyget(childpos));
+            pos = childpos;
+            childpos = 2 * pos + 1;
+        }
+        heap.pyset(pos, newitem);
+        siftDown(heap, startpos, pos, max);
+    }
+
+    /**
+     * <code>a &lt; b</code> as a Java <code>boolean</code>. Where both are exactly the same
+     * built-in type, that type's comparison is called directly, avoiding the reflected-operand
+     * and recursion checks of the general case.
+     */
+    static boolean lessThan(PyObject a, PyObject b) {
+        PyType t = a.getType();
+        if (t == b.getType()) {
+            if (t == PyFloat.TYPE) {
+                return ((PyFloat)a).getValue() < ((PyFloat)b).getValue();
+            } else if (t == PyLong.TYPE || t == PyUnicode.TYPE || t == PyBytes.TYPE) {
+                return a.richCompare(b, CompareOp.LT).__bool__();
+            }
+        }
+        return a.do_richCompare(b, CompareOp.LT).__bool__();
+    }
+}
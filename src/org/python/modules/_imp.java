@@ -5,6 +5,7 @@ import org.python.Version;
 import org.python.core.BufferProtocol;
 import org.python.core.BytecodeLoader;
 import org.python.core.ClassDictInit;
+import org.python.core.DirectoryCache;
 import org.python.core.PyBUF;
 import org.python.core.PyBuffer;
 import org.python.core.PyByteArray;
@@ -34,6 +35,8 @@ import java.lang.reflect.InvocationTargetException;
 import java.lang.reflect.Method;
 import java.nio.file.Path;
 import java.nio.file.Paths;
+import java.util.ArrayList;
+import java.util.List;
 import java.util.concurrent.locks.ReentrantLock;
 
 @ExposedModule
@@ -243,4 +246,35 @@ public class _imp {
         }
         throw Py.TypeError(String.format("bytes expected, found %s", data.getType().getName()));
     }
+
+    /**
+     * Find a module in a directory, for <code>FileFinder.find_spec</code>, from the cached
+     * listing of the directory (see {@link DirectoryCache#find(String, String, String[], boolean)}).
+     *
+     * @param path directory
+     * @param name last component of the module name
+     * @param suffixes file suffixes in the order of the finder's loaders
+     * @param relaxCase whether to ignore the case of file names
+     * @return <code>(index, path, package_dir)</code> or <code>None</code>
+     */
+    @ExposedFunction
+    public static final PyObject _find_in_directory(PyObject path, PyObject name,
+            PyObject suffixes, PyObject relaxCase) {
+        List<String> s = new ArrayList<>();
+        for (PyObject suffix : suffixes.asIterable()) {
+            s.add(suffix.toString());
+        }
+        PyObject found = DirectoryCache.find(path.toString(), name.toString(),
+                s.toArray(new String[s.size()]), relaxCase.__bool__());
+        return found == null ? Py.None : found;
+    }
+
+    /**
+     * Forget the cached listings of a directory and those under it, so that files added since
+     * are found.
+     */
+    @ExposedFunction
+    public static final void _invalidate_directory(PyObject path) {
+        DirectoryCache.invalidate(path.toString());
+    }
 }
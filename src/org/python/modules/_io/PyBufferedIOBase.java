@@ -0,0 +1,181 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import org.python.core.Py;
+import org.python.core.PyBuffer;
+import org.python.core.PyBytes;
+import org.python.core.PyLong;
+import org.python.core.PyNewWrapper;
+import org.python.core.PyObject;
+import org.python.core.PyType;
+import org.python.core.util.StringUtil;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedType;
+
+/**
+ * An implementation of Python <code>_io._BufferedIOBase</code> mirroring the arrangement of methods
+ * in the CPython version. The concrete buffered types share their implementation through
+ * {@link PyBufferedIOMixin}.
+ */
+@ExposedType(name = "_io._BufferedIOBase", doc = PyBufferedIOBase.doc, base = PyIOBase.class)
+public class PyBufferedIOBase extends PyIOBase {
+
+    public static final PyType TYPE = PyType.fromClass(PyBufferedIOBase.class);
+
+    public PyBufferedIOBase() {
+        this(TYPE);
+    }
+
+    public PyBufferedIOBase(PyType subtype) {
+        super(subtype);
+    }
+
+    @ExposedNew
+    static PyObject _BufferedIOBase__new__(PyNewWrapper new_, boolean init, PyType subtype,
+            PyObject[] args, String[] keywords) {
+        if (new_.for_type == subtype) {
+            // We only want an _io._BufferedIOBase, so the constructor does it all
+            return new PyBufferedIOBase();
+        } else {
+            // We want some sub-class of it (in which __init__ will be called by the caller)
+            return new PyBufferedIOBaseDerived(subtype);
+        }
+    }
+
+    /**
+     * Read and return up to <code>n</code> bytes, or everything to end of stream if
+     * <code>n&lt;0</code>.
+     *
+     * @param n number of bytes to read (if possible)
+     * @return a PyBytes holding the bytes read or <code>Py.None</code> (when a non-blocking source
+     *         is not ready with further data)
+     */
+    public PyObject read(int n) {
+        return _BufferedIOBase_read(Py.newInteger(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = read_doc)
+    final PyObject _BufferedIOBase_read(PyObject n) {
+        throw unsupported("read");
+    }
+
+    /**
+     * Read and return up to <code>n</code> bytes, with at most one read of the underlying raw
+     * stream.
+     *
+     * @param n number of bytes to read (if possible)
+     * @return a PyBytes holding the bytes read or <code>Py.None</code>
+     */
+    public PyObject read1(int n) {
+        return _BufferedIOBase_read1(Py.newInteger(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = read1_doc)
+    final PyObject _BufferedIOBase_read1(PyObject n) {
+        throw unsupported("read1");
+    }
+
+    /**
+     * Read up to <code>len(b)</code> bytes into <code>b</code> using the (possibly overridden)
+     * <code>read()</code> method.
+     *
+     * @param b object supporting the buffer API to fill
+     * @return number of bytes read
+     */
+    public PyObject readinto(PyObject b) {
+        return _BufferedIOBase_readinto(b);
+    }
+
+    @ExposedMethod(doc = readinto_doc)
+    final PyObject _BufferedIOBase_readinto(PyObject b) {
+        return _readinto(b, "read");
+    }
+
+    @ExposedMethod(doc = readinto_doc)
+    final PyObject _BufferedIOBase_readinto1(PyObject b) {
+        return _readinto(b, "read1");
+    }
+
+    private PyObject _readinto(PyObject b, String method) {
+        PyBuffer buf = writablePyBuffer(b);
+        try {
+            PyObject data = invoke(method, Py.newInteger(buf.getLen()));
+            if (!(data instanceof PyBytes)) {
+                throw Py.TypeError(method + "() should return bytes");
+            }
+            byte[] bytes = StringUtil.toBytes(((PyBytes)data).getString());
+            buf.copyFrom(bytes, 0, 0, bytes.length);
+            return new PyLong(bytes.length);
+        } finally {
+            buf.release();
+        }
+    }
+
+    /**
+     * Write the given bytes to the stream, returning the number of bytes accepted.
+     *
+     * @param b bytes-like object to write
+     * @return number of bytes written
+     */
+    public PyObject write(PyObject b) {
+        return _BufferedIOBase_write(b);
+    }
+
+    @ExposedMethod(doc = write_doc)
+    final PyObject _BufferedIOBase_write(PyObject b) {
+        throw unsupported("write");
+    }
+
+    /**
+     * Separate the underlying raw stream from the buffer and return it.
+     *
+     * @return the raw stream
+     */
+    public PyObject detach() {
+        return _BufferedIOBase_detach();
+    }
+
+    @ExposedMethod(doc = detach_doc)
+    final PyObject _BufferedIOBase_detach() {
+        throw unsupported("detach");
+    }
+
+    /*
+     * Documentation strings: public where they might be useful to a subclass.
+     */
+    public static final String read_doc = "Read and return up to n bytes.\n" + "\n"
+            + "If the argument is omitted, None, or negative, reads and\n"
+            + "returns all data until EOF.\n" + "\n"
+            + "Returns an empty bytes object on EOF.\n" + "\n"
+            + "Returns None if the underlying raw stream was open in non-blocking\n"
+            + "mode and no data is available at the moment.";
+
+    public static final String read1_doc = "Read and return up to n bytes, with at most one read()\n"
+            + "call to the underlying raw stream. A short result does not imply\n"
+            + "that EOF is imminent.\n" + "\n" + "Returns an empty bytes object on EOF.";
+
+    public static final String readinto_doc =
+            "Read up to len(b) bytes into b and return the number of bytes read.";
+
+    public static final String write_doc = "Write the given buffer to the IO stream.\n" + "\n"
+            + "Returns the number of bytes written, which is never less than\n" + "len(b).\n"
+            + "\n" + "Raises BlockingIOError if the buffer is full and the\n"
+            + "underlying raw stream cannot accept more data at the moment.";
+
+    public static final String detach_doc =
+            "Disconnect this buffer from its underlying raw stream and return it.\n" + "\n"
+                    + "After the raw stream has been detached, the buffer is in an unusable\n"
+                    + "state.";
+
+    static final String doc = "Base class for buffered IO objects.\n" + "\n"
+            + "The main difference with RawIOBase is that the read() method\n"
+            + "supports omitting the size argument, and does not have a default\n"
+            + "implementation that defers to readinto().\n" + "\n"
+            + "In addition, read(), readinto() and write() may raise\n"
+            + "BlockingIOError if the underlying raw stream is in non-blocking\n"
+            + "mode and not ready; unlike their raw counterparts, they will never\n"
+            + "return None.\n" + "\n"
+            + "A typical implementation should not inherit from a RawIOBase\n"
+            + "implementation, but wrap one.";
+}
@@ -0,0 +1,879 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import java.io.ByteArrayOutputStream;
+import java.nio.ByteBuffer;
+
+import org.python.core.Py;
+import org.python.core.PyBUF;
+import org.python.core.PyBuffer;
+import org.python.core.PyByteArray;
+import org.python.core.PyBytes;
+import org.python.core.PyException;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyTuple;
+import org.python.core.PyType;
+import org.python.core.PyUnicode;
+import org.python.core.Visitproc;
+import org.python.core.util.StringUtil;
+
+import jnr.constants.platform.Errno;
+
+/**
+ * The implementation shared by <code>_io.BufferedReader</code>, <code>_io.BufferedWriter</code> and
+ * <code>_io.BufferedRandom</code>, after the <code>buffered</code> object of CPython's
+ * <code>bufferedio.c</code>. Each of those types exposes the subset of these operations that is
+ * appropriate to it.
+ * <p>
+ * When the raw stream is exactly an <code>_io.FileIO</code> (not a Python subclass of it) reads
+ * and writes go straight to its Java delegate through a {@link ByteBuffer}, so that reading a line,
+ * for example, involves no Python-level call at all. Otherwise the raw stream is driven through its
+ * (possibly overridden) Python methods.
+ * <p>
+ * At most one of the read buffer and the write buffer holds data at any time. While the read
+ * buffer holds data the raw stream is positioned after it, and while the write buffer holds data
+ * the raw stream is positioned where that data will be written.
+ */
+abstract class PyBufferedIOMixin extends PyBufferedIOBase {
+
+    /** The raw stream, or <code>null</code> if not yet initialised or detached. */
+    protected PyObject raw;
+
+    /** The raw stream when it is exactly an <code>_io.FileIO</code>, otherwise <code>null</code>. */
+    private PyFileIO fileRaw;
+
+    /** Set once {@link #_detach()} has separated this object from its raw stream. */
+    private boolean detached;
+
+    /** True when this object is exactly of its built-in type, not of a Python subclass. */
+    protected final boolean exact;
+
+    /** Size of the read and the write buffers. */
+    protected int bufferSize;
+
+    /** Read buffer (or <code>null</code> if not reading) with valid data in [readPos:readEnd]. */
+    private byte[] readBuf;
+    private int readPos, readEnd;
+
+    /** Write buffer (or <code>null</code> if not writing) with pending data in [0:writeEnd]. */
+    private byte[] writeBuf;
+    private int writeEnd;
+
+    /** Keywords of <code>__init__</code> for the buffered types over a single raw stream. */
+    static final String[] initKwds = {"raw", "buffer_size"};
+
+    protected PyBufferedIOMixin(PyType subtype, boolean exact) {
+        super(subtype);
+        this.exact = exact;
+    }
+
+    /**
+     * Attach this object to a raw stream, as <code>__init__</code> does. Any previous state is
+     * discarded.
+     *
+     * @param raw stream to buffer
+     * @param bufferSize size of the buffer(s)
+     * @param reading whether to allocate a read buffer (and require a readable stream)
+     * @param writing whether to allocate a write buffer (and require a writable stream)
+     */
+    protected void init(PyObject raw, int bufferSize, boolean reading, boolean writing) {
+        if (reading && !raw.invoke("readable").__bool__()) {
+            throw _io.UnsupportedOperation("File or stream is not readable.");
+        }
+        if (writing && !raw.invoke("writable").__bool__()) {
+            throw _io.UnsupportedOperation("File or stream is not writable.");
+        }
+        if (bufferSize <= 0) {
+            throw Py.ValueError("buffer size must be strictly positive");
+        }
+        this.raw = raw;
+        this.fileRaw = raw.getType() == PyFileIO.TYPE ? (PyFileIO)raw : null;
+        this.detached = false;
+        this.bufferSize = bufferSize;
+        this.readBuf = reading ? new byte[bufferSize] : null;
+        this.writeBuf = writing ? new byte[bufferSize] : null;
+        readPos = readEnd = writeEnd = 0;
+    }
+
+    /*
+     * ============================================================================================
+     * Access to the raw stream
+     * ============================================================================================
+     */
+
+    protected final void checkInitialized() {
+        if (raw == null) {
+            throw Py.ValueError(detached ? "raw stream has been detached"
+                    : "I/O operation on uninitialized object");
+        }
+    }
+
+    /** Whether the raw stream is closed (which is what <code>closed</code> reports). */
+    final boolean rawClosed() {
+        checkInitialized();
+        return fileRaw != null ? fileRaw.closed() : raw.__getattr__("closed").__bool__();
+    }
+
+    private void checkClosed(String msg) {
+        if (rawClosed()) {
+            throw Py.ValueError(msg);
+        }
+    }
+
+    /**
+     * Read from the raw stream into part of a Java array.
+     *
+     * @return count of bytes read, 0 at end of file, or -1 if a non-blocking stream had no data.
+     */
+    private int rawRead(byte[] b, int off, int len) {
+        if (fileRaw != null) {
+            return fileRaw.readinto(ByteBuffer.wrap(b, off, len));
+        }
+        PyByteArray ba = new PyByteArray(len);
+        PyObject r = raw.invoke("readinto", ba);
+        if (r == Py.None) {
+            return -1;
+        }
+        int n = r.asInt();
+        if (n < 0 || n > len) {
+            String fmt = "raw readinto() returned invalid length %d "
+                    + "(should have been between 0 and %d)";
+            throw Py.IOError(String.format(fmt, n, len));
+        }
+        if (n > 0) {
+            PyBuffer view = ba.getBuffer(PyBUF.FULL_RO);
+            try {
+                view.copyTo(0, b, off, n);
+            } finally {
+                view.release();
+            }
+        }
+        return n;
+    }
+
+    /**
+     * Write part of a Java array to the raw stream.
+     *
+     * @return count of bytes written, or -1 if a non-blocking stream accepted none.
+     */
+    private int rawWrite(byte[] b, int off, int len) {
+        if (fileRaw != null) {
+            return fileRaw.write(ByteBuffer.wrap(b, off, len));
+        }
+        PyObject r = raw.invoke("write", bytes(b, off, len));
+        if (r == Py.None) {
+            return -1;
+        }
+        int n = r.asInt();
+        if (n < 0 || n > len) {
+            String fmt = "raw write() returned invalid length %d "
+                    + "(should have been between 0 and %d)";
+            throw Py.IOError(String.format(fmt, n, len));
+        }
+        return n;
+    }
+
+    private long rawSeek(long pos, int whence) {
+        long n;
+        if (fileRaw != null) {
+            n = fileRaw.seek(pos, whence);
+        } else {
+            n = raw.invoke("seek", Py.newLong(pos), Py.newInteger(whence)).asLong();
+        }
+        if (n < 0) {
+            throw Py.IOError(String.format("Raw stream returned invalid position %d", n));
+        }
+        return n;
+    }
+
+    private long rawTell() {
+        long n = fileRaw != null ? fileRaw.tell() : raw.invoke("tell").asLong();
+        if (n < 0) {
+            throw Py.IOError(String.format("Raw stream returned invalid position %d", n));
+        }
+        return n;
+    }
+
+    /** A <code>bytes</code> object from part of a Java array. */
+    static PyBytes bytes(byte[] b, int off, int len) {
+        return new PyBytes(StringUtil.fromBytes(b, off, len));
+    }
+
+    private static PyException blockingIOError(String msg, int written) {
+        return new PyException(Py.BlockingIOError, new PyTuple(
+                Py.newInteger(Errno.EAGAIN.intValue()), Py.newUnicode(msg),
+                Py.newInteger(written)));
+    }
+
+    /*
+     * ============================================================================================
+     * Buffer management
+     * ============================================================================================
+     */
+
+    /** Number of bytes read ahead and not yet consumed. */
+    private int available() {
+        return readEnd - readPos;
+    }
+
+    /** Refill the (empty) read buffer with one raw read, returning the {@link #rawRead} result. */
+    private int fill() {
+        readPos = 0;
+        int n = rawRead(readBuf, 0, bufferSize);
+        readEnd = n > 0 ? n : 0;
+        return n;
+    }
+
+    /** Before reading, send any pending writes downstream. */
+    private void prepareRead() {
+        if (writeEnd > 0) {
+            flushWriteBuffer();
+        }
+    }
+
+    /** Before writing, drop any read-ahead and move the raw stream back to the logical position. */
+    private void prepareWrite() {
+        int n = available();
+        readPos = readEnd = 0;
+        if (n > 0) {
+            rawSeek(-n, 1);
+        }
+    }
+
+    /** Write the whole of the write buffer to the raw stream. */
+    private void flushWriteBuffer() {
+        int off = 0;
+        try {
+            while (off < writeEnd) {
+                int n = rawWrite(writeBuf, off, writeEnd - off);
+                if (n <= 0) {
+                    throw blockingIOError("write could not complete without blocking", 0);
+                }
+                off += n;
+            }
+        } finally {
+            // Whatever happened, keep only what remains to be written
+            if (off > 0) {
+                System.arraycopy(writeBuf, off, writeBuf, 0, writeEnd - off);
+                writeEnd -= off;
+            }
+        }
+    }
+
+    /** Write data directly to the raw stream (the write buffer being empty). */
+    private void writeAll(byte[] b, int off, int len) {
+        int done = 0;
+        while (done < len) {
+            int n = rawWrite(b, off + done, len - done);
+            if (n <= 0) {
+                throw blockingIOError("write could not complete without blocking", done);
+            }
+            done += n;
+        }
+    }
+
+    /*
+     * ============================================================================================
+     * Implementations of the exposed methods
+     * ============================================================================================
+     */
+
+    /** Convert the argument of a read method to an int, where <code>None</code> means -1. */
+    static int sizeArg(PyObject size) {
+        if (size == null || size == Py.None) {
+            return -1;
+        } else if (size.isIndex()) {
+            return size.asIndex();
+        } else {
+            throw tailoredTypeError("integer", size);
+        }
+    }
+
+    @Override
+    public PyObject read(int n) {
+        return _read(n);
+    }
+
+    final synchronized PyObject _read(int n) {
+        checkClosed("read of closed file");
+        if (n < -1) {
+            throw Py.ValueError("read length must be positive or -1");
+        }
+        prepareRead();
+        if (n < 0) {
+            return readall();
+        }
+
+        int avail = available();
+        if (n <= avail) {
+            // Satisfied entirely from the buffer
+            PyObject result = bytes(readBuf, readPos, n);
+            readPos += n;
+            return result;
+        }
+
+        byte[] out = new byte[n];
+        System.arraycopy(readBuf, readPos, out, 0, avail);
+        int got = avail;
+        readPos = readEnd = 0;
+
+        while (got < n) {
+            int r;
+            if (n - got >= bufferSize) {
+                // A large request: read straight into the result
+                r = rawRead(out, got, n - got);
+                if (r > 0) {
+                    got += r;
+                }
+            } else {
+                r = fill();
+                if (r > 0) {
+                    int k = Math.min(r, n - got);
+                    System.arraycopy(readBuf, 0, out, got, k);
+                    readPos = k;
+                    got += k;
+                }
+            }
+            if (r == 0) {
+                break;
+            } else if (r < 0) {
+                if (got == 0) {
+                    return Py.None;
+                }
+                break;
+            }
+        }
+        return bytes(out, 0, got);
+    }
+
+    /** Everything from the buffer and the raw stream to end of file. */
+    private PyObject readall() {
+        ByteArrayOutputStream acc = new ByteArrayOutputStream(Math.max(bufferSize, available()));
+        acc.write(readBuf, readPos, available());
+        readPos = readEnd = 0;
+
+        if (fileRaw == null) {
+            // Let the raw stream do it if it can
+            PyObject readallMethod = raw.__findattr__("readall");
+            if (readallMethod != null) {
+                PyObject data = readallMethod.__call__();
+                if (data == Py.None) {
+                    return acc.size() == 0 ? Py.None : bytes(acc.toByteArray(), 0, acc.size());
+                } else if (!(data instanceof PyBytes)) {
+                    throw Py.TypeError("readall() should return bytes");
+                } else if (acc.size() == 0) {
+                    return data;
+                }
+                byte[] rest = StringUtil.toBytes(((PyBytes)data).getString());
+                acc.write(rest, 0, rest.length);
+                return bytes(acc.toByteArray(), 0, acc.size());
+            }
+        }
+
+        // The read buffer is empty so we may use it to collect chunks
+        while (true) {
+            int r = rawRead(readBuf, 0, bufferSize);
+            if (r > 0) {
+                acc.write(readBuf, 0, r);
+            } else if (r == 0 || acc.size() > 0) {
+                break;
+            } else {
+                return Py.None;
+            }
+        }
+        return bytes(acc.toByteArray(), 0, acc.size());
+    }
+
+    @Override
+    public PyObject read1(int n) {
+        return _read1(n);
+    }
+
+    final synchronized PyObject _read1(int n) {
+        checkClosed("read of closed file");
+        if (n < 0) {
+            throw Py.ValueError("read length must be positive");
+        } else if (n == 0) {
+            return Py.EmptyByte;
+        }
+        byte[] b = read1Bytes(n);
+        return b == null ? Py.None : bytes(b, 0, b.length);
+    }
+
+    /**
+     * As <code>read1()</code>, but returning a Java array, and <code>null</code> when a
+     * non-blocking raw stream has no data. This is the means by which the text layer takes its
+     * input when the buffer is of a built-in type.
+     *
+     * @param n maximum number of bytes to return (&gt;0)
+     * @return up to <code>n</code> bytes (empty at end of file) or <code>null</code>
+     */
+    final synchronized byte[] read1Bytes(int n) {
+        prepareRead();
+        int avail = available();
+        if (avail == 0) {
+            if (n > bufferSize) {
+                // Bypass the buffer
+                byte[] out = new byte[n];
+                int r = rawRead(out, 0, n);
+                if (r < 0) {
+                    return null;
+                } else if (r < n) {
+                    byte[] part = new byte[r];
+                    System.arraycopy(out, 0, part, 0, r);
+                    return part;
+                }
+                return out;
+            } else if (fill() < 0) {
+                return null;
+            }
+            avail = readEnd;
+        }
+        int k = Math.min(n, avail);
+        byte[] out = new byte[k];
+        System.arraycopy(readBuf, readPos, out, 0, k);
+        readPos += k;
+        return out;
+    }
+
+    final synchronized PyObject _peek(int n) {
+        checkClosed("peek of closed file");
+        prepareRead();
+        if (available() == 0 && fill() < 0) {
+            return Py.EmptyByte;
+        }
+        return bytes(readBuf, readPos, available());
+    }
+
+    @Override
+    public PyObject readinto(PyObject b) {
+        return _readinto(b, false);
+    }
+
+    final synchronized PyObject _readinto(PyObject b, boolean one) {
+        checkClosed("readinto of closed file");
+        PyBuffer buf = writablePyBuffer(b);
+        try {
+            int len = buf.getLen();
+            prepareRead();
+
+            // First from the buffer
+            int got = Math.min(available(), len);
+            if (got > 0) {
+                buf.copyFrom(readBuf, readPos, 0, got);
+                readPos += got;
+                if (one || got == len) {
+                    return new PyLong(got);
+                }
+            }
+
+            // Then from the raw stream
+            while (got < len) {
+                int r;
+                if (len - got >= bufferSize) {
+                    byte[] tmp = new byte[len - got];
+                    r = rawRead(tmp, 0, tmp.length);
+                    if (r > 0) {
+                        buf.copyFrom(tmp, 0, got, r);
+                        got += r;
+                    }
+                } else {
+                    r = fill();
+                    if (r > 0) {
+                        int k = Math.min(r, len - got);
+                        buf.copyFrom(readBuf, 0, got, k);
+                        readPos = k;
+                        got += k;
+                    }
+                }
+                if (r <= 0) {
+                    if (r < 0 && got == 0) {
+                        return Py.None;
+                    }
+                    break;
+                } else if (one) {
+                    break;
+                }
+            }
+            return new PyLong(got);
+
+        } finally {
+            buf.release();
+        }
+    }
+
+    @Override
+    public PyObject readline(int limit) {
+        return _readline(limit);
+    }
+
+    @Override
+    public PyObject readline() {
+        return _readline(-1);
+    }
+
+    /**
+     * Return one line (bytes terminated by <code>'\n'</code>), or <code>limit</code> bytes, or the
+     * rest of the stream, whichever is shortest. The buffer is scanned directly, and most lines are
+     * returned without copying anything but the line itself.
+     *
+     * @param limit maximum number of bytes (&lt;0 means no limit)
+     * @return the line (or fragment)
+     */
+    final synchronized PyObject _readline(int limit) {
+        checkClosed("readline of closed file");
+        prepareRead();
+
+        int remaining = limit < 0 ? Integer.MAX_VALUE : limit;
+        int n = Math.min(available(), remaining);
+        int end = indexOfNewline(readBuf, readPos, readPos + n);
+        if (end >= 0 || n == remaining) {
+            // The line (or as much as we may return) is already in the buffer
+            int len = end >= 0 ? end + 1 - readPos : n;
+            PyObject line = bytes(readBuf, readPos, len);
+            readPos += len;
+            return line;
+        }
+
+        // The line continues past the buffer: collect the pieces
+        ByteArrayOutputStream acc = new ByteArrayOutputStream(Math.max(2 * n, 128));
+        acc.write(readBuf, readPos, n);
+        readPos += n;
+        remaining -= n;
+
+        while (remaining > 0 && fill() > 0) {
+            n = Math.min(readEnd, remaining);
+            end = indexOfNewline(readBuf, 0, n);
+            if (end >= 0) {
+                acc.write(readBuf, 0, end + 1);
+                readPos = end + 1;
+                break;
+            }
+            acc.write(readBuf, 0, n);
+            readPos = n;
+            remaining -= n;
+        }
+        return bytes(acc.toByteArray(), 0, acc.size());
+    }
+
+    private static int indexOfNewline(byte[] b, int start, int end) {
+        for (int i = start; i < end; i++) {
+            if (b[i] == '\n') {
+                return i;
+            }
+        }
+        return -1;
+    }
+
+    @Override
+    public PyObject readlines(PyObject hint) {
+        return _readlines(hint);
+    }
+
+    final PyObject _readlines(PyObject hint) {
+        if (!exact) {
+            // A subclass may have overridden readline()
+            return _IOBase_readlines(hint);
+        }
+        int h = sizeArg(hint);
+        PyList lines = new PyList();
+        int total = 0;
+        while (true) {
+            PyObject line = _readline(-1);
+            int n = line.__len__();
+            if (n == 0) {
+                break;
+            }
+            lines.append(line);
+            total += n;
+            if (h > 0 && total >= h) {
+                break;
+            }
+        }
+        return lines;
+    }
+
+    /**
+     * The next line, for iteration, or <code>null</code> at the end of the stream.
+     */
+    final PyObject nextLine() {
+        PyObject line = exact ? _readline(-1) : invoke("readline");
+        return line.__bool__() ? line : null;
+    }
+
+    @Override
+    public PyObject __next__() {
+        return nextLine();
+    }
+
+    @Override
+    public PyObject write(PyObject b) {
+        return _write(b);
+    }
+
+    final synchronized PyObject _write(PyObject b) {
+        if (b instanceof PyUnicode) {
+            throw Py.TypeError("can't write str to binary stream");
+        }
+        PyBuffer buf = readablePyBuffer(b);
+        try {
+            checkClosed("write to closed file");
+            int len = buf.getLen();
+            prepareWrite();
+            if (len <= bufferSize - writeEnd) {
+                // Fits in the buffer
+                buf.copyTo(0, writeBuf, writeEnd, len);
+                writeEnd += len;
+            } else {
+                flushWriteBuffer();
+                if (len >= bufferSize) {
+                    // Too big to be worth buffering
+                    byte[] data = new byte[len];
+                    buf.copyTo(data, 0);
+                    writeAll(data, 0, len);
+                } else {
+                    buf.copyTo(0, writeBuf, 0, len);
+                    writeEnd = len;
+                }
+            }
+            return new PyLong(len);
+        } finally {
+            buf.release();
+        }
+    }
+
+    /**
+     * Write from a Java array, as <code>write()</code> does. This is the means by which the text
+     * layer delivers its output when the buffer is of a built-in type.
+     */
+    final synchronized void writeBytes(byte[] b, int off, int len) {
+        checkClosed("write to closed file");
+        prepareWrite();
+        if (len <= bufferSize - writeEnd) {
+            System.arraycopy(b, off, writeBuf, writeEnd, len);
+            writeEnd += len;
+        } else {
+            flushWriteBuffer();
+            if (len >= bufferSize) {
+                writeAll(b, off, len);
+            } else {
+                System.arraycopy(b, off, writeBuf, 0, len);
+                writeEnd = len;
+            }
+        }
+    }
+
+    @Override
+    public void flush() {
+        _flush();
+    }
+
+    final synchronized void _flush() {
+        checkClosed("flush of closed file");
+        if (writeEnd > 0) {
+            flushWriteBuffer();
+        }
+    }
+
+    @Override
+    public long seek(long pos, int whence) {
+        return _seek(pos, whence);
+    }
+
+    final synchronized long _seek(long pos, int whence) {
+        if (whence < 0 || whence > 2) {
+            throw Py.ValueError(String.format("whence must be between 0 and 2, not %d", whence));
+        }
+        checkClosed("seek of closed file");
+
+        if (whence != 2 && writeEnd == 0 && readEnd > 0) {
+            // We may be able to move within the read buffer without troubling the raw stream
+            long rawPos = rawTell();
+            long target = whence == 0 ? pos : rawPos - available() + pos;
+            long bufStart = rawPos - readEnd;
+            if (target >= bufStart && target <= rawPos) {
+                readPos = (int)(target - bufStart);
+                return target;
+            }
+        }
+
+        if (writeEnd > 0) {
+            flushWriteBuffer();
+        }
+        if (whence == 1) {
+            pos -= available();
+        }
+        readPos = readEnd = 0;
+        return rawSeek(pos, whence);
+    }
+
+    @Override
+    public long tell() {
+        return _tell();
+    }
+
+    final synchronized long _tell() {
+        long pos = rawTell() - available() + writeEnd;
+        return pos < 0 ? 0 : pos;
+    }
+
+    final synchronized PyObject _truncate(PyObject pos) {
+        checkClosed("truncate of closed file");
+        if (writeEnd > 0) {
+            flushWriteBuffer();
+        }
+        if (pos == null || pos == Py.None) {
+            pos = Py.newLong(_tell());
+        }
+        prepareWrite();
+        return raw.invoke("truncate", pos);
+    }
+
+    @Override
+    public void close() {
+        _close();
+    }
+
+    final synchronized void _close() {
+        if (rawClosed()) {
+            return;
+        }
+        try {
+            // Flushes through the (possibly overridden) flush() and becomes closed locally
+            _IOBase_close();
+        } finally {
+            readPos = readEnd = 0;
+            raw.invoke("close");
+        }
+    }
+
+    @Override
+    public PyObject detach() {
+        return _detach();
+    }
+
+    final synchronized PyObject _detach() {
+        checkInitialized();
+        _flush();
+        PyObject r = raw;
+        raw = null;
+        fileRaw = null;
+        detached = true;
+        dismissCloser();
+        return r;
+    }
+
+    @Override
+    public void __del_builtin__() {
+        if (raw == null) {
+            dismissCloser();
+        } else {
+            super.__del_builtin__();
+        }
+    }
+
+    @Override
+    public boolean readable() {
+        return _readable();
+    }
+
+    final boolean _readable() {
+        checkInitialized();
+        return fileRaw != null ? fileRaw.readable() : raw.invoke("readable").__bool__();
+    }
+
+    @Override
+    public boolean writable() {
+        return _writable();
+    }
+
+    final boolean _writable() {
+        checkInitialized();
+        return fileRaw != null ? fileRaw.writable() : raw.invoke("writable").__bool__();
+    }
+
+    @Override
+    public boolean seekable() {
+        return _seekable();
+    }
+
+    final boolean _seekable() {
+        checkInitialized();
+        return fileRaw != null ? fileRaw.seekable() : raw.invoke("seekable").__bool__();
+    }
+
+    @Override
+    public PyObject fileno() {
+        return _fileno();
+    }
+
+    final PyObject _fileno() {
+        checkInitialized();
+        return raw.invoke("fileno");
+    }
+
+    @Override
+    public boolean isatty() {
+        return _isatty();
+    }
+
+    final boolean _isatty() {
+        checkInitialized();
+        return raw.invoke("isatty").__bool__();
+    }
+
+    final PyObject _raw() {
+        return raw;
+    }
+
+    final PyObject _name() {
+        checkInitialized();
+        return raw.__getattr__("name");
+    }
+
+    final PyObject _mode() {
+        checkInitialized();
+        return raw.__getattr__("mode");
+    }
+
+    /** The <code>repr()</code> of this object, given the name of its built-in type. */
+    final String _repr(String typeName) {
+        PyObject name = null;
+        if (raw != null) {
+            try {
+                name = raw.__findattr__("name");
+            } catch (PyException pye) {
+                if (!pye.match(Py.ValueError)) {
+                    throw pye;
+                }
+            }
+        }
+        if (name == null) {
+            return String.format("<%s>", typeName);
+        } else {
+            return String.format("<%s name=%s>", typeName, name.__repr__().toString());
+        }
+    }
+
+    final PyObject _getstate() {
+        throw Py.TypeError(String.format("cannot serialize '%s' object",
+                getType().fastGetName()));
+    }
+
+    /* Traverseproc implementation */
+    @Override
+    public int traverse(Visitproc visit, Object arg) {
+        int retVal = super.traverse(visit, arg);
+        if (retVal != 0) {
+            return retVal;
+        }
+        return raw == null ? 0 : visit.visit(raw, arg);
+    }
+
+    @Override
+    public boolean refersDirectlyTo(PyObject ob) {
+        return ob != null && (ob == raw || super.refersDirectlyTo(ob));
+    }
+}
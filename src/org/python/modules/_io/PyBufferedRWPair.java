@@ -0,0 +1,177 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import org.python.core.ArgParser;
+import org.python.core.BuiltinDocs;
+import org.python.core.Py;
+import org.python.core.PyException;
+import org.python.core.PyObject;
+import org.python.core.PyType;
+import org.python.core.Visitproc;
+import org.python.expose.ExposedGet;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedType;
+
+/**
+ * An implementation of Python <code>_io.BufferedRWPair</code>, which joins two raw streams, one
+ * readable and one writable, into a single buffered object. Each raw stream gets its own
+ * {@link PyBufferedReader} or {@link PyBufferedWriter}, which do the work.
+ */
+@ExposedType(name = "_io.BufferedRWPair", doc = BuiltinDocs.BufferedRWPair_doc,
+        base = PyBufferedIOBase.class)
+public class PyBufferedRWPair extends PyBufferedIOBase {
+
+    public static final PyType TYPE = PyType.fromClass(PyBufferedRWPair.class);
+
+    /** The buffer for reading (<code>null</code> until initialised). */
+    private PyBufferedReader reader;
+
+    /** The buffer for writing (<code>null</code> until initialised). */
+    private PyBufferedWriter writer;
+
+    public PyBufferedRWPair(PyType subtype) {
+        super(subtype);
+    }
+
+    @ExposedNew
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair___init___doc)
+    final void BufferedRWPair___init__(PyObject[] args, String[] kwds) {
+        ArgParser ap = new ArgParser("BufferedRWPair", args, kwds,
+                new String[] {"reader", "writer", "buffer_size"}, 2);
+        int bufferSize = ap.getInt(2, _io.DEFAULT_BUFFER_SIZE.asInt());
+        reader = new PyBufferedReader(ap.getPyObject(0), bufferSize);
+        writer = new PyBufferedWriter(ap.getPyObject(1), bufferSize);
+        // The pair closes its members: they need not be closed independently at shutdown
+        reader.dismissCloser();
+        writer.dismissCloser();
+    }
+
+    private void checkInitialized() {
+        if (reader == null) {
+            throw Py.ValueError("I/O operation on uninitialized object");
+        }
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRWPair_read_doc)
+    final PyObject BufferedRWPair_read(PyObject n) {
+        checkInitialized();
+        return reader._read(PyBufferedIOMixin.sizeArg(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRWPair_peek_doc)
+    final PyObject BufferedRWPair_peek(PyObject n) {
+        checkInitialized();
+        return reader._peek(PyBufferedIOMixin.sizeArg(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRWPair_read1_doc)
+    final PyObject BufferedRWPair_read1(PyObject n) {
+        checkInitialized();
+        return reader._read1(PyBufferedIOMixin.sizeArg(n));
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair_readinto_doc)
+    final PyObject BufferedRWPair_readinto(PyObject b) {
+        checkInitialized();
+        return reader._readinto(b, false);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair_readinto1_doc)
+    final PyObject BufferedRWPair_readinto1(PyObject b) {
+        checkInitialized();
+        return reader._readinto(b, true);
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRWPair_readline_doc)
+    final PyObject BufferedRWPair_readline(PyObject limit) {
+        checkInitialized();
+        return reader._readline(PyBufferedIOMixin.sizeArg(limit));
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair_write_doc)
+    final PyObject BufferedRWPair_write(PyObject b) {
+        checkInitialized();
+        return writer._write(b);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair_flush_doc)
+    final void BufferedRWPair_flush() {
+        checkInitialized();
+        writer._flush();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair_readable_doc)
+    final boolean BufferedRWPair_readable() {
+        checkInitialized();
+        return reader._readable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair_writable_doc)
+    final boolean BufferedRWPair_writable() {
+        checkInitialized();
+        return writer._writable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair_isatty_doc)
+    final boolean BufferedRWPair_isatty() {
+        checkInitialized();
+        return writer._isatty() || reader._isatty();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRWPair_close_doc)
+    final void BufferedRWPair_close() {
+        checkInitialized();
+        dismissCloser();
+        try {
+            writer._close();
+        } finally {
+            reader._close();
+        }
+    }
+
+    @ExposedGet(name = "closed", doc = BuiltinDocs.BufferedRWPair_closed_doc)
+    final boolean BufferedRWPair_closed() {
+        checkInitialized();
+        return writer.rawClosed();
+    }
+
+    @ExposedMethod
+    final PyObject BufferedRWPair___getstate__() {
+        throw Py.TypeError(String.format("cannot serialize '%s' object",
+                getType().fastGetName()));
+    }
+
+    @Override
+    public void __del_builtin__() {
+        dismissCloser();
+        if (reader != null) {
+            try {
+                BufferedRWPair_close();
+            } catch (PyException pye) {
+                // As for any finaliser, errors are not reported
+            }
+        }
+    }
+
+    /* Traverseproc implementation */
+    @Override
+    public int traverse(Visitproc visit, Object arg) {
+        int retVal = super.traverse(visit, arg);
+        if (retVal != 0) {
+            return retVal;
+        }
+        if (reader != null) {
+            retVal = visit.visit(reader, arg);
+            if (retVal != 0) {
+                return retVal;
+            }
+        }
+        return writer == null ? 0 : visit.visit(writer, arg);
+    }
+
+    @Override
+    public boolean refersDirectlyTo(PyObject ob) {
+        return ob != null && (ob == reader || ob == writer || super.refersDirectlyTo(ob));
+    }
+}
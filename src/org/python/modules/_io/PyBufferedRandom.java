@@ -1,15 +1,193 @@
+/* Copyright (c) Jython Developers */
 package org.python.modules._io;
 
+import org.python.core.ArgParser;
+import org.python.core.BuiltinDocs;
+import org.python.core.Py;
 import org.python.core.PyObject;
 import org.python.core.PyType;
+import org.python.expose.ExposedGet;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
 import org.python.expose.ExposedType;
 
-@ExposedType(name = "_io.BufferedRandom")
-public class PyBufferedRandom extends PyObject {
+/**
+ * An implementation of Python <code>_io.BufferedRandom</code>, a buffer for a seekable raw stream
+ * that may be both read and written. The work is done in {@link PyBufferedIOMixin}: this class
+ * exposes the methods of both a reader and a writer.
+ */
+@ExposedType(name = "_io.BufferedRandom", doc = BuiltinDocs.BufferedRandom_doc,
+        base = PyBufferedIOBase.class)
+public class PyBufferedRandom extends PyBufferedIOMixin {
 
     public static final PyType TYPE = PyType.fromClass(PyBufferedRandom.class);
 
-    public PyBufferedRandom() {
-        super(TYPE);
+    public PyBufferedRandom(PyType subtype) {
+        super(subtype, subtype == TYPE);
+    }
+
+    /**
+     * Construct a <code>BufferedRandom</code> on the given raw stream.
+     *
+     * @param raw seekable raw stream
+     * @param bufferSize size of the buffer
+     */
+    public PyBufferedRandom(PyObject raw, int bufferSize) {
+        this(TYPE);
+        init(checkSeekable(raw), bufferSize, true, true);
+    }
+
+    @ExposedNew
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom___init___doc)
+    final void BufferedRandom___init__(PyObject[] args, String[] kwds) {
+        ArgParser ap = new ArgParser("BufferedRandom", args, kwds, initKwds, 1);
+        init(checkSeekable(ap.getPyObject(0)), ap.getInt(1, _io.DEFAULT_BUFFER_SIZE.asInt()),
+                true, true);
+    }
+
+    private static PyObject checkSeekable(PyObject raw) {
+        if (!raw.invoke("seekable").__bool__()) {
+            throw _io.UnsupportedOperation("File or stream is not seekable.");
+        }
+        return raw;
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRandom_read_doc)
+    final PyObject BufferedRandom_read(PyObject n) {
+        return _read(sizeArg(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRandom_read1_doc)
+    final PyObject BufferedRandom_read1(PyObject n) {
+        return _read1(sizeArg(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRandom_peek_doc)
+    final PyObject BufferedRandom_peek(PyObject n) {
+        return _peek(sizeArg(n));
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_readinto_doc)
+    final PyObject BufferedRandom_readinto(PyObject b) {
+        return _readinto(b, false);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_readinto1_doc)
+    final PyObject BufferedRandom_readinto1(PyObject b) {
+        return _readinto(b, true);
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRandom_readline_doc)
+    final PyObject BufferedRandom_readline(PyObject limit) {
+        return _readline(sizeArg(limit));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRandom_readlines_doc)
+    final PyObject BufferedRandom_readlines(PyObject hint) {
+        return _readlines(hint);
+    }
+
+    @ExposedMethod(doc = "x.__next__() <==> next(x)")
+    final PyObject BufferedRandom___next__() {
+        PyObject line = nextLine();
+        if (line == null) {
+            throw Py.StopIteration();
+        }
+        return line;
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_write_doc)
+    final PyObject BufferedRandom_write(PyObject b) {
+        return _write(b);
+    }
+
+    @ExposedMethod(defaults = "0", doc = BuiltinDocs.BufferedRandom_seek_doc)
+    final long BufferedRandom_seek(long pos, int whence) {
+        return _seek(pos, whence);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_tell_doc)
+    final long BufferedRandom_tell() {
+        return _tell();
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedRandom_truncate_doc)
+    final PyObject BufferedRandom_truncate(PyObject pos) {
+        return _truncate(pos);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_flush_doc)
+    final void BufferedRandom_flush() {
+        _flush();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_close_doc)
+    final void BufferedRandom_close() {
+        _close();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_detach_doc)
+    final PyObject BufferedRandom_detach() {
+        return _detach();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_readable_doc)
+    final boolean BufferedRandom_readable() {
+        return _readable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_writable_doc)
+    final boolean BufferedRandom_writable() {
+        return _writable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_seekable_doc)
+    final boolean BufferedRandom_seekable() {
+        return _seekable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_fileno_doc)
+    final PyObject BufferedRandom_fileno() {
+        return _fileno();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedRandom_isatty_doc)
+    final boolean BufferedRandom_isatty() {
+        return _isatty();
+    }
+
+    @ExposedGet(name = "raw", doc = BuiltinDocs.BufferedRandom_raw_doc)
+    final PyObject BufferedRandom_raw() {
+        return _raw();
+    }
+
+    @ExposedGet(name = "closed", doc = BuiltinDocs.BufferedRandom_closed_doc)
+    final boolean BufferedRandom_closed() {
+        return rawClosed();
+    }
+
+    @ExposedGet(name = "name", doc = BuiltinDocs.BufferedRandom_name_doc)
+    final PyObject BufferedRandom_name() {
+        return _name();
+    }
+
+    @ExposedGet(name = "mode", doc = BuiltinDocs.BufferedRandom_mode_doc)
+    final PyObject BufferedRandom_mode() {
+        return _mode();
+    }
+
+    @ExposedMethod(names = {"__str__", "__repr__"}, doc = BuiltinDocs.object___str___doc)
+    final String BufferedRandom_toString() {
+        return _repr("_io.BufferedRandom");
+    }
+
+    @ExposedMethod
+    final PyObject BufferedRandom___getstate__() {
+        return _getstate();
+    }
+
+    @Override
+    public String toString() {
+        return BufferedRandom_toString();
     }
 }
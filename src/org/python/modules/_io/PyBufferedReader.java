@@ -1,114 +1,175 @@
+/* Copyright (c) Jython Developers */
 package org.python.modules._io;
 
-import com.google.common.io.ByteStreams;
+import org.python.core.ArgParser;
 import org.python.core.BuiltinDocs;
 import org.python.core.Py;
-import org.python.core.PyBytes;
-import org.python.core.PyLong;
 import org.python.core.PyObject;
+import org.python.core.PyType;
+import org.python.expose.ExposedGet;
 import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
 import org.python.expose.ExposedType;
 
-import java.io.BufferedInputStream;
-import java.io.File;
-import java.io.FileInputStream;
-import java.io.FileNotFoundException;
-import java.io.IOException;
-import java.io.InputStream;
-import java.nio.channels.FileChannel;
-
-@ExposedType(name = "_io.BufferedReader")
-public class PyBufferedReader extends PyObject {
-    private BufferedInputStream input;
-    private FileChannel fileChannel;
-
-    public PyBufferedReader(InputStream in) {
-        super(TYPE);
-        input = new BufferedInputStream(in);
-        if (in instanceof FileInputStream) {
-            fileChannel = ((FileInputStream) in).getChannel();
-        }
+/**
+ * An implementation of Python <code>_io.BufferedReader</code>, a buffer for a readable raw stream.
+ * The work is done in {@link PyBufferedIOMixin}: this class exposes the methods appropriate to a
+ * reader.
+ */
+@ExposedType(name = "_io.BufferedReader", doc = BuiltinDocs.BufferedReader_doc,
+        base = PyBufferedIOBase.class)
+public class PyBufferedReader extends PyBufferedIOMixin {
+
+    public static final PyType TYPE = PyType.fromClass(PyBufferedReader.class);
+
+    public PyBufferedReader(PyType subtype) {
+        super(subtype, subtype == TYPE);
     }
 
-    public PyBufferedReader(File file) {
-        super(TYPE);
-        try {
-            FileInputStream fileInputStream = new FileInputStream(file);
-            input = new BufferedInputStream(fileInputStream);
-            fileChannel = fileInputStream.getChannel();
-        } catch (FileNotFoundException e) {
-            throw Py.IOError(e);
-        }
+    /**
+     * Construct a <code>BufferedReader</code> on the given raw stream.
+     *
+     * @param raw readable raw stream
+     * @param bufferSize size of the buffer
+     */
+    public PyBufferedReader(PyObject raw, int bufferSize) {
+        this(TYPE);
+        init(raw, bufferSize, true, false);
     }
 
-    @ExposedMethod(names = {"read", "read1"}, defaults = {"-1"}, doc = BuiltinDocs.BufferedReader_read_doc)
-    public final PyObject BufferedReader_read(PyObject sizeObj) {
-        int size = sizeObj.asInt();
-        if (size < -1) {
-            throw Py.ValueError("invalid number of bytes to read");
-        }
-        byte[] buf;
-        if (size > 0) {
-            buf = new byte[size];
-            try {
-                int n = input.read(buf);
-                return new PyBytes(new String(buf, 0, n));
-            } catch (IOException e) {
-                throw Py.IOError(e);
-            }
-        }
-        try {
-            buf = ByteStreams.toByteArray(input);
-            return new PyBytes(new String(buf));
-        } catch (IOException e) {
-            throw Py.IOError(e);
-        }
+    @ExposedNew
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader___init___doc)
+    final void BufferedReader___init__(PyObject[] args, String[] kwds) {
+        ArgParser ap = new ArgParser("BufferedReader", args, kwds, initKwds, 1);
+        init(ap.getPyObject(0), ap.getInt(1, _io.DEFAULT_BUFFER_SIZE.asInt()), true, false);
     }
 
-    @ExposedMethod(defaults = {"0"}, doc = BuiltinDocs.BufferedReader_peek_doc)
-    public final PyObject BufferedReader_peek(PyObject sizeObj) {
-        int size = sizeObj.asInt();
-        byte[] buf = new byte[size];
-        try {
-            int n = input.read(buf);
-            input.mark(n);
-            input.reset();
-            return new PyBytes(new String(buf, 0, n));
-        } catch (IOException e) {
-            throw Py.IOError(e);
-        }
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedReader_read_doc)
+    final PyObject BufferedReader_read(PyObject n) {
+        return _read(sizeArg(n));
     }
 
-    @ExposedMethod
-    public final PyObject BufferedReader_tell() {
-        try {
-            return new PyLong(fileChannel.position());
-        } catch (IOException e) {
-            throw Py.IOError(e);
-        }
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedReader_read1_doc)
+    final PyObject BufferedReader_read1(PyObject n) {
+        return _read1(sizeArg(n));
     }
 
-    @ExposedMethod(defaults = {"0"}, doc = BuiltinDocs.BufferedReader_seek_doc)
-    public final PyObject BufferedReader_seek(PyObject pos, PyObject whence) {
-        try {
-            return new PyLong(fileChannel.position());
-        } catch (IOException e) {
-            throw Py.IOError(e);
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedReader_peek_doc)
+    final PyObject BufferedReader_peek(PyObject n) {
+        return _peek(sizeArg(n));
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_readinto_doc)
+    final PyObject BufferedReader_readinto(PyObject b) {
+        return _readinto(b, false);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_readinto1_doc)
+    final PyObject BufferedReader_readinto1(PyObject b) {
+        return _readinto(b, true);
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedReader_readline_doc)
+    final PyObject BufferedReader_readline(PyObject limit) {
+        return _readline(sizeArg(limit));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedReader_readlines_doc)
+    final PyObject BufferedReader_readlines(PyObject hint) {
+        return _readlines(hint);
+    }
+
+    @ExposedMethod(doc = "x.__next__() <==> next(x)")
+    final PyObject BufferedReader___next__() {
+        PyObject line = nextLine();
+        if (line == null) {
+            throw Py.StopIteration();
         }
+        return line;
     }
 
-    @ExposedMethod
-    public final PyObject BufferedReader_readable() {
-        return Py.True;
+    @ExposedMethod(defaults = "0", doc = BuiltinDocs.BufferedReader_seek_doc)
+    final long BufferedReader_seek(long pos, int whence) {
+        return _seek(pos, whence);
     }
 
-    @ExposedMethod
-    public final PyObject BufferedReader_writable() {
-        return Py.False;
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_tell_doc)
+    final long BufferedReader_tell() {
+        return _tell();
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedReader_truncate_doc)
+    final PyObject BufferedReader_truncate(PyObject pos) {
+        return _truncate(pos);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_flush_doc)
+    final void BufferedReader_flush() {
+        _flush();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_close_doc)
+    final void BufferedReader_close() {
+        _close();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_detach_doc)
+    final PyObject BufferedReader_detach() {
+        return _detach();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_readable_doc)
+    final boolean BufferedReader_readable() {
+        return _readable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_seekable_doc)
+    final boolean BufferedReader_seekable() {
+        return _seekable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_fileno_doc)
+    final PyObject BufferedReader_fileno() {
+        return _fileno();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedReader_isatty_doc)
+    final boolean BufferedReader_isatty() {
+        return _isatty();
+    }
+
+    @ExposedGet(name = "raw", doc = BuiltinDocs.BufferedReader_raw_doc)
+    final PyObject BufferedReader_raw() {
+        return _raw();
+    }
+
+    @ExposedGet(name = "closed", doc = BuiltinDocs.BufferedReader_closed_doc)
+    final boolean BufferedReader_closed() {
+        return rawClosed();
+    }
+
+    @ExposedGet(name = "name", doc = BuiltinDocs.BufferedReader_name_doc)
+    final PyObject BufferedReader_name() {
+        return _name();
+    }
+
+    @ExposedGet(name = "mode", doc = BuiltinDocs.BufferedReader_mode_doc)
+    final PyObject BufferedReader_mode() {
+        return _mode();
+    }
+
+    @ExposedMethod(names = {"__str__", "__repr__"}, doc = BuiltinDocs.object___str___doc)
+    final String BufferedReader_toString() {
+        return _repr("_io.BufferedReader");
     }
 
     @ExposedMethod
-    public final PyObject BufferedReader_seekable() {
-        return Py.newBoolean(fileChannel != null);
+    final PyObject BufferedReader___getstate__() {
+        return _getstate();
+    }
+
+    @Override
+    public String toString() {
+        return BufferedReader_toString();
     }
 }
@@ -1,72 +1,135 @@
+/* Copyright (c) Jython Developers */
 package org.python.modules._io;
 
-import org.python.core.BufferProtocol;
+import org.python.core.ArgParser;
 import org.python.core.BuiltinDocs;
-import org.python.core.Py;
-import org.python.core.PyBUF;
-import org.python.core.PyLong;
 import org.python.core.PyObject;
 import org.python.core.PyType;
+import org.python.expose.ExposedGet;
 import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
 import org.python.expose.ExposedType;
 
-import java.io.BufferedOutputStream;
-import java.io.File;
-import java.io.FileNotFoundException;
-import java.io.FileOutputStream;
-import java.io.IOException;
-import java.io.OutputStream;
-import java.nio.channels.FileChannel;
+/**
+ * An implementation of Python <code>_io.BufferedWriter</code>, a buffer for a writable raw stream.
+ * The work is done in {@link PyBufferedIOMixin}: this class exposes the methods appropriate to a
+ * writer.
+ */
+@ExposedType(name = "_io.BufferedWriter", doc = BuiltinDocs.BufferedWriter_doc,
+        base = PyBufferedIOBase.class)
+public class PyBufferedWriter extends PyBufferedIOMixin {
 
-@ExposedType(name = "_io.BufferedWriter")
-public class PyBufferedWriter extends PyObject {
     public static final PyType TYPE = PyType.fromClass(PyBufferedWriter.class);
 
-    private BufferedOutputStream output;
-    private FileChannel fileChannel;
+    public PyBufferedWriter(PyType subtype) {
+        super(subtype, subtype == TYPE);
+    }
 
-    public PyBufferedWriter(OutputStream out) {
-        output = new BufferedOutputStream(out);
+    /**
+     * Construct a <code>BufferedWriter</code> on the given raw stream.
+     *
+     * @param raw writable raw stream
+     * @param bufferSize size of the buffer
+     */
+    public PyBufferedWriter(PyObject raw, int bufferSize) {
+        this(TYPE);
+        init(raw, bufferSize, false, true);
     }
 
-    public PyBufferedWriter(File file) {
-        try {
-            FileOutputStream fileOutputStream = new FileOutputStream(file);
-            output = new BufferedOutputStream(fileOutputStream);
-            fileChannel = fileOutputStream.getChannel();
-        } catch (FileNotFoundException e) {
-            throw Py.IOError(e);
-        }
+    @ExposedNew
+    @ExposedMethod(doc = BuiltinDocs.BufferedWriter___init___doc)
+    final void BufferedWriter___init__(PyObject[] args, String[] kwds) {
+        ArgParser ap = new ArgParser("BufferedWriter", args, kwds, initKwds, 1);
+        init(ap.getPyObject(0), ap.getInt(1, _io.DEFAULT_BUFFER_SIZE.asInt()), false, true);
     }
 
     @ExposedMethod(doc = BuiltinDocs.BufferedWriter_write_doc)
-    public final PyObject BufferedWriter_write(PyObject b) {
-        if (!(b instanceof BufferProtocol)) {
-            throw Py.TypeError("bytes-like object expected");
-        }
-        try {
-            output.write(((BufferProtocol) b).getBuffer(PyBUF.FULL_RO).getNIOByteBuffer().array());
-            return new PyLong(b.__len__());
-        } catch (IOException e) {
-            throw Py.IOError(e);
-        }
+    final PyObject BufferedWriter_write(PyObject b) {
+        return _write(b);
     }
 
-    @ExposedMethod(doc = BuiltinDocs.BufferedWriter_flush_doc)
-    public final void BufferedWriter_flush() {
-        try {
-            output.flush();
-        } catch (IOException e) {
-            throw Py.IOError(e);
-        }
+    @ExposedMethod(defaults = "0", doc = BuiltinDocs.BufferedWriter_seek_doc)
+    final long BufferedWriter_seek(long pos, int whence) {
+        return _seek(pos, whence);
     }
 
     @ExposedMethod(doc = BuiltinDocs.BufferedWriter_tell_doc)
-    public final PyObject BufferedWriter_tell() {
-        try {
-            return new PyLong(fileChannel.position());
-        } catch (IOException e) {
-            throw Py.IOError(e);
-        }
+    final long BufferedWriter_tell() {
+        return _tell();
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BufferedWriter_truncate_doc)
+    final PyObject BufferedWriter_truncate(PyObject pos) {
+        return _truncate(pos);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedWriter_flush_doc)
+    final void BufferedWriter_flush() {
+        _flush();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedWriter_close_doc)
+    final void BufferedWriter_close() {
+        _close();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedWriter_detach_doc)
+    final PyObject BufferedWriter_detach() {
+        return _detach();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedWriter_writable_doc)
+    final boolean BufferedWriter_writable() {
+        return _writable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedWriter_seekable_doc)
+    final boolean BufferedWriter_seekable() {
+        return _seekable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedWriter_fileno_doc)
+    final PyObject BufferedWriter_fileno() {
+        return _fileno();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BufferedWriter_isatty_doc)
+    final boolean BufferedWriter_isatty() {
+        return _isatty();
+    }
+
+    @ExposedGet(name = "raw", doc = BuiltinDocs.BufferedWriter_raw_doc)
+    final PyObject BufferedWriter_raw() {
+        return _raw();
+    }
+
+    @ExposedGet(name = "closed", doc = BuiltinDocs.BufferedWriter_closed_doc)
+    final boolean BufferedWriter_closed() {
+        return rawClosed();
+    }
+
+    @ExposedGet(name = "name", doc = BuiltinDocs.BufferedWriter_name_doc)
+    final PyObject BufferedWriter_name() {
+        return _name();
+    }
+
+    @ExposedGet(name = "mode", doc = BuiltinDocs.BufferedWriter_mode_doc)
+    final PyObject BufferedWriter_mode() {
+        return _mode();
+    }
+
+    @ExposedMethod(names = {"__str__", "__repr__"}, doc = BuiltinDocs.object___str___doc)
+    final String BufferedWriter_toString() {
+        return _repr("_io.BufferedWriter");
+    }
+
+    @ExposedMethod
+    final PyObject BufferedWriter___getstate__() {
+        return _getstate();
+    }
+
+    @Override
+    public String toString() {
+        return BufferedWriter_toString();
     }
 }
@@ -0,0 +1,442 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import java.lang.ref.WeakReference;
+import java.util.Arrays;
+
+import org.python.core.ArgParser;
+import org.python.core.BufferProtocol;
+import org.python.core.BuiltinDocs;
+import org.python.core.Py;
+import org.python.core.PyBUF;
+import org.python.core.PyBuffer;
+import org.python.core.PyDictionary;
+import org.python.core.PyLong;
+import org.python.core.PyMemoryView;
+import org.python.core.PyObject;
+import org.python.core.PyTuple;
+import org.python.core.PyType;
+import org.python.core.PyUnicode;
+import org.python.core.buffer.SimpleWritableBuffer;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedType;
+
+/**
+ * An implementation of Python <code>_io.BytesIO</code>, an in-memory binary stream, following the
+ * semantics of CPython's <code>bytesio.c</code>. The content is held in a <code>byte[]</code>
+ * that grows as necessary, and may be exported as a writable <code>memoryview</code> by
+ * <code>getbuffer()</code>, which prevents resizing while the view is held.
+ */
+@ExposedType(name = "_io.BytesIO", doc = BuiltinDocs.BytesIO_doc, base = PyBufferedIOBase.class)
+public class PyBytesIO extends PyBufferedIOBase {
+
+    public static final PyType TYPE = PyType.fromClass(PyBytesIO.class);
+
+    private static final byte[] EMPTY = new byte[0];
+
+    /** The content in <code>buf[:size]</code>, or <code>null</code> when closed. */
+    private byte[] buf = EMPTY;
+    private int size;
+
+    /** Current position (may be beyond the end). */
+    private int pos;
+
+    /** The last buffer exported by <code>getbuffer()</code>, held weakly. */
+    private WeakReference<PyBuffer> export;
+
+    private final boolean exact;
+
+    public PyBytesIO(PyType subtype) {
+        super(subtype);
+        exact = subtype == TYPE;
+    }
+
+    /**
+     * Construct an empty <code>BytesIO</code>.
+     */
+    public PyBytesIO() {
+        this(TYPE);
+    }
+
+    @ExposedNew
+    @ExposedMethod(doc = BuiltinDocs.BytesIO___init___doc)
+    final void BytesIO___init__(PyObject[] args, String[] kwds) {
+        ArgParser ap = new ArgParser("BytesIO", args, kwds, new String[] {"initial_bytes"}, 0);
+        PyObject initial = ap.getPyObject(0, Py.None);
+        checkExports();
+        size = pos = 0;
+        buf = EMPTY;
+        if (initial != Py.None) {
+            writeFrom(initial);
+            pos = 0;
+        }
+    }
+
+    private void checkClosed() {
+        if (buf == null) {
+            throw Py.ValueError("I/O operation on closed file.");
+        }
+    }
+
+    /**
+     * Raise a <code>BufferError</code> if a <code>getbuffer()</code> view of the content is still
+     * held, since the operation the caller is about to perform might change the size or the array.
+     */
+    private void checkExports() {
+        if (export != null) {
+            PyBuffer pybuf = export.get();
+            if (pybuf != null && !pybuf.isReleased()) {
+                throw Py.BufferError("Existing exports of data: object cannot be re-sized");
+            }
+            export = null;
+        }
+    }
+
+    /** Ensure the array can hold at least <code>n</code> bytes. */
+    private void ensureCapacity(int n) {
+        if (n > buf.length) {
+            int newLength = Math.max(n, buf.length + (buf.length >> 1) + 16);
+            byte[] b = new byte[newLength];
+            System.arraycopy(buf, 0, b, 0, size);
+            buf = b;
+        }
+    }
+
+    /** Write the bytes of the object at the current position and return the number written. */
+    private int writeFrom(PyObject obj) {
+        if (obj instanceof PyUnicode) {
+            throw Py.TypeError("a bytes-like object is required, not 'str'");
+        }
+        PyBuffer src = readablePyBuffer(obj);
+        try {
+            int n = src.getLen();
+            if (n > 0) {
+                int end = pos + n;
+                if (end < 0) {
+                    throw Py.OverflowError("new buffer size too large");
+                }
+                ensureCapacity(end);
+                if (pos > size) {
+                    // Pad with zeros from the end to the current position (the array may be old)
+                    Arrays.fill(buf, size, pos, (byte)0);
+                }
+                src.copyTo(0, buf, pos, n);
+                pos = end;
+                if (end > size) {
+                    size = end;
+                }
+            }
+            return n;
+        } finally {
+            src.release();
+        }
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_getvalue_doc)
+    final synchronized PyObject BytesIO_getvalue() {
+        checkClosed();
+        return PyBufferedIOMixin.bytes(buf, 0, size);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_getbuffer_doc)
+    final synchronized PyObject BytesIO_getbuffer() {
+        checkClosed();
+        PyBuffer pybuf = new SimpleWritableBuffer(PyBUF.FULL, buf, 0, size);
+        export = new WeakReference<PyBuffer>(pybuf);
+        return new PyMemoryView(pybuf);
+    }
+
+    @Override
+    public PyObject read(int n) {
+        return BytesIO_read(Py.newInteger(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BytesIO_read_doc)
+    final synchronized PyObject BytesIO_read(PyObject n) {
+        checkClosed();
+        int len = PyBufferedIOMixin.sizeArg(n), avail = Math.max(size - pos, 0);
+        if (len < 0 || len > avail) {
+            len = avail;
+        }
+        PyObject result = PyBufferedIOMixin.bytes(buf, pos, len);
+        pos += len;
+        return result;
+    }
+
+    @Override
+    public PyObject read1(int n) {
+        return BytesIO_read(Py.newInteger(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BytesIO_read1_doc)
+    final PyObject BytesIO_read1(PyObject n) {
+        return BytesIO_read(n);
+    }
+
+    @Override
+    public PyObject readinto(PyObject b) {
+        return BytesIO_readinto(b);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_readinto_doc)
+    final synchronized PyObject BytesIO_readinto(PyObject b) {
+        checkClosed();
+        PyBuffer dest = writablePyBuffer(b);
+        try {
+            int len = Math.min(dest.getLen(), Math.max(size - pos, 0));
+            dest.copyFrom(buf, pos, 0, len);
+            pos += len;
+            return new PyLong(len);
+        } finally {
+            dest.release();
+        }
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_readinto1_doc)
+    final PyObject BytesIO_readinto1(PyObject b) {
+        return BytesIO_readinto(b);
+    }
+
+    @Override
+    public PyObject readline(int limit) {
+        return BytesIO_readline(Py.newInteger(limit));
+    }
+
+    @Override
+    public PyObject readline() {
+        return BytesIO_readline(null);
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BytesIO_readline_doc)
+    final synchronized PyObject BytesIO_readline(PyObject limit) {
+        checkClosed();
+        return _readline(PyBufferedIOMixin.sizeArg(limit));
+    }
+
+    private PyObject _readline(int limit) {
+        int end = size;
+        if (limit >= 0 && pos + limit < size) {
+            end = pos + limit;
+        }
+        int start = pos, i = start;
+        while (i < end) {
+            if (buf[i++] == '\n') {
+                break;
+            }
+        }
+        if (i <= start) {
+            return Py.EmptyByte;
+        }
+        pos = i;
+        return PyBufferedIOMixin.bytes(buf, start, i - start);
+    }
+
+    /**
+     * The next line, for iteration, or <code>null</code> at the end of the stream.
+     */
+    private PyObject nextLine() {
+        PyObject line;
+        if (exact) {
+            synchronized (this) {
+                checkClosed();
+                line = _readline(-1);
+            }
+        } else {
+            line = invoke("readline");
+        }
+        return line.__len__() == 0 ? null : line;
+    }
+
+    @Override
+    public PyObject __next__() {
+        return nextLine();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO___next___doc)
+    final PyObject BytesIO___next__() {
+        PyObject line = nextLine();
+        if (line == null) {
+            throw Py.StopIteration();
+        }
+        return line;
+    }
+
+    @Override
+    public PyObject write(PyObject b) {
+        return BytesIO_write(b);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_write_doc)
+    final synchronized PyObject BytesIO_write(PyObject b) {
+        checkClosed();
+        checkExports();
+        return new PyLong(writeFrom(b));
+    }
+
+    @Override
+    public long seek(long pos, int whence) {
+        return BytesIO_seek(pos, whence);
+    }
+
+    @ExposedMethod(defaults = "0", doc = BuiltinDocs.BytesIO_seek_doc)
+    final synchronized long BytesIO_seek(long pos, int whence) {
+        checkClosed();
+        if (pos < 0 && whence == 0) {
+            throw Py.ValueError(String.format("negative seek value %d", pos));
+        }
+
+        // whence = 0: offset relative to beginning of the string.
+        // whence = 1: offset relative to current position.
+        // whence = 2: offset relative the end of the string.
+        if (whence == 1) {
+            pos += this.pos;
+        } else if (whence == 2) {
+            pos += size;
+        } else if (whence != 0) {
+            throw Py.ValueError(String.format("invalid whence (%d, should be 0, 1 or 2)",
+                    whence));
+        }
+        if (pos < 0) {
+            pos = 0;
+        } else if (pos > Integer.MAX_VALUE) {
+            throw Py.OverflowError("new position too large");
+        }
+        this.pos = (int)pos;
+        return pos;
+    }
+
+    @Override
+    public long tell() {
+        return BytesIO_tell();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_tell_doc)
+    final long BytesIO_tell() {
+        checkClosed();
+        return pos;
+    }
+
+    @Override
+    public long truncate(long size) {
+        return BytesIO_truncate(Py.newLong(size));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.BytesIO_truncate_doc)
+    final synchronized long BytesIO_truncate(PyObject size) {
+        checkClosed();
+        checkExports();
+        long n;
+        if (size == null || size == Py.None) {
+            n = pos;
+        } else if (size.isIndex()) {
+            n = size.asLong();
+        } else {
+            throw tailoredTypeError("integer", size);
+        }
+        if (n < 0) {
+            throw Py.ValueError(String.format("negative size value %d", n));
+        }
+        if (n < this.size) {
+            this.size = (int)n;
+        }
+        return n;
+    }
+
+    @Override
+    public void close() {
+        BytesIO_close();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_close_doc)
+    final synchronized void BytesIO_close() {
+        checkExports();
+        dismissCloser();
+        __closed = true;
+        buf = null;
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_readable_doc)
+    final boolean BytesIO_readable() {
+        checkClosed();
+        return true;
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_writable_doc)
+    final boolean BytesIO_writable() {
+        checkClosed();
+        return true;
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO_seekable_doc)
+    final boolean BytesIO_seekable() {
+        checkClosed();
+        return true;
+    }
+
+    @Override
+    public boolean readable() {
+        return BytesIO_readable();
+    }
+
+    @Override
+    public boolean writable() {
+        return BytesIO_writable();
+    }
+
+    @Override
+    public boolean seekable() {
+        return BytesIO_seekable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO___getstate___doc)
+    final synchronized PyObject BytesIO___getstate__() {
+        PyObject value = BytesIO_getvalue();
+        PyObject dict = __dict__.__len__() == 0 ? Py.None : __dict__.copy();
+        return new PyTuple(value, Py.newLong(pos), dict);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.BytesIO___setstate___doc)
+    final synchronized void BytesIO___setstate__(PyObject state) {
+        if (!(state instanceof PyTuple) || state.__len__() < 3) {
+            throw Py.TypeError(String.format("%s.__setstate__ argument should be 3-tuple, got %s",
+                    getType().fastGetName(), state.getType().fastGetName()));
+        }
+        checkClosed();
+        checkExports();
+
+        // Reset the object to its default state and set the value of the internal buffer
+        PyObject value = state.__getitem__(0);
+        if (value instanceof PyUnicode || !(value instanceof BufferProtocol)) {
+            throw Py.TypeError(String.format(
+                    "'%s' does not support the buffer interface", value.getType().fastGetName()));
+        }
+        size = pos = 0;
+        buf = EMPTY;
+        writeFrom(value);
+
+        // Set the position (unlike write(), the position may be beyond the end)
+        PyObject position = state.__getitem__(1);
+        if (!position.isIndex()) {
+            throw Py.TypeError(String.format("second item of state must be an integer, not %s",
+                    position.getType().fastGetName()));
+        }
+        long p = position.asLong();
+        if (p < 0) {
+            throw Py.ValueError("position value cannot be negative");
+        } else if (p > Integer.MAX_VALUE) {
+            throw Py.OverflowError("new position too large");
+        }
+        pos = (int)p;
+
+        // Set the dictionary of the instance variables
+        PyObject dict = state.__getitem__(2);
+        if (dict != Py.None) {
+            if (!(dict instanceof PyDictionary)) {
+                throw Py.TypeError(String.format("third item of state should be a dict, got a %s",
+                        dict.getType().fastGetName()));
+            }
+            __dict__.update(dict);
+        }
+    }
+}
@@ -276,6 +276,38 @@ public class PyFileIO extends PyRawIOBase {
         return new PyLong(count);
     }
 
+    /**
+     * Read into a Java buffer directly from the delegate. This is for use by the buffered layer
+     * when it knows the (possibly overridden) Python <code>readinto()</code> need not be consulted.
+     *
+     * @param buf to read into between its position and limit
+     * @return number of bytes read (0 at end of file)
+     */
+    int readinto(ByteBuffer buf) {
+        if (!readable) {            // ... (or closed)
+            throw tailoredValueError("read");
+        }
+        synchronized (ioDelegate) {
+            return ioDelegate.readinto(buf);
+        }
+    }
+
+    /**
+     * Write from a Java buffer directly to the delegate. This is for use by the buffered layer when
+     * it knows the (possibly overridden) Python <code>write()</code> need not be consulted.
+     *
+     * @param buf to write from between its position and limit
+     * @return number of bytes written
+     */
+    int write(ByteBuffer buf) {
+        if (!writable) {            // ... (or closed)
+            throw tailoredValueError("writ");
+        }
+        synchronized (ioDelegate) {
+            return ioDelegate.write(buf);
+        }
+    }
+
     @Override
     public PyObject write(PyObject buf) {
         return FileIO_write(buf);
@@ -760,6 +760,14 @@ public class PyIOBase extends PyObject implements FinalizableBuiltin, Traversepr
         invoke("close");
     }
 
+    /**
+     * Stop this object being closed at shutdown, for example when it has been detached from the
+     * stream it wrapped and no longer owns anything that needs closing.
+     */
+    final void dismissCloser() {
+        closer.dismiss();
+    }
+
     /** Convenience method providing the exception in the _checkWhatever() methods. */
     private static PyException tailoredIOError(String msg, String oper) {
         if (msg == null) {
@@ -0,0 +1,502 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import org.python.core.ArgParser;
+import org.python.core.BuiltinDocs;
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyTuple;
+import org.python.core.PyType;
+import org.python.core.PyUnicode;
+import org.python.expose.ExposedGet;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedType;
+
+/**
+ * An implementation of Python <code>_io.StringIO</code>, an in-memory text stream, following the
+ * semantics of CPython's <code>stringio.c</code>. Newlines are translated (according to the
+ * <code>newline</code> argument) as text is written, so reading is a matter of scanning the
+ * stored text.
+ * <p>
+ * The text is held in a UTF-16 <code>StringBuilder</code> but positions are in code points, as
+ * in CPython. While the text contains no surrogate characters the two coincide, and no conversion
+ * is necessary.
+ */
+@ExposedType(name = "_io.StringIO", doc = BuiltinDocs.StringIO_doc, base = PyTextIOBase.class)
+public class PyStringIO extends PyTextIOBase {
+
+    public static final PyType TYPE = PyType.fromClass(PyStringIO.class);
+
+    /** The text, or <code>null</code> if not yet initialised (or closed). */
+    private StringBuilder buf;
+
+    /** Length of {@link #buf} in code points. */
+    private int size;
+
+    /** Current position in code points (may be beyond the end). */
+    private int pos;
+
+    /** True while {@link #buf} contains no surrogates (so that indexes are code points). */
+    private boolean basic = true;
+
+    private final boolean exact;
+
+    /** The <code>newline</code> argument to <code>__init__</code> (for the state). */
+    private String readnl;
+    private boolean readuniversal, readtranslate;
+
+    /** What to write for <code>'\n'</code>, or <code>null</code> to write it unchanged. */
+    private String writenl;
+
+    /** Universal newline decoder, or <code>null</code> if newlines are not universal. */
+    private TextDecoder decoder;
+
+    public PyStringIO(PyType subtype) {
+        super(subtype);
+        exact = subtype == TYPE;
+    }
+
+    /**
+     * Construct an empty <code>StringIO</code> with the default newline handling.
+     */
+    public PyStringIO() {
+        this(TYPE);
+        init(null, "\n");
+    }
+
+    @ExposedNew
+    @ExposedMethod(doc = BuiltinDocs.StringIO___init___doc)
+    final void StringIO___init__(PyObject[] args, String[] kwds) {
+        ArgParser ap = new ArgParser("StringIO", args, kwds,
+                new String[] {"initial_value", "newline"}, 0);
+        PyObject value = ap.getPyObject(0, Py.None);
+        PyObject newline = ap.getPyObject(1, Py.newUnicode("\n"));
+        init(value, newlineArg(newline));
+    }
+
+    private static String newlineArg(PyObject newline) {
+        if (newline == Py.None) {
+            return null;
+        } else if (!(newline instanceof PyUnicode)) {
+            throw Py.TypeError(String.format("newline must be str or None, not %s",
+                    newline.getType().fastGetName()));
+        }
+        String nl = newline.toString();
+        if (!nl.isEmpty() && !nl.equals("\n") && !nl.equals("\r") && !nl.equals("\r\n")) {
+            throw Py.ValueError(String.format("illegal newline value: %s", newline.__repr__()));
+        }
+        return nl;
+    }
+
+    private void init(PyObject value, String newline) {
+        if (value != null && value != Py.None && !(value instanceof PyUnicode)) {
+            throw Py.TypeError(String.format("initial_value must be str or None, not %s",
+                    value.getType().fastGetName()));
+        }
+
+        readnl = newline;
+        readuniversal = newline == null || newline.isEmpty();
+        readtranslate = newline == null;
+        /*
+         * If newline == "", we don't translate anything. If newline == "\n" or newline == None,
+         * translation is to "\n", which is a no-op (for None, the decoder translates).
+         */
+        writenl = newline != null && newline.startsWith("\r") ? newline : null;
+        decoder = readuniversal ? TextDecoder.forNewlines(readtranslate) : null;
+
+        buf = new StringBuilder();
+        size = pos = 0;
+        basic = true;
+        __closed = false;
+
+        if (value != null && value != Py.None) {
+            writeText(((PyUnicode)value).getString());
+            pos = 0;
+        }
+    }
+
+    private void checkInitialized() {
+        if (buf == null && !__closed) {
+            throw Py.ValueError("I/O operation on uninitialized object");
+        }
+    }
+
+    private void checkClosed() {
+        checkInitialized();
+        if (__closed) {
+            throw Py.ValueError("I/O operation on closed file");
+        }
+    }
+
+    /** Index in {@link #buf} of the code point at position <code>p</code> (&le;size). */
+    private int index(int p) {
+        return basic ? p : buf.offsetByCodePoints(0, p);
+    }
+
+    private static boolean hasSurrogates(CharSequence s) {
+        for (int i = 0; i < s.length(); i++) {
+            if (Character.isSurrogate(s.charAt(i))) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /**
+     * Write text at the current position, translating newlines, and advance the position.
+     *
+     * @param text to write
+     */
+    private void writeText(String text) {
+        if (decoder != null) {
+            text = decoder.decode(text, true);
+        }
+        if (writenl != null) {
+            text = text.replace("\n", writenl);
+        }
+        int len = text.length();
+        if (len == 0) {
+            return;
+        }
+
+        if (basic && hasSurrogates(text)) {
+            // From now on, positions and indexes differ
+            basic = false;
+        }
+        int n = basic ? len : text.codePointCount(0, len);
+
+        if (pos > size) {
+            // Pad with nulls from the end to the current position
+            for (int i = size; i < pos; i++) {
+                buf.append('\0');
+            }
+            size = pos;
+        }
+
+        int start = index(pos);
+        if (pos + n >= size) {
+            // Overwrite (some of) the tail and extend
+            buf.setLength(start);
+            buf.append(text);
+            size = pos + n;
+        } else {
+            buf.replace(start, index(pos + n), text);
+        }
+        pos += n;
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.StringIO_getvalue_doc)
+    final synchronized PyObject StringIO_getvalue() {
+        checkClosed();
+        return Py.newUnicode(buf.toString(), basic);
+    }
+
+    @Override
+    public PyObject read(int n) {
+        return StringIO_read(Py.newInteger(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.StringIO_read_doc)
+    final synchronized PyObject StringIO_read(PyObject n) {
+        checkClosed();
+        int size = PyBufferedIOMixin.sizeArg(n), avail = this.size - pos;
+        if (size < 0 || size > avail) {
+            size = avail;
+        }
+        if (size <= 0) {
+            return Py.newUnicode("");
+        }
+        int start = index(pos);
+        pos += size;
+        return Py.newUnicode(buf.substring(start, index(pos)), basic);
+    }
+
+    @Override
+    public PyObject readline(int limit) {
+        return StringIO_readline(Py.newInteger(limit));
+    }
+
+    @Override
+    public PyObject readline() {
+        return StringIO_readline(null);
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.StringIO_readline_doc)
+    final synchronized PyObject StringIO_readline(PyObject limit) {
+        checkClosed();
+        return Py.newUnicode(_readline(PyBufferedIOMixin.sizeArg(limit)), basic);
+    }
+
+    private String _readline(int limit) {
+        if (pos >= size) {
+            return "";
+        }
+        int start = index(pos);
+        int end = limit >= 0 && pos + limit < size ? index(pos + limit) : buf.length();
+
+        // Find the line ending in buf[start:end]
+        int lineEnd = end;
+        if (readtranslate) {
+            int i = buf.indexOf("\n", start);
+            if (i >= 0 && i < end) {
+                lineEnd = i + 1;
+            }
+        } else if (readuniversal) {
+            for (int i = start; i < end; i++) {
+                char c = buf.charAt(i);
+                if (c == '\n') {
+                    lineEnd = i + 1;
+                    break;
+                } else if (c == '\r') {
+                    lineEnd = (i + 1 < end && buf.charAt(i + 1) == '\n') ? i + 2 : i + 1;
+                    break;
+                }
+            }
+        } else {
+            int i = buf.indexOf(readnl, start);
+            if (i >= 0 && i + readnl.length() <= end) {
+                lineEnd = i + readnl.length();
+            }
+        }
+
+        String line = buf.substring(start, lineEnd);
+        pos += basic ? line.length() : line.codePointCount(0, line.length());
+        return line;
+    }
+
+    /**
+     * The next line, for iteration, or <code>null</code> at the end of the stream.
+     */
+    private PyObject nextLine() {
+        PyObject line;
+        if (exact) {
+            checkClosed();
+            line = Py.newUnicode(_readline(-1), basic);
+        } else {
+            line = invoke("readline");
+            if (!(line instanceof PyUnicode)) {
+                throw Py.IOError(String.format("readline() should have returned a str object, "
+                        + "not '%s'", line.getType().fastGetName()));
+            }
+        }
+        return line.__len__() == 0 ? null : line;
+    }
+
+    @Override
+    public PyObject __next__() {
+        return nextLine();
+    }
+
+    @ExposedMethod(doc = "x.__next__() <==> next(x)")
+    final PyObject StringIO___next__() {
+        PyObject line = nextLine();
+        if (line == null) {
+            throw Py.StopIteration();
+        }
+        return line;
+    }
+
+    @Override
+    public PyObject write(PyObject s) {
+        return StringIO_write(s);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.StringIO_write_doc)
+    final synchronized PyObject StringIO_write(PyObject s) {
+        if (!(s instanceof PyUnicode)) {
+            throw Py.TypeError(String.format("string argument expected, got '%s'",
+                    s.getType().fastGetName()));
+        }
+        checkClosed();
+        int n = s.__len__();
+        if (n > 0) {
+            writeText(((PyUnicode)s).getString());
+        }
+        return Py.newInteger(n);
+    }
+
+    @Override
+    public long seek(long pos, int whence) {
+        return StringIO_seek(pos, whence);
+    }
+
+    @ExposedMethod(defaults = "0", doc = BuiltinDocs.StringIO_seek_doc)
+    final synchronized long StringIO_seek(long pos, int whence) {
+        checkClosed();
+        if (whence != 0 && whence != 1 && whence != 2) {
+            throw Py.ValueError(String.format("Invalid whence (%d, should be 0, 1 or 2)",
+                    whence));
+        } else if (pos < 0 && whence == 0) {
+            throw Py.ValueError(String.format("Negative seek position %d", pos));
+        } else if (whence != 0 && pos != 0) {
+            throw Py.IOError("Can't do nonzero cur-relative seeks");
+        }
+
+        // whence = 0: offset relative to beginning of the string.
+        // whence = 1: no change to current position.
+        // whence = 2: change position to end of file.
+        if (whence == 1) {
+            pos = this.pos;
+        } else if (whence == 2) {
+            pos = size;
+        } else if (pos > Integer.MAX_VALUE) {
+            throw Py.OverflowError("seek position too large");
+        }
+        this.pos = (int)pos;
+        return pos;
+    }
+
+    @Override
+    public long tell() {
+        return StringIO_tell();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.StringIO_tell_doc)
+    final long StringIO_tell() {
+        checkClosed();
+        return pos;
+    }
+
+    @Override
+    public long truncate(long size) {
+        return StringIO_truncate(Py.newLong(size));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.StringIO_truncate_doc)
+    final synchronized long StringIO_truncate(PyObject size) {
+        checkClosed();
+        long n;
+        if (size == null || size == Py.None) {
+            n = pos;
+        } else if (size.isIndex()) {
+            n = size.asLong();
+        } else {
+            throw tailoredTypeError("integer", size);
+        }
+        if (n < 0) {
+            throw Py.ValueError(String.format("Negative size value %d", n));
+        }
+        if (n < this.size) {
+            buf.setLength(index((int)n));
+            this.size = (int)n;
+        }
+        return n;
+    }
+
+    @Override
+    public void close() {
+        StringIO_close();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.StringIO_close_doc)
+    final synchronized void StringIO_close() {
+        dismissCloser();
+        __closed = true;
+        // Free up some memory
+        buf = null;
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.StringIO_readable_doc)
+    final boolean StringIO_readable() {
+        checkClosed();
+        return true;
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.StringIO_writable_doc)
+    final boolean StringIO_writable() {
+        checkClosed();
+        return true;
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.StringIO_seekable_doc)
+    final boolean StringIO_seekable() {
+        checkClosed();
+        return true;
+    }
+
+    @Override
+    public boolean readable() {
+        return StringIO_readable();
+    }
+
+    @Override
+    public boolean writable() {
+        return StringIO_writable();
+    }
+
+    @Override
+    public boolean seekable() {
+        return StringIO_seekable();
+    }
+
+    @ExposedGet(name = "line_buffering", doc = BuiltinDocs.StringIO_line_buffering_doc)
+    final boolean StringIO_line_buffering() {
+        checkClosed();
+        return false;
+    }
+
+    @ExposedGet(name = "newlines", doc = BuiltinDocs.StringIO_newlines_doc)
+    final PyObject StringIO_newlines() {
+        checkClosed();
+        return decoder == null ? Py.None : decoder.getNewlines();
+    }
+
+    @ExposedMethod
+    final synchronized PyObject StringIO___getstate__() {
+        PyObject value = StringIO_getvalue();
+        PyObject dict = __dict__.__len__() == 0 ? Py.None : __dict__.copy();
+        return new PyTuple(value, readnl == null ? Py.None : Py.newUnicode(readnl),
+                Py.newLong(pos), dict);
+    }
+
+    @ExposedMethod
+    final synchronized void StringIO___setstate__(PyObject state) {
+        checkClosed();
+        if (!(state instanceof PyTuple) || state.__len__() < 4) {
+            throw Py.TypeError(String.format("%s.__setstate__ argument should be 4-tuple, got %s",
+                    getType().fastGetName(), state.getType().fastGetName()));
+        }
+        PyObject value = state.__getitem__(0);
+        PyObject position = state.__getitem__(2);
+        PyObject dict = state.__getitem__(3);
+
+        // Initialise the object's state (validating the newline argument)
+        init(null, newlineArg(state.__getitem__(1)));
+
+        /*
+         * Restore the buffer state. We don't write the value, since the newlines in it have already
+         * been translated once by __init__.
+         */
+        if (!(value instanceof PyUnicode)) {
+            throw Py.TypeError(String.format("initial_value must be str, not %s",
+                    value.getType().fastGetName()));
+        }
+        String text = ((PyUnicode)value).getString();
+        buf.append(text);
+        basic = !hasSurrogates(text);
+        size = basic ? text.length() : text.codePointCount(0, text.length());
+
+        // Restore the position
+        if (!(position instanceof PyLong) && !position.isIndex()) {
+            throw Py.TypeError(String.format("third item of state must be an integer, got %s",
+                    position.getType().fastGetName()));
+        }
+        long p = position.asLong();
+        if (p < 0) {
+            throw Py.ValueError("position value cannot be negative");
+        }
+        pos = (int)p;
+
+        // Set the dictionary of the instance variables
+        if (dict != Py.None) {
+            if (!(dict instanceof PyDictionary)) {
+                throw Py.TypeError(String.format("fourth item of state should be a dict, got a %s",
+                        dict.getType().fastGetName()));
+            }
+            __dict__.update(dict);
+        }
+    }
+}
@@ -0,0 +1,110 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import org.python.core.BuiltinDocs;
+import org.python.core.Py;
+import org.python.core.PyNewWrapper;
+import org.python.core.PyObject;
+import org.python.core.PyType;
+import org.python.expose.ExposedGet;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedType;
+
+/**
+ * An implementation of Python <code>_io._TextIOBase</code> mirroring the arrangement of methods in
+ * the CPython version: the base of {@link PyTextIOWrapper} and {@link PyStringIO}.
+ */
+@ExposedType(name = "_io._TextIOBase", doc = BuiltinDocs.TextIOBase_doc, base = PyIOBase.class)
+public class PyTextIOBase extends PyIOBase {
+
+    public static final PyType TYPE = PyType.fromClass(PyTextIOBase.class);
+
+    public PyTextIOBase() {
+        this(TYPE);
+    }
+
+    public PyTextIOBase(PyType subtype) {
+        super(subtype);
+    }
+
+    @ExposedNew
+    static PyObject _TextIOBase__new__(PyNewWrapper new_, boolean init, PyType subtype,
+            PyObject[] args, String[] keywords) {
+        if (new_.for_type == subtype) {
+            return new PyTextIOBase();
+        } else {
+            return new PyTextIOBaseDerived(subtype);
+        }
+    }
+
+    /**
+     * Read and return up to <code>n</code> characters, or everything to end of stream if
+     * <code>n&lt;0</code>.
+     *
+     * @param n number of characters to read (if possible)
+     * @return the text read
+     */
+    public PyObject read(int n) {
+        return _TextIOBase_read(Py.newInteger(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.TextIOBase_read_doc)
+    final PyObject _TextIOBase_read(PyObject n) {
+        throw unsupported("read");
+    }
+
+    @Override
+    public PyObject readline(int limit) {
+        return _TextIOBase_readline(Py.newInteger(limit));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.TextIOBase_readline_doc)
+    final PyObject _TextIOBase_readline(PyObject limit) {
+        throw unsupported("readline");
+    }
+
+    /**
+     * Write the string <code>s</code> to the stream, returning the number of characters written.
+     *
+     * @param s text to write
+     * @return number of characters written
+     */
+    public PyObject write(PyObject s) {
+        return _TextIOBase_write(s);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOBase_write_doc)
+    final PyObject _TextIOBase_write(PyObject s) {
+        throw unsupported("write");
+    }
+
+    /**
+     * Separate the underlying buffer from the text layer and return it.
+     *
+     * @return the buffer
+     */
+    public PyObject detach() {
+        return _TextIOBase_detach();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOBase_detach_doc)
+    final PyObject _TextIOBase_detach() {
+        throw unsupported("detach");
+    }
+
+    @ExposedGet(name = "encoding", doc = BuiltinDocs.TextIOBase_encoding_doc)
+    final PyObject _TextIOBase_encoding() {
+        return Py.None;
+    }
+
+    @ExposedGet(name = "newlines", doc = BuiltinDocs.TextIOBase_newlines_doc)
+    final PyObject _TextIOBase_newlines() {
+        return Py.None;
+    }
+
+    @ExposedGet(name = "errors", doc = BuiltinDocs.TextIOBase_errors_doc)
+    final PyObject _TextIOBase_errors() {
+        return Py.None;
+    }
+}
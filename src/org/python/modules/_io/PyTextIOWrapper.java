@@ -0,0 +1,1080 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import java.math.BigInteger;
+
+import org.python.core.ArgParser;
+import org.python.core.BuiltinDocs;
+import org.python.core.Py;
+import org.python.core.PyBytes;
+import org.python.core.PyException;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyType;
+import org.python.core.PyUnicode;
+import org.python.core.Visitproc;
+import org.python.core.codecs;
+import org.python.core.imp;
+import org.python.core.util.StringUtil;
+import org.python.expose.ExposedGet;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedSet;
+import org.python.expose.ExposedType;
+
+/**
+ * An implementation of Python <code>_io.TextIOWrapper</code>, the character and line based layer
+ * over a buffered binary stream. This is a port to Java of the algorithms in
+ * <code>_pyio.TextIOWrapper</code>, including the opaque cookie of <code>tell()</code> and
+ * <code>seek()</code>.
+ * <p>
+ * Decoded text is held as a UTF-16 Java <code>String</code>, and <code>readline()</code> and
+ * iteration find line endings by scanning it directly. When the buffer is exactly one of the
+ * built-in buffered types, input and output bypass its Python methods entirely (see
+ * {@link PyBufferedIOMixin#read1Bytes(int)} and {@link PyBufferedIOMixin#writeBytes}).
+ * <p>
+ * Counts of characters within the decoded text, including those packed into a
+ * <code>tell()</code> cookie, are in UTF-16 units. Counts presented to the client (the argument of
+ * <code>read()</code> and the value returned by <code>write()</code>) are in code points, as in
+ * Python.
+ */
+@ExposedType(name = "_io.TextIOWrapper", doc = BuiltinDocs.TextIOWrapper_doc,
+        base = PyTextIOBase.class)
+public class PyTextIOWrapper extends PyTextIOBase {
+
+    public static final PyType TYPE = PyType.fromClass(PyTextIOWrapper.class);
+
+    /** The buffered binary stream, or <code>null</code> if not initialised or detached. */
+    private PyObject buffer;
+
+    /** The buffer when it is exactly of one of the built-in buffered types. */
+    private PyBufferedIOMixin fastBuffer;
+
+    private boolean detached;
+
+    /** True when this object is exactly an <code>_io.TextIOWrapper</code>. */
+    private final boolean exact;
+
+    private String encoding;
+    private String errors;
+    private boolean lineBuffering;
+
+    /** Newline handling on input and output (see <code>__init__</code>). */
+    private String readnl;
+    private boolean readuniversal, readtranslate, writetranslate;
+    private String writenl;
+
+    private boolean seekable, telling, hasRead1;
+
+    private TextDecoder decoder;
+    private TextEncoder encoder;
+
+    /** Text returned by the decoder, not yet consumed beyond index {@link #decodedCharsUsed}. */
+    private String decodedChars = "";
+    private int decodedCharsUsed;
+
+    /**
+     * When {@link #haveSnapshot}, the decoder flags and input (bytes) at a point where the decoder
+     * had nothing buffered, from which <code>tell()</code> can reconstruct the current position.
+     */
+    private boolean haveSnapshot;
+    private long snapshotFlags;
+    private String snapshotInput;
+
+    /** Bytes per character in the last chunk decoded (a guide when reconstructing position). */
+    private double b2cratio;
+
+    /** Size of the chunks requested from the buffer. */
+    private int chunkSize = 8192;
+
+    private static final String[] initKwds = {"buffer", "encoding", "errors", "newline",
+            "line_buffering", "write_through"};
+
+    public PyTextIOWrapper(PyType subtype) {
+        super(subtype);
+        exact = subtype == TYPE;
+    }
+
+    /**
+     * Construct a <code>TextIOWrapper</code> on the given buffered stream.
+     *
+     * @param buffer buffered binary stream
+     * @param encoding name of the encoding or <code>null</code> for the locale default
+     * @param errors error policy name or <code>null</code> for "strict"
+     * @param newline newline handling (see <code>io.open</code>) or <code>null</code>
+     * @param lineBuffering flush when a line ending is written
+     */
+    public PyTextIOWrapper(PyObject buffer, String encoding, String errors, String newline,
+            boolean lineBuffering) {
+        this(TYPE);
+        init(buffer, encoding, errors, newline, lineBuffering);
+    }
+
+    @ExposedNew
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper___init___doc)
+    final void TextIOWrapper___init__(PyObject[] args, String[] kwds) {
+        ArgParser ap = new ArgParser("TextIOWrapper", args, kwds, initKwds, 1);
+        PyObject newline = ap.getPyObject(3, Py.None);
+        if (newline != Py.None && !(newline instanceof PyUnicode)) {
+            throw Py.TypeError(String.format("illegal newline type: %s",
+                    newline.getType().fastGetName()));
+        }
+        init(ap.getPyObject(0), stringArg(ap.getPyObject(1, Py.None), "encoding"),
+                stringArg(ap.getPyObject(2, Py.None), "errors"),
+                newline == Py.None ? null : newline.toString(),
+                ap.getPyObject(4, Py.False).__bool__());
+    }
+
+    private static String stringArg(PyObject arg, String name) {
+        if (arg == Py.None) {
+            return null;
+        } else if (arg instanceof PyUnicode) {
+            return arg.toString();
+        } else {
+            throw Py.TypeError(String.format("TextIOWrapper() argument '%s' must be str or None, "
+                    + "not %s", name, arg.getType().fastGetName()));
+        }
+    }
+
+    private void init(PyObject buffer, String encoding, String errors, String newline,
+            boolean lineBuffering) {
+        if (newline != null && !newline.isEmpty() && !newline.equals("\n")
+                && !newline.equals("\r") && !newline.equals("\r\n")) {
+            throw Py.ValueError(String.format("illegal newline value: %s",
+                    Py.newUnicode(newline).__repr__()));
+        }
+
+        if (encoding == null) {
+            encoding = defaultEncoding();
+        }
+        PyObject isText = codecs.lookup(encoding).__findattr__("_is_text_encoding");
+        if (isText != null && !isText.__bool__()) {
+            throw Py.LookupError(String.format("'%s' is not a text encoding; "
+                    + "use codecs.open() to handle arbitrary codecs", encoding));
+        }
+
+        this.buffer = buffer;
+        this.fastBuffer = buffer instanceof PyBufferedIOMixin
+                && ((PyBufferedIOMixin)buffer).exact ? (PyBufferedIOMixin)buffer : null;
+        this.detached = false;
+        this.encoding = encoding;
+        this.errors = errors == null ? "strict" : errors;
+        this.lineBuffering = lineBuffering;
+
+        readuniversal = newline == null || newline.isEmpty();
+        readtranslate = newline == null;
+        readnl = newline;
+        writetranslate = newline == null || !newline.isEmpty();
+        writenl = newline == null || newline.isEmpty() ? System.lineSeparator() : newline;
+
+        encoder = null;
+        decoder = null;
+        setDecodedChars("");
+        haveSnapshot = false;
+        seekable = telling = buffer.invoke("seekable").__bool__();
+        hasRead1 = buffer.__findattr__("read1") != null;
+        b2cratio = 0.0;
+
+        if (seekable && bufferWritable()) {
+            if (bufferTell() != 0) {
+                try {
+                    getEncoder().reset(false);
+                } catch (PyException pye) {
+                    // Sometimes the encoder doesn't exist
+                    if (!pye.match(Py.LookupError)) {
+                        throw pye;
+                    }
+                }
+            }
+        }
+    }
+
+    /** The locale's preferred encoding, as in CPython (or ASCII if that cannot be found). */
+    private static String defaultEncoding() {
+        try {
+            PyObject bootlocale = imp.load("_bootlocale");
+            return bootlocale.invoke("getpreferredencoding", Py.False).toString();
+        } catch (PyException pye) {
+            if (!pye.match(Py.ImportError)) {
+                throw pye;
+            }
+            return "ascii";
+        }
+    }
+
+    /*
+     * ============================================================================================
+     * Access to the buffer
+     * ============================================================================================
+     */
+
+    private void checkAttached() {
+        if (buffer == null) {
+            throw Py.ValueError(detached ? "underlying buffer has been detached"
+                    : "I/O operation on uninitialized object");
+        }
+    }
+
+    private boolean bufferClosed() {
+        checkAttached();
+        if (fastBuffer != null) {
+            return fastBuffer.rawClosed();
+        }
+        return buffer.__getattr__("closed").__bool__();
+    }
+
+    private void checkClosed() {
+        if (bufferClosed()) {
+            throw Py.ValueError("I/O operation on closed file.");
+        }
+    }
+
+    private boolean bufferReadable() {
+        return fastBuffer != null ? fastBuffer._readable() : buffer.invoke("readable").__bool__();
+    }
+
+    private boolean bufferWritable() {
+        return fastBuffer != null ? fastBuffer._writable() : buffer.invoke("writable").__bool__();
+    }
+
+    private long bufferTell() {
+        return fastBuffer != null ? fastBuffer._tell() : buffer.invoke("tell").asLong();
+    }
+
+    private long bufferSeek(long pos, int whence) {
+        if (fastBuffer != null) {
+            return fastBuffer._seek(pos, whence);
+        }
+        return buffer.invoke("seek", Py.newLong(pos), Py.newInteger(whence)).asLong();
+    }
+
+    private void bufferFlush() {
+        if (fastBuffer != null) {
+            fastBuffer._flush();
+        } else {
+            buffer.invoke("flush");
+        }
+    }
+
+    /** Check that the result of a read of the buffer is bytes and return them as a String. */
+    private static String bytesResult(PyObject b, String method) {
+        if (b == Py.None) {
+            return "";
+        } else if (!(b instanceof PyBytes)) {
+            throw Py.TypeError(String.format("underlying %s() should have returned a bytes "
+                    + "object, not '%s'", method, b.getType().fastGetName()));
+        }
+        return ((PyBytes)b).getString();
+    }
+
+    /** Up to <code>n</code> bytes from the buffer, or everything if <code>n&lt;0</code>. */
+    private String bufferRead(int n) {
+        if (fastBuffer != null) {
+            return bytesResult(fastBuffer._read(n), "read");
+        } else if (n < 0) {
+            return bytesResult(buffer.invoke("read"), "read");
+        } else {
+            return bytesResult(buffer.invoke("read", Py.newInteger(n)), "read");
+        }
+    }
+
+    /*
+     * ============================================================================================
+     * Encoding and decoding
+     * ============================================================================================
+     */
+
+    private TextDecoder getDecoder() {
+        if (decoder == null) {
+            TextDecoder d = TextDecoder.forEncoding(encoding, errors);
+            if (readuniversal) {
+                d = new TextDecoder.Newline(d, readtranslate);
+            }
+            decoder = d;
+        }
+        return decoder;
+    }
+
+    private TextEncoder getEncoder() {
+        if (encoder == null) {
+            encoder = TextEncoder.forEncoding(encoding, errors);
+        }
+        return encoder;
+    }
+
+    private void setDecodedChars(String chars) {
+        decodedChars = chars;
+        decodedCharsUsed = 0;
+    }
+
+    /**
+     * Consume up to <code>n</code> characters (code points) of the decoded text, or all of it if
+     * <code>n&lt;0</code>.
+     */
+    private String takeDecodedChars(int n) {
+        int start = decodedCharsUsed, len = decodedChars.length(), end;
+        if (n < 0 || n >= len - start) {
+            end = len;
+        } else {
+            end = start;
+            for (int i = 0; i < n && end < len; i++) {
+                end += Character.charCount(decodedChars.codePointAt(end));
+            }
+        }
+        decodedCharsUsed = end;
+        return decodedChars.substring(start, end);
+    }
+
+    /**
+     * Read and decode the next chunk of data from the buffer into {@link #decodedChars}, taking a
+     * snapshot for <code>tell()</code> on the way.
+     *
+     * @return true unless end of file was reached
+     */
+    private boolean readChunk() {
+        String decBuffer = null;
+        long decFlags = 0;
+        if (telling) {
+            // The snapshot point is where the decoder's input buffer was empty
+            decBuffer = decoder.getBuffered();
+            decFlags = decoder.getFlags();
+        }
+
+        String input;
+        if (fastBuffer != null) {
+            byte[] b = fastBuffer.read1Bytes(chunkSize);
+            input = b == null ? "" : StringUtil.fromBytes(b);
+        } else if (hasRead1) {
+            input = bytesResult(buffer.invoke("read1", Py.newInteger(chunkSize)), "read1");
+        } else {
+            input = bytesResult(buffer.invoke("read", Py.newInteger(chunkSize)), "read");
+        }
+
+        boolean eof = input.isEmpty();
+        String decoded = decoder.decode(input, eof);
+        setDecodedChars(decoded);
+        b2cratio = decoded.isEmpty() ? 0.0 : (double)input.length() / decoded.length();
+
+        if (telling) {
+            snapshotFlags = decFlags;
+            snapshotInput = decBuffer.isEmpty() ? input : decBuffer + input;
+            haveSnapshot = true;
+        }
+        return !eof;
+    }
+
+    /*
+     * ============================================================================================
+     * Reading
+     * ============================================================================================
+     */
+
+    @Override
+    public PyObject read(int n) {
+        return Py.newUnicode(_read(n));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.TextIOWrapper_read_doc)
+    final PyObject TextIOWrapper_read(PyObject n) {
+        return Py.newUnicode(_read(PyBufferedIOMixin.sizeArg(n)));
+    }
+
+    private synchronized String _read(int n) {
+        checkClosed();
+        if (!bufferReadable()) {
+            throw _io.UnsupportedOperation("not readable");
+        }
+        TextDecoder d = getDecoder();
+
+        if (n < 0) {
+            // Read everything
+            String rest = d.decode(bufferRead(-1), true);
+            String result = takeDecodedChars(-1) + rest;
+            setDecodedChars("");
+            haveSnapshot = false;
+            return result;
+        }
+
+        // Keep reading chunks until we have n characters to return
+        String part = takeDecodedChars(n);
+        int count = part.codePointCount(0, part.length());
+        if (count >= n) {
+            return part;
+        }
+        StringBuilder result = new StringBuilder(part);
+        boolean eof = false;
+        while (count < n && !eof) {
+            eof = !readChunk();
+            part = takeDecodedChars(n - count);
+            result.append(part);
+            count += part.codePointCount(0, part.length());
+        }
+        return result.toString();
+    }
+
+    @Override
+    public PyObject readline(int limit) {
+        return Py.newUnicode(_readline(limit));
+    }
+
+    @Override
+    public PyObject readline() {
+        return Py.newUnicode(_readline(-1));
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.TextIOWrapper_readline_doc)
+    final PyObject TextIOWrapper_readline(PyObject limit) {
+        if (limit != null && limit != Py.None && !limit.isIndex()) {
+            throw Py.TypeError("size must be an integer");
+        }
+        return Py.newUnicode(_readline(PyBufferedIOMixin.sizeArg(limit)));
+    }
+
+    /**
+     * Return one line, or at most <code>limit</code> characters (code points) of it. In the common
+     * case the whole line lies in text already decoded, and is returned as a single substring of
+     * it.
+     */
+    private synchronized String _readline(int limit) {
+        checkClosed();
+        getDecoder();
+
+        int start = decodedCharsUsed, len = decodedChars.length();
+        int endpos = findLineEnd(decodedChars, start, len);
+        if (endpos >= 0 && (limit < 0 || endpos - start <= limit)) {
+            decodedCharsUsed = endpos;
+            return decodedChars.substring(start, endpos);
+        }
+
+        // The line extends beyond the decoded text, or we may have to truncate it
+        StringBuilder line = new StringBuilder(decodedChars.length() - start + 80);
+        line.append(decodedChars, start, len);
+        decodedCharsUsed = len;
+        int count = limit < 0 ? 0 : line.codePointCount(0, line.length());
+        int searchFrom = 0;
+
+        while (true) {
+            endpos = findLineEnd(line, searchFrom, line.length());
+            if (endpos >= 0) {
+                break;
+            }
+            // A fixed line ending may be split across the join with the next text
+            searchFrom = readnl == null || readuniversal ? line.length()
+                    : Math.max(0, line.length() - readnl.length() + 1);
+
+            if (limit >= 0 && count >= limit) {
+                endpos = line.length();
+                break;
+            }
+
+            // No line ending seen yet: get more data
+            while (readChunk() && decodedChars.isEmpty()) {}
+            if (decodedChars.isEmpty()) {
+                // End of file
+                setDecodedChars("");
+                haveSnapshot = false;
+                return line.toString();
+            }
+            line.append(decodedChars);
+            decodedCharsUsed = decodedChars.length();
+            if (limit >= 0) {
+                count += decodedChars.codePointCount(0, decodedChars.length());
+            }
+        }
+
+        if (limit >= 0 && count > limit) {
+            int cap = line.offsetByCodePoints(0, limit);
+            if (endpos > cap) {
+                endpos = cap;
+            }
+        }
+
+        // Rewind the decoded text to just after the line ending we found
+        decodedCharsUsed -= line.length() - endpos;
+        line.setLength(endpos);
+        return line.toString();
+    }
+
+    /**
+     * Find the end of the first line in <code>s[start:end]</code> according to the newline mode.
+     *
+     * @return the index just beyond the line ending, or -1 if there is none
+     */
+    private int findLineEnd(CharSequence s, int start, int end) {
+        if (readtranslate) {
+            // Newlines are already translated, only search for \n
+            for (int i = start; i < end; i++) {
+                if (s.charAt(i) == '\n') {
+                    return i + 1;
+                }
+            }
+        } else if (readuniversal) {
+            // Any of \r, \r\n, \n: the decoder ensures that \r\n is not split
+            for (int i = start; i < end; i++) {
+                char c = s.charAt(i);
+                if (c == '\n') {
+                    return i + 1;
+                } else if (c == '\r') {
+                    return (i + 1 < end && s.charAt(i + 1) == '\n') ? i + 2 : i + 1;
+                }
+            }
+        } else {
+            int n = readnl.length();
+            char first = readnl.charAt(0);
+            outer: for (int i = start; i <= end - n; i++) {
+                if (s.charAt(i) == first) {
+                    for (int j = 1; j < n; j++) {
+                        if (s.charAt(i + j) != readnl.charAt(j)) {
+                            continue outer;
+                        }
+                    }
+                    return i + n;
+                }
+            }
+        }
+        return -1;
+    }
+
+    /**
+     * The next line, for iteration, or <code>null</code> at the end of the stream.
+     */
+    private PyObject nextLine() {
+        telling = false;
+        PyObject line = exact ? Py.newUnicode(_readline(-1)) : invoke("readline");
+        if (!line.__bool__()) {
+            haveSnapshot = false;
+            telling = seekable;
+            return null;
+        }
+        return line;
+    }
+
+    @Override
+    public PyObject __next__() {
+        return nextLine();
+    }
+
+    @ExposedMethod(doc = "x.__next__() <==> next(x)")
+    final PyObject TextIOWrapper___next__() {
+        PyObject line = nextLine();
+        if (line == null) {
+            throw Py.StopIteration();
+        }
+        return line;
+    }
+
+    /*
+     * ============================================================================================
+     * Writing
+     * ============================================================================================
+     */
+
+    @Override
+    public PyObject write(PyObject s) {
+        return TextIOWrapper_write(s);
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_write_doc)
+    final synchronized PyObject TextIOWrapper_write(PyObject s) {
+        checkClosed();
+        if (!(s instanceof PyUnicode)) {
+            throw Py.TypeError(String.format("can't write %s to text stream",
+                    s.getType().fastGetName()));
+        }
+        String text = ((PyUnicode)s).getString();
+        int length = s.__len__();
+
+        boolean haslf = (writetranslate || lineBuffering) && text.indexOf('\n') >= 0;
+        if (haslf && writetranslate && !writenl.equals("\n")) {
+            text = text.replace("\n", writenl);
+        }
+        String b = getEncoder().encode(text);
+        if (fastBuffer != null) {
+            byte[] bytes = StringUtil.toBytes(b);
+            fastBuffer.writeBytes(bytes, 0, bytes.length);
+        } else {
+            buffer.invoke("write", new PyBytes(b));
+        }
+        if (lineBuffering && (haslf || text.indexOf('\r') >= 0)) {
+            TextIOWrapper_flush();
+        }
+
+        haveSnapshot = false;
+        if (decoder != null) {
+            decoder.reset();
+        }
+        return Py.newInteger(length);
+    }
+
+    @Override
+    public void flush() {
+        TextIOWrapper_flush();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_flush_doc)
+    final void TextIOWrapper_flush() {
+        checkClosed();
+        bufferFlush();
+        telling = seekable;
+    }
+
+    /*
+     * ============================================================================================
+     * Positioning
+     * ============================================================================================
+     */
+
+    @Override
+    public long tell() {
+        return TextIOWrapper_tell().asLong();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_tell_doc)
+    final synchronized PyObject TextIOWrapper_tell() {
+        checkClosed();
+        if (!seekable) {
+            throw _io.UnsupportedOperation("underlying stream is not seekable");
+        }
+        if (!telling) {
+            throw Py.IOError("telling position disabled by next() call");
+        }
+        TextIOWrapper_flush();
+        long position = bufferTell();
+        if (decoder == null || !haveSnapshot) {
+            if (!decodedChars.isEmpty()) {
+                throw Py.AssertionError("pending decoded text");
+            }
+            return Py.newLong(position);
+        }
+
+        // Skip backward to the snapshot point (see readChunk)
+        long decFlags = snapshotFlags;
+        String nextInput = snapshotInput;
+        position -= nextInput.length();
+
+        // How many decoded characters have been used up since the snapshot?
+        int charsToSkip = decodedCharsUsed;
+        if (charsToSkip == 0) {
+            // We haven't moved from the snapshot point
+            return packCookie(position, decFlags, 0, false, 0);
+        }
+
+        // Starting from the snapshot position, walk the decoder forward to the current position
+        String savedBuffer = decoder.getBuffered();
+        long savedFlags = decoder.getFlags();
+        try {
+            // Fast search for an acceptable start point, close to our current position
+            int skipBytes = (int)(b2cratio * charsToSkip);
+            int skipBack = 1;
+            while (skipBytes > 0) {
+                decoder.setState("", decFlags);
+                // Decode up to tentative start point
+                int n = decoder.decode(nextInput.substring(0, skipBytes), false).length();
+                if (n <= charsToSkip) {
+                    String b = decoder.getBuffered();
+                    if (b.isEmpty()) {
+                        // Before position and no bytes buffered in decoder: OK
+                        decFlags = decoder.getFlags();
+                        charsToSkip -= n;
+                        break;
+                    }
+                    // Skip back by buffered amount and reset heuristic
+                    skipBytes -= b.length();
+                    skipBack = 1;
+                } else {
+                    // We're too far ahead, skip back a bit
+                    skipBytes -= skipBack;
+                    skipBack *= 2;
+                }
+            }
+            if (skipBytes <= 0) {
+                skipBytes = 0;
+                decoder.setState("", decFlags);
+            }
+
+            // Note our initial start point
+            long startPos = position + skipBytes;
+            long startFlags = decFlags;
+            if (charsToSkip == 0) {
+                // We haven't moved from the start point
+                return packCookie(startPos, startFlags, 0, false, 0);
+            }
+
+            /*
+             * Feed the decoder one byte at a time, noting the nearest "safe start point" before the
+             * current location (a point where the decoder has nothing buffered, so seek() can
+             * start from there and advance to this location).
+             */
+            int bytesFed = 0;
+            boolean needEOF = false;
+            int charsDecoded = 0;
+            boolean enough = false;
+            for (int i = skipBytes; i < nextInput.length(); i++) {
+                bytesFed += 1;
+                charsDecoded += decoder.decode(nextInput.substring(i, i + 1), false).length();
+                if (decoder.getBuffered().isEmpty() && charsDecoded <= charsToSkip) {
+                    // Decoder buffer is empty, so this is a safe start point
+                    startPos += bytesFed;
+                    charsToSkip -= charsDecoded;
+                    startFlags = decoder.getFlags();
+                    bytesFed = 0;
+                    charsDecoded = 0;
+                }
+                if (charsDecoded >= charsToSkip) {
+                    enough = true;
+                    break;
+                }
+            }
+            if (!enough) {
+                // We didn't get enough decoded data; signal EOF to get more
+                charsDecoded += decoder.decode("", true).length();
+                needEOF = true;
+                if (charsDecoded < charsToSkip) {
+                    throw Py.IOError("can't reconstruct logical file position");
+                }
+            }
+
+            // The returned cookie corresponds to the last safe start point
+            return packCookie(startPos, startFlags, bytesFed, needEOF, charsToSkip);
+
+        } finally {
+            decoder.setState(savedBuffer, savedFlags);
+        }
+    }
+
+    private static final BigInteger MASK64 = PyLong.MAX_ULONG;
+
+    /**
+     * Compose a <code>tell()</code> cookie. Its meaning is: seek to <code>position</code>, set the
+     * decoder flags to <code>decFlags</code>, read <code>bytesToFeed</code> bytes, feed them into
+     * the decoder with <code>needEOF</code> as the EOF flag, then skip <code>charsToSkip</code>
+     * characters of the decoded result. For simple decoders this is just the byte offset.
+     */
+    private static PyObject packCookie(long position, long decFlags, int bytesToFeed,
+            boolean needEOF, int charsToSkip) {
+        if (decFlags == 0 && bytesToFeed == 0 && !needEOF && charsToSkip == 0) {
+            return Py.newLong(position);
+        }
+        BigInteger cookie = BigInteger.valueOf(position)
+                .or(BigInteger.valueOf(decFlags).and(MASK64).shiftLeft(64))
+                .or(BigInteger.valueOf(bytesToFeed).shiftLeft(128))
+                .or(BigInteger.valueOf(charsToSkip).shiftLeft(192));
+        if (needEOF) {
+            cookie = cookie.setBit(256);
+        }
+        return PyLong.valueOf(cookie);
+    }
+
+    private static BigInteger cookieValue(PyObject cookie) {
+        PyObject index = cookie.__index__();
+        if (index instanceof PyLong) {
+            return ((PyLong)index).getValue();
+        }
+        return BigInteger.valueOf(index.asLong());
+    }
+
+    @Override
+    public long seek(long pos, int whence) {
+        return TextIOWrapper_seek(Py.newLong(pos), whence).asLong();
+    }
+
+    @ExposedMethod(defaults = "0", doc = BuiltinDocs.TextIOWrapper_seek_doc)
+    final synchronized PyObject TextIOWrapper_seek(PyObject cookieObj, int whence) {
+        checkClosed();
+        if (!seekable) {
+            throw _io.UnsupportedOperation("underlying stream is not seekable");
+        }
+        BigInteger cookie = cookieValue(cookieObj);
+
+        if (whence == 1) {
+            // Seek relative to current position
+            if (cookie.signum() != 0) {
+                throw _io.UnsupportedOperation("can't do nonzero cur-relative seeks");
+            }
+            // Seeking to the current position should sync the underlying buffer with it
+            whence = 0;
+            cookie = cookieValue(TextIOWrapper_tell());
+        }
+
+        if (whence == 2) {
+            // Seek relative to end of file
+            if (cookie.signum() != 0) {
+                throw _io.UnsupportedOperation("can't do nonzero end-relative seeks");
+            }
+            TextIOWrapper_flush();
+            long position = bufferSeek(0, 2);
+            setDecodedChars("");
+            haveSnapshot = false;
+            if (decoder != null) {
+                decoder.reset();
+            }
+            resetEncoder(position == 0);
+            return Py.newLong(position);
+        }
+
+        if (whence != 0) {
+            throw Py.ValueError(String.format("invalid whence (%d, should be 0, 1 or 2)", whence));
+        }
+        if (cookie.signum() < 0) {
+            throw Py.ValueError(String.format("negative seek position %s", cookie));
+        }
+        TextIOWrapper_flush();
+
+        // Go back to the safe start point and replay the effect of read(charsToSkip) from there
+        long startPos = cookie.and(MASK64).longValue();
+        long decFlags = cookie.shiftRight(64).and(MASK64).longValue();
+        int bytesToFeed = cookie.shiftRight(128).and(MASK64).intValue();
+        int charsToSkip = cookie.shiftRight(192).and(MASK64).intValue();
+        boolean needEOF = cookie.testBit(256);
+
+        // Seek back to the safe start point
+        bufferSeek(startPos, 0);
+        setDecodedChars("");
+        haveSnapshot = false;
+
+        // Restore the decoder to its state from the safe start point
+        if (cookie.signum() == 0 && decoder != null) {
+            decoder.reset();
+        } else if (decoder != null || decFlags != 0 || charsToSkip != 0) {
+            getDecoder().setState("", decFlags);
+            snapshotFlags = decFlags;
+            snapshotInput = "";
+            haveSnapshot = true;
+        }
+
+        if (charsToSkip != 0) {
+            // Just like readChunk, feed the decoder and save a snapshot
+            String input = bufferRead(bytesToFeed);
+            setDecodedChars(decoder.decode(input, needEOF));
+            snapshotFlags = decFlags;
+            snapshotInput = input;
+            haveSnapshot = true;
+
+            // Skip charsToSkip of the decoded characters
+            if (decodedChars.length() < charsToSkip) {
+                throw Py.IOError("can't restore logical file position");
+            }
+            decodedCharsUsed = charsToSkip;
+        }
+
+        resetEncoder(cookie.signum() == 0);
+        return PyLong.valueOf(cookie);
+    }
+
+    /** Reset the encoder (which matters only for proper BOM handling). */
+    private void resetEncoder(boolean atStart) {
+        try {
+            getEncoder().reset(atStart);
+        } catch (PyException pye) {
+            // Sometimes the encoder doesn't exist
+            if (!pye.match(Py.LookupError)) {
+                throw pye;
+            }
+        }
+    }
+
+    @ExposedMethod(defaults = "null", doc = BuiltinDocs.TextIOWrapper_truncate_doc)
+    final PyObject TextIOWrapper_truncate(PyObject pos) {
+        TextIOWrapper_flush();
+        if (pos == null || pos == Py.None) {
+            pos = TextIOWrapper_tell();
+        }
+        return buffer.invoke("truncate", pos);
+    }
+
+    /*
+     * ============================================================================================
+     * Other methods and attributes
+     * ============================================================================================
+     */
+
+    @Override
+    public void close() {
+        TextIOWrapper_close();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_close_doc)
+    final synchronized void TextIOWrapper_close() {
+        if (!bufferClosed()) {
+            dismissCloser();
+            try {
+                invoke("flush");
+            } finally {
+                __closed = true;
+                buffer.invoke("close");
+            }
+        }
+    }
+
+    @Override
+    public void __del_builtin__() {
+        if (buffer == null) {
+            dismissCloser();
+        } else {
+            super.__del_builtin__();
+        }
+    }
+
+    @Override
+    public PyObject detach() {
+        return TextIOWrapper_detach();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_detach_doc)
+    final synchronized PyObject TextIOWrapper_detach() {
+        checkAttached();
+        TextIOWrapper_flush();
+        PyObject b = buffer;
+        buffer = null;
+        fastBuffer = null;
+        detached = true;
+        dismissCloser();
+        return b;
+    }
+
+    @Override
+    public boolean readable() {
+        return TextIOWrapper_readable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_readable_doc)
+    final boolean TextIOWrapper_readable() {
+        checkAttached();
+        return bufferReadable();
+    }
+
+    @Override
+    public boolean writable() {
+        return TextIOWrapper_writable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_writable_doc)
+    final boolean TextIOWrapper_writable() {
+        checkAttached();
+        return bufferWritable();
+    }
+
+    @Override
+    public boolean seekable() {
+        return TextIOWrapper_seekable();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_seekable_doc)
+    final boolean TextIOWrapper_seekable() {
+        checkClosed();
+        return seekable;
+    }
+
+    @Override
+    public PyObject fileno() {
+        return TextIOWrapper_fileno();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_fileno_doc)
+    final PyObject TextIOWrapper_fileno() {
+        checkAttached();
+        return buffer.invoke("fileno");
+    }
+
+    @Override
+    public boolean isatty() {
+        return TextIOWrapper_isatty();
+    }
+
+    @ExposedMethod(doc = BuiltinDocs.TextIOWrapper_isatty_doc)
+    final boolean TextIOWrapper_isatty() {
+        checkAttached();
+        return buffer.invoke("isatty").__bool__();
+    }
+
+    @ExposedGet(name = "closed", doc = BuiltinDocs.TextIOWrapper_closed_doc)
+    final boolean TextIOWrapper_closed() {
+        return bufferClosed();
+    }
+
+    @ExposedGet(name = "name", doc = BuiltinDocs.TextIOWrapper_name_doc)
+    final PyObject TextIOWrapper_name() {
+        checkAttached();
+        return buffer.__getattr__("name");
+    }
+
+    @ExposedGet(name = "buffer", doc = BuiltinDocs.TextIOWrapper_buffer_doc)
+    final PyObject TextIOWrapper_buffer() {
+        return buffer == null ? Py.None : buffer;
+    }
+
+    @ExposedGet(name = "encoding", doc = BuiltinDocs.TextIOWrapper_encoding_doc)
+    final PyObject TextIOWrapper_encoding() {
+        return encoding == null ? Py.None : Py.newUnicode(encoding);
+    }
+
+    @ExposedGet(name = "errors", doc = BuiltinDocs.TextIOWrapper_errors_doc)
+    final PyObject TextIOWrapper_errors() {
+        return errors == null ? Py.None : Py.newUnicode(errors);
+    }
+
+    @ExposedGet(name = "line_buffering", doc = BuiltinDocs.TextIOWrapper_line_buffering_doc)
+    final boolean TextIOWrapper_line_buffering() {
+        return lineBuffering;
+    }
+
+    @ExposedGet(name = "newlines", doc = BuiltinDocs.TextIOWrapper_newlines_doc)
+    final PyObject TextIOWrapper_newlines() {
+        return decoder == null ? Py.None : decoder.getNewlines();
+    }
+
+    @ExposedGet(name = "_CHUNK_SIZE", doc = BuiltinDocs.TextIOWrapper__CHUNK_SIZE_doc)
+    final int TextIOWrapper__CHUNK_SIZE() {
+        return chunkSize;
+    }
+
+    @ExposedSet(name = "_CHUNK_SIZE")
+    final void TextIOWrapper__CHUNK_SIZE(int size) {
+        if (size <= 0) {
+            throw Py.ValueError("a strictly positive integer is required");
+        }
+        chunkSize = size;
+    }
+
+    @ExposedMethod(names = {"__str__", "__repr__"}, doc = BuiltinDocs.object___str___doc)
+    final String TextIOWrapper_toString() {
+        StringBuilder result = new StringBuilder("<_io.TextIOWrapper");
+        for (String attr : new String[] {"name", "mode"}) {
+            try {
+                PyObject value = __findattr__(attr);
+                if (value != null) {
+                    result.append(' ').append(attr).append('=').append(value.__repr__());
+                }
+            } catch (PyException pye) {
+                // Leave it out
+            }
+        }
+        return result.append(" encoding='").append(encoding).append("'>").toString();
+    }
+
+    @Override
+    public String toString() {
+        return TextIOWrapper_toString();
+    }
+
+    @ExposedMethod
+    final PyObject TextIOWrapper___getstate__() {
+        throw Py.TypeError(String.format("cannot serialize '%s' object",
+                getType().fastGetName()));
+    }
+
+    /* Traverseproc implementation */
+    @Override
+    public int traverse(Visitproc visit, Object arg) {
+        int retVal = super.traverse(visit, arg);
+        if (retVal != 0) {
+            return retVal;
+        }
+        return buffer == null ? 0 : visit.visit(buffer, arg);
+    }
+
+    @Override
+    public boolean refersDirectlyTo(PyObject ob) {
+        return ob != null && (ob == buffer || super.refersDirectlyTo(ob));
+    }
+}
@@ -0,0 +1,360 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import org.python.core.Py;
+import org.python.core.PyBytes;
+import org.python.core.PyObject;
+import org.python.core.PyTuple;
+import org.python.core.PyUnicode;
+import org.python.core.codecs;
+import org.python.core.imp;
+
+/**
+ * Incremental decoding of bytes to text for {@link PyTextIOWrapper}, with the decoder state that
+ * <code>tell()</code> and <code>seek()</code> need, after the model of a Python
+ * <code>codecs.IncrementalDecoder</code>. Bytes are represented, as in {@link PyBytes}, by a
+ * <code>String</code> of characters 0 to 255, and text is returned as a UTF-16 Java
+ * <code>String</code>.
+ * <p>
+ * The commonest encodings (UTF-8, Latin-1 and ASCII) are decoded in Java. Any other encoding is
+ * decoded by the incremental decoder the <code>codecs</code> registry provides.
+ */
+abstract class TextDecoder {
+
+    /**
+     * Decode the next input, returning what text can be produced from it.
+     *
+     * @param input bytes as a <code>String</code> of characters 0 to 255
+     * @param fin true if this is the last input (there may then be nothing held back)
+     * @return decoded text
+     */
+    abstract String decode(String input, boolean fin);
+
+    /** Bytes fed to the decoder but held back, waiting for more input. */
+    abstract String getBuffered();
+
+    /** The decoder flags (the second element of the state tuple in Python). */
+    abstract long getFlags();
+
+    /** Restore a state previously returned by {@link #getBuffered()} and {@link #getFlags()}. */
+    abstract void setState(String buffered, long flags);
+
+    /** Return to the initial state. */
+    abstract void reset();
+
+    /** The newlines seen so far, as for the <code>newlines</code> attribute. */
+    PyObject getNewlines() {
+        return Py.None;
+    }
+
+    /**
+     * Create a decoder for the named encoding.
+     *
+     * @param encoding name of the encoding
+     * @param errors error policy name (e.g. "strict")
+     * @return suitable decoder
+     */
+    static TextDecoder forEncoding(String encoding, String errors) {
+        switch (normalize(encoding)) {
+            case "utf-8":
+            case "utf8":
+                return new UTF8(errors);
+            case "latin-1":
+            case "latin1":
+            case "iso-8859-1":
+            case "iso8859-1":
+                return new Latin1(errors);
+            case "ascii":
+            case "us-ascii":
+                return new ASCII(errors);
+            default:
+                PyObject factory = imp.load("codecs").invoke("getincrementaldecoder",
+                        Py.newUnicode(encoding));
+                return new Python(factory.__call__(Py.newUnicode(errors)));
+        }
+    }
+
+    /**
+     * Create a decoder that passes text through unchanged, apart from universal newline handling
+     * (as <code>io.IncrementalNewlineDecoder(None, translate)</code>).
+     *
+     * @param translate whether to translate line endings to <code>'\n'</code>
+     * @return suitable decoder
+     */
+    static TextDecoder forNewlines(boolean translate) {
+        // Latin-1 decoding is the identity on any String
+        return new Newline(new Latin1("strict"), translate);
+    }
+
+    /** Normalise an encoding name for comparison with those decoded in Java. */
+    static String normalize(String encoding) {
+        return encoding.toLowerCase().replace('_', '-').replace(' ', '-');
+    }
+
+    /** Decoder for encodings where every byte stands alone: no state to keep. */
+    private static abstract class Stateless extends TextDecoder {
+
+        protected final String errors;
+
+        Stateless(String errors) {
+            this.errors = errors;
+        }
+
+        @Override
+        String getBuffered() {
+            return "";
+        }
+
+        @Override
+        long getFlags() {
+            return 0;
+        }
+
+        @Override
+        void setState(String buffered, long flags) {}
+
+        @Override
+        void reset() {}
+    }
+
+    /** Latin-1, where the bytes are the characters. */
+    private static class Latin1 extends Stateless {
+
+        Latin1(String errors) {
+            super(errors);
+        }
+
+        @Override
+        String decode(String input, boolean fin) {
+            return input;
+        }
+    }
+
+    private static class ASCII extends Stateless {
+
+        ASCII(String errors) {
+            super(errors);
+        }
+
+        @Override
+        String decode(String input, boolean fin) {
+            for (int i = 0; i < input.length(); i++) {
+                if (input.charAt(i) >= 0x80) {
+                    // Let the codec deal with the error according to the policy
+                    return codecs.PyUnicode_DecodeASCII(input, input.length(), errors);
+                }
+            }
+            return input;
+        }
+    }
+
+    /** UTF-8, holding back any incomplete sequence at the end of the input. */
+    private static class UTF8 extends TextDecoder {
+
+        private final String errors;
+        private String pending = "";
+
+        UTF8(String errors) {
+            this.errors = errors;
+        }
+
+        @Override
+        String decode(String input, boolean fin) {
+            String s = pending.isEmpty() ? input : pending + input;
+            if (fin) {
+                pending = "";
+                return codecs.PyUnicode_DecodeUTF8(s, errors);
+            }
+            int[] consumed = new int[1];
+            String text = codecs.PyUnicode_DecodeUTF8Stateful(s, errors, consumed);
+            pending = consumed[0] < s.length() ? s.substring(consumed[0]) : "";
+            return text;
+        }
+
+        @Override
+        String getBuffered() {
+            return pending;
+        }
+
+        @Override
+        long getFlags() {
+            return 0;
+        }
+
+        @Override
+        void setState(String buffered, long flags) {
+            pending = buffered;
+        }
+
+        @Override
+        void reset() {
+            pending = "";
+        }
+    }
+
+    /** Any encoding, through a Python <code>codecs.IncrementalDecoder</code>. */
+    private static class Python extends TextDecoder {
+
+        private final PyObject decoder;
+
+        Python(PyObject decoder) {
+            this.decoder = decoder;
+        }
+
+        @Override
+        String decode(String input, boolean fin) {
+            PyObject text = decoder.invoke("decode", new PyBytes(input), Py.newBoolean(fin));
+            if (!(text instanceof PyUnicode)) {
+                throw Py.TypeError(String.format("decoder should return a string result, not '%s'",
+                        text.getType().fastGetName()));
+            }
+            return ((PyUnicode)text).getString();
+        }
+
+        @Override
+        String getBuffered() {
+            return ((PyBytes)state().__getitem__(0)).getString();
+        }
+
+        @Override
+        long getFlags() {
+            return state().__getitem__(1).asLong();
+        }
+
+        private PyObject state() {
+            PyObject state = decoder.invoke("getstate");
+            if (!(state instanceof PyTuple) || state.__len__() != 2) {
+                throw Py.TypeError("illegal decoder state");
+            }
+            return state;
+        }
+
+        @Override
+        void setState(String buffered, long flags) {
+            decoder.invoke("setstate", new PyTuple(new PyBytes(buffered), Py.newLong(flags)));
+        }
+
+        @Override
+        void reset() {
+            decoder.invoke("reset");
+        }
+    }
+
+    /**
+     * Universal newline support over another decoder, after
+     * <code>io.IncrementalNewlineDecoder</code>: a <code>'\r'</code> at the end of the output is
+     * held back until we know whether a <code>'\n'</code> follows, and each kind of line ending is
+     * noted (and translated if required).
+     */
+    static class Newline extends TextDecoder {
+
+        private static final int LF = 1, CR = 2, CRLF = 4;
+
+        private final TextDecoder decoder;
+        private final boolean translate;
+        private boolean pendingCR;
+        private int seenNL;
+
+        Newline(TextDecoder decoder, boolean translate) {
+            this.decoder = decoder;
+            this.translate = translate;
+        }
+
+        @Override
+        String decode(String input, boolean fin) {
+            String output = decoder.decode(input, fin);
+            if (pendingCR && (fin || !output.isEmpty())) {
+                output = "\r" + output;
+                pendingCR = false;
+            }
+
+            int n = output.length();
+            if (n > 0 && !fin && output.charAt(n - 1) == '\r') {
+                output = output.substring(0, --n);
+                pendingCR = true;
+            }
+
+            // Note the kinds of line ending and find out whether there is translating to do
+            int firstCR = output.indexOf('\r');
+            if (firstCR < 0) {
+                if (seenNL != (LF | CR | CRLF) && output.indexOf('\n') >= 0) {
+                    seenNL |= LF;
+                }
+                return output;
+            }
+
+            StringBuilder b = translate ? new StringBuilder(n) : null;
+            if (b != null) {
+                b.append(output, 0, firstCR);
+            }
+            if (output.lastIndexOf('\n', firstCR) >= 0) {
+                seenNL |= LF;
+            }
+            for (int i = firstCR; i < n; i++) {
+                char c = output.charAt(i);
+                if (c == '\r') {
+                    if (i + 1 < n && output.charAt(i + 1) == '\n') {
+                        seenNL |= CRLF;
+                        i++;
+                    } else {
+                        seenNL |= CR;
+                    }
+                    c = '\n';
+                } else if (c == '\n') {
+                    seenNL |= LF;
+                }
+                if (b != null) {
+                    b.append(c);
+                }
+            }
+            return b != null ? b.toString() : output;
+        }
+
+        @Override
+        String getBuffered() {
+            return decoder.getBuffered();
+        }
+
+        @Override
+        long getFlags() {
+            return (decoder.getFlags() << 1) | (pendingCR ? 1 : 0);
+        }
+
+        @Override
+        void setState(String buffered, long flags) {
+            pendingCR = (flags & 1) != 0;
+            decoder.setState(buffered, flags >> 1);
+        }
+
+        @Override
+        void reset() {
+            seenNL = 0;
+            pendingCR = false;
+            decoder.reset();
+        }
+
+        @Override
+        PyObject getNewlines() {
+            PyObject lf = Py.newUnicode("\n"), cr = Py.newUnicode("\r");
+            PyObject crlf = Py.newUnicode("\r\n");
+            switch (seenNL) {
+                case LF:
+                    return lf;
+                case CR:
+                    return cr;
+                case CRLF:
+                    return crlf;
+                case CR | LF:
+                    return new PyTuple(cr, lf);
+                case LF | CRLF:
+                    return new PyTuple(lf, crlf);
+                case CR | CRLF:
+                    return new PyTuple(cr, crlf);
+                case CR | LF | CRLF:
+                    return new PyTuple(cr, lf, crlf);
+                default:
+                    return Py.None;
+            }
+        }
+    }
+}
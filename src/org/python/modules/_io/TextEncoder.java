@@ -0,0 +1,114 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._io;
+
+import org.python.core.Py;
+import org.python.core.PyBytes;
+import org.python.core.PyObject;
+import org.python.core.codecs;
+import org.python.core.imp;
+
+/**
+ * Incremental encoding of text to bytes for {@link PyTextIOWrapper}, the counterpart of
+ * {@link TextDecoder}. The result is a <code>String</code> of characters 0 to 255 (as in a
+ * {@link PyBytes}).
+ */
+abstract class TextEncoder {
+
+    /**
+     * Encode the next text.
+     *
+     * @param text UTF-16 text
+     * @return bytes as a <code>String</code> of characters 0 to 255
+     */
+    abstract String encode(String text);
+
+    /**
+     * Prepare to write at the start of the stream (<code>atStart</code> true) or elsewhere. This
+     * matters only to encoders that write a byte order mark.
+     */
+    void reset(boolean atStart) {}
+
+    /**
+     * Create an encoder for the named encoding.
+     *
+     * @param encoding name of the encoding
+     * @param errors error policy name (e.g. "strict")
+     * @return suitable encoder
+     */
+    static TextEncoder forEncoding(String encoding, final String errors) {
+        switch (TextDecoder.normalize(encoding)) {
+            case "utf-8":
+            case "utf8":
+                return new TextEncoder() {
+
+                    @Override
+                    String encode(String text) {
+                        return isASCII(text) ? text : codecs.PyUnicode_EncodeUTF8(text, errors);
+                    }
+                };
+            case "latin-1":
+            case "latin1":
+            case "iso-8859-1":
+            case "iso8859-1":
+                return new TextEncoder() {
+
+                    @Override
+                    String encode(String text) {
+                        return codecs.PyUnicode_EncodeLatin1(text, text.length(), errors);
+                    }
+                };
+            case "ascii":
+            case "us-ascii":
+                return new TextEncoder() {
+
+                    @Override
+                    String encode(String text) {
+                        return isASCII(text) ? text
+                                : codecs.PyUnicode_EncodeASCII(text, text.length(), errors);
+                    }
+                };
+            default:
+                PyObject factory = imp.load("codecs").invoke("getincrementalencoder",
+                        Py.newUnicode(encoding));
+                return new Python(factory.__call__(Py.newUnicode(errors)));
+        }
+    }
+
+    private static boolean isASCII(String text) {
+        for (int i = 0; i < text.length(); i++) {
+            if (text.charAt(i) >= 0x80) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /** Any encoding, through a Python <code>codecs.IncrementalEncoder</code>. */
+    private static class Python extends TextEncoder {
+
+        private final PyObject encoder;
+
+        Python(PyObject encoder) {
+            this.encoder = encoder;
+        }
+
+        @Override
+        String encode(String text) {
+            PyObject b = encoder.invoke("encode", Py.newUnicode(text));
+            if (!(b instanceof PyBytes)) {
+                throw Py.TypeError(String.format("encoder should return a bytes object, not '%s'",
+                        b.getType().fastGetName()));
+            }
+            return ((PyBytes)b).getString();
+        }
+
+        @Override
+        void reset(boolean atStart) {
+            if (atStart) {
+                encoder.invoke("reset");
+            } else {
+                encoder.invoke("setstate", Py.Zero);
+            }
+        }
+    }
+}
@@ -6,7 +6,6 @@ import org.python.core.ClassDictInit;
 import org.python.core.Py;
 import org.python.core.PyException;
 import org.python.core.PyInteger;
-import org.python.core.PyLong;
 import org.python.core.PyObject;
 import org.python.core.PyStringMap;
 import org.python.core.PyType;
@@ -34,6 +33,15 @@ public class _io implements ClassDictInit {
         dict.__setitem__("_IOBase", PyIOBase.TYPE);
         dict.__setitem__("_RawIOBase", PyRawIOBase.TYPE);
         dict.__setitem__("FileIO", PyFileIO.TYPE);
+        dict.__setitem__("_BufferedIOBase", PyBufferedIOBase.TYPE);
+        dict.__setitem__("BufferedReader", PyBufferedReader.TYPE);
+        dict.__setitem__("BufferedWriter", PyBufferedWriter.TYPE);
+        dict.__setitem__("BufferedRandom", PyBufferedRandom.TYPE);
+        dict.__setitem__("BufferedRWPair", PyBufferedRWPair.TYPE);
+        dict.__setitem__("BytesIO", PyBytesIO.TYPE);
+        dict.__setitem__("_TextIOBase", PyTextIOBase.TYPE);
+        dict.__setitem__("TextIOWrapper", PyTextIOWrapper.TYPE);
+        dict.__setitem__("StringIO", PyStringIO.TYPE);
 
         // Define UnsupportedOperation exception by constructing the type
 
@@ -178,31 +186,24 @@ public class _io implements ClassDictInit {
 
         } else {
             // We are buffering, so wrap raw into a buffered file
-            PyObject bufferType = null;
-            PyObject io = imp.load("io");
+            PyBufferedIOMixin buffer;
 
             if (mode.updating) {
-                bufferType = io.__getattr__("BufferedRandom");
+                buffer = new PyBufferedRandom(raw, buffering);
             } else if (mode.writing || mode.appending || mode.creating) {
-                bufferType = io.__getattr__("BufferedWriter");
+                buffer = new PyBufferedWriter(raw, buffering);
             } else {                        // = reading
-                bufferType = io.__getattr__("BufferedReader");
+                buffer = new PyBufferedReader(raw, buffering);
             }
 
-            PyLong pyBuffering = new PyLong(buffering);
-            PyObject buffer = bufferType.__call__(raw, pyBuffering);
-
             if (mode.binary) {
                 // If binary, return the just the buffered file
                 return buffer;
 
             } else {
                 // We are opening in text mode, so wrap buffered file in a TextIOWrapper.
-                PyObject textType = io.__getattr__("TextIOWrapper");
-                PyObject[] textArgs =
-                        {buffer, ap.getPyObject(3, Py.None), ap.getPyObject(4, Py.None),
-                                ap.getPyObject(5, Py.None), Py.newBoolean(line_buffering)};
-                PyObject wrapper = textType.__call__(textArgs);
+                PyObject wrapper =
+                        new PyTextIOWrapper(buffer, encoding, errors, newline, line_buffering);
                 wrapper.__setattr__("mode", new PyUnicode(m));
                 return wrapper;
             }
@@ -1,14 +1,20 @@
 package org.python.modules._json;
 
+import java.util.AbstractMap;
+import java.util.ArrayList;
+import java.util.Collection;
+import java.util.List;
+import java.util.Map;
+
 import org.python.core.ArgParser;
 import org.python.core.Py;
-import org.python.core.PyBytes;
 import org.python.core.PyDictionary;
 import org.python.core.PyFloat;
 import org.python.core.PyInteger;
 import org.python.core.PyLong;
 import org.python.core.PyList;
 import org.python.core.PyObject;
+import org.python.core.PySequenceList;
 import org.python.core.PyTuple;
 import org.python.core.PyType;
 import org.python.core.PyUnicode;
@@ -58,12 +64,53 @@ public class Encoder extends PyObject implements Traverseproc {
     }
 
     public PyObject __call__(PyObject obj, PyObject indent_level) {
-        PyList rval = new PyList();
-        encode_obj(rval, obj, 0);
-        return rval;
+        /* The whole document is one chunk, which json.encoder joins without copying */
+        Sink out = new Sink(null);
+        encode_obj(out, obj, 0);
+        return new PyTuple(Py.newUnicode(out.buf.toString()));
+    }
+
+    /**
+     * Write the JSON representation of <code>obj</code> to the file object <code>fp</code>, in
+     * chunks of about {@link #CHUNK_SIZE} characters, so that the document is never held in
+     * memory as a whole (used by <code>json.dump</code>).
+     */
+    public void dump(PyObject obj, PyObject fp) {
+        Sink out = new Sink(fp.__getattr__("write"));
+        encode_obj(out, obj, 0);
+        out.flush();
+    }
+
+    /** The number of characters the encoder collects before it writes them to a file. */
+    static final int CHUNK_SIZE = 1 << 16;
+
+    /** Where the encoder writes: a buffer, emptied into a file when it fills up. */
+    private static final class Sink {
+
+        final StringBuilder buf = new StringBuilder();
+        /** The <code>write</code> method of the file, or <code>null</code> to keep everything. */
+        private final PyObject write;
+
+        Sink(PyObject write) {
+            this.write = write;
+        }
+
+        /** Write out what has been encoded so far if there is enough of it. */
+        void chunk() {
+            if (write != null && buf.length() >= CHUNK_SIZE) {
+                flush();
+            }
+        }
+
+        void flush() {
+            if (buf.length() > 0) {
+                write.__call__(Py.newUnicode(buf.toString()));
+                buf.setLength(0);
+            }
+        }
     }
 
-    private PyUnicode encode_float(PyObject obj) {
+    private String encode_float(PyObject obj) {
         /* Return the JSON representation of a PyFloat */
         double i = obj.asDouble();
         if (Double.isInfinite(i) || Double.isNaN(i)) {
@@ -71,20 +118,35 @@ public class Encoder extends PyObject implements Traverseproc {
                 throw Py.ValueError("Out of range float values are not JSON compliant");
             }
             if (i == Double.POSITIVE_INFINITY) {
-                return new PyUnicode("Infinity");
+                return "Infinity";
             } else if (i == Double.NEGATIVE_INFINITY) {
-                return new PyUnicode("-Infinity");
+                return "-Infinity";
             } else {
-                return new PyUnicode("NaN");
+                return "NaN";
             }
         }
-        /* Use a better float format here? */
-        return obj.__repr__();
+        /* Use float.__repr__, not that of a subclass */
+        PyFloat f = obj.getClass() == PyFloat.class ? (PyFloat) obj : new PyFloat(i);
+        return f.__repr__().getString();
     }
 
-    private PyBytes encode_string(PyObject obj) {
-        /* Return the JSON representation of a string */
-        return (PyBytes) encoder.__call__(obj);
+    private static String encode_int(PyObject obj) {
+        /* Use int.__repr__, not that of a subclass (such as an IntEnum) */
+        if (obj instanceof PyInteger) {
+            return Integer.toString(((PyInteger) obj).getValue());
+        }
+        return ((PyLong) obj).getValue().toString();
+    }
+
+    private void encode_string(Sink out, PyUnicode obj) {
+        /* Write the JSON representation of a string, escaping it here for the _json encoders */
+        if (encoder instanceof _json.EncodeBasestringAsciiFunction) {
+            _json.escape(out.buf, obj.getString(), true);
+        } else if (encoder instanceof _json.EncodeBasestringFunction) {
+            _json.escape(out.buf, obj.getString(), false);
+        } else {
+            out.buf.append(encoder.__call__(obj).asString());
+        }
     }
 
     private PyObject checkCircularReference(PyObject obj) {
@@ -99,110 +161,129 @@ public class Encoder extends PyObject implements Traverseproc {
         return ident;
     }
 
-    private void encode_obj(PyList rval, PyObject obj, int indent_level) {
-        /* Encode Python object obj to a JSON term, rval is a PyList */
-        if (obj == Py.None) {
-            rval.append(new PyBytes("null"));
+    private void encode_obj(Sink out, PyObject obj, int indent_level) {
+        /* Encode Python object obj to a JSON term, written to out */
+        if (obj instanceof PyUnicode) {
+            encode_string(out, (PyUnicode) obj);
+        } else if (obj == Py.None) {
+            out.buf.append("null");
         } else if (obj == Py.True) {
-            rval.append(new PyBytes("true"));
+            out.buf.append("true");
         } else if (obj == Py.False) {
-            rval.append(new PyBytes("false"));
-        } else if (obj instanceof PyBytes) {
-            rval.append(encode_string(obj));
+            out.buf.append("false");
         } else if (obj instanceof PyInteger || obj instanceof PyLong) {
-            rval.append(obj.__str__());
+            out.buf.append(encode_int(obj));
         } else if (obj instanceof PyFloat) {
-            rval.append(encode_float(obj));
+            out.buf.append(encode_float(obj));
         } else if (obj instanceof PyList || obj instanceof PyTuple) {
-            encode_list(rval, obj, indent_level);
+            encode_list(out, (PySequenceList) obj, indent_level);
         } else if (obj instanceof PyDictionary) {
-            encode_dict(rval, (PyDictionary) obj, indent_level);
+            encode_dict(out, (PyDictionary) obj, indent_level);
         } else {
             PyObject ident = checkCircularReference(obj);
             if (defaultfn == Py.None) {
-                throw Py.TypeError(String.format(".80s is not JSON serializable", obj.__repr__()));
+                throw Py.TypeError(String.format("%.80s is not JSON serializable", obj.__repr__()));
             }
 
             PyObject newobj = defaultfn.__call__(obj);
-            encode_obj(rval, newobj, indent_level);
+            encode_obj(out, newobj, indent_level);
             if (ident != null) {
                 markers.__delitem__(ident);
             }
         }
     }
 
-    private void encode_dict(PyList rval, PyDictionary dct, int indent_level) {
+    private void encode_dict(Sink out, PyDictionary dct, int indent_level) {
         /* Encode Python dict dct a JSON term */
         if (dct.__len__() == 0) {
-            rval.append(new PyBytes("{}"));
+            out.buf.append("{}");
             return;
         }
 
         PyObject ident = checkCircularReference(dct);
-        rval.append(new PyBytes("{"));
+        out.buf.append('{');
 
-        /* TODO: C speedup not implemented for sort_keys */
+        Collection<Map.Entry<PyObject, PyObject>> items;
+        if (dct.getClass() == PyDictionary.class) {
+            items = dct.getMap().entrySet();
+        } else {
+            // A subclass (OrderedDict, say) may override iteration or __getitem__
+            List<Map.Entry<PyObject, PyObject>> entries = new ArrayList<>();
+            for (PyObject key : dct.asIterable()) {
+                entries.add(new AbstractMap.SimpleImmutableEntry<>(key, dct.__getitem__(key)));
+            }
+            items = entries;
+        }
+        if (sort_keys.__bool__()) {
+            List<Map.Entry<PyObject, PyObject>> sorted = new ArrayList<>(items);
+            sorted.sort((a, b) -> a.getKey()._cmp(b.getKey()));
+            items = sorted;
+        }
 
-        int idx = 0;
-        for (PyObject key : dct.asIterable()) {
-            PyUnicode kstr;
+        boolean first = true;
+        for (Map.Entry<PyObject, PyObject> item : items) {
+            PyObject key = item.getKey();
+            String kstr;
 
-            if (key instanceof PyBytes) {
-                kstr = (PyUnicode) ((PyBytes) key).decode();
-            } else if (key instanceof PyUnicode) {
-                kstr = (PyUnicode) key;
+            if (key instanceof PyUnicode) {
+                kstr = null;
             } else if (key instanceof PyFloat) {
                 kstr = encode_float(key);
-            } else if (key instanceof PyInteger || key instanceof PyLong) {
-                kstr = key.__str__();
             } else if (key == Py.True) {
-                kstr = new PyUnicode("true");
+                kstr = "true";
             } else if (key == Py.False) {
-                kstr = new PyUnicode("false");
+                kstr = "false";
+            } else if (key instanceof PyInteger || key instanceof PyLong) {
+                kstr = encode_int(key);
             } else if (key == Py.None) {
-                kstr = new PyUnicode("null");
+                kstr = "null";
             } else if (skipkeys) {
                 continue;
             } else {
-                throw Py.TypeError(String.format("keys must be a string: %.80s", key.__repr__()));
+                throw Py.TypeError(String.format("key %.80s is not a string", key.__repr__()));
             }
 
-            if (idx > 0) {
-                rval.append(item_separator);
+            if (!first) {
+                out.buf.append(item_separator.asString());
             }
+            first = false;
 
-            PyObject value = dct.__getitem__(key);
-            PyBytes encoded = encode_string(kstr);
-            rval.append(encoded);
-            rval.append(key_separator);
-            encode_obj(rval, value, indent_level);
-            idx += 1;
+            encode_string(out, kstr == null ? (PyUnicode) key : Py.newUnicode(kstr));
+            out.buf.append(key_separator.asString());
+            encode_obj(out, item.getValue(), indent_level);
+            out.chunk();
         }
 
         if (ident != null) {
             markers.__delitem__(ident);
         }
-        rval.append(new PyBytes("}"));
+        out.buf.append('}');
     }
 
 
-    private void encode_list(PyList rval, PyObject seq, int indent_level) {
+    private void encode_list(Sink out, PySequenceList seq, int indent_level) {
+        int size = seq.size();
+        if (size == 0) {
+            out.buf.append("[]");
+            return;
+        }
+
         PyObject ident = checkCircularReference(seq);
-        rval.append(new PyBytes("["));
+        out.buf.append('[');
 
-        int i = 0;
-        for (PyObject obj : seq.asIterable()) {
+        /* Index rather than iterate, so a list that changes size is not an error */
+        for (int i = 0; i < seq.size(); i++) {
             if (i > 0) {
-                rval.append(item_separator);
+                out.buf.append(item_separator.asString());
             }
-            encode_obj(rval, obj, indent_level);
-            i++;
+            encode_obj(out, seq.pyget(i), indent_level);
+            out.chunk();
         }
 
         if (ident != null) {
             markers.__delitem__(ident);
         }
-        rval.append(new PyBytes("]"));
+        out.buf.append(']');
     }
 
 
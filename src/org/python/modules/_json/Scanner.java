@@ -1,12 +1,20 @@
 package org.python.modules._json;
 
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
 import org.python.core.Py;
-import org.python.core.PyBytes;
 import org.python.core.PyDictionary;
+import org.python.core.PyException;
+import org.python.core.PyFloat;
 import org.python.core.PyList;
+import org.python.core.PyLong;
 import org.python.core.PyObject;
 import org.python.core.PyTuple;
 import org.python.core.PyType;
+import org.python.core.PyUnicode;
 import org.python.core.Traverseproc;
 import org.python.core.Visitproc;
 import org.python.expose.ExposedGet;
@@ -21,7 +29,6 @@ public class Scanner extends PyObject implements Traverseproc {
     @ExposedGet
     public final String __module__ = "_json";
 
-    final String encoding;
     final boolean strict;
     final PyObject object_hook;
     final PyObject pairs_hook;
@@ -31,7 +38,6 @@ public class Scanner extends PyObject implements Traverseproc {
 
     public Scanner(PyObject context) {
         super();
-        encoding = "utf-8";
         strict = context.__getattr__("strict").__bool__();
         object_hook = context.__getattr__("object_hook");
         pairs_hook = context.__getattr__("object_pairs_hook");
@@ -41,285 +47,483 @@ public class Scanner extends PyObject implements Traverseproc {
     }
 
     public PyObject __call__(PyObject string, PyObject idx) {
-        return _scan_once((PyBytes)string, idx.asInt());
+        int start = idx.asInt();
+        if (start < 0) {
+            throw Py.ValueError("idx cannot be negative");
+        }
+        Parse parse = new Parse(this, checkString(string), strict);
+        PyObject rval = parse.scan_once(parse.offset(start));
+        return valIndex(rval, parse.index(parse.next));
     }
 
-    private static boolean IS_WHITESPACE(int c) {
-        return (c == ' ') || (c == '\t') || (c == '\n') || (c == '\r');
+    static PyUnicode checkString(PyObject string) {
+        if (!(string instanceof PyUnicode)) {
+            throw Py.TypeError(String.format("first argument must be a string, not %.80s",
+                    string.getType().fastGetName()));
+        }
+        return (PyUnicode) string;
     }
 
     static PyTuple valIndex(PyObject obj, int i) {
         return new PyTuple(obj, Py.newInteger(i));
     }
 
-    public PyTuple _parse_object(PyBytes pystr, int idx) { // }, Py_ssize_t *next_idx_ptr) {
-        /* Read a JSON object from PyBytes pystr.
-        idx is the index of the first character after the opening curly brace.
-
-        Returns a new PyTuple of a PyObject (usually a dict, but object_hook can change that)
-        and the next_idx to the first character after
-        the closing curly brace.
-        */
-        PyBytes str = pystr;
-        int end_idx = pystr.__len__() - 1;
-        PyList pairs = new PyList();
-        PyObject key;
-        PyObject val;
-
-        /* skip whitespace after { */
-        while (idx <= end_idx && IS_WHITESPACE(str.getInt(idx))) idx++;
-
-        /* only loop if the object is non-empty */
-        if (idx <= end_idx && str.getInt(idx) != '}') {
-            while (idx <= end_idx) {
-                /* read key */
-                if (str.getInt(idx) != '"') {
-                    _json.raise_errmsg("Expecting property name", pystr, idx);
-                }
-                PyTuple key_idx = _json.scanstring(pystr, idx + 1, encoding, strict);
-                key = key_idx.pyget(0);
-                idx = key_idx.pyget(1).asInt();
-
-                /* skip whitespace between key and : delimiter, read :, skip whitespace */
-                while (idx <= end_idx && IS_WHITESPACE(str.getInt(idx))) idx++;
-                if (idx > end_idx || str.getInt(idx) != ':') {
-                    _json.raise_errmsg("Expecting : delimiter", pystr, idx);
-                }
-                idx++;
-                while (idx <= end_idx && IS_WHITESPACE(str.getInt(idx))) idx++;
-
-                /* read any JSON data type */
-                PyTuple val_idx = _scan_once(pystr, idx);
-                val = val_idx.pyget(0);
-                idx = val_idx.pyget(1).asInt();
-                pairs.append(new PyTuple(key, val));
+    /**
+     * Scan the JSON string in <code>pystr</code> whose contents start at <code>end</code> (just
+     * after the opening quote), returning the decoded string and the index just after the
+     * closing quote (for <code>_json.scanstring</code>).
+     */
+    static PyTuple scanstring(PyUnicode pystr, int end, boolean strict) {
+        Parse parse = new Parse(null, pystr, strict);
+        if (end < 0 || end > parse.index(parse.len)) {
+            throw Py.ValueError("end is out of bounds");
+        }
+        PyObject rval = parse.newString(parse.scanstring(parse.offset(end)));
+        return valIndex(rval, parse.index(parse.next));
+    }
 
-                /* skip whitespace before } or , */
-                while (idx <= end_idx && IS_WHITESPACE(str.getInt(idx))) idx++;
+    private static boolean IS_WHITESPACE(int c) {
+        return (c == ' ') || (c == '\t') || (c == '\n') || (c == '\r');
+    }
 
-                /* bail if the object is closed or we didn't get the , delimiter */
-                if (idx > end_idx) break;
-                if (str.getInt(idx) == '}') {
-                    break;
-                } else if (str.getInt(idx) != ',') {
-                    _json.raise_errmsg("Expecting , delimiter", pystr, idx);
-                }
-                idx++;
+    /**
+     * The parse of one document: each method returns the term it reads and leaves in
+     * {@link #next} the offset of the character after it, so no (value, index) pair is made for
+     * the terms inside the document.
+     * <p>
+     * Offsets are into the UTF-16 <code>String</code> of the document. They are the Python
+     * indexes unless the document has supplementary characters, in which case indexes are
+     * translated where they go in or out.
+     */
+    private static final class Parse {
+
+        /** The scanner, for the hooks and parse functions, or null to scan strings only. */
+        final Scanner scanner;
+        final PyUnicode pystr;
+        final String str;
+        final int len;
+        /** Whether the document is all in the Basic Multilingual Plane. */
+        final boolean basic;
+        final boolean strict;
+        /** The offset after the last term read. */
+        int next;
+        /** The keys of objects already met, so that repeated keys share one str. */
+        private final Map<String, PyObject> memo = new HashMap<>();
+        /**
+         * The keys and values of the objects, and the items of the arrays, being read. Each
+         * object or array takes those it added when it is complete.
+         */
+        private final ArrayList<PyObject> stack = new ArrayList<>();
+
+        Parse(Scanner scanner, PyUnicode pystr, boolean strict) {
+            this.scanner = scanner;
+            this.pystr = pystr;
+            this.str = pystr.getString();
+            this.len = str.length();
+            this.basic = pystr.isBasicPlane();
+            this.strict = strict;
+        }
 
-                /* skip whitespace after , delimiter */
-                while (idx <= end_idx && IS_WHITESPACE(str.getInt(idx))) idx++;
+        /** The offset of the Python index <code>idx</code>. */
+        int offset(int idx) {
+            if (basic) {
+                return idx;
             }
-        }
-        /* verify that idx < end_idx, str[idx] should be '}' */
-        if (idx > end_idx || str.getInt(idx) != '}') {
-            _json.raise_errmsg("Expecting object", pystr, end_idx);
+            int count = pystr.getCodePointCount();
+            return idx <= count ? str.offsetByCodePoints(0, idx) : len + idx - count;
         }
 
-        /* if pairs_hook is not None: rval = object_pairs_hook(pairs) */
-        if (pairs_hook != Py.None) {
-            return valIndex(pairs_hook.__call__(pairs), idx + 1);
+        /** The Python index of the offset <code>off</code>. */
+        int index(int off) {
+            if (basic) {
+                return off;
+            }
+            return off <= len ? str.codePointCount(0, off)
+                    : pystr.getCodePointCount() + off - len;
         }
 
-        PyObject rval = new PyDictionary();
-        ((PyDictionary)rval).update(pairs);
-
-        /* if object_hook is not None: rval = object_hook(rval) */
-        if (object_hook != Py.None) {
-            rval = object_hook.__call__(rval);
+        void raise_errmsg(String msg, int off) {
+            _json.raise_errmsg(msg, pystr, index(off));
         }
 
-        return valIndex(rval, idx + 1);
-    }
+        PyException stopIteration(int off) {
+            return Py.StopIteration(Py.newInteger(index(off)));
+        }
 
-    public PyTuple _parse_array(PyBytes pystr, int idx) {
-        /* Read a JSON array from PyBytes pystr.
+        PyUnicode newString(String s) {
+            return new PyUnicode(s, basic);
+        }
 
+        int skipWhitespace(int idx) {
+            while (idx < len && IS_WHITESPACE(str.charAt(idx))) {
+                idx++;
+            }
+            return idx;
+        }
 
-        Returns a new PyTuple of a PyList and next_idx (first character after
-        the closing brace.)
-        */
-        PyBytes str = pystr;
-        int end_idx = pystr.__len__() - 1;
-        PyList rval = new PyList();
+        PyObject parse_object(int idx) {
+            /* Read a JSON object. idx is the offset of the first character after the opening
+            curly brace. Returns a dict (or what a hook makes of it). */
+            int base = stack.size();
+
+            /* skip whitespace after { */
+            idx = skipWhitespace(idx);
+
+            /* only loop if the object is non-empty */
+            if (idx >= len || str.charAt(idx) != '}') {
+                while (true) {
+                    /* read key */
+                    if (idx >= len || str.charAt(idx) != '"') {
+                        raise_errmsg("Expecting property name enclosed in double quotes", idx);
+                    }
+                    String k = scanstring(idx + 1);
+                    PyObject key = memo.get(k);
+                    if (key == null) {
+                        key = newString(k);
+                        memo.put(k, key);
+                    }
+                    idx = next;
+
+                    /* skip whitespace between key and : delimiter, read :, skip whitespace */
+                    idx = skipWhitespace(idx);
+                    if (idx >= len || str.charAt(idx) != ':') {
+                        raise_errmsg("Expecting ':' delimiter", idx);
+                    }
+                    idx = skipWhitespace(idx + 1);
+
+                    /* read any JSON term */
+                    PyObject val = scan_once(idx);
+                    idx = next;
+                    stack.add(key);
+                    stack.add(val);
+
+                    /* skip whitespace before } or , */
+                    idx = skipWhitespace(idx);
+
+                    /* bail if the object is closed or we didn't get the , delimiter */
+                    if (idx < len && str.charAt(idx) == '}') {
+                        break;
+                    } else if (idx >= len || str.charAt(idx) != ',') {
+                        raise_errmsg("Expecting ',' delimiter", idx);
+                    }
+
+                    /* skip whitespace after , delimiter */
+                    idx = skipWhitespace(idx + 1);
+                }
+            }
+            next = idx + 1;
+
+            List<PyObject> items = stack.subList(base, stack.size());
+            PyObject rval;
+            if (scanner.pairs_hook != Py.None) {
+                /* rval = object_pairs_hook(pairs) */
+                PyList pairs = new PyList();
+                for (int i = 0; i < items.size(); i += 2) {
+                    pairs.append(new PyTuple(items.get(i), items.get(i + 1)));
+                }
+                items.clear();
+                return scanner.pairs_hook.__call__(pairs);
+            }
 
-        /* skip whitespace after [ */
-        while (idx <= end_idx && IS_WHITESPACE(str.getInt(idx))) idx++;
+            /* Insert into a dict of the right size; a repeated key keeps the last value */
+            PyDictionary dict = new PyDictionary(PyDictionary.TYPE, items.size() / 2);
+            Map<PyObject, PyObject> map = dict.getMap();
+            for (int i = 0; i < items.size(); i += 2) {
+                map.put(items.get(i), items.get(i + 1));
+            }
+            items.clear();
+            rval = dict;
 
-        /* only loop if the array is non-empty */
-        if (idx <= end_idx && str.getInt(idx) != ']') {
-            while (idx <= end_idx) {
+            /* if object_hook is not None: rval = object_hook(rval) */
+            if (scanner.object_hook != Py.None) {
+                rval = scanner.object_hook.__call__(rval);
+            }
+            return rval;
+        }
 
-                /* read any JSON term and de-tuplefy the (rval, idx) */
-                PyTuple val_idx = _scan_once(pystr, idx);
-                PyObject val = val_idx.pyget(0);
-                idx = val_idx.pyget(1).asInt();
-                rval.append(val);
+        PyObject parse_array(int idx) {
+            /* Read a JSON array. idx is the offset of the first character after the opening
+            bracket. Returns a list. */
+            int base = stack.size();
+
+            /* skip whitespace after [ */
+            idx = skipWhitespace(idx);
+
+            /* only loop if the array is non-empty */
+            if (idx >= len || str.charAt(idx) != ']') {
+                while (true) {
+                    /* read any JSON term */
+                    stack.add(scan_once(idx));
+                    idx = next;
+
+                    /* skip whitespace between term and , */
+                    idx = skipWhitespace(idx);
+
+                    /* bail if the array is closed or we didn't get the , delimiter */
+                    if (idx < len && str.charAt(idx) == ']') {
+                        break;
+                    } else if (idx >= len || str.charAt(idx) != ',') {
+                        raise_errmsg("Expecting ',' delimiter", idx);
+                    }
+
+                    /* skip whitespace after , */
+                    idx = skipWhitespace(idx + 1);
+                }
+            }
+            next = idx + 1;
 
-                /* skip whitespace between term and , */
-                while (idx <= end_idx && IS_WHITESPACE(str.getInt(idx))) idx++;
+            List<PyObject> items = stack.subList(base, stack.size());
+            PyList rval = PyList.fromList(new ArrayList<>(items));
+            items.clear();
+            return rval;
+        }
 
-                /* bail if the array is closed or we didn't get the , delimiter */
-                if (idx > end_idx) break;
-                if (str.getInt(idx) == ']') {
+        PyObject scan_once(int idx) {
+            /* Read one JSON term (of any kind). idx is the offset of its first character. */
+            if (idx >= len) {
+                throw stopIteration(idx);
+            }
+            switch (str.charAt(idx)) {
+                case '"':
+                    /* string */
+                    return newString(scanstring(idx + 1));
+                case '{':
+                    /* object */
+                    return parse_object(idx + 1);
+                case '[':
+                    /* array */
+                    return parse_array(idx + 1);
+                case 'n':
+                    /* null */
+                    if (str.startsWith("null", idx)) {
+                        next = idx + 4;
+                        return Py.None;
+                    }
+                    break;
+                case 't':
+                    /* true */
+                    if (str.startsWith("true", idx)) {
+                        next = idx + 4;
+                        return Py.True;
+                    }
+                    break;
+                case 'f':
+                    /* false */
+                    if (str.startsWith("false", idx)) {
+                        next = idx + 5;
+                        return Py.False;
+                    }
+                    break;
+                case 'N':
+                    /* NaN */
+                    if (str.startsWith("NaN", idx)) {
+                        return parse_constant("NaN", idx + 3);
+                    }
+                    break;
+                case 'I':
+                    /* Infinity */
+                    if (str.startsWith("Infinity", idx)) {
+                        return parse_constant("Infinity", idx + 8);
+                    }
+                    break;
+                case '-':
+                    /* -Infinity */
+                    if (str.startsWith("-Infinity", idx)) {
+                        return parse_constant("-Infinity", idx + 9);
+                    }
                     break;
-                } else if (str.getInt(idx) != ',') {
-                    _json.raise_errmsg("Expecting , delimiter", pystr, idx);
-                }
-                idx++;
-
-                /* skip whitespace after , */
-                while (idx <= end_idx && IS_WHITESPACE(str.getInt(idx))) idx++;
             }
+            /* Didn't find a string, object, array, or named constant. Look for a number. */
+            return match_number(idx);
         }
 
-        /* verify that idx < end_idx, str[idx] should be ']' */
-        if (idx > end_idx || str.getInt(idx) != ']') {
-            _json.raise_errmsg("Expecting object", pystr, end_idx);
+        PyObject parse_constant(String constant, int idx) {
+            next = idx;
+            return scanner.parse_constant.__call__(Py.newUnicode(constant));
         }
-        return valIndex(rval, idx + 1);
-    }
 
+        private boolean isDigit(int idx) {
+            char c = str.charAt(idx);
+            return c >= '0' && c <= '9';
+        }
 
-    public PyTuple _scan_once(PyBytes pystr, int idx) {
-        /* Read one JSON term (of any kind) from PyBytes pystr.
-        idx is the index of the first character of the term
+        PyObject match_number(int start) {
+            /* Read a JSON number. start is the offset of its first character. Returns an int
+            or a float, or what parse_int or parse_float make of the text. */
+            int idx = start;
+            boolean is_float = false;
 
-        Returns a new PyTuple of a PyObject representation of the term along
-        with the next_idx
-        */
-        PyBytes str = pystr;
-        int length = pystr.__len__();
-        if (idx >= length) {
-            throw Py.StopIteration();
-        }
-        switch (str.getInt(idx)) {
-            case '"':
-                /* string */
-                return _json.scanstring(pystr, idx + 1, encoding, strict);
-            case '{':
-                /* object */
-                return _parse_object(pystr, idx + 1);
-            case '[':
-                /* array */
-                return _parse_array(pystr, idx + 1);
-            case 'n':
-                /* null */
-                if ((idx + 3 < length) && str.getInt(idx + 1) == 'u' && str.getInt(idx + 2) == 'l' && str.getInt(idx + 3) == 'l') {
-                    return valIndex(Py.None, idx + 4);
-                }
-                break;
-            case 't':
-                /* true */
-                if ((idx + 3 < length) && str.getInt(idx + 1) == 'r' && str.getInt(idx + 2) == 'u' && str.getInt(idx + 3) == 'e') {
-                    return valIndex(Py.True, idx + 4);
-                }
-                break;
-            case 'f':
-                /* false */
-                if ((idx + 4 < length) && str.getInt(idx + 1) == 'a' && str.getInt(idx + 2) == 'l' && str.getInt(idx + 3) == 's' && str.getInt(idx + 4) == 'e') {
-                    return valIndex(Py.False, idx + 5);
-                }
-                break;
-            case 'N':
-                /* NaN */
-                if ((idx + 2 < length) && str.getInt(idx + 1) == 'a' && str.getInt(idx + 2) == 'N') {
-                    return _parse_constant("NaN", idx + 3);
-                }
-                break;
-            case 'I':
-                /* Infinity */
-                if ((idx + 7 < length) && str.getInt(idx + 1) == 'n' && str.getInt(idx + 2) == 'f' && str.getInt(idx + 3) == 'i' && str.getInt(idx + 4) == 'n' && str.getInt(idx + 5) == 'i' && str.getInt(idx + 6) == 't' && str.getInt(idx + 7) == 'y') {
-                    return _parse_constant("Infinity", idx + 8);
-                }
-                break;
-            case '-':
-                /* -Infinity */
-                if ((idx + 8 < length) && str.getInt(idx + 1) == 'I' && str.getInt(idx + 2) == 'n' && str.getInt(idx + 3) == 'f' && str.getInt(idx + 4) == 'i' && str.getInt(idx + 5) == 'n' && str.getInt(idx + 6) == 'i' && str.getInt(idx + 7) == 't' && str.getInt(idx + 8) == 'y') {
-                    return _parse_constant("-Infinity", idx + 9);
+            /* read a sign if it's there, make sure it's not the end of the string */
+            if (str.charAt(idx) == '-') {
+                idx++;
+                if (idx >= len) {
+                    throw stopIteration(start);
                 }
-                break;
-        }
-        /* Didn't find a string, object, array, or named constant. Look for a number. */
-        return _match_number(pystr, idx);
-    }
-
-    public PyTuple _parse_constant(String constant, int idx) {
-        return valIndex(parse_constant.__call__(Py.newString(constant)), idx);
-    }
+            }
 
-    public PyTuple _match_number(PyBytes pystr, int start) {
-        /* Read a JSON number from PyBytes pystr.
-        idx is the index of the first character of the number
-
-        Returns a new PyObject representation of that number:
-        PyInt, PyLong, or PyFloat.
-        May return other types if parse_int or parse_float are set
-        along with index to the first character after
-        the number.
-        */
-        PyBytes str = pystr;
-        int end_idx = pystr.__len__() - 1;
-        int idx = start;
-        boolean is_float = false;
-
-        /* read a sign if it's there, make sure it's not the end of the string */
-        if (str.getInt(idx) == '-') {
-            idx++;
-            if (idx > end_idx) {
-                throw Py.StopIteration();
+            /* read as many integer digits as we find as long as it doesn't start with 0 */
+            char c = str.charAt(idx);
+            if (c >= '1' && c <= '9') {
+                idx++;
+                while (idx < len && isDigit(idx)) idx++;
+            }
+            /* if it starts with 0 we only expect one integer digit */
+            else if (c == '0') {
+                idx++;
+            }
+            /* no integer digits, error */
+            else {
+                throw stopIteration(start);
             }
-        }
 
-        /* read as many integer digits as we find as long as it doesn't start with 0 */
-        if (str.getInt(idx) >= '1' && str.getInt(idx) <= '9') {
-            idx++;
-            while (idx <= end_idx && str.getInt(idx) >= '0' && str.getInt(idx) <= '9') idx++;
-        }
-        /* if it starts with 0 we only expect one integer digit */
-        else if (str.getInt(idx) == '0') {
-            idx++;
-        }
-        /* no integer digits, error */
-        else {
-            throw Py.StopIteration();
-        }
+            /* if the next char is '.' followed by a digit then read all float digits */
+            if (idx < len - 1 && str.charAt(idx) == '.' && isDigit(idx + 1)) {
+                is_float = true;
+                idx += 2;
+                while (idx < len && isDigit(idx)) idx++;
+            }
 
-        /* if the next char is '.' followed by a digit then read all float digits */
-        if (idx < end_idx && str.getInt(idx) == '.' && str.getInt(idx + 1) >= '0' && str.getInt(idx + 1) <= '9') {
-            is_float = true;
-            idx += 2;
-            while (idx <= end_idx && str.getInt(idx) >= '0' && str.getInt(idx) <= '9') idx++;
-        }
+            /* if the next char is 'e' or 'E' then maybe read the exponent (or backtrack) */
+            if (idx < len - 1 && (str.charAt(idx) == 'e' || str.charAt(idx) == 'E')) {
 
-        /* if the next char is 'e' or 'E' then maybe read the exponent (or backtrack) */
-        if (idx < end_idx && (str.getInt(idx) == 'e' || str.getInt(idx) == 'E')) {
+                /* save the index of the 'e' or 'E' just in case we need to backtrack */
+                int e_start = idx;
+                idx++;
 
-            /* save the index of the 'e' or 'E' just in case we need to backtrack */
-            int e_start = idx;
-            idx++;
+                /* read an exponent sign if present */
+                if (idx < len - 1 && (str.charAt(idx) == '-' || str.charAt(idx) == '+')) idx++;
 
-            /* read an exponent sign if present */
-            if (idx < end_idx && (str.getInt(idx) == '-' || str.getInt(idx) == '+')) idx++;
+                /* read all digits */
+                while (idx < len && isDigit(idx)) idx++;
 
-            /* read all digits */
-            while (idx <= end_idx && str.getInt(idx) >= '0' && str.getInt(idx) <= '9') idx++;
+                /* if we got a digit, then parse as float. if not, backtrack */
+                if (isDigit(idx - 1)) {
+                    is_float = true;
+                } else {
+                    idx = e_start;
+                }
+            }
 
-            /* if we got a digit, then parse as float. if not, backtrack */
-            if (str.getInt(idx - 1) >= '0' && str.getInt(idx - 1) <= '9') {
-                is_float = true;
+            next = idx;
+            String numstr = str.substring(start, idx);
+            if (is_float) {
+                /* parse as a float here if parse_float is float, else call it */
+                if (scanner.parse_float == PyFloat.TYPE) {
+                    return Py.newFloat(Double.parseDouble(numstr));
+                }
+                return scanner.parse_float.__call__(Py.newUnicode(numstr));
             } else {
-                idx = e_start;
+                /* parse as an int here if parse_int is int, else call it */
+                if (scanner.parse_int == PyLong.TYPE) {
+                    if (idx - start <= 18) {
+                        return Py.newInteger(Long.parseLong(numstr));
+                    }
+                    return Py.newLong(numstr);
+                }
+                return scanner.parse_int.__call__(Py.newUnicode(numstr));
             }
         }
 
-        /* copy the section we determined to be a number */
-        PyBytes numstr = (PyBytes) str.getslice(start, idx);
-        if (is_float) {
-            /* parse as a float using a fast path if available, otherwise call user defined method */
-            return valIndex(parse_float.__call__(numstr), idx);
-        } else {
-            /* parse as an int using a fast path if available, otherwise call user defined method */
-            return valIndex(parse_int.__call__(numstr), idx);
+        String scanstring(int end) {
+            /* Read the contents of a JSON string from offset end (after the opening quote) and
+            return them decoded; next is left after the closing quote. */
+            int begin = end - 1;
+            StringBuilder chunks = null;
+            while (true) {
+                /* Find the end of the string or the next escape */
+                int idx = end;
+                char c = 0;
+                for (; idx < len; idx++) {
+                    c = str.charAt(idx);
+                    if (c == '"' || c == '\\') {
+                        break;
+                    } else if (strict && c <= 0x1f) {
+                        raise_errmsg("Invalid control character at", idx);
+                    }
+                }
+                if (idx >= len) {
+                    raise_errmsg("Unterminated string starting at", begin);
+                }
+
+                /* A string without escapes needs no copying but the substring */
+                if (c == '"' && chunks == null) {
+                    next = idx + 1;
+                    return str.substring(end, idx);
+                }
+
+                /* Pick up this chunk */
+                if (chunks == null) {
+                    chunks = new StringBuilder(idx - end + 16);
+                }
+                chunks.append(str, end, idx);
+                idx++;
+                if (c == '"') {
+                    next = idx;
+                    return chunks.toString();
+                }
+                if (idx == len) {
+                    raise_errmsg("Unterminated string starting at", begin);
+                }
+                c = str.charAt(idx);
+                if (c != 'u') {
+                    /* Non-unicode backslash escapes */
+                    end = idx + 1;
+                    switch (c) {
+                        case '"':
+                        case '\\':
+                        case '/':
+                            break;
+                        case 'b':
+                            c = '\b';
+                            break;
+                        case 'f':
+                            c = '\f';
+                            break;
+                        case 'n':
+                            c = '\n';
+                            break;
+                        case 'r':
+                            c = '\r';
+                            break;
+                        case 't':
+                            c = '\t';
+                            break;
+                        default:
+                            raise_errmsg("Invalid \\escape", end - 2);
+                    }
+                    chunks.append(c);
+                } else {
+                    /* Decode 4 hex digits, and a second \\uXXXX for a surrogate pair */
+                    c = decode_uXXXX(idx);
+                    end = idx + 5;
+                    if (Character.isHighSurrogate(c) && end + 6 < len
+                            && str.charAt(end) == '\\' && str.charAt(end + 1) == 'u') {
+                        char c2 = decode_uXXXX(end + 1);
+                        if (Character.isLowSurrogate(c2)) {
+                            chunks.append(c);
+                            c = c2;
+                            end += 6;
+                        }
+                    }
+                    chunks.append(c);
+                }
+            }
+        }
+
+        private char decode_uXXXX(int idx) {
+            /* idx is the offset of the u */
+            if (idx + 4 >= len) {
+                raise_errmsg("Invalid \\uXXXX escape", idx - 1);
+            }
+            int c = 0;
+            for (int i = idx + 1; i <= idx + 4; i++) {
+                int digit = Character.digit(str.charAt(i), 16);
+                if (digit < 0 || str.charAt(i) > 'f') {
+                    raise_errmsg("Invalid \\uXXXX escape", idx - 1);
+                }
+                c = (c << 4) | digit;
+            }
+            return (char) c;
         }
     }
 
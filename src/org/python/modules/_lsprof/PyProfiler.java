@@ -0,0 +1,432 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._lsprof;
+
+import java.util.Arrays;
+import java.util.HashMap;
+import java.util.IdentityHashMap;
+import java.util.Map;
+
+import org.python.core.ArgParser;
+import org.python.core.Py;
+import org.python.core.PyException;
+import org.python.core.PyFloat;
+import org.python.core.PyFrame;
+import org.python.core.PyList;
+import org.python.core.PyObject;
+import org.python.core.PyType;
+import org.python.core.ThreadState;
+import org.python.core.TraceFunction;
+import org.python.core.Traverseproc;
+import org.python.core.Visitproc;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedType;
+
+/**
+ * <code>_lsprof.Profiler</code>, a deterministic profiler following CPython's
+ * <code>Modules/_lsprof.c</code>. When enabled it is installed as the profile function of the
+ * calling thread (as <code>sys.setprofile</code> would install a Python function), so it sees
+ * the call and return of every Python frame on that thread without a call into Python code.
+ * <p>
+ * Statistics are kept in primitive arrays indexed by an entry number for each code object, and
+ * by a sub-entry number for each (caller, callee) pair. Times are measured with
+ * <code>System.nanoTime()</code> unless a timer function is given. Calls to functions
+ * implemented in Java do not create frames, so (unlike CPython) they are not reported
+ * separately: their time counts as inline time of the Python function that called them.
+ */
+@ExposedType(name = "_lsprof.Profiler", doc = PyProfiler.Profiler_doc)
+public class PyProfiler extends PyObject implements Traverseproc {
+
+    public static final PyType TYPE = PyType.fromClass(PyProfiler.class);
+
+    static final String Profiler_doc = "Profiler(custom_timer=None, time_unit=None, "
+            + "subcalls=True, builtins=True)\n\n"
+            + "    Builds a profiler object using the specified timer function.\n"
+            + "    The default timer is a fast built-in one based on real time.\n"
+            + "    For custom timer functions returning integers, time_unit can\n"
+            + "    be a float specifying a scale (i.e. how long each integer unit\n"
+            + "    is, in seconds).\n";
+
+    /** Custom timer function, or <code>null</code> to use <code>System.nanoTime()</code>. */
+    private PyObject timer;
+
+    /** Seconds per tick of the timer. */
+    private double unit = 1e-9;
+
+    /** True if a custom timer returns integers in units of {@link #unit}, not float seconds. */
+    private boolean intTimer;
+
+    /** Whether to record statistics for (caller, callee) pairs. */
+    private boolean subcalls = true;
+
+    /** The trace function installed in the thread state while enabled. */
+    private final Tracer tracer = new Tracer();
+
+    /** The thread state on which we are installed, or <code>null</code> when disabled. */
+    private ThreadState installed;
+
+    /** Entry number of each code object seen. */
+    private final Map<Object, Integer> entryIndex = new IdentityHashMap<>();
+    private Object[] entryCode = new Object[16];
+    private long[] callCount = new long[16];
+    private long[] recCallCount = new long[16];
+    private long[] totalTime = new long[16];
+    private long[] inlineTime = new long[16];
+    private int[] recursionLevel = new int[16];
+    private int entries;
+
+    /** Sub-entry number of each (caller, callee) pair, as <code>caller &lt;&lt; 32 | callee</code>. */
+    private final Map<Long, Integer> subIndex = new HashMap<>();
+    private long[] subKey = new long[16];
+    private long[] subCallCount = new long[16];
+    private long[] subRecCallCount = new long[16];
+    private long[] subTotalTime = new long[16];
+    private long[] subInlineTime = new long[16];
+    private int[] subRecursionLevel = new int[16];
+    private int subEntries;
+
+    /** The stack of calls in progress: entry, sub-entry, start time, time in subcalls. */
+    private int[] ctxEntry = new int[32];
+    private int[] ctxSub = new int[32];
+    private long[] ctxStart = new long[32];
+    private long[] ctxSubTime = new long[32];
+    private int depth;
+
+    /** Set while calling a custom timer, so that its own frames are not profiled. */
+    private boolean inTimer;
+
+    public PyProfiler() {
+        super(TYPE);
+    }
+
+    public PyProfiler(PyType subtype) {
+        super(subtype);
+    }
+
+    @ExposedNew
+    @ExposedMethod
+    final void Profiler___init__(PyObject[] args, String[] kwds) {
+        ArgParser ap = new ArgParser("Profiler", args, kwds,
+                new String[] {"timer", "timeunit", "subcalls", "builtins"}, 0);
+        PyObject timerArg = ap.getPyObject(0, Py.None);
+        double timeunit = ap.getPyObject(1, Py.None) == Py.None ? 0.0
+                : ap.getPyObject(1).asDouble();
+        subcalls = ap.getPyObject(2, Py.True).__bool__();
+        // builtins (argument 3) is accepted, but Java functions are not profiled separately
+        ap.getPyObject(3, Py.True);
+        clear();
+        if (timerArg == Py.None) {
+            timer = null;
+            unit = 1e-9;
+            intTimer = false;
+        } else {
+            timer = timerArg;
+            intTimer = timeunit > 0.0;
+            // Float seconds are held as nanoseconds
+            unit = intTimer ? timeunit : 1e-9;
+        }
+    }
+
+    @ExposedMethod(doc = "getstats() -> list of profiler_entry objects\n\n"
+            + "Return all information collected by the profiler.\n"
+            + "Each profiler_entry is a tuple-like object with the\n"
+            + "following attributes:\n\n"
+            + "    code          code object\n"
+            + "    callcount     how many times this was called\n"
+            + "    reccallcount  how many times called recursively\n"
+            + "    totaltime     total time in this entry\n"
+            + "    inlinetime    inline time in this entry (not in subcalls)\n"
+            + "    calls         details of the calls\n\n"
+            + "The calls attribute is either None or a list of\n"
+            + "profiler_subentry objects:\n\n"
+            + "    code          called code object\n"
+            + "    callcount     how many times this is called\n"
+            + "    reccallcount  how many times this is called recursively\n"
+            + "    totaltime     total time spent in this call\n"
+            + "    inlinetime    inline time (not in further subcalls)\n")
+    final synchronized PyObject Profiler_getstats() {
+        // Sub-entries of each caller
+        PyList[] calls = new PyList[entries];
+        if (subcalls) {
+            for (int s = 0; s < subEntries; s++) {
+                int caller = (int)(subKey[s] >>> 32), callee = (int)subKey[s];
+                if (calls[caller] == null) {
+                    calls[caller] = new PyList();
+                }
+                calls[caller].append(new _lsprof.ProfilerSubEntry(code(callee),
+                        Py.newInteger(subCallCount[s]), Py.newInteger(subRecCallCount[s]),
+                        seconds(subTotalTime[s]), seconds(subInlineTime[s])));
+            }
+        }
+
+        PyList stats = new PyList();
+        for (int e = 0; e < entries; e++) {
+            stats.append(new _lsprof.ProfilerEntry(code(e), Py.newInteger(callCount[e]),
+                    Py.newInteger(recCallCount[e]), seconds(totalTime[e]),
+                    seconds(inlineTime[e]), calls[e] == null ? Py.None : calls[e]));
+        }
+        return stats;
+    }
+
+    private PyObject code(int e) {
+        Object code = entryCode[e];
+        return code instanceof PyObject ? (PyObject)code : Py.newUnicode(code.toString());
+    }
+
+    private PyFloat seconds(long ticks) {
+        return new PyFloat(ticks * unit);
+    }
+
+    @ExposedMethod(defaults = {"null", "null"}, doc = "enable(subcalls=True, builtins=True)\n\n"
+            + "Start collecting profiling information.\n"
+            + "If 'subcalls' is True, also records for each function\n"
+            + "statistics separated according to its current caller.\n"
+            + "If 'builtins' is True, records the time spent in\n"
+            + "built-in functions separately from their caller.\n")
+    final synchronized void Profiler_enable(PyObject subcallsArg, PyObject builtins) {
+        if (subcallsArg != null) {
+            subcalls = subcallsArg.__bool__();
+        }
+        ThreadState ts = Py.getThreadState();
+        if (installed != null && installed != ts) {
+            throw Py.RuntimeError("profiler is already enabled in another thread");
+        }
+        installed = ts;
+        ts.profilefunc = tracer;
+    }
+
+    @ExposedMethod(doc = "disable()\n\nStop collecting profiling information.\n")
+    final synchronized void Profiler_disable() {
+        if (installed != null) {
+            if (installed.profilefunc == tracer) {
+                installed.profilefunc = null;
+            }
+            installed = null;
+        }
+        flushUnmatched();
+    }
+
+    @ExposedMethod(doc = "clear()\n\nClear all profiling information collected so far.\n")
+    final synchronized void Profiler_clear() {
+        clear();
+    }
+
+    private void clear() {
+        entryIndex.clear();
+        Arrays.fill(entryCode, 0, entries, null);
+        entries = 0;
+        subIndex.clear();
+        subEntries = 0;
+        depth = 0;
+    }
+
+    /** The current time in ticks of {@link #unit}. */
+    private long now() {
+        if (timer == null) {
+            return System.nanoTime();
+        }
+        inTimer = true;
+        try {
+            PyObject t = timer.__call__();
+            return intTimer ? t.asLong() : (long)(t.asDouble() * 1e9);
+        } finally {
+            inTimer = false;
+        }
+    }
+
+    /** Find or create the entry for a code object. */
+    private int entry(Object code) {
+        Integer e = entryIndex.get(code);
+        if (e != null) {
+            return e;
+        }
+        int n = entries++;
+        if (n == callCount.length) {
+            int len = 2 * n;
+            entryCode = Arrays.copyOf(entryCode, len);
+            callCount = Arrays.copyOf(callCount, len);
+            recCallCount = Arrays.copyOf(recCallCount, len);
+            totalTime = Arrays.copyOf(totalTime, len);
+            inlineTime = Arrays.copyOf(inlineTime, len);
+            recursionLevel = Arrays.copyOf(recursionLevel, len);
+        }
+        entryCode[n] = code;
+        callCount[n] = recCallCount[n] = totalTime[n] = inlineTime[n] = 0;
+        recursionLevel[n] = 0;
+        entryIndex.put(code, n);
+        return n;
+    }
+
+    /** Find or create the sub-entry for calls from <code>caller</code> to <code>callee</code>. */
+    private int subEntry(int caller, int callee) {
+        long key = ((long)caller << 32) | callee;
+        Integer s = subIndex.get(key);
+        if (s != null) {
+            return s;
+        }
+        int n = subEntries++;
+        if (n == subKey.length) {
+            int len = 2 * n;
+            subKey = Arrays.copyOf(subKey, len);
+            subCallCount = Arrays.copyOf(subCallCount, len);
+            subRecCallCount = Arrays.copyOf(subRecCallCount, len);
+            subTotalTime = Arrays.copyOf(subTotalTime, len);
+            subInlineTime = Arrays.copyOf(subInlineTime, len);
+            subRecursionLevel = Arrays.copyOf(subRecursionLevel, len);
+        }
+        subKey[n] = key;
+        subCallCount[n] = subRecCallCount[n] = subTotalTime[n] = subInlineTime[n] = 0;
+        subRecursionLevel[n] = 0;
+        subIndex.put(key, n);
+        return n;
+    }
+
+    /** A call begins: push a context for it. */
+    private synchronized void enter(Object code) {
+        int e = entry(code);
+        if (depth == ctxEntry.length) {
+            int len = 2 * depth;
+            ctxEntry = Arrays.copyOf(ctxEntry, len);
+            ctxSub = Arrays.copyOf(ctxSub, len);
+            ctxStart = Arrays.copyOf(ctxStart, len);
+            ctxSubTime = Arrays.copyOf(ctxSubTime, len);
+        }
+        recursionLevel[e]++;
+        int s = -1;
+        if (subcalls && depth > 0) {
+            s = subEntry(ctxEntry[depth - 1], e);
+            subRecursionLevel[s]++;
+        }
+        ctxEntry[depth] = e;
+        ctxSub[depth] = s;
+        ctxSubTime[depth] = 0;
+        ctxStart[depth] = now();
+        depth++;
+    }
+
+    /** A call ends (by return or exception): pop its context and account for the time. */
+    private synchronized void leave() {
+        if (depth == 0) {
+            // Return from a call in progress when we were enabled
+            return;
+        }
+        leave(now());
+    }
+
+    private void leave(long t) {
+        int d = --depth;
+        long tt = t - ctxStart[d];
+        long it = tt - ctxSubTime[d];
+        if (d > 0) {
+            ctxSubTime[d - 1] += tt;
+        }
+
+        int e = ctxEntry[d];
+        if (--recursionLevel[e] == 0) {
+            totalTime[e] += tt;
+        } else {
+            recCallCount[e]++;
+        }
+        inlineTime[e] += it;
+        callCount[e]++;
+
+        int s = ctxSub[d];
+        if (s >= 0) {
+            if (--subRecursionLevel[s] == 0) {
+                subTotalTime[s] += tt;
+            } else {
+                subRecCallCount[s]++;
+            }
+            subInlineTime[s] += it;
+            subCallCount[s]++;
+        }
+    }
+
+    /** Close every call still in progress, as if it returned now. */
+    private void flushUnmatched() {
+        if (depth > 0) {
+            long t = now();
+            while (depth > 0) {
+                leave(t);
+            }
+        }
+    }
+
+    /**
+     * The profile function installed in the thread state. It returns nothing useful, as the
+     * return value of a profile function is ignored.
+     */
+    private class Tracer extends TraceFunction {
+
+        @Override
+        public TraceFunction traceCall(PyFrame frame) {
+            if (!inTimer) {
+                enter(frame.f_code);
+            }
+            return null;
+        }
+
+        @Override
+        public TraceFunction traceReturn(PyFrame frame, PyObject ret) {
+            if (!inTimer) {
+                leave();
+            }
+            return null;
+        }
+
+        @Override
+        public TraceFunction traceLine(PyFrame frame, int line) {
+            return null;
+        }
+
+        @Override
+        public TraceFunction traceException(PyFrame frame, PyException exc) {
+            // Called (instead of traceReturn) when an exception ends the frame
+            if (!inTimer) {
+                leave();
+            }
+            return null;
+        }
+
+        @Override
+        public PyObject getTraceObject() {
+            return PyProfiler.this;
+        }
+    }
+
+    /* Traverseproc implementation */
+    @Override
+    public int traverse(Visitproc visit, Object arg) {
+        int retVal;
+        if (timer != null) {
+            retVal = visit.visit(timer, arg);
+            if (retVal != 0) {
+                return retVal;
+            }
+        }
+        for (int e = 0; e < entries; e++) {
+            if (entryCode[e] instanceof PyObject) {
+                retVal = visit.visit((PyObject)entryCode[e], arg);
+                if (retVal != 0) {
+                    return retVal;
+                }
+            }
+        }
+        return 0;
+    }
+
+    @Override
+    public boolean refersDirectlyTo(PyObject ob) {
+        if (ob == null) {
+            return false;
+        } else if (ob == timer) {
+            return true;
+        }
+        for (int e = 0; e < entries; e++) {
+            if (entryCode[e] == ob) {
+                return true;
+            }
+        }
+        return false;
+    }
+}
@@ -0,0 +1,112 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules._lsprof;
+
+import org.python.core.PyObject;
+import org.python.core.PyTuple;
+import org.python.core.PyType;
+import org.python.expose.ExposedGet;
+import org.python.expose.ExposedModule;
+import org.python.expose.ExposedType;
+import org.python.expose.ModuleInit;
+
+/**
+ * The Python <code>_lsprof</code> module: the fast profiler behind <code>cProfile</code>.
+ */
+@ExposedModule(doc = _lsprof.__doc__)
+public class _lsprof {
+
+    public static final String __doc__ = "Fast profiler";
+
+    @ModuleInit
+    public static void classDictInit(PyObject dict) {
+        dict.__setitem__("Profiler", PyProfiler.TYPE);
+        dict.__setitem__("profiler_entry", ProfilerEntry.TYPE);
+        dict.__setitem__("profiler_subentry", ProfilerSubEntry.TYPE);
+    }
+
+    /**
+     * The statistics for one function, as returned by <code>Profiler.getstats()</code>: a tuple
+     * with named fields, like CPython's structseq of the same name.
+     */
+    @ExposedType(name = "_lsprof.profiler_entry", isBaseType = false)
+    public static class ProfilerEntry extends PyTuple {
+
+        public static final PyType TYPE = PyType.fromClass(ProfilerEntry.class);
+
+        ProfilerEntry(PyObject code, PyObject callcount, PyObject reccallcount,
+                PyObject totaltime, PyObject inlinetime, PyObject calls) {
+            super(TYPE, new PyObject[] {code, callcount, reccallcount, totaltime, inlinetime,
+                    calls});
+        }
+
+        @ExposedGet(name = "code", doc = "code object or built-in function name")
+        public PyObject getCode() {
+            return pyget(0);
+        }
+
+        @ExposedGet(name = "callcount", doc = "how many times this was called")
+        public PyObject getCallcount() {
+            return pyget(1);
+        }
+
+        @ExposedGet(name = "reccallcount", doc = "how many times called recursively")
+        public PyObject getReccallcount() {
+            return pyget(2);
+        }
+
+        @ExposedGet(name = "totaltime", doc = "total time in this entry")
+        public PyObject getTotaltime() {
+            return pyget(3);
+        }
+
+        @ExposedGet(name = "inlinetime", doc = "inline time in this entry (not in subcalls)")
+        public PyObject getInlinetime() {
+            return pyget(4);
+        }
+
+        @ExposedGet(name = "calls", doc = "details of the calls")
+        public PyObject getCalls() {
+            return pyget(5);
+        }
+    }
+
+    /**
+     * The statistics for calls from one function to another, the elements of
+     * <code>profiler_entry.calls</code>.
+     */
+    @ExposedType(name = "_lsprof.profiler_subentry", isBaseType = false)
+    public static class ProfilerSubEntry extends PyTuple {
+
+        public static final PyType TYPE = PyType.fromClass(ProfilerSubEntry.class);
+
+        ProfilerSubEntry(PyObject code, PyObject callcount, PyObject reccallcount,
+                PyObject totaltime, PyObject inlinetime) {
+            super(TYPE, new PyObject[] {code, callcount, reccallcount, totaltime, inlinetime});
+        }
+
+        @ExposedGet(name = "code", doc = "called code object or built-in function name")
+        public PyObject getCode() {
+            return pyget(0);
+        }
+
+        @ExposedGet(name = "callcount", doc = "how many times this is called")
+        public PyObject getCallcount() {
+            return pyget(1);
+        }
+
+        @ExposedGet(name = "reccallcount", doc = "how many times this is called recursively")
+        public PyObject getReccallcount() {
+            return pyget(2);
+        }
+
+        @ExposedGet(name = "totaltime", doc = "total time spent in this call")
+        public PyObject getTotaltime() {
+            return pyget(3);
+        }
+
+        @ExposedGet(name = "inlinetime", doc = "inline time (not in further subcalls)")
+        public PyObject getInlinetime() {
+            return pyget(4);
+        }
+    }
+}
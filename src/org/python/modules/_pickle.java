@@ -22,6 +22,7 @@ import org.python.core.PyDictionary;
 import org.python.core.PyException;
 import org.python.core.PyFile;
 import org.python.core.PyFloat;
+import org.python.core.PyFrozenSet;
 import org.python.core.PyFunction;
 import org.python.core.PyInteger;
 import org.python.core.PyList;
@@ -30,6 +31,7 @@ import org.python.core.PyModule;
 import org.python.core.PyNone;
 import org.python.core.PyObject;
 import org.python.core.PyReflectedFunction;
+import org.python.core.PySet;
 import org.python.core.PySlice;
 import org.python.core.PyStringMap;
 import org.python.core.PyTuple;
@@ -42,7 +44,9 @@ import org.python.core.stringlib.Encoding;
 import org.python.util.Generic;
 
 import java.math.BigInteger;
+import java.util.Iterator;
 import java.util.Map;
+import java.util.Set;
 
 /**
  *
@@ -359,18 +363,18 @@ public class _pickle implements ClassDictInit {
     /**
      * File format version we write.
      */
-    public static final String format_version = "2.0";
+    public static final String format_version = "4.0";
 
     /**
      * Old format versions we can read.
      */
     public static final String[] compatible_formats =
-                new String[] { "1.0", "1.1", "1.2", "1.3", "2.0" };
+                new String[] { "1.0", "1.1", "1.2", "1.3", "2.0", "3.0", "4.0" };
 
     /**
      * Highest protocol version supported.
      */
-    public static final int HIGHEST_PROTOCOL = 2;
+    public static final int HIGHEST_PROTOCOL = 4;
 
     public static String[] __depends__ = new String[] {
         "copyreg",
@@ -437,6 +441,20 @@ public class _pickle implements ClassDictInit {
     final static char LONG1           = 0x8A;
     final static char LONG4           = 0x8B;
 
+    final static char BINBYTES        = 'B';
+    final static char SHORT_BINBYTES  = 'C';
+
+    final static char SHORT_BINUNICODE = 0x8C;
+    final static char BINUNICODE8     = 0x8D;
+    final static char BINBYTES8       = 0x8E;
+    final static char EMPTY_SET       = 0x8F;
+    final static char ADDITEMS        = 0x90;
+    final static char FROZENSET       = 0x91;
+    final static char NEWOBJ_EX       = 0x92;
+    final static char STACK_GLOBAL    = 0x93;
+    final static char MEMOIZE         = 0x94;
+    final static char FRAME           = 0x95;
+
     private static PyDictionary dispatch_table;
     private static PyDictionary extension_registry;
     private static PyDictionary inverted_registry;
@@ -474,11 +492,27 @@ public class _pickle implements ClassDictInit {
 
     private static PyType BoolType = PyType.fromClass(PyBoolean.class);
 
+    private static PyType SetType = PyType.fromClass(PySet.class);
+
+    private static PyType FrozenSetType = PyType.fromClass(PyFrozenSet.class);
+
 
     private static PyObject dict;
 
     private static final int BATCHSIZE = 1024;
 
+    /**
+     * Size at which the Pickler ends a frame (protocol 4) or otherwise passes what it has
+     * buffered to the file.
+     */
+    private static final int FRAME_SIZE_TARGET = 64 * 1024;
+
+    /** Frames smaller than this are written without the FRAME opcode. */
+    private static final int FRAME_SIZE_MIN = 4;
+
+    /** The length of the FRAME opcode and its 8 byte length. */
+    private static final int FRAME_HEADER_SIZE = 9;
+
     /**
      * Initialization when module is imported.
      */
@@ -551,7 +585,8 @@ public class _pickle implements ClassDictInit {
      * @param file      a file-like object, can be a cStringIO.StringIO,
      *                  a PyFile or any python object which implements a
      *                  <i>write</i> method.
-     * @param protocol  pickle protocol version (0 - text, 1 - pre-2.3 binary, 2 - 2.3)
+     * @param protocol  pickle protocol version (0 - text, 1 - pre-2.3 binary, 2 - 2.3,
+     *                  3 - bytes, 4 - framed)
      * @return         a new Pickler instance.
      */
     public static Pickler Pickler(PyObject file, int protocol) {
@@ -589,7 +624,8 @@ public class _pickle implements ClassDictInit {
      * @param file      a file-like object, can be a cStringIO.StringIO,
      *                  a PyFile or any python object which implements a
      *                  <i>write</i> method.
-     * @param protocol  pickle protocol version (0 - text, 1 - pre-2.3 binary, 2 - 2.3)
+     * @param protocol  pickle protocol version (0 - text, 1 - pre-2.3 binary, 2 - 2.3,
+     *                  3 - bytes, 4 - framed)
      */
     public static void dump(PyObject object, PyObject file, int protocol) {
         new Pickler(file, protocol).dump(object);
@@ -608,7 +644,8 @@ public class _pickle implements ClassDictInit {
     /**
      * Shorthand function which pickles and returns the string representation.
      * @param object    a data object which should be pickled.
-     * @param protocol  pickle protocol version (0 - text, 1 - pre-2.3 binary, 2 - 2.3)
+     * @param protocol  pickle protocol version (0 - text, 1 - pre-2.3 binary, 2 - 2.3,
+     *                  3 - bytes, 4 - framed)
      * @return         a string representing the pickled object.
      */
     public static PyBytes dumps(PyObject object, int protocol) {
@@ -675,6 +712,15 @@ public class _pickle implements ClassDictInit {
 
         private PickleMemo memo = new PickleMemo();
 
+        /**
+         * The pickle written so far and not yet passed to the file: when framing (protocol 4),
+         * the current frame, with room at frameStart for the FRAME opcode and its length.
+         */
+        private final StringBuilder out = new StringBuilder();
+
+        /** Where the current frame starts in out, or -1 when not framing. */
+        private int frameStart = -1;
+
         /**
          * To write references to persistent objects, the persistent module
          * must assign a method to persistent_id which returns either None
@@ -694,6 +740,11 @@ public class _pickle implements ClassDictInit {
 
 
         public Pickler(PyObject file, int protocol) {
+            if (protocol < 0) {
+                protocol = HIGHEST_PROTOCOL;
+            } else if (protocol > HIGHEST_PROTOCOL) {
+                throw Py.ValueError("pickle protocol must be <= " + HIGHEST_PROTOCOL);
+            }
             this.file = PyIOFileFactory.createIOFile(file);
             this.protocol = protocol;
         }
@@ -704,18 +755,66 @@ public class _pickle implements ClassDictInit {
          * @param object        The object which will be pickled.
          */
         public void dump(PyObject object) {
-            if (protocol >= 2) {
-                file.write(PROTO);
-                file.write((char) protocol);
+            try {
+                if (protocol >= 2) {
+                    write(PROTO);
+                    write((char) protocol);
+                }
+                if (protocol >= 4) {
+                    startFrame();
+                }
+                save(object);
+                write(STOP);
+                commitFrame(true);
+            } finally {
+                out.setLength(0);
+                frameStart = -1;
             }
-            save(object);
-            file.write(STOP);
             file.flush();
         }
 
-        private static final int get_id(PyObject o) {
-            // we don't pickle Java instances so we don't have to consider that case
-            return System.identityHashCode(o);
+        private void write(char ch) {
+            out.append(ch);
+        }
+
+        private void write(String str) {
+            out.append(str);
+        }
+
+        private void startFrame() {
+            frameStart = out.length();
+            for (int i = 0; i < FRAME_HEADER_SIZE; i++) {
+                out.append('\0');
+            }
+        }
+
+        /**
+         * Pass what is buffered to the file, as a frame when framing, if there is enough of it
+         * or if forced at the end of the pickle. Called only between opcodes, since a frame
+         * must hold whole opcodes.
+         */
+        private void commitFrame(boolean force) {
+            if (out.length() < FRAME_SIZE_TARGET && !force) {
+                return;
+            }
+            if (frameStart >= 0) {
+                long n = out.length() - frameStart - FRAME_HEADER_SIZE;
+                if (n >= FRAME_SIZE_MIN) {
+                    out.setCharAt(frameStart, FRAME);
+                    for (int i = 0; i < 8; i++) {
+                        out.setCharAt(frameStart + 1 + i, (char)((n >>> (8 * i)) & 0xFF));
+                    }
+                } else {
+                    out.delete(frameStart, frameStart + FRAME_HEADER_SIZE);
+                }
+            }
+            if (out.length() > 0) {
+                file.write(out.toString());
+                out.setLength(0);
+            }
+            if (frameStart >= 0 && !force) {
+                startFrame();
+            }
         }
 
 
@@ -723,20 +822,20 @@ public class _pickle implements ClassDictInit {
         private void put(int i) {
             if (protocol > 0) {
                 if (i < 256) {
-                    file.write(BINPUT);
-                    file.write((char)i);
+                    write(BINPUT);
+                    write((char)i);
                     return;
                 }
-                file.write(LONG_BINPUT);
-                file.write((char)( i         & 0xFF));
-                file.write((char)((i >>>  8) & 0xFF));
-                file.write((char)((i >>> 16) & 0xFF));
-                file.write((char)((i >>> 24) & 0xFF));
+                write(LONG_BINPUT);
+                write((char)( i         & 0xFF));
+                write((char)((i >>>  8) & 0xFF));
+                write((char)((i >>> 16) & 0xFF));
+                write((char)((i >>> 24) & 0xFF));
                 return;
             }
-            file.write(PUT);
-            file.write(String.valueOf(i));
-            file.write("\n");
+            write(PUT);
+            write(String.valueOf(i));
+            write("\n");
         }
 
 
@@ -744,20 +843,34 @@ public class _pickle implements ClassDictInit {
         private void get(int i) {
             if (protocol > 0) {
                 if (i < 256) {
-                    file.write(BINGET);
-                    file.write((char)i);
+                    write(BINGET);
+                    write((char)i);
                     return;
                 }
-                file.write(LONG_BINGET);
-                file.write((char)( i         & 0xFF));
-                file.write((char)((i >>>  8) & 0xFF));
-                file.write((char)((i >>> 16) & 0xFF));
-                file.write((char)((i >>> 24) & 0xFF));
+                write(LONG_BINGET);
+                write((char)( i         & 0xFF));
+                write((char)((i >>>  8) & 0xFF));
+                write((char)((i >>> 16) & 0xFF));
+                write((char)((i >>> 24) & 0xFF));
                 return;
             }
-            file.write(GET);
-            file.write(String.valueOf(i));
-            file.write("\n");
+            write(GET);
+            write(String.valueOf(i));
+            write("\n");
+        }
+
+        /**
+         * Add the object to the memo, at the next index, which protocol 4 leaves implicit and
+         * the others write out.
+         */
+        private void memoize(PyObject object) {
+            int i = memo.size();
+            memo.put(object, i);
+            if (protocol >= 4) {
+                write(MEMOIZE);
+            } else {
+                put(i);
+            }
         }
 
 
@@ -767,12 +880,12 @@ public class _pickle implements ClassDictInit {
 
 
         private void save(PyObject object, boolean pers_save) {
+            commitFrame(false);
+
             if (!pers_save && persistent_id != null && save_pers(object, persistent_id)) {
                 return;
             }
 
-            int d = get_id(object);
-
             PyType t = object.getType();
 
             if (t == TupleType && object.__len__() == 0) {
@@ -783,7 +896,7 @@ public class _pickle implements ClassDictInit {
                 return;
             }
 
-            int m = getMemoPosition(d, object);
+            int m = memo.get(object);
             if (m >= 0) {
                 get(m);
                 return;
@@ -860,12 +973,12 @@ public class _pickle implements ClassDictInit {
                 if (!Py.isInstance(pid, PyBytes.TYPE)) {
                     throw new PyException(PicklingError, "persistent id must be string");
                 }
-                file.write(PERSID);
-                file.write(pid.toString());
-                file.write("\n");
+                write(PERSID);
+                write(pid.toString());
+                write("\n");
             } else {
                 save(pid, true);
-                file.write(BINPERSID);
+                write(BINPERSID);
             }
             return true;
         }
@@ -875,7 +988,17 @@ public class _pickle implements ClassDictInit {
                                        PyObject object)
         {
             PyObject callableName = callable.__findattr__("__name__");
-            if(protocol >= 2 && callableName != null
+            if (protocol >= 4 && callableName != null
+                    && "__newobj_ex__".equals(callableName.toString())) {
+                PyObject cls = arg_tup.__finditem__(0);
+                if (cls.__findattr__("__new__") == null)
+                    throw new PyException(PicklingError,
+                                          "args[0] from __newobj_ex__ args has no __new__");
+                save(cls);
+                save(arg_tup.__finditem__(1));
+                save(arg_tup.__finditem__(2));
+                write(NEWOBJ_EX);
+            } else if(protocol >= 2 && callableName != null
                     && "__newobj__".equals(callableName.toString())) {
                 PyObject cls = arg_tup.__finditem__(0);
                 if(cls.__findattr__("__new__") == null)
@@ -884,15 +1007,15 @@ public class _pickle implements ClassDictInit {
                 // TODO: check class
                 save(cls);
                 save(arg_tup.__getitem__(new PySlice(Py.One, Py.None, Py.None)));
-                file.write(NEWOBJ);
+                write(NEWOBJ);
             } else {
                 save(callable);
                 save(arg_tup);
-                file.write(REDUCE);
+                write(REDUCE);
             }
 
             // Memoize
-            put(putMemo(get_id(object), object));
+            memoize(object);
 
             if (listitems != Py.None) {
                 batch_appends(listitems);
@@ -902,7 +1025,7 @@ public class _pickle implements ClassDictInit {
             }
             if (state != Py.None) {
                 save(state);
-                file.write(BUILD);
+                write(BUILD);
             }
         }
 
@@ -938,6 +1061,10 @@ public class _pickle implements ClassDictInit {
                 save_global(object);
             else if (type == BoolType)
                 save_bool(object);
+            else if (type == SetType && protocol >= 4)
+                save_set(object);
+            else if (type == FrozenSetType && protocol >= 4)
+                save_frozenset(object);
             else
                 return false;
             return true;
@@ -946,7 +1073,7 @@ public class _pickle implements ClassDictInit {
 
 
         final private void save_none(PyObject object) {
-            file.write(NONE);
+            write(NONE);
         }
 
         final private void save_int(PyObject object) {
@@ -959,35 +1086,35 @@ public class _pickle implements ClassDictInit {
 
                 if (i3 == '\0' && i4 == '\0') {
                     if (i2 == '\0') {
-                        file.write(BININT1);
-                        file.write(i1);
+                        write(BININT1);
+                        write(i1);
                         return;
                     }
-                    file.write(BININT2);
-                    file.write(i1);
-                    file.write(i2);
+                    write(BININT2);
+                    write(i1);
+                    write(i2);
                     return;
                 }
-                file.write(BININT);
-                file.write(i1);
-                file.write(i2);
-                file.write(i3);
-                file.write(i4);
+                write(BININT);
+                write(i1);
+                write(i2);
+                write(i3);
+                write(i4);
             } else {
-                file.write(INT);
-                file.write(object.toString());
-                file.write("\n");
+                write(INT);
+                write(object.toString());
+                write("\n");
             }
         }
 
         private void save_bool(PyObject object) {
             int value = ((PyBoolean)object).getValue();
             if(protocol >= 2) {
-                file.write(value != 0 ? NEWTRUE : NEWFALSE);
+                write(value != 0 ? NEWTRUE : NEWFALSE);
             } else {
-                file.write(INT);
-                file.write(value != 0 ? "01" : "00");
-                file.write("\n");
+                write(INT);
+                write(value != 0 ? "01" : "00");
+                write("\n");
             }
         }
 
@@ -997,30 +1124,30 @@ public class _pickle implements ClassDictInit {
 
                 if (integer.compareTo(BigInteger.ZERO) == 0) {
                     // It's 0 -- an empty bytestring.
-                    file.write(LONG1);
-                    file.write((char)0);
+                    write(LONG1);
+                    write((char)0);
                     return;
                 }
 
                 byte[] bytes = integer.toByteArray();
                 int l = bytes.length;
                 if (l < 256) {
-                    file.write(LONG1);
-                    file.write((char)l);
+                    write(LONG1);
+                    write((char)l);
                 } else {
-                    file.write(LONG4);
+                    write(LONG4);
                     writeInt4(l);
                 }
                 // Write in reverse order: pickle orders by little
                 // endian whereas BigInteger orders by big endian
                 for (int i = l - 1; i >= 0; i--) {
                     int b = bytes[i] & 0xff;
-                    file.write((char)b);
+                    write((char)b);
                 }
             } else {
-                file.write(LONG);
-                file.write(object.toString());
-                file.write("\n");
+                write(LONG);
+                write(object.toString());
+                write("\n");
             }
         }
 
@@ -1029,32 +1156,32 @@ public class _pickle implements ClassDictInit {
             char i2 = (char)((l >>> 8 ) & 0xFF);
             char i3 = (char)((l >>> 16) & 0xFF);
             char i4 = (char)((l >>> 24) & 0xFF);
-            file.write(i1);
-            file.write(i2);
-            file.write(i3);
-            file.write(i4);
+            write(i1);
+            write(i2);
+            write(i3);
+            write(i4);
         }
 
 
         final private void save_float(PyObject object) {
             if (protocol > 0) {
-                file.write(BINFLOAT);
+                write(BINFLOAT);
                 double value= ((PyFloat) object).getValue();
                 // It seems that struct.pack('>d', ..) and doubleToLongBits
                 // are the same. Good for me :-)
                 long bits = Double.doubleToLongBits(value);
-                file.write((char)((bits >>> 56) & 0xFF));
-                file.write((char)((bits >>> 48) & 0xFF));
-                file.write((char)((bits >>> 40) & 0xFF));
-                file.write((char)((bits >>> 32) & 0xFF));
-                file.write((char)((bits >>> 24) & 0xFF));
-                file.write((char)((bits >>> 16) & 0xFF));
-                file.write((char)((bits >>>  8) & 0xFF));
-                file.write((char)((bits >>>  0) & 0xFF));
+                write((char)((bits >>> 56) & 0xFF));
+                write((char)((bits >>> 48) & 0xFF));
+                write((char)((bits >>> 40) & 0xFF));
+                write((char)((bits >>> 32) & 0xFF));
+                write((char)((bits >>> 24) & 0xFF));
+                write((char)((bits >>> 16) & 0xFF));
+                write((char)((bits >>>  8) & 0xFF));
+                write((char)((bits >>>  0) & 0xFF));
             } else {
-                file.write(FLOAT);
-                file.write(object.toString());
-                file.write("\n");
+                write(FLOAT);
+                write(object.toString());
+                write("\n");
             }
         }
 
@@ -1062,184 +1189,245 @@ public class _pickle implements ClassDictInit {
         final private void save_string(PyObject object) {
             String str = object.toString();
 
-            if (protocol > 0) {
+            if (protocol >= 3) {
                 int l = str.length();
                 if (l < 256) {
-                    file.write(SHORT_BINSTRING);
-                    file.write((char)l);
+                    write(SHORT_BINBYTES);
+                    write((char)l);
                 } else {
-                    file.write(BINSTRING);
-                    file.write((char)( l         & 0xFF));
-                    file.write((char)((l >>> 8 ) & 0xFF));
-                    file.write((char)((l >>> 16) & 0xFF));
-                    file.write((char)((l >>> 24) & 0xFF));
+                    write(BINBYTES);
+                    writeInt4(l);
                 }
-                file.write(str);
+                write(str);
+            } else if (protocol > 0) {
+                int l = str.length();
+                if (l < 256) {
+                    write(SHORT_BINSTRING);
+                    write((char)l);
+                } else {
+                    write(BINSTRING);
+                    write((char)( l         & 0xFF));
+                    write((char)((l >>> 8 ) & 0xFF));
+                    write((char)((l >>> 16) & 0xFF));
+                    write((char)((l >>> 24) & 0xFF));
+                }
+                write(str);
             } else {
-                file.write(STRING);
-                file.write(object.__repr__().toString());
-                file.write("\n");
+                write(STRING);
+                write(object.__repr__().toString());
+                write("\n");
             }
-            put(putMemo(get_id(object), object));
+            memoize(object);
         }
 
         private void save_unicode(PyObject object) {
             if (protocol > 0) {
                 String str = codecs.PyUnicode_EncodeUTF8(object.toString(), "struct");
-                file.write(BINUNICODE);
-                writeInt4(str.length());
-                file.write(str);
+                int l = str.length();
+                if (l < 256 && protocol >= 4) {
+                    write(SHORT_BINUNICODE);
+                    write((char)l);
+                } else {
+                    write(BINUNICODE);
+                    writeInt4(l);
+                }
+                write(str);
             } else {
-                file.write(UNICODE);
-                file.write(codecs.PyUnicode_EncodeRawUnicodeEscape(object.toString(),
+                write(UNICODE);
+                write(codecs.PyUnicode_EncodeRawUnicodeEscape(object.toString(),
                                                         "strict", true));
-                file.write("\n");
+                write("\n");
             }
-            put(putMemo(get_id(object), object));
+            memoize(object);
         }
 
         private void save_tuple(PyObject object) {
-            int d = get_id(object);
-
             int len = object.__len__();
 
             if (len > 0 && len <= 3 && protocol >= 2) {
                 for (int i = 0; i < len; i++)
                     save(object.__finditem__(i));
-                int m = getMemoPosition(d, object);
+                int m = memo.get(object);
                 if (m >= 0) {
                     for (int i = 0; i < len; i++)
-                        file.write(POP);
+                        write(POP);
                     get(m);
                 }
                 else {
                     char opcode = (char) (TUPLE1 + len - 1);
-                    file.write(opcode);
-                    put(putMemo(d, object));
+                    write(opcode);
+                    memoize(object);
                 }
                 return;
             }
 
-            file.write(MARK);
+            write(MARK);
 
             for (int i = 0; i < len; i++)
                 save(object.__finditem__(i));
 
             if (len > 0) {
-                int m = getMemoPosition(d, object);
+                int m = memo.get(object);
                 if (m >= 0) {
                     if (protocol > 0) {
-                        file.write(POP_MARK);
+                        write(POP_MARK);
                         get(m);
                         return;
                     }
                     for (int i = 0; i < len+1; i++)
-                        file.write(POP);
+                        write(POP);
                     get(m);
                     return;
                 }
             }
-            file.write(TUPLE);
-            put(putMemo(d, object));
+            write(TUPLE);
+            memoize(object);
         }
 
 
         final private void save_empty_tuple(PyObject object) {
-            file.write(EMPTY_TUPLE);
+            write(EMPTY_TUPLE);
         }
 
         private void save_list(PyObject object) {
             if (protocol > 0)
-                file.write(EMPTY_LIST);
+                write(EMPTY_LIST);
             else {
-                file.write(MARK);
-                file.write(LIST);
+                write(MARK);
+                write(LIST);
             }
 
-            put(putMemo(get_id(object), object));
+            memoize(object);
 
             batch_appends(object);
         }
 
         private void batch_appends(PyObject object) {
-            int countInBatch = 0;
-            for (PyObject nextObj : object.asIterable()) {
-                if(protocol == 0) {
-                    save(nextObj);
-                    file.write(APPEND);
-                } else {
-                    if(countInBatch == 0) {
-                        file.write(MARK);
-                    }
-                    countInBatch++;
-                    save(nextObj);
-                    if(countInBatch == BATCHSIZE) {
-                        file.write(APPENDS);
-                        countInBatch = 0;
-                    }
+            Iterator<PyObject> it = object.asIterable().iterator();
+            if (protocol == 0) {
+                // APPENDS isn't available; do one at a time.
+                while (it.hasNext()) {
+                    save(it.next());
+                    write(APPEND);
                 }
+                return;
+            }
+            // proto > 0: write in batches of BATCHSIZE, and a last single item by APPEND.
+            while (it.hasNext()) {
+                PyObject first = it.next();
+                if (!it.hasNext()) {
+                    save(first);
+                    write(APPEND);
+                    return;
+                }
+                write(MARK);
+                save(first);
+                for (int n = 1; n < BATCHSIZE && it.hasNext(); n++) {
+                    save(it.next());
+                }
+                write(APPENDS);
             }
-            if (countInBatch > 0)
-                file.write(APPENDS);
         }
 
 
         private void save_dict(PyObject object) {
             if (protocol > 0)
-                file.write(EMPTY_DICT);
+                write(EMPTY_DICT);
             else {
-                file.write(MARK);
-                file.write(DICT);
+                write(MARK);
+                write(DICT);
             }
 
-            put(putMemo(get_id(object), object));
+            memoize(object);
 
-            batch_setitems(object.invoke("items"));
+            // Save the entries of the table itself rather than of items() tuples
+            Map<?, PyObject> map;
+            if (object instanceof PyDictionary) {
+                map = ((PyDictionary)object).getMap();
+            } else {
+                map = ((PyStringMap)object).getMap();
+            }
+            batch_setitems(map.entrySet().iterator());
         }
 
         private void batch_setitems(PyObject object) {
+            batch_setitems(object.asIterable().iterator());
+        }
+
+        /** Write the items, each a 2-tuple or a map entry, as batch_appends. */
+        private void batch_setitems(Iterator<?> it) {
             if (protocol == 0) {
                 // SETITEMS isn't available; do one at a time.
-                for (PyObject p : object.asIterable()) {
-                    if (!(p instanceof PyTuple) || p.__len__() != 2) {
-                        throw Py.TypeError("dict items iterator must return 2-tuples");
-                    }
-                    save(p.__getitem__(0));
-                    save(p.__getitem__(1));
-                    file.write(SETITEM);
+                while (it.hasNext()) {
+                    save_item(it.next());
+                    write(SETITEM);
                 }
-            } else {
-                // proto > 0:  write in batches of BATCHSIZE.
-                PyObject obj;
-                PyObject[] slice = new PyObject[BATCHSIZE];
-                int n;
-                do {
-                    // Get next group of (no more than) BATCHSIZE elements.
-                    for (n = 0; n < BATCHSIZE; n++) {
-                        obj = object.__next__();
-                        if (obj == null) {
-                            break;
-                        }
-                        slice[n] = obj;
-                    }
+                return;
+            }
+            // proto > 0: write in batches of BATCHSIZE.
+            while (it.hasNext()) {
+                Object first = it.next();
+                if (!it.hasNext()) {
+                    save_item(first);
+                    write(SETITEM);
+                    return;
+                }
+                write(MARK);
+                save_item(first);
+                for (int n = 1; n < BATCHSIZE && it.hasNext(); n++) {
+                    save_item(it.next());
+                }
+                write(SETITEMS);
+            }
+        }
 
-                    if (n > 1) {
-                        // Pump out MARK, slice[0:n], APPENDS.
-                        file.write(MARK);
-                        for (int i = 0; i < n; i++) {
-                            obj = slice[i];
-                            save(obj.__getitem__(0));
-                            save(obj.__getitem__(1));
-                        }
-                        file.write(SETITEMS);
-                    } else if (n == 1) {
-                        obj = slice[0];
-                        save(obj.__getitem__(0));
-                        save(obj.__getitem__(1));
-                        file.write(SETITEM);
-                    }
-                } while (n == BATCHSIZE);
+        private void save_item(Object item) {
+            if (item instanceof Map.Entry) {
+                Map.Entry<?, ?> entry = (Map.Entry<?, ?>)item;
+                Object key = entry.getKey();
+                // The keys of a PyStringMap may be Java strings
+                save(key instanceof String ? Py.newUnicode((String)key) : (PyObject)key);
+                save((PyObject)entry.getValue());
+                return;
+            }
+            if (!(item instanceof PyTuple) || ((PyTuple)item).__len__() != 2) {
+                throw Py.TypeError("dict items iterator must return 2-tuples");
+            }
+            PyTuple p = (PyTuple)item;
+            save(p.__getitem__(0));
+            save(p.__getitem__(1));
+        }
+
+
+        private void save_set(PyObject object) {
+            write(EMPTY_SET);
+
+            memoize(object);
+
+            Iterator<PyObject> it = ((PySet)object).getSet().iterator();
+            while (it.hasNext()) {
+                write(MARK);
+                for (int n = 0; n < BATCHSIZE && it.hasNext(); n++) {
+                    save(it.next());
+                }
+                write(ADDITEMS);
+            }
+        }
+
+        private void save_frozenset(PyObject object) {
+            write(MARK);
+            for (PyObject item : ((PyFrozenSet)object).getSet()) {
+                save(item);
             }
+            int m = memo.get(object);
+            if (m >= 0) {
+                // Saving an item saved the frozenset itself
+                write(POP_MARK);
+                get(m);
+                return;
+            }
+            write(FROZENSET);
+            memoize(object);
         }
 
         final private void save_global(PyObject object) {
@@ -1261,60 +1449,33 @@ public class _pickle implements ClassDictInit {
                 if(extCode != Py.None) {
                     int code = ((PyInteger)extCode).getValue();
                     if(code <= 0xFF) {
-                        file.write(EXT1);
-                        file.write((char)code);
+                        write(EXT1);
+                        write((char)code);
                     } else if(code <= 0xFFFF) {
-                        file.write(EXT2);
-                        file.write((char)(code & 0xFF));
-                        file.write((char)(code >> 8));
+                        write(EXT2);
+                        write((char)(code & 0xFF));
+                        write((char)(code >> 8));
                     } else {
-                        file.write(EXT4);
+                        write(EXT4);
                         writeInt4(code);
                     }
                     return;
                 }
             }
 
-            file.write(GLOBAL);
-            file.write(module.toString());
-            file.write("\n");
-            file.write(name.toString());
-            file.write("\n");
-            put(putMemo(get_id(object), object));
-        }
-
-
-        final private int getMemoPosition(int id, Object o) {
-            return memo.findPosition(id, o);
-        }
-
-        final private int putMemo(int id, PyObject object) {
-            int memo_len = memo.size() + 1;
-            memo.put(id, memo_len, object);
-            return memo_len;
-        }
-
-
-        /**
-         * Keeps a reference to the object x in the memo.
-         *
-         * Because we remember objects by their id, we have
-         * to assure that possibly temporary objects are kept
-         * alive by referencing them.
-         * We store a reference at the id of the memo, which should
-         * normally not be used unless someone tries to deepcopy
-         * the memo itself...
-         */
-        final private void keep_alive(PyObject obj) {
-            int id = System.identityHashCode(memo);
-            PyList list = (PyList) memo.findValue(id, memo);
-            if (list == null) {
-                list = new PyList();
-                memo.put(id, -1, list);
+            if (protocol >= 4) {
+                save(module instanceof PyUnicode ? module : Py.newUnicode(module.toString()));
+                save(name instanceof PyUnicode ? name : Py.newUnicode(name.toString()));
+                write(STACK_GLOBAL);
+            } else {
+                write(GLOBAL);
+                write(module.toString());
+                write("\n");
+                write(name.toString());
+                write("\n");
             }
-            list.append(obj);
+            memoize(object);
         }
-
     }
 
     private static Map<PyObject,PyObject> classmap = Generic.map();
@@ -1357,147 +1518,86 @@ public class _pickle implements ClassDictInit {
 
 
     /*
-     * A very specialized and simplified version of PyStringMap. It can
-     * only use integers as keys and stores both an integer and an object
-     * as value. It is very private! And should only be used thread-confined.
+     * A very specialized table from objects, compared by identity, to their
+     * index in the memo of a Pickler. It is open addressed, probing linearly
+     * in arrays of a power of two length. It holds the objects strongly, so
+     * none can be collected and its identity given to another while pickling.
+     * It is very private! And should only be used thread-confined.
      */
     static private class PickleMemo {
-        //Table of primes to cycle through
-        private final int[] primes = {
-            13, 61, 251, 1021, 4093,
-            5987, 9551, 15683, 19609, 31397,
-            65521, 131071, 262139, 524287, 1048573, 2097143,
-            4194301, 8388593, 16777213, 33554393, 67108859,
-            134217689, 268435399, 536870909, 1073741789,};
-
-        private transient int[] keys;
-        private transient int[] position;
-        private transient Object[] values;
 
+        private Object[] keys;
+        private int[] positions;
         private int size;
-        private transient int filled;
-        private transient int prime;
-
-        public PickleMemo(int capacity) {
-            prime = 0;
-            keys = null;
-            values = null;
-            resize(capacity);
-        }
 
         public PickleMemo() {
-            this(4);
+            keys = new Object[16];
+            positions = new int[16];
         }
 
         public int size() {
             return size;
         }
 
-        private int findIndex(int key, Object value) {
-            int[] table = keys;
-            int maxindex = table.length;
-            int index = (key & 0x7fffffff) % maxindex;
-
-            // Fairly aribtrary choice for stepsize...
-            int stepsize = maxindex / 5;
+        private static int hash(Object key) {
+            int h = System.identityHashCode(key);
+            // Identity hashes may differ mostly in the high bits
+            return h ^ (h >>> 16);
+        }
 
-            // Cycle through possible positions for the key;
-            //int collisions = 0;
-            while (true) {
-                int tkey = table[index];
-                if (tkey == key && value == values[index]) {
-                    return index;
+        /** The index of the object in the memo, or -1 if it is not there. */
+        public int get(Object key) {
+            Object[] table = keys;
+            int mask = table.length - 1;
+            for (int i = hash(key) & mask; ; i = (i + 1) & mask) {
+                Object k = table[i];
+                if (k == key) {
+                    return positions[i];
+                } else if (k == null) {
+                    return -1;
                 }
-                if (values[index] == null) return -1;
-                index = (index+stepsize) % maxindex;
             }
         }
 
-        public int findPosition(int key, Object value) {
-            int idx = findIndex(key, value);
-            if (idx < 0) return -1;
-            return position[idx];
-        }
-
-
-        public Object findValue(int key, Object value) {
-            int idx = findIndex(key, value);
-            if (idx < 0) return null;
-            return values[idx];
+        public void put(Object key, int position) {
+            if (2 * (size + 1) > keys.length) {
+                resize(2 * keys.length);
+            }
+            insert(key, position);
         }
 
-
-        private final void insertkey(int key, int pos, Object value) {
-            int[] table = keys;
-            int maxindex = table.length;
-            int index = (key & 0x7fffffff) % maxindex;
-
-            // Fairly aribtrary choice for stepsize...
-            int stepsize = maxindex / 5;
-
-            // Cycle through possible positions for the key;
-            while (true) {
-                int tkey = table[index];
-                if (values[index] == null) {
-                    table[index] = key;
-                    position[index] = pos;
-                    values[index] = value;
-                    filled++;
+        private void insert(Object key, int position) {
+            Object[] table = keys;
+            int mask = table.length - 1;
+            for (int i = hash(key) & mask; ; i = (i + 1) & mask) {
+                Object k = table[i];
+                if (k == null) {
+                    table[i] = key;
+                    positions[i] = position;
                     size++;
-                    break;
-                } else if (tkey == key && values[index] == value) {
-                    position[index] = pos;
-                    break;
+                    return;
+                } else if (k == key) {
+                    positions[i] = position;
+                    return;
                 }
-                index = (index+stepsize) % maxindex;
             }
         }
 
-
-        private final void resize(int capacity) {
-            int p = prime;
-            for(; p<primes.length; p++) {
-                if (primes[p] >= capacity) break;
-            }
-            if (primes[p] < capacity) {
-                throw Py.ValueError("can't make hashtable of size: " +
-                                    capacity);
-            }
-            capacity = primes[p];
-            prime = p;
-
-            int[] oldKeys = keys;
-            int[] oldPositions = position;
-            Object[] oldValues = values;
-
-            keys = new int[capacity];
-            position = new int[capacity];
-            values = new Object[capacity];
+        private void resize(int capacity) {
+            Object[] oldKeys = keys;
+            int[] oldPositions = positions;
+            keys = new Object[capacity];
+            positions = new int[capacity];
             size = 0;
-            filled = 0;
-
-            if (oldValues != null) {
-                int n = oldValues.length;
-
-                for(int i=0; i<n; i++) {
-                    Object value = oldValues[i];
-                    if (value == null) continue;
-                    insertkey(oldKeys[i], oldPositions[i], value);
+            for (int i = 0; i < oldKeys.length; i++) {
+                if (oldKeys[i] != null) {
+                    insert(oldKeys[i], oldPositions[i]);
                 }
             }
         }
-
-        public void put(int key, int pos, Object value) {
-            if (2*filled > keys.length) resize(keys.length+1);
-            insertkey(key, pos, value);
-        }
     }
 
 
-
-
-
-
     /**
      * The Unpickler object. Unpickler instances are create by the factory
      * methods Unpickler.
@@ -1527,12 +1627,74 @@ public class _pickle implements ClassDictInit {
         private int stackTop;
         private PyObject[] stack;
 
+        /** The protocol of the pickle, as its PROTO opcode gives it. */
+        private int proto;
+
+        /** The frame being read (protocol 4), read from the file in one call, or null. */
+        private String frame;
+
+        /** The position in frame of the next opcode or argument. */
+        private int framePos;
+
 
         Unpickler(PyObject file) {
             this.file = PyIOFileFactory.createIOFile(file);
         }
 
 
+        /**
+         * Read len characters (bytes), from the current frame if there is one. The data of a
+         * frame may not run on into what follows it.
+         */
+        private String read(int len) {
+            String f = frame;
+            if (f != null) {
+                int end = framePos + len;
+                if (end <= f.length()) {
+                    String s = f.substring(framePos, end);
+                    framePos = end;
+                    return s;
+                } else if (framePos < f.length()) {
+                    throw new PyException(UnpicklingError,
+                                          "pickle exhausted before end of frame");
+                }
+                frame = null;
+            }
+            return file.read(len);
+        }
+
+        /** Read one character (byte), raising EOFError at the end of the file. */
+        private int readChar() {
+            String f = frame;
+            if (f != null && framePos < f.length()) {
+                return f.charAt(framePos++);
+            }
+            String s = read(1);
+            if (s.length() < 1) {
+                load_eof();
+            }
+            return s.charAt(0);
+        }
+
+        private String readlineNoNl() {
+            String f = frame;
+            if (f != null) {
+                if (framePos < f.length()) {
+                    int nl = f.indexOf('\n', framePos);
+                    if (nl < 0) {
+                        throw new PyException(UnpicklingError,
+                                              "pickle exhausted before end of frame");
+                    }
+                    String line = f.substring(framePos, nl);
+                    framePos = nl + 1;
+                    return line;
+                }
+                frame = null;
+            }
+            return file.readlineNoNl();
+        }
+
+
         /**
          * Unpickle and return an instance of the object represented by
          * the file.
@@ -1542,13 +1704,10 @@ public class _pickle implements ClassDictInit {
             stack = new PyObject[10];
 
             while (true) {
-                String s = file.read(1);
-//              System.out.println("load:" + s);
+                char key = (char)readChar();
+//              System.out.println("load:" + key);
 //              for (int i = 0; i < stackTop; i++)
 //                  System.out.println("   " + stack[i]);
-                if (s.length() < 1)
-                    load_eof();
-                char key = s.charAt(0);
                 switch (key) {
                 case PERSID:          load_persid(); break;
                 case BINPERSID:       load_binpersid(); break;
@@ -1564,7 +1723,7 @@ public class _pickle implements ClassDictInit {
                 case BINSTRING:       load_binstring(); break;
                 case SHORT_BINSTRING: load_short_binstring(); break;
                 case UNICODE:         load_unicode(); break;
-                case BINUNICODE:      load_binunicode(); break;
+                case BINUNICODE:      load_binunicode(4); break;
                 case TUPLE:           load_tuple(); break;
                 case EMPTY_TUPLE:     load_empty_tuple(); break;
                 case EMPTY_LIST:      load_empty_list(); break;
@@ -1602,6 +1761,18 @@ public class _pickle implements ClassDictInit {
                 case NEWFALSE:        load_boolean(false); break;
                 case LONG1:           load_bin_long(1); break;
                 case LONG4:           load_bin_long(4); break;
+                case BINBYTES:        load_binbytes(4); break;
+                case SHORT_BINBYTES:  load_binbytes(1); break;
+                case BINBYTES8:       load_binbytes(8); break;
+                case SHORT_BINUNICODE: load_binunicode(1); break;
+                case BINUNICODE8:     load_binunicode(8); break;
+                case EMPTY_SET:       load_empty_set(); break;
+                case ADDITEMS:        load_additems(); break;
+                case FROZENSET:       load_frozenset(); break;
+                case NEWOBJ_EX:       load_newobj_ex(); break;
+                case STACK_GLOBAL:    load_stack_global(); break;
+                case MEMOIZE:         load_memoize(); break;
+                case FRAME:           load_frame(); break;
                 case STOP:
                     return load_stop();
                 default:
@@ -1626,14 +1797,33 @@ public class _pickle implements ClassDictInit {
         }
 
         private void load_proto() {
-            int proto = file.read(1).charAt(0);
-            if (proto < 0 || proto > 2)
+            int proto = readChar();
+            if (proto < 0 || proto > HIGHEST_PROTOCOL)
                 throw Py.ValueError("unsupported pickle protocol: " + proto);
+            this.proto = proto;
+        }
+
+        private void load_frame() {
+            if (frame != null && framePos < frame.length()) {
+                throw new PyException(UnpicklingError,
+                                      "beginning of a new frame before end of current frame");
+            }
+            long len = read_binint8();
+            if (len > Integer.MAX_VALUE) {
+                throw new PyException(UnpicklingError, "frame size " + len + " is too large");
+            }
+            frame = null;
+            String f = file.read((int)len);
+            if (f.length() < len) {
+                throw new PyException(UnpicklingError, "pickle data was truncated");
+            }
+            frame = f;
+            framePos = 0;
         }
 
 
         final private void load_persid() {
-            load_persid(new PyBytes(file.readlineNoNl()));
+            load_persid(new PyBytes(readlineNoNl()));
         }
 
 
@@ -1662,7 +1852,7 @@ public class _pickle implements ClassDictInit {
         }
 
         final private void load_int() {
-            String line = file.readlineNoNl();
+            String line = readlineNoNl();
             PyObject value;
             // The following could be abstracted into a common string
             // -> int/long method.
@@ -1696,7 +1886,7 @@ public class _pickle implements ClassDictInit {
         }
 
         private int read_binint() {
-            String s = file.read(4);
+            String s = read(4);
             return s.charAt(0) |
                    (s.charAt(1)<<8) |
                    (s.charAt(2)<<16) |
@@ -1705,7 +1895,7 @@ public class _pickle implements ClassDictInit {
 
 
         final private void load_binint1() {
-            int val = file.read(1).charAt(0);
+            int val = readChar();
             push(new PyInteger(val));
         }
 
@@ -1715,12 +1905,12 @@ public class _pickle implements ClassDictInit {
         }
 
         private int read_binint2() {
-            String s = file.read(2);
+            String s = read(2);
             return (s.charAt(1)) << 8 | (s.charAt(0));
         }
 
         final private void load_long() {
-            String line = file.readlineNoNl();
+            String line = readlineNoNl();
             push(new PyLong(line));
         }
 
@@ -1730,7 +1920,7 @@ public class _pickle implements ClassDictInit {
                 push(new PyLong(BigInteger.ZERO));
                 return;
             }
-            String s = file.read(longLength);
+            String s = read(longLength);
             byte[] bytes = new byte[s.length()];
             // Write to the byte array in reverse order: pickle orders
             // by little endian whereas BigInteger orders by big
@@ -1750,7 +1940,7 @@ public class _pickle implements ClassDictInit {
 
         private int read_binint(int length) {
             if (length == 1)
-                return file.read(1).charAt(0);
+                return readChar();
             else if (length == 2)
                 return read_binint2();
             else
@@ -1758,12 +1948,12 @@ public class _pickle implements ClassDictInit {
         }
 
         final private void load_float() {
-            String line = file.readlineNoNl();
+            String line = readlineNoNl();
             push(new PyFloat(Double.valueOf(line).doubleValue()));
         }
 
         final private void load_binfloat() {
-            String s = file.read(8);
+            String s = read(8);
             long bits = s.charAt(7) |
                         ((long)s.charAt(6) << 8) |
                         ((long)s.charAt(5) << 16) |
@@ -1776,7 +1966,7 @@ public class _pickle implements ClassDictInit {
         }
 
         final private void load_string() {
-            String line = file.readlineNoNl();
+            String line = readlineNoNl();
 
             String value;
             char quote = line.charAt(0);
@@ -1812,29 +2002,60 @@ public class _pickle implements ClassDictInit {
 
         final private void load_binstring() {
             int len = read_binint();
-            push(new PyBytes(file.read(len)));
+            push(new PyBytes(read(len)));
         }
 
 
         final private void load_short_binstring() {
-            int len = file.read(1).charAt(0);
-            push(new PyBytes(file.read(len)));
+            int len = readChar();
+            push(new PyBytes(read(len)));
         }
 
 
         final private void load_unicode() {
-            String line = file.readlineNoNl();
+            String line = readlineNoNl();
             String value = codecs.PyUnicode_DecodeRawUnicodeEscape(line,
                                                                    "strict");
             push(new PyUnicode(value));
         }
 
-        final private void load_binunicode() {
-            int len = read_binint();
-            String line = file.read(len);
+        private void load_binunicode(int length) {
+            int len = read_size(length);
+            String line = read(len);
             push(new PyUnicode(codecs.PyUnicode_DecodeUTF8(line, "strict")));
         }
 
+        private void load_binbytes(int length) {
+            int len = read_size(length);
+            push(new PyBytes(read(len)));
+        }
+
+        /** Read an unsigned size of 1, 4 or 8 bytes, which has to fit a Java string. */
+        private int read_size(int length) {
+            long size;
+            if (length == 1)
+                size = readChar();
+            else if (length == 4)
+                size = read_binint() & 0xFFFFFFFFL;
+            else
+                size = read_binint8();
+            if (size < 0 || size > Integer.MAX_VALUE) {
+                throw new PyException(UnpicklingError,
+                                      "size " + Long.toUnsignedString(size)
+                                      + " exceeds the maximum size of a string");
+            }
+            return (int)size;
+        }
+
+        private long read_binint8() {
+            String s = read(8);
+            long x = 0;
+            for (int i = 7; i >= 0; i--) {
+                x = (x << 8) | s.charAt(i);
+            }
+            return x;
+        }
+
         final private void load_tuple() {
             PyObject[] arr = new PyObject[marker()];
             pop(arr);
@@ -1862,6 +2083,34 @@ public class _pickle implements ClassDictInit {
             push(new PyDictionary());
         }
 
+        private void load_empty_set() {
+            push(new PySet());
+        }
+
+        private void load_additems() {
+            int mark = marker();
+            PyObject obj = peek(mark + 1);
+            if (obj instanceof PySet) {
+                Set<PyObject> set = ((PySet)obj).getSet();
+                for (int i = mark - 1; i >= 0; i--) {
+                    set.add(peek(i));
+                }
+            } else {
+                PyObject adder = obj.__getattr__("add");
+                for (int i = mark - 1; i >= 0; i--) {
+                    adder.__call__(peek(i));
+                }
+            }
+            pop(mark + 1);
+        }
+
+        private void load_frozenset() {
+            PyObject[] arr = new PyObject[marker()];
+            pop(arr);
+            pop();
+            push(new PyFrozenSet(new PyTuple(arr)));
+        }
+
 
         final private void load_list() {
             PyObject[] arr = new PyObject[marker()];
@@ -1889,8 +2138,8 @@ public class _pickle implements ClassDictInit {
             pop(args);
             pop();
 
-            String module = file.readlineNoNl();
-            String name = file.readlineNoNl();
+            String module = readlineNoNl();
+            String name = readlineNoNl();
             PyObject klass = find_class(module, name);
 
             PyObject value = null;
@@ -1911,13 +2160,23 @@ public class _pickle implements ClassDictInit {
         }
 
         final private void load_global() {
-            String module = file.readlineNoNl();
-            String name = file.readlineNoNl();
+            String module = readlineNoNl();
+            String name = readlineNoNl();
             PyObject klass = find_class(module, name);
             push(klass);
         }
 
 
+        private void load_stack_global() {
+            PyObject name = pop();
+            PyObject module = pop();
+            if (!(name instanceof PyUnicode) || !(module instanceof PyUnicode)) {
+                throw new PyException(UnpicklingError, "STACK_GLOBAL requires str");
+            }
+            push(find_class(module.toString(), name.toString()));
+        }
+
+
         final private PyObject find_class(String module, String name) {
             if (find_global != null) {
                if (find_global == Py.None)
@@ -1931,7 +2190,19 @@ public class _pickle implements ClassDictInit {
             if (mod == null) {
                 mod = importModule(module);
             }
-            PyObject global = mod.__findattr__(name.intern());
+            PyObject global;
+            if (proto >= 4 && name.indexOf('.') >= 0) {
+                // A qualified name, such as that of a nested class
+                global = mod;
+                for (String part : name.split("\\.")) {
+                    global = global.__findattr__(part.intern());
+                    if (global == null) {
+                        break;
+                    }
+                }
+            } else {
+                global = mod.__findattr__(name.intern());
+            }
             if (global == null) {
                 throw new PyException(Py.SystemError,
                           "Failed to import class " + name + " from module " +
@@ -1977,6 +2248,26 @@ public class _pickle implements ClassDictInit {
             push(cls.__getattr__("__new__").__call__(args));
         }
 
+        private void load_newobj_ex() {
+            PyObject kwargs = pop();
+            PyObject arg_tup = pop();
+            PyObject cls = pop();
+            int nargs = arg_tup.__len__();
+            int nkw = kwargs.__len__();
+            PyObject[] args = new PyObject[1 + nargs + nkw];
+            String[] keywords = new String[nkw];
+            args[0] = cls;
+            for (int i = 0; i < nargs; i++) {
+                args[1 + i] = arg_tup.__finditem__(i);
+            }
+            int k = 0;
+            for (PyObject key : kwargs.asIterable()) {
+                keywords[k] = PyObject.asName(key);
+                args[1 + nargs + k++] = kwargs.__getitem__(key);
+            }
+            push(cls.__getattr__("__new__").__call__(args, keywords));
+        }
+
         final private PyObject[] make_array(PyObject seq) {
             int n = seq.__len__();
             PyObject[] objs= new PyObject[n];
@@ -2000,7 +2291,7 @@ public class _pickle implements ClassDictInit {
         }
 
         final private void load_get() {
-            String py_str = file.readlineNoNl();
+            String py_str = readlineNoNl();
             PyObject value = memo.get(py_str);
             if (value == null) {
                 throw new PyException(BadPickleGet, py_str);
@@ -2009,7 +2300,7 @@ public class _pickle implements ClassDictInit {
         }
 
         final private void load_binget() {
-            String py_key = String.valueOf((int)file.read(1).charAt(0));
+            String py_key = String.valueOf((int)readChar());
             PyObject value = memo.get(py_key);
             if (value == null) {
                 throw new PyException(BadPickleGet, py_key);
@@ -2029,12 +2320,12 @@ public class _pickle implements ClassDictInit {
 
 
         final private void load_put() {
-            memo.put(file.readlineNoNl(), peek());
+            memo.put(readlineNoNl(), peek());
         }
 
 
         final private void load_binput() {
-            int i = file.read(1).charAt(0);
+            int i = readChar();
             memo.put(String.valueOf(i), peek());
         }
 
@@ -2044,6 +2335,10 @@ public class _pickle implements ClassDictInit {
             memo.put(String.valueOf(i), peek());
         }
 
+        private void load_memoize() {
+            memo.put(String.valueOf(memo.size()), peek());
+        }
+
         final private void load_append() {
             PyObject value = pop();
             PyObject obj = peek();
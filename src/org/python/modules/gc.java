@@ -24,6 +24,7 @@ import java.util.IdentityHashMap;
 import java.util.List;
 import java.util.Set;
 import java.util.concurrent.atomic.AtomicBoolean;
+import java.util.concurrent.atomic.AtomicInteger;
 
 //These imports belong to the out-commented section on MXBean-based
 //gc-sync far below. That section is kept to document this failed
@@ -472,7 +473,7 @@ public class gc {
     private static HashSet<WeakReferenceGC> monitoredObjects;
     private static HashSet<Class<? extends PyObject>> reflectionWarnedClasses;
     private static ReferenceQueue<Object> gcTrash;
-    private static int finalizeWaitCount = 0;
+    private static volatile int finalizeWaitCount = 0;
     private static int initWaitTime = 10, defaultWaitFactor = 2;
     private static long lastRemoveTimeStamp = -1, maxWaitTime = initWaitTime;
     private static int gcMonitoredRunCount = 0;
@@ -489,7 +490,8 @@ public class gc {
     private static Thread postFinalizationProcessor;
     public static long postFinalizationTimeOut = 100;
     private static long postFinalizationTimestamp = System.currentTimeMillis()-2*postFinalizationTimeOut;
-    private static int openFinalizeCount = 0;
+    /** Finalizers running now, possibly on several threads (see FinalizeTrigger). */
+    private static final AtomicInteger openFinalizeCount = new AtomicInteger();
     private static boolean postFinalizationPending = false;
     private static boolean lockPostFinalization = false;
 
@@ -1060,14 +1062,14 @@ public class gc {
             // This should only be measured when openFinalizeCount is zero.
             long current = System.currentTimeMillis();
             while (true) {
-                if (!lockPostFinalization && openFinalizeCount == 0
+                if (!lockPostFinalization && openFinalizeCount.get() == 0
                         && current - postFinalizationTimestamp
                         > postFinalizationTimeOut) {
                     break;
                 }
                 try {
                     long time = postFinalizationTimeOut - current + postFinalizationTimestamp;
-                    if (openFinalizeCount != 0 || lockPostFinalization || time < 0) {
+                    if (openFinalizeCount.get() != 0 || lockPostFinalization || time < 0) {
                         time = gcRecallTime;
                     }
                     Thread.sleep(time);
@@ -1282,7 +1284,7 @@ public class gc {
     }
 
     public static void notifyPreFinalization() {
-        ++openFinalizeCount;
+        openFinalizeCount.incrementAndGet();
         if (System.currentTimeMillis() - postFinalizationTimestamp
                 < postFinalizationTimeOut) {
             return;
@@ -1325,8 +1327,7 @@ public class gc {
 
     public static void notifyPostFinalization() {
         postFinalizationTimestamp = System.currentTimeMillis();
-        --openFinalizeCount;
-        if (openFinalizeCount == 0 && postFinalizationProcessor != null) {
+        if (openFinalizeCount.decrementAndGet() == 0 && postFinalizationProcessor != null) {
             postFinalizationProcessor.interrupt();
         }
     }
@@ -1653,8 +1654,9 @@ public class gc {
      * {@link org.python.core.finalization.FinalizeTrigger}.
      */
     public static void notifyFinalize(PyObject finalized) {
-        if (--finalizeWaitCount == 0 && waitingForFinalizers) {
-            synchronized(GCSentinel.class) {
+        // Finalizers may run on several threads, so count down under the lock.
+        synchronized(GCSentinel.class) {
+            if (--finalizeWaitCount == 0 && waitingForFinalizers) {
                 GCSentinel.class.notify();
             }
         }
@@ -2316,7 +2318,7 @@ public class gc {
         }
         //Can the following block be skipped if monitor global is active?
         //No, because there could already be unmonitored finalizable objects!
-        while (openFinalizeCount > 0 || System.currentTimeMillis() - postFinalizationTimestamp
+        while (openFinalizeCount.get() > 0 || System.currentTimeMillis() - postFinalizationTimestamp
                 < postFinalizationTimeOut) {
             try {
                 Thread.sleep(postFinalizationTimeOut);
@@ -3,8 +3,6 @@ package org.python.modules.itertools;
 
 import org.python.core.ArgParser;
 import org.python.core.BuiltinDocs;
-import org.python.core.Py;
-import org.python.core.PyException;
 import org.python.core.PyIterator;
 import org.python.core.PyObject;
 import org.python.core.PyTuple;
@@ -56,17 +54,22 @@ public class chain extends PyIterator {
     private void chain___init__(final PyObject superIterator) {
 
         iter = new itertools.ItertoolsIterator() {
-            PyObject currentIterator = superIterator.__next__().__iter__();
+            PyObject currentIterator;
 
             public PyObject __next__() {
-                try {
-                    return currentIterator.__next__();
-                } catch (PyException e) {
-                    if (e.match(Py.StopIteration)) {
-                        currentIterator = superIterator.__next__().__iter__();
-                        return __next__();
+                while (true) {
+                    if (currentIterator != null) {
+                        PyObject next = nextElement(currentIterator);
+                        if (next != null) {
+                            return next;
+                        }
                     }
-                    throw e;
+                    PyObject iterable = nextElement(superIterator);
+                    if (iterable == null) {
+                        currentIterator = null;
+                        return null;
+                    }
+                    currentIterator = iterable.__iter__();
                 }
             }
 
@@ -85,12 +88,12 @@ public class chain extends PyIterator {
 
     @Override
     public PyObject __next__() {
-        return chain___next__();
+        return iter.__next__();
     }
 
     @ExposedMethod(doc = BuiltinDocs.chain___next___doc)
     final PyObject chain___next__() {
-        return iter.__next__();
+        return doNext(iter.__next__());
     }
 
     /* Traverseproc implementation */
@@ -60,7 +60,16 @@ public class itertools {
          * the Exception and return null according to PyIterator practice.
          */
         protected PyObject nextElement(PyObject pyIter) {
-            return pyIter.__next__();
+            try {
+                return pyIter.__next__();
+            } catch (PyException pyEx) {
+                if (pyEx.match(Py.StopIteration)) {
+                    // An iterator defined in Python: builtin ones return null instead
+                    stopException = pyEx;
+                    return null;
+                }
+                throw pyEx;
+            }
         }
     }
 
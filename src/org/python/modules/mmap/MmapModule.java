@@ -0,0 +1,55 @@
+package org.python.modules.mmap;
+
+import org.python.core.Py;
+import org.python.core.PyObject;
+import org.python.expose.ExposedConst;
+import org.python.expose.ExposedModule;
+import org.python.expose.ModuleInit;
+
+/**
+ * The Python <code>mmap</code> module, mapping files into memory with
+ * <code>java.nio.channels.FileChannel.map</code>. The type itself is {@link PyMMap}.
+ */
+@ExposedModule(name = "mmap")
+public class MmapModule {
+
+    @ExposedConst
+    public static final int ACCESS_DEFAULT = 0;
+    @ExposedConst
+    public static final int ACCESS_READ = 1;
+    @ExposedConst
+    public static final int ACCESS_WRITE = 2;
+    @ExposedConst
+    public static final int ACCESS_COPY = 3;
+
+    @ExposedConst
+    public static final int MAP_SHARED = 1;
+    @ExposedConst
+    public static final int MAP_PRIVATE = 2;
+    @ExposedConst
+    public static final int MAP_ANON = 0x20;
+    @ExposedConst
+    public static final int MAP_ANONYMOUS = MAP_ANON;
+
+    @ExposedConst
+    public static final int PROT_READ = 1;
+    @ExposedConst
+    public static final int PROT_WRITE = 2;
+    @ExposedConst
+    public static final int PROT_EXEC = 4;
+
+    /**
+     * Java does not reveal the page size, and <code>FileChannel.map</code> does not require the
+     * offset to be aligned, but programs use these to calculate offsets.
+     */
+    @ExposedConst
+    public static final int PAGESIZE = 4096;
+    @ExposedConst
+    public static final int ALLOCATIONGRANULARITY = PAGESIZE;
+
+    @ModuleInit
+    public static void init(PyObject dict) {
+        dict.__setitem__("error", Py.OSError);
+        dict.__setitem__("mmap", PyMMap.TYPE);
+    }
+}
@@ -0,0 +1,737 @@
+package org.python.modules.mmap;
+
+import java.io.IOException;
+import java.lang.ref.WeakReference;
+import java.nio.ByteBuffer;
+import java.nio.MappedByteBuffer;
+import java.nio.channels.Channel;
+import java.nio.channels.FileChannel;
+import java.nio.channels.NonReadableChannelException;
+import java.nio.channels.NonWritableChannelException;
+
+import jnr.constants.platform.Errno;
+
+import org.python.core.ArgParser;
+import org.python.core.BufferProtocol;
+import org.python.core.Py;
+import org.python.core.PyBUF;
+import org.python.core.PyBuffer;
+import org.python.core.PyBytes;
+import org.python.core.PyException;
+import org.python.core.PyIterator;
+import org.python.core.PyLong;
+import org.python.core.PyNewWrapper;
+import org.python.core.PyObject;
+import org.python.core.PySlice;
+import org.python.core.PyType;
+import org.python.core.PyUnicode;
+import org.python.core.buffer.BaseBuffer;
+import org.python.core.buffer.SimpleNIOBuffer;
+import org.python.core.io.FileDescriptors;
+import org.python.core.io.RawIOBase;
+import org.python.expose.ExposedGet;
+import org.python.expose.ExposedMethod;
+import org.python.expose.ExposedNew;
+import org.python.expose.ExposedType;
+import org.python.modules._io.PyFileIO;
+
+/**
+ * Python <code>mmap.mmap</code>: a memory-mapped file, or an anonymous block of memory, that
+ * behaves both as a mutable sequence of bytes and as a file-like object with a position.
+ * <p>
+ * The mapping is a <code>MappedByteBuffer</code> from <code>FileChannel.map</code> (or a direct
+ * <code>ByteBuffer</code> for an anonymous map), so the data stay outside the Java heap. The
+ * object exports them through the buffer protocol as a {@link SimpleNIOBuffer}, so that
+ * <code>memoryview</code>, <code>struct.unpack_from</code> and the like see the mapped memory
+ * itself and need not copy it. A single <code>MappedByteBuffer</code> is limited to
+ * <code>Integer.MAX_VALUE</code> bytes: larger files may be mapped as windows using the
+ * <code>offset</code> argument.
+ * <p>
+ * Java provides no way to unmap a file explicitly. <code>close()</code> drops this object's
+ * reference to the mapping, which is released when it is garbage-collected.
+ */
+@ExposedType(name = "mmap.mmap", doc = PyMMap.mmap_doc)
+public class PyMMap extends PyObject implements BufferProtocol {
+
+    public static final PyType TYPE = PyType.fromClass(PyMMap.class);
+
+    /** The mapped data, or <code>null</code> when closed. */
+    private ByteBuffer data;
+
+    /** The size of the mapping (the capacity of {@link #data}). */
+    private int size;
+
+    /** Current position for the file-like methods. */
+    private int pos;
+
+    /** The <code>ACCESS_*</code> mode (after resolving <code>ACCESS_DEFAULT</code> if we can). */
+    private int access;
+
+    /** The file mapped, or <code>null</code> for an anonymous map. */
+    private FileChannel channel;
+
+    /** Offset in the file of the start of the mapping. */
+    private long offset;
+
+    /** The last buffer exported through the buffer protocol, held weakly. */
+    private WeakReference<BaseBuffer> export;
+
+    public PyMMap(PyType subtype) {
+        super(subtype);
+    }
+
+    private static final String[] newKwds =
+            {"fileno", "length", "flags", "prot", "access", "offset"};
+
+    @ExposedNew
+    static PyObject mmap_new(PyNewWrapper new_, boolean init, PyType subtype, PyObject[] args,
+            String[] keywords) {
+        ArgParser ap = new ArgParser("mmap", args, keywords, newKwds, 2);
+        PyObject fileno = ap.getPyObject(0);
+        long length = ap.getPyObject(1).asLong();
+        int flags = ap.getInt(2, MmapModule.MAP_SHARED);
+        int prot = ap.getInt(3, MmapModule.PROT_WRITE | MmapModule.PROT_READ);
+        int access = ap.getInt(4, MmapModule.ACCESS_DEFAULT);
+        long offset = ap.getPyObject(5, Py.Zero).asLong();
+
+        PyMMap self = new_.for_type == subtype ? new PyMMap(subtype) : new PyMMapDerived(subtype);
+        self.map(fileno, length, flags, prot, access, offset);
+        return self;
+    }
+
+    /**
+     * Create the mapping, following the argument processing of CPython's
+     * <code>new_mmap_object</code> (Unix version).
+     */
+    private void map(PyObject fileno, long length, int flags, int prot, int access, long offset) {
+        if (length < 0) {
+            throw Py.OverflowError("memory mapped length must be postiive");
+        } else if (offset < 0) {
+            throw Py.OverflowError("memory mapped offset must be positive");
+        } else if (access != MmapModule.ACCESS_DEFAULT && (flags != MmapModule.MAP_SHARED
+                || prot != (MmapModule.PROT_WRITE | MmapModule.PROT_READ))) {
+            throw Py.ValueError("mmap can't specify both access and flags, prot.");
+        }
+
+        switch (access) {
+            case MmapModule.ACCESS_READ:
+                flags = MmapModule.MAP_SHARED;
+                prot = MmapModule.PROT_READ;
+                break;
+            case MmapModule.ACCESS_WRITE:
+                flags = MmapModule.MAP_SHARED;
+                prot = MmapModule.PROT_READ | MmapModule.PROT_WRITE;
+                break;
+            case MmapModule.ACCESS_COPY:
+                flags = MmapModule.MAP_PRIVATE;
+                prot = MmapModule.PROT_READ | MmapModule.PROT_WRITE;
+                break;
+            case MmapModule.ACCESS_DEFAULT:
+                // Map prot to access type
+                if ((prot & MmapModule.PROT_WRITE) == 0) {
+                    access = MmapModule.ACCESS_READ;
+                } else if ((prot & MmapModule.PROT_READ) == 0) {
+                    access = MmapModule.ACCESS_WRITE;
+                }
+                break;
+            default:
+                throw Py.ValueError("mmap invalid access parameter.");
+        }
+        this.access = access;
+        this.offset = offset;
+
+        if (fileno.isIndex() && fileno.asInt() == -1) {
+            // Anonymous map: zero-filled memory, not shared with anything
+            this.data = ByteBuffer.allocateDirect(mapSize(length));
+            this.size = data.capacity();
+            return;
+        }
+
+        this.channel = channelFor(fileno);
+        FileChannel.MapMode mode;
+        if (access == MmapModule.ACCESS_READ) {
+            mode = FileChannel.MapMode.READ_ONLY;
+        } else if ((flags & MmapModule.MAP_PRIVATE) != 0) {
+            mode = FileChannel.MapMode.PRIVATE;
+        } else {
+            mode = FileChannel.MapMode.READ_WRITE;
+        }
+
+        try {
+            long fileSize = channel.size();
+            if (length == 0) {
+                if (fileSize == 0) {
+                    throw Py.ValueError("cannot mmap an empty file");
+                } else if (offset >= fileSize) {
+                    throw Py.ValueError("mmap offset is greater than file size");
+                }
+                length = fileSize - offset;
+            } else if (offset > fileSize || fileSize - offset < length) {
+                throw Py.ValueError("mmap length is greater than file size");
+            }
+            this.data = channel.map(mode, offset, mapSize(length));
+            this.size = data.capacity();
+        } catch (NonReadableChannelException | NonWritableChannelException e) {
+            throw Py.OSError(Errno.EACCES);
+        } catch (IOException ioe) {
+            throw Py.OSError(ioe);
+        }
+    }
+
+    /** Check the length of a mapping will fit a <code>ByteBuffer</code>. */
+    private static int mapSize(long length) {
+        if (length > Integer.MAX_VALUE) {
+            throw Py.OverflowError("memory mapped length is too large for one mapping "
+                    + "(use offset to map a part of the file)");
+        }
+        return (int)length;
+    }
+
+    /**
+     * Find the <code>FileChannel</code> of a file descriptor, which in Jython is a
+     * <code>FileIO</code>, or the object returned by its <code>fileno()</code>.
+     */
+    private static FileChannel channelFor(PyObject fileno) {
+        RawIOBase raw;
+        if (fileno instanceof PyFileIO) {
+            raw = ((PyFileIO)fileno).getRawIO();
+        } else {
+            raw = FileDescriptors.get(fileno);
+        }
+        Channel c = raw.getChannel();
+        if (!(c instanceof FileChannel)) {
+            throw Py.OSError(Errno.ENODEV);
+        }
+        return (FileChannel)c;
+    }
+
+    private void checkValid() {
+        if (data == null) {
+            throw Py.ValueError("mmap closed or invalid");
+        }
+    }
+
+    private void checkWritable() {
+        if (access == MmapModule.ACCESS_READ) {
+            throw Py.TypeError("mmap can't modify a readonly memory map.");
+        }
+    }
+
+    /** True if a buffer exported through the buffer protocol has not been released. */
+    private boolean hasExports() {
+        if (export != null) {
+            BaseBuffer pybuf = export.get();
+            if (pybuf != null && !pybuf.isReleased()) {
+                return true;
+            }
+            export = null;
+        }
+        return false;
+    }
+
+    /** The bytes <code>[start:start+n]</code> of the mapping as a <code>byte[]</code>. */
+    private byte[] get(int start, int n) {
+        byte[] b = new byte[n];
+        ByteBuffer src = data.duplicate();
+        src.position(start);
+        src.get(b);
+        return b;
+    }
+
+    /** Copy bytes into the mapping at <code>start</code>. */
+    private void put(int start, byte[] b) {
+        ByteBuffer dest = data.duplicate();
+        dest.position(start);
+        dest.put(b);
+    }
+
+    /** The bytes of an object supporting the buffer protocol. */
+    private static byte[] bytesOf(PyObject obj) {
+        if (obj instanceof PyUnicode || !(obj instanceof BufferProtocol)) {
+            throw Py.TypeError(String.format("a bytes-like object is required, not '%s'",
+                    obj.getType().fastGetName()));
+        }
+        try (PyBuffer buf = ((BufferProtocol)obj).getBuffer(PyBUF.FULL_RO)) {
+            byte[] b = new byte[buf.getLen()];
+            buf.copyTo(b, 0);
+            return b;
+        }
+    }
+
+    /*
+     * ============================================================================================
+     * Buffer protocol
+     * ============================================================================================
+     */
+
+    /**
+     * {@inheritDoc}
+     * <p>
+     * The buffer is a view of the mapped memory itself, writable unless the map was opened with
+     * <code>ACCESS_READ</code>. While it is held, the map cannot be closed or resized.
+     */
+    @Override
+    public synchronized PyBuffer getBuffer(int flags) {
+        checkValid();
+        BaseBuffer pybuf = export == null ? null : export.get();
+        if (pybuf != null) {
+            // Re-use the existing export (its view of the data is still valid)
+            return pybuf.getBufferAgain(flags);
+        }
+        pybuf = new SimpleNIOBuffer(flags, data, access == MmapModule.ACCESS_READ);
+        export = new WeakReference<BaseBuffer>(pybuf);
+        return pybuf;
+    }
+
+    /*
+     * ============================================================================================
+     * Sequence protocol
+     * ============================================================================================
+     */
+
+    @Override
+    public int __len__() {
+        return mmap___len__();
+    }
+
+    @ExposedMethod
+    final synchronized int mmap___len__() {
+        checkValid();
+        return size;
+    }
+
+    @Override
+    public PyObject __finditem__(PyObject key) {
+        try {
+            return mmap___getitem__(key);
+        } catch (PyException pe) {
+            if (pe.match(Py.IndexError)) {
+                return null;
+            }
+            throw pe;
+        }
+    }
+
+    @Override
+    public PyObject __iter__() {
+        return mmap___iter__();
+    }
+
+    /** Iteration yields <code>bytes</code> of length 1, where indexing gives an int. */
+    @ExposedMethod
+    final PyObject mmap___iter__() {
+        checkValid();
+        return new PyIterator() {
+
+            private int i;
+
+            @Override
+            public PyObject __next__() {
+                synchronized (PyMMap.this) {
+                    checkValid();
+                    return i < size ? new PyBytes(get(i++, 1)) : null;
+                }
+            }
+        };
+    }
+
+    @ExposedMethod
+    final synchronized PyObject mmap___getitem__(PyObject key) {
+        checkValid();
+        if (key instanceof PySlice) {
+            int[] indices = ((PySlice)key).indicesEx(size);
+            int start = indices[0], step = indices[2], n = indices[3];
+            if (n <= 0) {
+                return Py.EmptyByte;
+            } else if (step == 1) {
+                return new PyBytes(get(start, n));
+            } else {
+                byte[] b = new byte[n];
+                for (int i = 0, p = start; i < n; i++, p += step) {
+                    b[i] = data.get(p);
+                }
+                return new PyBytes(b);
+            }
+        } else if (key.isIndex()) {
+            return Py.newInteger(data.get(index(key)) & 0xff);
+        } else {
+            throw Py.TypeError("mmap indices must be integers");
+        }
+    }
+
+    /** Convert an index (which may be negative) to a position in the map, or raise IndexError. */
+    private int index(PyObject key) {
+        long i = key.asLong();
+        if (i < 0) {
+            i += size;
+        }
+        if (i < 0 || i >= size) {
+            throw Py.IndexError("mmap index out of range");
+        }
+        return (int)i;
+    }
+
+    @Override
+    public void __setitem__(PyObject key, PyObject value) {
+        mmap___setitem__(key, value);
+    }
+
+    @ExposedMethod
+    final synchronized void mmap___setitem__(PyObject key, PyObject value) {
+        checkValid();
+        checkWritable();
+        if (key instanceof PySlice) {
+            int[] indices = ((PySlice)key).indicesEx(size);
+            int start = indices[0], step = indices[2], n = indices[3];
+            byte[] b = bytesOf(value);
+            if (b.length != n) {
+                throw Py.IndexError("mmap slice assignment is wrong size");
+            } else if (step == 1) {
+                put(start, b);
+            } else {
+                for (int i = 0, p = start; i < n; i++, p += step) {
+                    data.put(p, b[i]);
+                }
+            }
+        } else if (key.isIndex()) {
+            int i = index(key);
+            if (!value.isIndex()) {
+                throw Py.TypeError("mmap item value must be an int");
+            }
+            long v = value.asLong();
+            if (v < 0 || v > 255) {
+                throw Py.ValueError("mmap item value must be in range(0, 256)");
+            }
+            data.put(i, (byte)v);
+        } else {
+            throw Py.TypeError("mmap indices must be integer");
+        }
+    }
+
+    @Override
+    public void __delitem__(PyObject key) {
+        mmap___delitem__(key);
+    }
+
+    @ExposedMethod
+    final void mmap___delitem__(PyObject key) {
+        throw Py.TypeError("mmap object doesn't support item deletion");
+    }
+
+    /*
+     * ============================================================================================
+     * File-like methods
+     * ============================================================================================
+     */
+
+    @ExposedMethod(doc = close_doc)
+    final synchronized void mmap_close() {
+        if (hasExports()) {
+            throw Py.BufferError("cannot close exported pointers exist");
+        }
+        // Java cannot unmap: the mapping goes when the buffer is garbage-collected
+        data = null;
+        channel = null;
+    }
+
+    @ExposedGet(name = "closed")
+    final synchronized boolean mmap_closed() {
+        return data == null;
+    }
+
+    @ExposedMethod
+    final PyObject mmap___enter__() {
+        checkValid();
+        return this;
+    }
+
+    @ExposedMethod
+    final boolean mmap___exit__(PyObject type, PyObject value, PyObject traceback) {
+        mmap_close();
+        return false;
+    }
+
+    @ExposedMethod(defaults = {"null", "null"}, doc = find_doc)
+    final PyObject mmap_find(PyObject sub, PyObject start, PyObject end) {
+        return Py.newInteger(find(sub, start, end, false));
+    }
+
+    @ExposedMethod(defaults = {"null", "null"}, doc = rfind_doc)
+    final PyObject mmap_rfind(PyObject sub, PyObject start, PyObject end) {
+        return Py.newInteger(find(sub, start, end, true));
+    }
+
+    private synchronized int find(PyObject subObj, PyObject startObj, PyObject endObj,
+            boolean reverse) {
+        checkValid();
+        byte[] sub = bytesOf(subObj);
+        int start = bound(startObj, pos), end = bound(endObj, size);
+        int n = sub.length, last = end - n;
+        if (last < start) {
+            return -1;
+        } else if (n == 0) {
+            return reverse ? last : start;
+        }
+
+        byte first = sub[0];
+        if (reverse) {
+            for (int p = last; p >= start; p--) {
+                if (data.get(p) == first && matches(p, sub)) {
+                    return p;
+                }
+            }
+        } else {
+            for (int p = start; p <= last; p++) {
+                if (data.get(p) == first && matches(p, sub)) {
+                    return p;
+                }
+            }
+        }
+        return -1;
+    }
+
+    /** True if the bytes at <code>p</code> match <code>sub</code> (first byte already known). */
+    private boolean matches(int p, byte[] sub) {
+        for (int i = 1; i < sub.length; i++) {
+            if (data.get(p + i) != sub[i]) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /** Interpret a slice-style bound: negative counts from the end; clip to the map. */
+    private int bound(PyObject obj, int dflt) {
+        if (obj == null || obj == Py.None) {
+            return dflt;
+        }
+        long i = obj.asLong();
+        if (i < 0) {
+            i += size;
+            if (i < 0) {
+                i = 0;
+            }
+        } else if (i > size) {
+            i = size;
+        }
+        return (int)i;
+    }
+
+    @ExposedMethod(defaults = {"0", "null"}, doc = flush_doc)
+    final synchronized PyObject mmap_flush(long offset, PyObject sizeObj) {
+        checkValid();
+        long n = sizeObj == null ? size : sizeObj.asLong();
+        if (offset < 0 || n < 0 || offset + n > size) {
+            throw Py.ValueError("flush values out of range");
+        }
+        if (access != MmapModule.ACCESS_READ && access != MmapModule.ACCESS_COPY
+                && data instanceof MappedByteBuffer) {
+            // Java can only force the whole mapping
+            ((MappedByteBuffer)data).force();
+        }
+        return Py.Zero;
+    }
+
+    @ExposedMethod(doc = move_doc)
+    final synchronized void mmap_move(long dest, long src, long count) {
+        checkValid();
+        checkWritable();
+        if (dest < 0 || src < 0 || count < 0 || size - dest < count || size - src < count) {
+            throw Py.ValueError("source, destination, or count out of range");
+        }
+        put((int)dest, get((int)src, (int)count));
+    }
+
+    @ExposedMethod(defaults = "null", doc = read_doc)
+    final synchronized PyObject mmap_read(PyObject n) {
+        checkValid();
+        int avail = Math.max(size - pos, 0);
+        long len = n == null || n == Py.None ? avail : n.asLong();
+        if (len < 0 || len > avail) {
+            len = avail;
+        }
+        byte[] b = get(pos, (int)len);
+        pos += len;
+        return new PyBytes(b);
+    }
+
+    @ExposedMethod(doc = read_byte_doc)
+    final synchronized int mmap_read_byte() {
+        checkValid();
+        if (pos >= size) {
+            throw Py.ValueError("read byte out of range");
+        }
+        return data.get(pos++) & 0xff;
+    }
+
+    @ExposedMethod(doc = readline_doc)
+    final synchronized PyObject mmap_readline() {
+        checkValid();
+        int start = Math.min(pos, size), p = start;
+        while (p < size) {
+            if (data.get(p++) == '\n') {
+                break;
+            }
+        }
+        pos = p;
+        return new PyBytes(get(start, p - start));
+    }
+
+    @ExposedMethod(doc = resize_doc)
+    final synchronized void mmap_resize(long newSize) {
+        checkValid();
+        if (access != MmapModule.ACCESS_WRITE && access != MmapModule.ACCESS_DEFAULT) {
+            throw Py.TypeError("mmap can't resize a readonly or copy-on-write memory map.");
+        } else if (hasExports()) {
+            throw Py.BufferError("mmap can't resize with extant buffers exported.");
+        } else if (newSize < 0) {
+            throw Py.ValueError("new size out of range");
+        }
+        int n = mapSize(newSize);
+
+        if (channel == null) {
+            // Anonymous: copy to a new block of memory
+            ByteBuffer b = ByteBuffer.allocateDirect(n);
+            ByteBuffer src = data.duplicate();
+            src.limit(Math.min(size, n));
+            b.put(src);
+            data = b;
+        } else {
+            // Change the size of the file and map it again
+            try {
+                long end = offset + n;
+                if (end < channel.size()) {
+                    channel.truncate(end);
+                }
+                data = channel.map(FileChannel.MapMode.READ_WRITE, offset, n);
+            } catch (IOException ioe) {
+                throw Py.OSError(ioe);
+            }
+        }
+        size = n;
+        if (pos > size) {
+            pos = size;
+        }
+    }
+
+    @ExposedMethod(defaults = "0", doc = seek_doc)
+    final synchronized void mmap_seek(long dist, int how) {
+        checkValid();
+        long where;
+        switch (how) {
+            case 0: // relative to start
+                where = dist;
+                break;
+            case 1: // relative to current position
+                where = pos + dist;
+                break;
+            case 2: // relative to end
+                where = size + dist;
+                break;
+            default:
+                throw Py.ValueError("unknown seek type");
+        }
+        if (where < 0 || where > size) {
+            throw Py.ValueError("seek out of range");
+        }
+        pos = (int)where;
+    }
+
+    @ExposedMethod(doc = size_doc)
+    final synchronized PyObject mmap_size() {
+        checkValid();
+        if (channel == null) {
+            return Py.newInteger(size);
+        }
+        try {
+            return new PyLong(channel.size());
+        } catch (IOException ioe) {
+            throw Py.OSError(ioe);
+        }
+    }
+
+    @ExposedMethod(doc = tell_doc)
+    final synchronized int mmap_tell() {
+        checkValid();
+        return pos;
+    }
+
+    @ExposedMethod(doc = write_doc)
+    final synchronized void mmap_write(PyObject bytes) {
+        checkValid();
+        checkWritable();
+        byte[] b = bytesOf(bytes);
+        if (pos > size || size - pos < b.length) {
+            throw Py.ValueError("data out of range");
+        }
+        put(pos, b);
+        pos += b.length;
+    }
+
+    @ExposedMethod(doc = write_byte_doc)
+    final synchronized void mmap_write_byte(int value) {
+        checkValid();
+        checkWritable();
+        if (pos >= size) {
+            throw Py.ValueError("write byte out of range");
+        } else if (value < 0 || value > 255) {
+            throw Py.ValueError("mmap item value must be in range(0, 256)");
+        }
+        data.put(pos++, (byte)value);
+    }
+
+    /*
+     * Documentation strings
+     */
+    static final String mmap_doc = "Windows: mmap(fileno, length[, tagname[, access[, offset]]])\n"
+            + "\n" + "Maps length bytes from the file specified by the file handle fileno,\n"
+            + "and returns a mmap object.  If length is larger than the current size\n"
+            + "of the file, the file is extended to contain length bytes.  If length\n"
+            + "is 0, the maximum length of the map is the current size of the file,\n"
+            + "except that if the file is empty Windows raises an exception (you cannot\n"
+            + "create an empty mapping on Windows).\n" + "\n"
+            + "Unix: mmap(fileno, length[, flags[, prot[, access[, offset]]]])\n" + "\n"
+            + "Maps length bytes from the file specified by the file descriptor fileno,\n"
+            + "and returns a mmap object.  If length is 0, the maximum length of the map\n"
+            + "will be the current size of the file when mmap is called.\n"
+            + "flags specifies the nature of the mapping. MAP_PRIVATE creates a\n"
+            + "private copy-on-write mapping, so changes to the contents of the mmap\n"
+            + "object will be private to this process, and MAP_SHARED creates a mapping\n"
+            + "that's shared with all other processes mapping the same areas of the file.\n"
+            + "The default value is MAP_SHARED.\n" + "\n"
+            + "To map anonymous memory, pass -1 as the fileno (both versions).";
+
+    private static final String close_doc = "close() -> None\n\nClose the mmap.";
+    private static final String find_doc = "find(sub[, start[, end]]) -> int\n\n"
+            + "Return the lowest index where sub is found, such that sub is contained\n"
+            + "within [start, end]. Return -1 on failure.";
+    private static final String rfind_doc = "rfind(sub[, start[, end]]) -> int\n\n"
+            + "Return the highest index where sub is found, such that sub is contained\n"
+            + "within [start, end]. Return -1 on failure.";
+    private static final String flush_doc = "flush([offset[, size]]) -> int\n\n"
+            + "Flush changes made to the in-memory copy of the file back to disk.";
+    private static final String move_doc = "move(dest, src, count) -> None\n\n"
+            + "Copy count bytes starting at src to the destination index dest.";
+    private static final String read_doc = "read([n]) -> bytes\n\n"
+            + "Return up to n bytes starting from the current file position.";
+    private static final String read_byte_doc = "read_byte() -> int\n\n"
+            + "Return the byte at the current file position and advance the position.";
+    private static final String readline_doc = "readline() -> bytes\n\n"
+            + "Return a single line, starting at the current file position and up to\n"
+            + "the next newline.";
+    private static final String resize_doc = "resize(newsize) -> None\n\n"
+            + "Resize the map and the underlying file, if any.";
+    private static final String seek_doc = "seek(pos[, whence]) -> None\n\n"
+            + "Set the current file position.";
+    private static final String size_doc = "size() -> int\n\n"
+            + "Return the length of the file, which can be larger than the size of the\n"
+            + "memory-mapped area.";
+    private static final String tell_doc = "tell() -> int\n\n"
+            + "Return the current position of the file pointer.";
+    private static final String write_doc = "write(bytes) -> None\n\n"
+            + "Write the bytes in bytes into memory at the current file position and\n"
+            + "advance the position.";
+    private static final String write_byte_doc = "write_byte(byte) -> None\n\n"
+            + "Write the integer byte into memory at the current file position and\n"
+            + "advance the position.";
+}
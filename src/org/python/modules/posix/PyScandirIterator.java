@@ -1,6 +1,5 @@
 package org.python.modules.posix;
 
-import org.python.core.Py;
 import org.python.core.PyIterator;
 import org.python.core.PyObject;
 import org.python.expose.ExposedType;
@@ -20,7 +19,7 @@ public class PyScandirIterator extends PyIterator {
 
     @Override
     public PyObject __next__() {
-        if (!iter.hasNext()) throw Py.StopIteration();
+        if (!iter.hasNext()) return null;
         return new PyDirEntry(iter.next());
     }
 }
@@ -0,0 +1,85 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules.sre;
+
+/**
+ * A pattern program translated to JVM bytecode by {@link MatcherCompiler}. It does the work of
+ * {@link SRE_STATE#SRE_MATCH(long[], int, int, boolean)} for the whole program, with the
+ * literals, character sets and repeats of that particular pattern built into the code.
+ * <p>
+ * The generated subclass is defined by its own class loader, so it reaches the state of the
+ * match only through the protected helpers here.
+ */
+public abstract class CompiledMatcher {
+
+    /** The program this matcher was compiled from (for the character sets it still looks up). */
+    protected final long[] pattern;
+
+    protected CompiledMatcher(long[] pattern) {
+        this.pattern = pattern;
+    }
+
+    /**
+     * Match the whole program against the string at <code>state.ptr</code>.
+     *
+     * @param state of the match, in which the end position and groups are set on success
+     * @param fullmatch whether the match must extend to the end of the string
+     * @return 1 for success and 0 for failure
+     */
+    protected abstract int match(SRE_STATE state, boolean fullmatch);
+
+    protected static int charAt(SRE_STATE state, int i) {
+        return state.str.charAt(i);
+    }
+
+    protected static int ptr(SRE_STATE state) {
+        return state.ptr;
+    }
+
+    protected static int end(SRE_STATE state) {
+        return state.end;
+    }
+
+    protected static int beginning(SRE_STATE state) {
+        return state.beginning;
+    }
+
+    /** Succeed, with the match ending at <code>ptr</code>. */
+    protected static int success(SRE_STATE state, int ptr) {
+        state.ptr = ptr;
+        return 1;
+    }
+
+    protected static int lower(int ch, int flags) {
+        return SRE_STATE.lower(ch, flags);
+    }
+
+    protected static boolean at(SRE_STATE state, int ptr, int at) {
+        return state.SRE_AT(ptr, at);
+    }
+
+    protected static boolean category(SRE_STATE state, int category, int ch) {
+        return state.sre_category(category, ch);
+    }
+
+    protected static boolean charset(SRE_STATE state, long[] pattern, int setidx, int ch) {
+        return state.SRE_CHARSET(pattern, setidx, ch);
+    }
+
+    /** As the <code>MARK</code> operation. */
+    protected static void mark(SRE_STATE state, int i, int ptr) {
+        state.MARK(i, ptr);
+    }
+
+    protected static int lastmark(SRE_STATE state) {
+        return state.lastmark;
+    }
+
+    protected static int lastindex(SRE_STATE state) {
+        return state.lastindex;
+    }
+
+    /** Forget the marks set since <code>lastmark</code> and <code>lastindex</code> were read. */
+    protected static void restoreLastmark(SRE_STATE state, int lastmark, int lastindex) {
+        state.LASTMARK_RESTORE(lastmark, lastindex);
+    }
+}
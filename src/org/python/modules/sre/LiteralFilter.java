@@ -0,0 +1,343 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules.sre;
+
+import static org.python.modules.sre.SRE_STATE.*;
+
+import java.util.ArrayDeque;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+
+/**
+ * Literal strings found in a pattern program when it is created, which
+ * {@link SRE_STATE#SRE_SEARCH(long[], int)} uses to skip over text where the pattern cannot
+ * match:
+ * <ul>
+ * <li>the <em>prefix</em> every match starts with (from the <code>INFO</code> block), found by
+ * {@link SRE_SUBJECT#indexOf(Literal, int, int)} rather than character by character;</li>
+ * <li>the leading literals of a <code>BRANCH</code> of literal alternatives
+ * (<code>foo|bar|baz</code>), found together by an Aho&ndash;Corasick automaton;</li>
+ * <li>a <em>required</em> literal that every match contains, so that a search stops once there
+ * is no occurrence of it left in the string.</li>
+ * </ul>
+ * The interpreter (or compiled matcher) still decides whether there is a match at each position
+ * these find.
+ */
+final class LiteralFilter {
+
+    /** Shortest required literal worth looking for ahead of the search. */
+    private static final int MIN_REQUIRED = 2;
+
+    /** The literal prefix of every match, or <code>null</code>. */
+    final Literal prefix;
+
+    /** The leading literals of the alternatives of an initial branch, or <code>null</code>. */
+    final Alternatives alternatives;
+
+    /** A literal every match contains, or <code>null</code>. */
+    final Literal required;
+
+    private LiteralFilter(Literal prefix, Alternatives alternatives, Literal required) {
+        this.prefix = prefix;
+        this.alternatives = alternatives;
+        this.required = required;
+    }
+
+    /**
+     * Extract the literals from a pattern program.
+     *
+     * @return the filter, or <code>null</code> if the program yields none of the literals
+     */
+    static LiteralFilter of(long[] code) {
+        Literal prefix = null;
+        int pidx = 0;
+        if (code[0] == SRE_OP_INFO) {
+            /* <INFO> <1=skip> <2=flags> <3=min> <4=max> <5=prefix info> */
+            int flags = (int) code[2];
+            if ((flags & SRE_INFO_PREFIX) != 0) {
+                /* <length> <skip> <prefix data> <overlap data> */
+                int len = (int) code[5];
+                if (len > 1) {
+                    prefix = new Literal(Arrays.copyOfRange(code, 7, 7 + len));
+                }
+            }
+            pidx = (int) code[1] + 1;
+        }
+        Alternatives alternatives = prefix == null ? branchLiterals(code, pidx) : null;
+        Literal required = requiredLiteral(code, pidx);
+        if (required != null && prefix != null && required.length() <= prefix.length()) {
+            // The prefix search already requires as much
+            required = null;
+        }
+        if (prefix == null && alternatives == null && required == null) {
+            return null;
+        }
+        return new LiteralFilter(prefix, alternatives, required);
+    }
+
+    /** The leading literals of a branch at <code>pidx</code>, if every alternative has one. */
+    private static Alternatives branchLiterals(long[] code, int pidx) {
+        pidx = skipMarks(code, pidx);
+        if (code[pidx] != SRE_OP_BRANCH) {
+            return null;
+        }
+        /* <BRANCH> <0=skip> code <JUMP> ... <NULL> */
+        List<int[]> literals = new ArrayList<>();
+        for (int alt = pidx + 1; code[alt] != 0; alt += (int) code[alt]) {
+            int[] literal = literalRun(code, alt + 1);
+            if (literal.length == 0) {
+                return null;
+            }
+            literals.add(literal);
+        }
+        return literals.size() < 2 ? null : new Alternatives(literals);
+    }
+
+    /** The longest run of literals at the top level of the program. */
+    private static Literal requiredLiteral(long[] code, int pidx) {
+        int[] best = new int[0];
+        for (;;) {
+            int[] run = literalRun(code, pidx);
+            if (run.length > best.length) {
+                best = run;
+            }
+            pidx = skipLiteralRun(code, pidx);
+            pidx = skipOperation(code, pidx);
+            if (pidx < 0) {
+                break;
+            }
+        }
+        return best.length < MIN_REQUIRED ? null : new Literal(best);
+    }
+
+    /** The characters of the <code>LITERAL</code> operations at <code>pidx</code>. */
+    private static int[] literalRun(long[] code, int pidx) {
+        List<Integer> chars = new ArrayList<>();
+        for (;;) {
+            int op = (int) code[pidx];
+            if (op == SRE_OP_LITERAL) {
+                chars.add((int) code[pidx + 1]);
+            } else if (op != SRE_OP_MARK) {
+                // Marks are zero-width: literals either side are adjacent in a match
+                break;
+            }
+            pidx += 2;
+        }
+        int[] run = new int[chars.size()];
+        for (int i = 0; i < run.length; i++) {
+            run[i] = chars.get(i);
+        }
+        return run;
+    }
+
+    private static int skipLiteralRun(long[] code, int pidx) {
+        while (code[pidx] == SRE_OP_LITERAL || code[pidx] == SRE_OP_MARK) {
+            pidx += 2;
+        }
+        return pidx;
+    }
+
+    private static int skipMarks(long[] code, int pidx) {
+        while (code[pidx] == SRE_OP_MARK) {
+            pidx += 2;
+        }
+        return pidx;
+    }
+
+    /**
+     * The position after the operation at <code>pidx</code> in a sequence, or -1 at the end of
+     * the program or where the structure is not simple enough to follow.
+     */
+    private static int skipOperation(long[] code, int pidx) {
+        switch ((int) code[pidx]) {
+            case SRE_OP_ANY:
+            case SRE_OP_ANY_ALL:
+                return pidx + 1;
+            case SRE_OP_AT:
+            case SRE_OP_CATEGORY:
+            case SRE_OP_LITERAL_IGNORE:
+            case SRE_OP_NOT_LITERAL:
+            case SRE_OP_NOT_LITERAL_IGNORE:
+            case SRE_OP_GROUPREF:
+            case SRE_OP_GROUPREF_IGNORE:
+                return pidx + 2;
+            case SRE_OP_IN:
+            case SRE_OP_IN_IGNORE:
+            case SRE_OP_REPEAT_ONE:
+            case SRE_OP_MIN_REPEAT_ONE:
+            case SRE_OP_ASSERT:
+            case SRE_OP_ASSERT_NOT:
+                /* <op> <skip> ... */
+                return pidx + 1 + (int) code[pidx + 1];
+            case SRE_OP_REPEAT:
+                /* <REPEAT> <skip> <1=min> <2=max> item <UNTIL> tail */
+                return pidx + 1 + (int) code[pidx + 1] + 1;
+            case SRE_OP_BRANCH:
+                /* <BRANCH> <0=skip> code <JUMP> ... <NULL> */
+                int alt = pidx + 1;
+                while (code[alt] != 0) {
+                    alt += (int) code[alt];
+                }
+                return alt + 1;
+            default:
+                return -1;
+        }
+    }
+
+    /** A literal string, as code points and (if all are in the BMP) as a Java string. */
+    static final class Literal {
+
+        final int[] codePoints;
+
+        /** The code points as a string, or <code>null</code> if there are supplementary ones. */
+        final String string;
+
+        Literal(long[] code) {
+            this(toInts(code));
+        }
+
+        Literal(int[] codePoints) {
+            this.codePoints = codePoints;
+            StringBuilder sb = new StringBuilder(codePoints.length);
+            for (int c : codePoints) {
+                if (c > Character.MAX_VALUE) {
+                    sb = null;
+                    break;
+                }
+                sb.append((char) c);
+            }
+            this.string = sb == null ? null : sb.toString();
+        }
+
+        int length() {
+            return codePoints.length;
+        }
+
+        private static int[] toInts(long[] code) {
+            int[] ints = new int[code.length];
+            for (int i = 0; i < code.length; i++) {
+                ints[i] = (int) code[i];
+            }
+            return ints;
+        }
+    }
+
+    /** An Aho&ndash;Corasick automaton that finds the first place any of the literals starts. */
+    static final class Alternatives {
+
+        /** Characters on the transitions out of each state, sorted. */
+        private final int[][] chars;
+        /** The states those transitions lead to. */
+        private final int[][] targets;
+        /** The failure link of each state. */
+        private final int[] fail;
+        /** The length of the longest literal ending at each state, or 0 if none does. */
+        private final int[] longest;
+        /** The length of the longest literal. */
+        private final int maxLength;
+
+        Alternatives(List<int[]> literals) {
+            // Build the trie
+            List<int[]> chars = new ArrayList<>();
+            List<int[]> targets = new ArrayList<>();
+            List<Integer> longest = new ArrayList<>();
+            chars.add(new int[0]);
+            targets.add(new int[0]);
+            longest.add(0);
+            int maxLength = 0;
+            for (int[] literal : literals) {
+                int state = 0;
+                for (int c : literal) {
+                    int next = lookup(chars.get(state), targets.get(state), c);
+                    if (next < 0) {
+                        next = chars.size();
+                        chars.add(new int[0]);
+                        targets.add(new int[0]);
+                        longest.add(0);
+                        addTransition(chars, targets, state, c, next);
+                    }
+                    state = next;
+                }
+                longest.set(state, Math.max(longest.get(state), literal.length));
+                maxLength = Math.max(maxLength, literal.length);
+            }
+            int n = chars.size();
+            this.chars = chars.toArray(new int[n][]);
+            this.targets = targets.toArray(new int[n][]);
+            this.longest = new int[n];
+            for (int i = 0; i < n; i++) {
+                this.longest[i] = longest.get(i);
+            }
+            this.maxLength = maxLength;
+
+            // Failure links, breadth first
+            this.fail = new int[n];
+            ArrayDeque<Integer> queue = new ArrayDeque<>();
+            for (int s : this.targets[0]) {
+                queue.add(s);
+            }
+            while (!queue.isEmpty()) {
+                int state = queue.poll();
+                for (int i = 0; i < this.chars[state].length; i++) {
+                    int c = this.chars[state][i], next = this.targets[state][i];
+                    int f = fail[state];
+                    int t;
+                    while ((t = lookup(this.chars[f], this.targets[f], c)) < 0 && f != 0) {
+                        f = fail[f];
+                    }
+                    fail[next] = t < 0 ? 0 : t;
+                    this.longest[next] = Math.max(this.longest[next], this.longest[fail[next]]);
+                    queue.add(next);
+                }
+            }
+        }
+
+        private static int lookup(int[] chars, int[] targets, int c) {
+            int i = Arrays.binarySearch(chars, c);
+            return i < 0 ? -1 : targets[i];
+        }
+
+        private static void addTransition(List<int[]> chars, List<int[]> targets, int state,
+                int c, int next) {
+            int[] cs = chars.get(state), ts = targets.get(state);
+            int i = -(Arrays.binarySearch(cs, c) + 1);
+            int[] ncs = new int[cs.length + 1], nts = new int[ts.length + 1];
+            System.arraycopy(cs, 0, ncs, 0, i);
+            System.arraycopy(ts, 0, nts, 0, i);
+            ncs[i] = c;
+            nts[i] = next;
+            System.arraycopy(cs, i, ncs, i + 1, cs.length - i);
+            System.arraycopy(ts, i, nts, i + 1, ts.length - i);
+            chars.set(state, ncs);
+            targets.set(state, nts);
+        }
+
+        /**
+         * The first position at or after <code>from</code> where one of the literals starts
+         * (and ends before <code>end</code>), or -1.
+         */
+        int find(SRE_SUBJECT str, int from, int end) {
+            int state = 0;
+            int best = -1;
+            for (int pos = from; pos < end; pos++) {
+                if (best >= 0 && pos >= best + maxLength - 1) {
+                    // Nothing ending from here on can start before best
+                    break;
+                }
+                int c = str.charAt(pos);
+                int t;
+                while ((t = lookup(chars[state], targets[state], c)) < 0 && state != 0) {
+                    state = fail[state];
+                }
+                state = t < 0 ? 0 : t;
+                if (longest[state] > 0) {
+                    int start = pos - longest[state] + 1;
+                    if (best < 0 || start < best) {
+                        best = start;
+                    }
+                }
+            }
+            return best;
+        }
+    }
+}
@@ -0,0 +1,653 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules.sre;
+
+import static org.python.modules.sre.SRE_STATE.*;
+
+import java.util.concurrent.atomic.AtomicInteger;
+
+import org.objectweb.asm.ClassWriter;
+import org.objectweb.asm.Label;
+import org.objectweb.asm.MethodVisitor;
+import org.objectweb.asm.Opcodes;
+import org.objectweb.asm.Type;
+import org.python.core.BytecodeLoader;
+
+/**
+ * Translates a pattern program (the <code>long[]</code> code from <code>sre_compile</code>) into
+ * a {@link CompiledMatcher} subclass, so that a pattern used often is no longer interpreted by
+ * {@link SRE_STATE#SRE_MATCH(long[], int, int, boolean)}.
+ * <p>
+ * Literals, character sets and categories are tested by inline code, and
+ * <code>REPEAT_ONE</code>/<code>MIN_REPEAT_ONE</code> become counting loops with backtracking
+ * by a jump back into the code for the rest of the pattern. <code>BRANCH</code> is supported by
+ * generating the rest of the pattern after each alternative. A program containing any other
+ * operation (general repeats, group references, assertions) is not compiled: {@link #compile}
+ * returns <code>null</code>, and the pattern stays with the interpreter.
+ * <p>
+ * The generated code keeps the semantics of the interpreter for groups (<code>MARK</code> and
+ * the restoring of <code>lastmark</code> on backtracking).
+ */
+final class MatcherCompiler implements Opcodes {
+
+    /** Give up on programs that would generate more code than this many operations. */
+    private static final int MAX_OPS = 1000;
+
+    private static final String BASE = Type.getInternalName(CompiledMatcher.class);
+    private static final String STATE = Type.getDescriptor(SRE_STATE.class);
+
+    private static final AtomicInteger serial = new AtomicInteger();
+
+    /* Local variables of the generated match(SRE_STATE, boolean) method */
+    private static final int L_STATE = 1;
+    private static final int L_FULLMATCH = 2;
+    private static final int L_END = 3;
+    private static final int L_PTR = 4;
+    private static final int L_CH = 5;
+    private static final int L_FIRST_TEMP = 6;
+
+    /** Thrown when the program cannot be compiled. */
+    private static final class Unsupported extends RuntimeException {
+
+        Unsupported() {
+            super(null, null, false, false);
+        }
+    }
+
+    private final long[] code;
+    private final int flags;
+    private MethodVisitor mv;
+    private int nextLocal = L_FIRST_TEMP;
+    private int ops = 0;
+
+    private MatcherCompiler(long[] code, int flags) {
+        this.code = code;
+        this.flags = flags;
+    }
+
+    /**
+     * Compile a pattern program, if it uses only operations the compiler supports.
+     *
+     * @param code the program
+     * @param flags of the pattern (as in the <code>SRE_STATE</code> matching it)
+     * @return the matcher, or <code>null</code> if the program must be interpreted
+     */
+    static CompiledMatcher compile(long[] code, int flags) {
+        String name = CompiledMatcher.class.getName() + "$Compiled" + serial.incrementAndGet();
+        byte[] bytes;
+        try {
+            bytes = new MatcherCompiler(code, flags).generate(name.replace('.', '/'));
+        } catch (Unsupported e) {
+            return null;
+        }
+        try {
+            Class<?> c = BytecodeLoader.makeClass(name, bytes, CompiledMatcher.class);
+            return (CompiledMatcher) c.getConstructor(long[].class).newInstance(code);
+        } catch (ReflectiveOperationException | LinkageError e) {
+            // Whatever the cause, the interpreter can still match the pattern
+            return null;
+        }
+    }
+
+    private byte[] generate(String internalName) {
+        ClassWriter cw = new ClassWriter(ClassWriter.COMPUTE_FRAMES);
+        cw.visit(V1_7, ACC_PUBLIC | ACC_FINAL | ACC_SUPER, internalName, null, BASE, null);
+
+        MethodVisitor init = cw.visitMethod(ACC_PUBLIC, "<init>", "([J)V", null, null);
+        init.visitCode();
+        init.visitVarInsn(ALOAD, 0);
+        init.visitVarInsn(ALOAD, 1);
+        init.visitMethodInsn(INVOKESPECIAL, BASE, "<init>", "([J)V", false);
+        init.visitInsn(RETURN);
+        init.visitMaxs(0, 0);
+        init.visitEnd();
+
+        mv = cw.visitMethod(ACC_PROTECTED, "match", "(" + STATE + "Z)I", null, null);
+        mv.visitCode();
+        mv.visitVarInsn(ALOAD, L_STATE);
+        helper("end", "(" + STATE + ")I");
+        mv.visitVarInsn(ISTORE, L_END);
+        mv.visitVarInsn(ALOAD, L_STATE);
+        helper("ptr", "(" + STATE + ")I");
+        mv.visitVarInsn(ISTORE, L_PTR);
+
+        Label fail = new Label();
+        int pidx = 0;
+        if (code[0] == SRE_OP_INFO) {
+            /* <INFO> <1=skip> <2=flags> <3=min> ...: fail if the string is too short */
+            int min = (int) code[3];
+            if (min != 0) {
+                mv.visitVarInsn(ILOAD, L_END);
+                mv.visitVarInsn(ILOAD, L_PTR);
+                mv.visitInsn(ISUB);
+                push(min);
+                mv.visitJumpInsn(IF_ICMPLT, fail);
+            }
+            pidx = (int) code[1] + 1;
+        }
+        sequence(pidx, fail);
+
+        mv.visitLabel(fail);
+        mv.visitInsn(ICONST_0);
+        mv.visitInsn(IRETURN);
+        try {
+            mv.visitMaxs(0, 0);
+            mv.visitEnd();
+            cw.visitEnd();
+            return cw.toByteArray();
+        } catch (RuntimeException e) {
+            // For example, the method is too large
+            throw new Unsupported();
+        }
+    }
+
+    /**
+     * Generate code to match the program from <code>pidx</code> to its end, returning from the
+     * method on success and jumping to <code>fail</code> on failure.
+     */
+    private void sequence(int pidx, Label fail) {
+        for (;;) {
+            count();
+            int op = (int) code[pidx];
+            switch (op) {
+                case SRE_OP_SUCCESS:
+                    Label succeed = new Label();
+                    mv.visitVarInsn(ILOAD, L_FULLMATCH);
+                    mv.visitJumpInsn(IFEQ, succeed);
+                    mv.visitVarInsn(ILOAD, L_PTR);
+                    mv.visitVarInsn(ILOAD, L_END);
+                    mv.visitJumpInsn(IF_ICMPNE, fail);
+                    mv.visitLabel(succeed);
+                    mv.visitVarInsn(ALOAD, L_STATE);
+                    mv.visitVarInsn(ILOAD, L_PTR);
+                    helper("success", "(" + STATE + "I)I");
+                    mv.visitInsn(IRETURN);
+                    return;
+
+                case SRE_OP_FAILURE:
+                    mv.visitJumpInsn(GOTO, fail);
+                    return;
+
+                case SRE_OP_MARK:
+                    /* <MARK> <gid> */
+                    mv.visitVarInsn(ALOAD, L_STATE);
+                    push((int) code[pidx + 1]);
+                    mv.visitVarInsn(ILOAD, L_PTR);
+                    helper("mark", "(" + STATE + "II)V");
+                    pidx += 2;
+                    break;
+
+                case SRE_OP_JUMP:
+                    /* <JUMP> <offset> */
+                    pidx += 1 + (int) code[pidx + 1];
+                    break;
+
+                case SRE_OP_AT:
+                    /* <AT> <code> */
+                    at((int) code[pidx + 1], fail);
+                    pidx += 2;
+                    break;
+
+                case SRE_OP_BRANCH:
+                    branch(pidx, fail);
+                    return;
+
+                case SRE_OP_REPEAT_ONE:
+                    repeatOne(pidx, fail);
+                    return;
+
+                case SRE_OP_MIN_REPEAT_ONE:
+                    minRepeatOne(pidx, fail);
+                    return;
+
+                default:
+                    /* a single character: fail at the end of the string or if it does not match */
+                    int next = pidx + itemSize(pidx);
+                    mv.visitVarInsn(ILOAD, L_PTR);
+                    mv.visitVarInsn(ILOAD, L_END);
+                    mv.visitJumpInsn(IF_ICMPGE, fail);
+                    if (op != SRE_OP_ANY_ALL) {
+                        loadChar(L_PTR);
+                        item(pidx, false, fail);
+                    }
+                    mv.visitIincInsn(L_PTR, 1);
+                    pidx = next;
+                    break;
+            }
+        }
+    }
+
+    /** The length of the single-character operation at <code>pidx</code>. */
+    private int itemSize(int pidx) {
+        switch ((int) code[pidx]) {
+            case SRE_OP_ANY:
+            case SRE_OP_ANY_ALL:
+                return 1;
+            case SRE_OP_LITERAL:
+            case SRE_OP_NOT_LITERAL:
+            case SRE_OP_LITERAL_IGNORE:
+            case SRE_OP_NOT_LITERAL_IGNORE:
+            case SRE_OP_CATEGORY:
+                return 2;
+            case SRE_OP_IN:
+            case SRE_OP_IN_IGNORE:
+                /* <IN> <skip> <set> */
+                return 1 + (int) code[pidx + 1];
+            default:
+                throw new Unsupported();
+        }
+    }
+
+    /**
+     * Generate a test of the character in <code>L_CH</code> against the single-character
+     * operation at <code>pidx</code>, jumping to <code>mismatch</code> if it fails.
+     *
+     * @param counting whether in a repeat, where (as in <code>SRE_COUNT</code>) an
+     *            <code>*_IGNORE</code> literal is compared as it stands, not lowered
+     */
+    private void item(int pidx, boolean counting, Label mismatch) {
+        int op = (int) code[pidx];
+        switch (op) {
+            case SRE_OP_LITERAL:
+            case SRE_OP_NOT_LITERAL:
+                mv.visitVarInsn(ILOAD, L_CH);
+                push((int) code[pidx + 1]);
+                mv.visitJumpInsn(op == SRE_OP_LITERAL ? IF_ICMPNE : IF_ICMPEQ, mismatch);
+                break;
+
+            case SRE_OP_LITERAL_IGNORE:
+            case SRE_OP_NOT_LITERAL_IGNORE:
+                int chr = (int) code[pidx + 1];
+                lowerChar();
+                mv.visitVarInsn(ILOAD, L_CH);
+                push(counting ? chr : SRE_STATE.lower(chr, flags));
+                mv.visitJumpInsn(op == SRE_OP_LITERAL_IGNORE ? IF_ICMPNE : IF_ICMPEQ, mismatch);
+                break;
+
+            case SRE_OP_ANY:
+                mv.visitVarInsn(ILOAD, L_CH);
+                push('\n');
+                mv.visitJumpInsn(IF_ICMPEQ, mismatch);
+                break;
+
+            case SRE_OP_ANY_ALL:
+                break;
+
+            case SRE_OP_IN:
+                charset(pidx + 2, mismatch);
+                break;
+
+            case SRE_OP_IN_IGNORE:
+                lowerChar();
+                charset(pidx + 2, mismatch);
+                break;
+
+            case SRE_OP_CATEGORY:
+                mv.visitVarInsn(ALOAD, L_STATE);
+                push((int) code[pidx + 1]);
+                mv.visitVarInsn(ILOAD, L_CH);
+                helper("category", "(" + STATE + "II)Z");
+                mv.visitJumpInsn(IFEQ, mismatch);
+                break;
+
+            default:
+                throw new Unsupported();
+        }
+    }
+
+    /**
+     * Generate a test of <code>L_CH</code> against the set starting at <code>setidx</code>, as
+     * by {@link SRE_STATE#SRE_CHARSET(long[], int, int)}. Literals, ranges and categories are
+     * tested inline, and sets with bitmaps by calling <code>SRE_CHARSET</code>.
+     */
+    private void charset(int setidx, Label mismatch) {
+        if (!isSimpleSet(setidx)) {
+            mv.visitVarInsn(ALOAD, L_STATE);
+            mv.visitVarInsn(ALOAD, 0);
+            mv.visitFieldInsn(GETFIELD, BASE, "pattern", "[J");
+            push(setidx);
+            mv.visitVarInsn(ILOAD, L_CH);
+            helper("charset", "(" + STATE + "[JII)Z");
+            mv.visitJumpInsn(IFEQ, mismatch);
+            return;
+        }
+
+        boolean negate = code[setidx] == SRE_OP_NEGATE;
+        if (negate) {
+            setidx++;
+        }
+        // A member of a negated set is a mismatch; otherwise, jump past the mismatch
+        Label member = new Label();
+        Label onMember = negate ? mismatch : member;
+        for (;;) {
+            count();
+            switch ((int) code[setidx]) {
+                case SRE_OP_FAILURE:
+                    if (!negate) {
+                        mv.visitJumpInsn(GOTO, mismatch);
+                    }
+                    mv.visitLabel(member);
+                    return;
+
+                case SRE_OP_LITERAL:
+                    mv.visitVarInsn(ILOAD, L_CH);
+                    push((int) code[setidx + 1]);
+                    mv.visitJumpInsn(IF_ICMPEQ, onMember);
+                    setidx += 2;
+                    break;
+
+                case SRE_OP_RANGE:
+                    Label outside = new Label();
+                    mv.visitVarInsn(ILOAD, L_CH);
+                    push((int) code[setidx + 1]);
+                    mv.visitJumpInsn(IF_ICMPLT, outside);
+                    mv.visitVarInsn(ILOAD, L_CH);
+                    push((int) code[setidx + 2]);
+                    mv.visitJumpInsn(IF_ICMPLE, onMember);
+                    mv.visitLabel(outside);
+                    setidx += 3;
+                    break;
+
+                case SRE_OP_CATEGORY:
+                    mv.visitVarInsn(ALOAD, L_STATE);
+                    push((int) code[setidx + 1]);
+                    mv.visitVarInsn(ILOAD, L_CH);
+                    helper("category", "(" + STATE + "II)Z");
+                    mv.visitJumpInsn(IFNE, onMember);
+                    setidx += 2;
+                    break;
+
+                default:
+                    // Excluded by isSimpleSet
+                    throw new Unsupported();
+            }
+        }
+    }
+
+    /** Whether the set has only literals, ranges and categories, and possibly a leading NEGATE. */
+    private boolean isSimpleSet(int setidx) {
+        if (code[setidx] == SRE_OP_NEGATE) {
+            setidx++;
+        }
+        for (;;) {
+            switch ((int) code[setidx]) {
+                case SRE_OP_FAILURE:
+                    return true;
+                case SRE_OP_LITERAL:
+                case SRE_OP_CATEGORY:
+                    setidx += 2;
+                    break;
+                case SRE_OP_RANGE:
+                    setidx += 3;
+                    break;
+                default:
+                    return false;
+            }
+        }
+    }
+
+    /** Generate a test of the position <code>L_PTR</code>, as by <code>SRE_AT</code>. */
+    private void at(int at, Label fail) {
+        switch (at) {
+            case SRE_AT_BEGINNING:
+            case SRE_AT_BEGINNING_STRING:
+                mv.visitVarInsn(ILOAD, L_PTR);
+                mv.visitVarInsn(ALOAD, L_STATE);
+                helper("beginning", "(" + STATE + ")I");
+                mv.visitJumpInsn(IF_ICMPNE, fail);
+                break;
+
+            case SRE_AT_END_STRING:
+                mv.visitVarInsn(ILOAD, L_PTR);
+                mv.visitVarInsn(ILOAD, L_END);
+                mv.visitJumpInsn(IF_ICMPNE, fail);
+                break;
+
+            default:
+                mv.visitVarInsn(ALOAD, L_STATE);
+                mv.visitVarInsn(ILOAD, L_PTR);
+                push(at);
+                helper("at", "(" + STATE + "II)Z");
+                mv.visitJumpInsn(IFEQ, fail);
+                break;
+        }
+    }
+
+    /**
+     * <code>&lt;BRANCH&gt; &lt;0=skip&gt; code &lt;JUMP&gt; ... &lt;NULL&gt;</code>: try each
+     * alternative followed by the rest of the pattern, restoring the position and marks between.
+     */
+    private void branch(int pidx, Label fail) {
+        int start = newLocal(), lastmark = newLocal(), lastindex = newLocal();
+        mv.visitVarInsn(ILOAD, L_PTR);
+        mv.visitVarInsn(ISTORE, start);
+        saveLastmark(lastmark, lastindex);
+        for (int alt = pidx + 1; code[alt] != 0; alt += (int) code[alt]) {
+            Label next = new Label();
+            sequence(alt + 1, next);
+            mv.visitLabel(next);
+            mv.visitVarInsn(ILOAD, start);
+            mv.visitVarInsn(ISTORE, L_PTR);
+            restoreLastmark(lastmark, lastindex);
+        }
+        mv.visitJumpInsn(GOTO, fail);
+    }
+
+    /**
+     * <code>&lt;REPEAT_ONE&gt; &lt;skip&gt; &lt;1=min&gt; &lt;2=max&gt; item &lt;SUCCESS&gt;
+     * tail</code>: match as many items as possible, then try the tail after each count, from the
+     * greatest down to <code>min</code>.
+     */
+    private void repeatOne(int pidx, Label fail) {
+        int min = (int) code[pidx + 2];
+        int max = (int) code[pidx + 3];
+        int item = pidx + 4;
+        int tail = pidx + 1 + (int) code[pidx + 1];
+        itemSize(item); // fails if the item is not a single character
+        int base = newLocal(), limit = newLocal(), cur = newLocal();
+        int lastmark = newLocal(), lastindex = newLocal();
+
+        // if (end - ptr < min) fail
+        mv.visitVarInsn(ILOAD, L_END);
+        mv.visitVarInsn(ILOAD, L_PTR);
+        mv.visitInsn(ISUB);
+        push(min);
+        mv.visitJumpInsn(IF_ICMPLT, fail);
+        mv.visitVarInsn(ILOAD, L_PTR);
+        mv.visitVarInsn(ISTORE, base);
+
+        // limit = (max == 65535 || end - ptr <= max) ? end : ptr + max
+        Label toEnd = new Label(), limited = new Label();
+        if (max != 65535) {
+            mv.visitVarInsn(ILOAD, L_END);
+            mv.visitVarInsn(ILOAD, L_PTR);
+            mv.visitInsn(ISUB);
+            push(max);
+            mv.visitJumpInsn(IF_ICMPLE, toEnd);
+            mv.visitVarInsn(ILOAD, L_PTR);
+            push(max);
+            mv.visitInsn(IADD);
+            mv.visitVarInsn(ISTORE, limit);
+            mv.visitJumpInsn(GOTO, limited);
+        }
+        mv.visitLabel(toEnd);
+        mv.visitVarInsn(ILOAD, L_END);
+        mv.visitVarInsn(ISTORE, limit);
+        mv.visitLabel(limited);
+
+        // Count the items
+        if (code[item] == SRE_OP_ANY_ALL) {
+            mv.visitVarInsn(ILOAD, limit);
+            mv.visitVarInsn(ISTORE, L_PTR);
+        } else {
+            Label loop = new Label(), done = new Label();
+            mv.visitLabel(loop);
+            mv.visitVarInsn(ILOAD, L_PTR);
+            mv.visitVarInsn(ILOAD, limit);
+            mv.visitJumpInsn(IF_ICMPGE, done);
+            loadChar(L_PTR);
+            item(item, true, done);
+            mv.visitIincInsn(L_PTR, 1);
+            mv.visitJumpInsn(GOTO, loop);
+            mv.visitLabel(done);
+        }
+
+        // if (ptr - base < min) fail
+        mv.visitVarInsn(ILOAD, L_PTR);
+        mv.visitVarInsn(ILOAD, base);
+        mv.visitInsn(ISUB);
+        push(min);
+        mv.visitJumpInsn(IF_ICMPLT, fail);
+
+        saveLastmark(lastmark, lastindex);
+        mv.visitVarInsn(ILOAD, L_PTR);
+        mv.visitVarInsn(ISTORE, cur);
+        Label attempt = new Label(), retry = new Label();
+        mv.visitLabel(attempt);
+        sequence(tail, retry);
+
+        // Give back one item and try again, unless that leaves fewer than min
+        mv.visitLabel(retry);
+        restoreLastmark(lastmark, lastindex);
+        mv.visitIincInsn(cur, -1);
+        mv.visitVarInsn(ILOAD, cur);
+        mv.visitVarInsn(ILOAD, base);
+        mv.visitInsn(ISUB);
+        push(min);
+        mv.visitJumpInsn(IF_ICMPLT, fail);
+        mv.visitVarInsn(ILOAD, cur);
+        mv.visitVarInsn(ISTORE, L_PTR);
+        mv.visitJumpInsn(GOTO, attempt);
+    }
+
+    /**
+     * <code>&lt;MIN_REPEAT_ONE&gt; &lt;skip&gt; &lt;1=min&gt; &lt;2=max&gt; item &lt;SUCCESS&gt;
+     * tail</code>: match <code>min</code> items, then try the tail after each further item, up
+     * to <code>max</code>.
+     */
+    private void minRepeatOne(int pidx, Label fail) {
+        int min = (int) code[pidx + 2];
+        int max = (int) code[pidx + 3];
+        int item = pidx + 4;
+        int tail = pidx + 1 + (int) code[pidx + 1];
+        itemSize(item); // fails if the item is not a single character
+        int base = newLocal(), cur = newLocal();
+        int lastmark = newLocal(), lastindex = newLocal();
+
+        // if (end - ptr < min) fail
+        mv.visitVarInsn(ILOAD, L_END);
+        mv.visitVarInsn(ILOAD, L_PTR);
+        mv.visitInsn(ISUB);
+        push(min);
+        mv.visitJumpInsn(IF_ICMPLT, fail);
+        mv.visitVarInsn(ILOAD, L_PTR);
+        mv.visitVarInsn(ISTORE, base);
+
+        // Match the minimum number of items (there are enough characters left)
+        if (min > 0) {
+            if (code[item] == SRE_OP_ANY_ALL) {
+                mv.visitIincInsn(L_PTR, min);
+            } else {
+                Label loop = new Label(), done = new Label();
+                mv.visitLabel(loop);
+                mv.visitVarInsn(ILOAD, L_PTR);
+                mv.visitVarInsn(ILOAD, base);
+                mv.visitInsn(ISUB);
+                push(min);
+                mv.visitJumpInsn(IF_ICMPGE, done);
+                loadChar(L_PTR);
+                item(item, true, fail);
+                mv.visitIincInsn(L_PTR, 1);
+                mv.visitJumpInsn(GOTO, loop);
+                mv.visitLabel(done);
+            }
+        }
+
+        saveLastmark(lastmark, lastindex);
+        mv.visitVarInsn(ILOAD, L_PTR);
+        mv.visitVarInsn(ISTORE, cur);
+        Label attempt = new Label(), retry = new Label();
+        mv.visitLabel(attempt);
+        sequence(tail, retry);
+
+        // Take one more item and try again, unless there are already max
+        mv.visitLabel(retry);
+        restoreLastmark(lastmark, lastindex);
+        if (max != 65535) {
+            mv.visitVarInsn(ILOAD, cur);
+            mv.visitVarInsn(ILOAD, base);
+            mv.visitInsn(ISUB);
+            push(max);
+            mv.visitJumpInsn(IF_ICMPGE, fail);
+        }
+        mv.visitVarInsn(ILOAD, cur);
+        mv.visitVarInsn(ILOAD, L_END);
+        mv.visitJumpInsn(IF_ICMPGE, fail);
+        if (code[item] != SRE_OP_ANY_ALL) {
+            loadChar(cur);
+            item(item, true, fail);
+        }
+        mv.visitIincInsn(cur, 1);
+        mv.visitVarInsn(ILOAD, cur);
+        mv.visitVarInsn(ISTORE, L_PTR);
+        mv.visitJumpInsn(GOTO, attempt);
+    }
+
+    private void saveLastmark(int lastmark, int lastindex) {
+        mv.visitVarInsn(ALOAD, L_STATE);
+        helper("lastmark", "(" + STATE + ")I");
+        mv.visitVarInsn(ISTORE, lastmark);
+        mv.visitVarInsn(ALOAD, L_STATE);
+        helper("lastindex", "(" + STATE + ")I");
+        mv.visitVarInsn(ISTORE, lastindex);
+    }
+
+    private void restoreLastmark(int lastmark, int lastindex) {
+        mv.visitVarInsn(ALOAD, L_STATE);
+        mv.visitVarInsn(ILOAD, lastmark);
+        mv.visitVarInsn(ILOAD, lastindex);
+        helper("restoreLastmark", "(" + STATE + "II)V");
+    }
+
+    /** Load the character at the position in local <code>ptr</code> into <code>L_CH</code>. */
+    private void loadChar(int ptr) {
+        mv.visitVarInsn(ALOAD, L_STATE);
+        mv.visitVarInsn(ILOAD, ptr);
+        helper("charAt", "(" + STATE + "I)I");
+        mv.visitVarInsn(ISTORE, L_CH);
+    }
+
+    /** Replace <code>L_CH</code> by its lower case, as by <code>SRE_STATE.lower</code>. */
+    private void lowerChar() {
+        mv.visitVarInsn(ILOAD, L_CH);
+        push(flags);
+        helper("lower", "(II)I");
+        mv.visitVarInsn(ISTORE, L_CH);
+    }
+
+    private void helper(String name, String descriptor) {
+        mv.visitMethodInsn(INVOKESTATIC, BASE, name, descriptor, false);
+    }
+
+    private void push(int value) {
+        if (value >= -1 && value <= 5) {
+            mv.visitInsn(ICONST_0 + value);
+        } else if (value >= Byte.MIN_VALUE && value <= Byte.MAX_VALUE) {
+            mv.visitIntInsn(BIPUSH, value);
+        } else if (value >= Short.MIN_VALUE && value <= Short.MAX_VALUE) {
+            mv.visitIntInsn(SIPUSH, value);
+        } else {
+            mv.visitLdcInsn(value);
+        }
+    }
+
+    private int newLocal() {
+        return nextLocal++;
+    }
+
+    /** Count an operation towards the limit on the size of the generated code. */
+    private void count() {
+        if (++ops > MAX_OPS) {
+            throw new Unsupported();
+        }
+    }
+}
@@ -42,6 +42,13 @@ public class PatternObject extends PyObject implements Traverseproc {
 
     private boolean isBytes;
 
+    /* the number of times used before compiling, or -1 once compilation was tried */
+    private int uses = 0;
+    /* the program compiled to bytecode (null if not, or not yet, compiled) */
+    private volatile CompiledMatcher matcher;
+    /* literals that let a search skip text, or null */
+    private final LiteralFilter filter;
+
 
     public PatternObject(PyObject pattern, int flags, long[] code,
             int groups, PyObject groupindex, PyObject indexgroup) {
@@ -52,6 +59,7 @@ public class PatternObject extends PyObject implements Traverseproc {
         this.flags   = flags;
         this.code    = code;
         this.codesize = code.length;
+        this.filter = LiteralFilter.of(code);
         this.groups  = groups;
         this.groupindex = new PyDictProxy(groupindex);
         this.indexgroup = indexgroup;
@@ -67,7 +75,7 @@ public class PatternObject extends PyObject implements Traverseproc {
         PyObject string = ap.getPyObject(0);
         int start = ap.getInt(1, 0);
         int end = ap.getInt(2, string.__len__());
-        SRE_STATE state = new SRE_STATE(string, start, end, flags);
+        SRE_STATE state = newState(string, start, end);
 
         state.ptr = state.start;
         int status = state.SRE_MATCH(code, 0, 1);
@@ -84,7 +92,7 @@ public class PatternObject extends PyObject implements Traverseproc {
         PyObject string = ap.getPyObject(0);
         int start = ap.getInt(1, 0);
         int end = ap.getInt(2, string.__len__());
-        SRE_STATE state = new SRE_STATE(string, start, end, flags);
+        SRE_STATE state = newState(string, start, end);
 
         state.ptr = state.start;
         int status = state.SRE_MATCH(code, 0, 1, true);
@@ -107,7 +115,7 @@ public class PatternObject extends PyObject implements Traverseproc {
         int start = ap.getInt(1, 0);
         int end = ap.getInt(2, string.__len__());
 
-        SRE_STATE state = new SRE_STATE(string, start, end, flags);
+        SRE_STATE state = newState(string, start, end);
 
         int status = state.SRE_SEARCH(code, 0);
 
@@ -158,7 +166,7 @@ public class PatternObject extends PyObject implements Traverseproc {
             }
         }
 
-        SRE_STATE state = new SRE_STATE(string, 0, Integer.MAX_VALUE, flags);
+        SRE_STATE state = newState(string, 0, Integer.MAX_VALUE);
 
         PyList list = new PyList();
 
@@ -244,7 +252,7 @@ public class PatternObject extends PyObject implements Traverseproc {
             }
             Py.FutureWarning("split() requires a non-empty pattern match.");
         }
-        SRE_STATE state = new SRE_STATE(string, 0, Integer.MAX_VALUE, flags);
+        SRE_STATE state = newState(string, 0, Integer.MAX_VALUE);
 
         PyList list = new PyList();
 
@@ -308,7 +316,7 @@ public class PatternObject extends PyObject implements Traverseproc {
         int start = ap.getInt(1, 0);
         int end = ap.getInt(2, Integer.MAX_VALUE);
 
-        SRE_STATE state = new SRE_STATE(string, start, end, flags);
+        SRE_STATE state = newState(string, start, end);
 
         final List<PyObject> list = new ArrayList<PyObject>();
 
@@ -366,10 +374,7 @@ public class PatternObject extends PyObject implements Traverseproc {
         PyObject string = ap.getPyObject(0);
 
         ScannerObject self = new ScannerObject();
-        self.state = new SRE_STATE(string,
-                                   ap.getInt(1, 0),
-                                   ap.getInt(2, Integer.MAX_VALUE),
-                                   flags);
+        self.state = newState(string, ap.getInt(1, 0), ap.getInt(2, Integer.MAX_VALUE));
         self.pattern = this;
         self.string = string;
         return self;
@@ -377,6 +382,24 @@ public class PatternObject extends PyObject implements Traverseproc {
 
 
 
+    /**
+     * Create the state for matching against <code>string</code>. Once the pattern has been used
+     * more than <code>python.sre.compile.threshold</code> times, its program is compiled to
+     * bytecode, and the state uses that instead of the interpreter.
+     */
+    private SRE_STATE newState(PyObject string, int start, int end) {
+        SRE_STATE state = new SRE_STATE(string, start, end, flags);
+        int threshold = Options.sreCompileThreshold;
+        if (uses >= 0 && threshold >= 0 && uses++ >= threshold) {
+            // Races here at worst compile the pattern twice
+            uses = -1;
+            matcher = MatcherCompiler.compile(code, flags);
+        }
+        state.matcher = matcher;
+        state.filter = filter;
+        return state;
+    }
+
     private void _error(int status) {
         if (status == SRE_STATE.SRE_ERROR_RECURSION_LIMIT)
             throw Py.RuntimeError("maximum recursion limit exceeded");
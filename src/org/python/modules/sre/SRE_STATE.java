@@ -21,18 +21,13 @@ import com.google.common.cache.CacheBuilder;
 import com.google.common.cache.CacheLoader;
 import com.google.common.cache.LoadingCache;
 import com.google.common.cache.Weigher;
-import org.python.core.BufferProtocol;
 import org.python.core.Options;
 import org.python.core.Py;
-import org.python.core.PyBUF;
-import org.python.core.PyBuffer;
 import org.python.core.PyBytes;
 import org.python.core.PyObject;
 import org.python.core.PySequence;
 import org.python.core.PyUnicode;
 
-import java.nio.ByteBuffer;
-
 public class SRE_STATE {
 
     /*
@@ -180,6 +175,10 @@ for line in sys.stdin:
     }
 
     final int lower(int ch) {
+        return lower(ch, flags);
+    }
+
+    static int lower(int ch, int flags) {
         if ((flags & SRE_FLAG_LOCALE) != 0)
             return ((ch) < 256 ? Character.toLowerCase(ch) : ch);
         if ((flags & SRE_FLAG_UNICODE) != 0)
@@ -329,13 +328,13 @@ for line in sys.stdin:
                 return ptr == beginning;
 
             case SRE_AT_BEGINNING_LINE:
-                return (ptr == beginning || SRE_IS_LINEBREAK(str[ptr - 1]));
+                return (ptr == beginning || SRE_IS_LINEBREAK(str.charAt(ptr - 1)));
 
             case SRE_AT_END:
-                return (ptr + 1 == end && SRE_IS_LINEBREAK(str[ptr])) || ptr == end;
+                return (ptr + 1 == end && SRE_IS_LINEBREAK(str.charAt(ptr))) || ptr == end;
 
             case SRE_AT_END_LINE:
-                return ptr == end || SRE_IS_LINEBREAK(str[ptr]);
+                return ptr == end || SRE_IS_LINEBREAK(str.charAt(ptr));
 
             case SRE_AT_END_STRING:
                 return ptr == end;
@@ -344,24 +343,24 @@ for line in sys.stdin:
             /* word boundary */
                 if (beginning == end)
                     return false;
-                thatp = (ptr > beginning) ? SRE_IS_WORD(str[ptr - 1]) : false;
-                thisp = (ptr < end) ? SRE_IS_WORD(str[ptr]) : false;
+                thatp = (ptr > beginning) ? SRE_IS_WORD(str.charAt(ptr - 1)) : false;
+                thisp = (ptr < end) ? SRE_IS_WORD(str.charAt(ptr)) : false;
                 return thisp != thatp;
 
             case SRE_AT_NON_BOUNDARY:
             /* word non-boundary */
                 if (beginning == end)
                     return false;
-                thatp = (ptr > beginning) ? SRE_IS_WORD(str[ptr - 1]) : false;
-                thisp = (ptr < end) ? SRE_IS_WORD(str[ptr]) : false;
+                thatp = (ptr > beginning) ? SRE_IS_WORD(str.charAt(ptr - 1)) : false;
+                thisp = (ptr < end) ? SRE_IS_WORD(str.charAt(ptr)) : false;
                 return thisp == thatp;
 
             case SRE_AT_LOC_BOUNDARY:
             case SRE_AT_UNI_BOUNDARY:
                 if (beginning == end)
                     return false;
-                thatp = (ptr > beginning) ? SRE_LOC_IS_WORD(str[ptr - 1]) : false;
-                thisp = (ptr < end) ? SRE_LOC_IS_WORD(str[ptr]) : false;
+                thatp = (ptr > beginning) ? SRE_LOC_IS_WORD(str.charAt(ptr - 1)) : false;
+                thisp = (ptr < end) ? SRE_LOC_IS_WORD(str.charAt(ptr)) : false;
                 return thisp != thatp;
 
             case SRE_AT_LOC_NON_BOUNDARY:
@@ -369,8 +368,8 @@ for line in sys.stdin:
             /* word non-boundary */
                 if (beginning == end)
                     return false;
-                thatp = (ptr > beginning) ? SRE_LOC_IS_WORD(str[ptr - 1]) : false;
-                thisp = (ptr < end) ? SRE_LOC_IS_WORD(str[ptr]) : false;
+                thatp = (ptr > beginning) ? SRE_LOC_IS_WORD(str.charAt(ptr - 1)) : false;
+                thisp = (ptr < end) ? SRE_LOC_IS_WORD(str.charAt(ptr)) : false;
                 return thisp == thatp;
         }
 
@@ -480,14 +479,14 @@ for line in sys.stdin:
             case SRE_OP_IN:
             /* repeated set */
 //            TRACE(pidx, ptr, "COUNT IN");
-                while (ptr < end && SRE_CHARSET(pattern, pidx + 2, str[ptr]))
+                while (ptr < end && SRE_CHARSET(pattern, pidx + 2, str.charAt(ptr)))
                     ptr++;
                 break;
 
             case SRE_OP_ANY:
             /* repeated dot wildcard. */
 //            TRACE(pidx, ptr, "COUNT ANY");
-                while (ptr < end && !SRE_IS_LINEBREAK(str[ptr]))
+                while (ptr < end && !SRE_IS_LINEBREAK(str.charAt(ptr)))
                     ptr++;
                 break;
 
@@ -502,7 +501,7 @@ for line in sys.stdin:
             /* repeated literal */
                 chr = (int) pattern[pidx + 1];
 //            TRACE(pidx, ptr, "COUNT LITERAL " + chr);
-                while (ptr < end && str[ptr] == chr)
+                while (ptr < end && str.charAt(ptr) == chr)
                     ptr++;
                 break;
 
@@ -510,7 +509,7 @@ for line in sys.stdin:
             /* repeated literal */
                 chr = (int) pattern[pidx + 1];
 //            TRACE(pidx, ptr, "COUNT LITERAL_IGNORE " + chr);
-                while (ptr < end && lower(str[ptr]) == chr)
+                while (ptr < end && lower(str.charAt(ptr)) == chr)
                     ptr++;
                 break;
 
@@ -518,7 +517,7 @@ for line in sys.stdin:
             /* repeated non-literal */
                 chr = (int) pattern[pidx + 1];
 //            TRACE(pidx, ptr, "COUNT NOT_LITERAL " + chr);
-                while (ptr < end && str[ptr] != chr)
+                while (ptr < end && str.charAt(ptr) != chr)
                     ptr++;
                 break;
 
@@ -526,7 +525,7 @@ for line in sys.stdin:
             /* repeated non-literal */
                 chr = (int) pattern[pidx + 1];
 //            TRACE(pidx, ptr, "COUNT NOT_LITERAL_IGNORE " + chr);
-                while (ptr < end && lower(str[ptr]) != chr)
+                while (ptr < end && lower(str.charAt(ptr)) != chr)
                     ptr++;
                 break;
 
@@ -563,6 +562,11 @@ for line in sys.stdin:
 
 //        TRACE(pidx, ptr, "ENTER " + level);
 
+        if (matcher != null && pidx == 0 && level == 1) {
+            /* the whole program, which has been compiled */
+            return matcher.match(this, fullmatch);
+        }
+
         if (level > USE_RECURSION_LIMIT)
             return SRE_ERROR_RECURSION_LIMIT;
 
@@ -584,18 +588,7 @@ for line in sys.stdin:
                 /* set mark */
                 /* <MARK> <gid> */
 //                TRACE(pidx, ptr, "MARK " + pattern[pidx]);
-                    i = (int) pattern[pidx];
-                    if ((i & 1) != 0)
-                        this.lastindex = i / 2 + 1;
-                    if (i > this.lastmark)
-                        this.lastmark = i;
-                    // auto scale
-                    if (i >= mark.length) {
-                        int[] tmp = mark;
-                        mark = new int[mark.length * 2];
-                        System.arraycopy(tmp, 0, mark, 0, tmp.length);
-                    }
-                    mark[i] = ptr;
+                    MARK((int) pattern[pidx], ptr);
                     pidx++;
                     break;
 
@@ -604,7 +597,7 @@ for line in sys.stdin:
                 /* <LITERAL> <code> */
 //                TRACE(pidx, ptr, "LITERAL " + pattern[pidx]);
 
-                    if (ptr >= end || str[ptr] != pattern[pidx])
+                    if (ptr >= end || str.charAt(ptr) != pattern[pidx])
                         return 0;
                     pidx++;
                     ptr++;
@@ -614,7 +607,7 @@ for line in sys.stdin:
                 /* match anything that is not literal character */
                 /* args: <code> */
 //                TRACE(pidx, ptr, "NOT_LITERAL " + pattern[pidx]);
-                    if (ptr >= end || str[ptr] == pattern[pidx])
+                    if (ptr >= end || str.charAt(ptr) == pattern[pidx])
                         return 0;
                     pidx++;
                     ptr++;
@@ -642,7 +635,7 @@ for line in sys.stdin:
                 /* <CATEGORY> <code> */
 //                TRACE(pidx, ptr, "CATEGORY " + pattern[pidx]);
 
-                    if (ptr >= end || !sre_category((int) pattern[pidx], str[ptr]))
+                    if (ptr >= end || !sre_category((int) pattern[pidx], str.charAt(ptr)))
                         return 0;
 
                     pidx++;
@@ -652,7 +645,7 @@ for line in sys.stdin:
                 case SRE_OP_ANY:
                 /* match anything */
 //                TRACE(pidx, ptr, "ANY");
-                    if (ptr >= end || SRE_IS_LINEBREAK(str[ptr]))
+                    if (ptr >= end || SRE_IS_LINEBREAK(str.charAt(ptr)))
                         return 0;
                     ptr++;
                     break;
@@ -670,7 +663,7 @@ for line in sys.stdin:
                 /* match set member (or non_member) */
                 /* <IN> <skip> <set> */
 //                TRACE(pidx, ptr, "IN");
-                    if (ptr >= end || !SRE_CHARSET(pattern, pidx + 1, str[ptr]))
+                    if (ptr >= end || !SRE_CHARSET(pattern, pidx + 1, str.charAt(ptr)))
                         return 0;
                     pidx += pattern[pidx];
                     ptr++;
@@ -678,7 +671,7 @@ for line in sys.stdin:
 
                 case SRE_OP_LITERAL_IGNORE:
 //                TRACE(pidx, ptr, "LITERAL_IGNORE " + pattern[pidx]);
-                    if (ptr >= end || lower(str[ptr]) != lower((int)pattern[pidx]))
+                    if (ptr >= end || lower(str.charAt(ptr)) != lower((int)pattern[pidx]))
                         return 0;
                     pidx++;
                     ptr++;
@@ -686,7 +679,7 @@ for line in sys.stdin:
 
                 case SRE_OP_NOT_LITERAL_IGNORE:
 //                TRACE(pidx, ptr, "NOT_LITERAL_IGNORE " + pattern[pidx]);
-                    if (ptr >= end || lower(str[ptr]) == lower((int) pattern[pidx]))
+                    if (ptr >= end || lower(str.charAt(ptr)) == lower((int) pattern[pidx]))
                         return 0;
                     pidx++;
                     ptr++;
@@ -695,7 +688,7 @@ for line in sys.stdin:
                 case SRE_OP_IN_IGNORE:
 //                TRACE(pidx, ptr, "IN_IGNORE");
                     if (ptr >= end ||
-                            !SRE_CHARSET(pattern, pidx + 1, lower(str[ptr])))
+                            !SRE_CHARSET(pattern, pidx + 1, lower(str.charAt(ptr))))
                         return 0;
                     pidx += pattern[pidx];
                     ptr++;
@@ -721,12 +714,12 @@ for line in sys.stdin:
                     }
                     for (; pattern[pidx] != 0; pidx += pattern[pidx]) {
                         if (pattern[pidx + 1] == SRE_OP_LITERAL
-                                && (ptr >= end || str[ptr] != pattern[pidx + 2]))
+                                && (ptr >= end || str.charAt(ptr) != pattern[pidx + 2]))
                             continue;
                         if (pattern[pidx + 1] == SRE_OP_IN
                                 && (ptr >= end || !SRE_CHARSET(pattern,
                                 pidx + 3,
-                                str[ptr])))
+                                str.charAt(ptr))))
                             continue;
                         this.ptr = ptr;
                         i = SRE_MATCH(pattern, pidx + 1, level + 1, fullmatch);
@@ -789,7 +782,7 @@ for line in sys.stdin:
                         chr = (int) pattern[pidx + (int) pattern[pidx] + 1];
                         for (; ; ) {
                             while (count >= mincount &&
-                                    (ptr >= end || str[ptr] != chr)) {
+                                    (ptr >= end || str.charAt(ptr) != chr)) {
                                 ptr--;
                                 count--;
                             }
@@ -1037,7 +1030,7 @@ for line in sys.stdin:
                     if (p == -1 || e == -1 || e < p)
                         return 0;
                     while (p < e) {
-                        if (ptr >= end || str[ptr] != str[p])
+                        if (ptr >= end || str.charAt(ptr) != str.charAt(p))
                             return 0;
                         p++;
                         ptr++;
@@ -1054,7 +1047,7 @@ for line in sys.stdin:
                     if (p == -1 || e == -1 || e < p)
                         return 0;
                     while (p < e) {
-                        if (ptr >= end || lower(str[ptr]) != lower(str[p]))
+                        if (ptr >= end || lower(str.charAt(ptr)) != lower(str.charAt(p)))
                             return 0;
                         p++;
                         ptr++;
@@ -1119,7 +1112,21 @@ for line in sys.stdin:
         /* return SRE_ERROR_ILLEGAL; -- see python-dev discussion */
     }
 
-    private void LASTMARK_RESTORE(int lastmark, int lastindex) {
+    final void MARK(int i, int ptr) {
+        if ((i & 1) != 0)
+            this.lastindex = i / 2 + 1;
+        if (i > this.lastmark)
+            this.lastmark = i;
+        // auto scale
+        if (i >= mark.length) {
+            int[] tmp = mark;
+            mark = new int[mark.length * 2];
+            System.arraycopy(tmp, 0, mark, 0, tmp.length);
+        }
+        mark[i] = ptr;
+    }
+
+    final void LASTMARK_RESTORE(int lastmark, int lastindex) {
         if (this.lastmark > lastmark) {
             while (this.lastmark > lastmark)
                 mark[this.lastmark--] = -1;
@@ -1127,6 +1134,19 @@ for line in sys.stdin:
         }
     }
 
+    /**
+     * Match at <code>this.start</code> during a search: by the compiled program if there is
+     * one, or else by interpreting from <code>pidx</code> (with <code>this.ptr</code> set to
+     * match).
+     */
+    private int SRE_MATCH_START(long[] pattern, int pidx) {
+        if (matcher != null) {
+            this.ptr = this.start;
+            return matcher.match(this, false);
+        }
+        return SRE_MATCH(pattern, pidx, 1);
+    }
+
     int SRE_SEARCH(long[] pattern, int pidx) {
         int ptr = this.start;
         int end = this.end;
@@ -1168,6 +1188,30 @@ for line in sys.stdin:
             pidx += 1 + pattern[pidx + 1];
         }
 
+        if (filter != null && filter.required != null
+                && str.indexOf(filter.required, ptr, this.end) < 0) {
+            /* a literal that every match contains does not occur */
+            return 0;
+        }
+
+        if (prefix_len > 1 && filter != null && filter.prefix != null) {
+            /* pattern starts with a known prefix.  find each occurrence
+               directly (by String.indexOf where possible) */
+            end = this.end;
+            for (; ; ) {
+                int found = str.indexOf(filter.prefix, ptr, end);
+                if (found < 0)
+                    return 0;
+                this.start = found;
+                this.ptr = found + prefix_skip;
+                if ((flags & SRE_INFO_LITERAL) != 0)
+                    return 1; /* we got all of it */
+                status = SRE_MATCH_START(pattern, pidx + 2 * prefix_skip);
+                if (status != 0)
+                    return status;
+                ptr = found + 1;
+            }
+        }
 
         if (prefix_len > 1) {
             /* pattern starts with a known prefix.  use the overlap
@@ -1176,7 +1220,7 @@ for line in sys.stdin:
             end = this.end;
             while (ptr < end) {
                 for (; ; ) {
-                    if (str[ptr] != pattern[prefix + i]) {
+                    if (str.charAt(ptr) != pattern[prefix + i]) {
                         if (i == 0)
                             break;
                         else
@@ -1189,8 +1233,7 @@ for line in sys.stdin:
                             this.ptr = ptr + 1 - prefix_len + prefix_skip;
                             if ((flags & SRE_INFO_LITERAL) != 0)
                                 return 1; /* we got all of it */
-                            status = SRE_MATCH(pattern,
-                                    pidx + 2 * prefix_skip, 1);
+                            status = SRE_MATCH_START(pattern, pidx + 2 * prefix_skip);
                             if (status != 0)
                                 return status;
                             /* close but no cigar -- try again */
@@ -1205,21 +1248,35 @@ for line in sys.stdin:
             return 0;
         }
 
+        if (filter != null && filter.alternatives != null) {
+            /* pattern is a branch of literals.  find the next place one
+               of them starts */
+            for (; ; ) {
+                int found = filter.alternatives.find(str, ptr, this.end);
+                if (found < 0 || found > end)
+                    return 0;
+                this.start = this.ptr = found;
+                status = SRE_MATCH_START(pattern, pidx);
+                if (status != 0)
+                    return status;
+                ptr = found + 1;
+            }
+        }
+
         if (pattern[pidx] == SRE_OP_LITERAL) {
             /* pattern starts with a literal */
             int chr = (int) pattern[pidx + 1];
             end = this.end;
             for (; ; ) {
-                while (ptr < end && str[ptr] != chr)
-                    ptr++;
-                if (ptr == end)
+                ptr = str.indexOf(chr, ptr, end);
+                if (ptr < 0)
                     return 0;
 //                TRACE(pidx, ptr, "SEARCH LITERAL");
                 this.start = ptr;
                 this.ptr = ++ptr;
                 if ((flags & SRE_INFO_LITERAL) != 0)
                     return 1;
-                status = SRE_MATCH(pattern, pidx + 2, 1);
+                status = SRE_MATCH_START(pattern, pidx + 2);
                 if (status != 0)
                     break;
             }
@@ -1228,14 +1285,14 @@ for line in sys.stdin:
             /* pattern starts with a character from a known set */
             end = this.end;
             for (; ; ) {
-                while (ptr < end && !SRE_CHARSET(pattern, charset, str[ptr]))
+                while (ptr < end && !SRE_CHARSET(pattern, charset, str.charAt(ptr)))
                     ptr++;
                 if (ptr == end)
                     return 0;
 //                TRACE(pidx, ptr, "SEARCH CHARSET");
                 this.start = ptr;
                 this.ptr = ptr;
-                status = SRE_MATCH(pattern, pidx, 1);
+                status = SRE_MATCH_START(pattern, pidx);
                 if (status != 0)
                     break;
                 ptr++;
@@ -1243,10 +1300,18 @@ for line in sys.stdin:
 
         } else {
             /* general case */
+            int required = -1;
             while (ptr <= end) {
+                if (filter != null && filter.required != null && ptr > required) {
+                    /* no match can start after the last occurrence of the
+                       required literal */
+                    required = str.indexOf(filter.required, ptr, this.end);
+                    if (required < 0)
+                        break;
+                }
 //                TRACE(pidx, ptr, "SEARCH");
                 this.start = this.ptr = ptr++;
-                status = SRE_MATCH(pattern, pidx, 1);
+                status = SRE_MATCH_START(pattern, pidx);
                 if (status != 0)
                     break;
             }
@@ -1264,7 +1329,7 @@ for line in sys.stdin:
 
     boolean isBytes;
     /* attributes for the match object */
-    int[] str;
+    SRE_SUBJECT str;
     int pos;
     int endpos;
 
@@ -1291,29 +1356,25 @@ for line in sys.stdin:
     /* duplicated from the PatternObject */
     int flags;
 
+    /* the pattern compiled to bytecode, if it has been (see PatternObject) */
+    CompiledMatcher matcher;
+
+    /* literals from the pattern that speed up the search (see PatternObject) */
+    LiteralFilter filter;
+
+    /**
+     * Code points of the <code>str</code> objects that contain surrogate pairs, and so cannot be
+     * matched in place. Other subjects are read directly (see {@link SRE_SUBJECT}).
+     */
     private enum CACHE {
         INSTANCE(Options.sreCacheSpec);
-        private LoadingCache<PyObject, int[]> cache;
+        private LoadingCache<PyUnicode, int[]> cache;
 
         private CACHE(String spec) {
-            CacheLoader<PyObject, int[]> loader = new CacheLoader<PyObject, int[]>() {
+            CacheLoader<PyUnicode, int[]> loader = new CacheLoader<PyUnicode, int[]>() {
                 @Override
-                public int[] load(PyObject key) {
-                    if (key instanceof PyBytes) {
-                        return ((PyBytes) key).toCodePoints();
-                    } else if (key instanceof PyUnicode) {
-                        return ((PyUnicode) key).toCodePoints();
-                    } else if (key instanceof BufferProtocol){
-                        try (PyBuffer pyBuffer = ((BufferProtocol) key).getBuffer(PyBUF.SIMPLE)) {
-                            ByteBuffer buf = pyBuffer.getNIOByteBuffer();
-                            int[] codepoints = new int[buf.limit() - buf.position()];
-                            for (int i = buf.position(), j = 0; i < buf.limit(); i++) {
-                                codepoints[j++] = buf.get(i) & 0xFF;
-                            }
-                            return codepoints;
-                        }
-                    }
-                    throw Py.TypeError("expected string or bytes-like object");
+                public int[] load(PyUnicode key) {
+                    return key.toCodePoints();
                 }
             };
 
@@ -1330,9 +1391,9 @@ for line in sys.stdin:
             }
 
             if (spec.contains("maximumWeight")) {
-                cache = builder.weigher(new Weigher<PyObject, int[]>() {
+                cache = builder.weigher(new Weigher<PyUnicode, int[]>() {
                     @Override
-                    public int weigh(PyObject k, int[] v) {
+                    public int weigh(PyUnicode k, int[] v) {
                         return v.length;
                     }
                 }).build(loader);
@@ -1341,13 +1402,18 @@ for line in sys.stdin:
             }
         }
 
-        private int[] get(PyObject str) {
+        private int[] get(PyUnicode str) {
             return cache.getUnchecked(str);
         }
     }
 
+    /** The code points of a <code>str</code> containing surrogate pairs, from the cache. */
+    static int[] toCodePoints(PyUnicode str) {
+        return CACHE.INSTANCE.get(str);
+    }
+
     public SRE_STATE(PyObject str, int start, int end, int flags) {
-        this.str = CACHE.INSTANCE.get(str);
+        this.str = SRE_SUBJECT.of(str);
         this.isBytes = !(str instanceof PyUnicode);
         int size = str.__len__();
 
@@ -1402,9 +1468,7 @@ for line in sys.stdin:
         if (string instanceof PyUnicode || string instanceof PyBytes) {
             return ((PySequence) string).getslice(i, j);
         } else {
-            int[] buf = new int[j - i];
-            System.arraycopy(str, i, buf, 0, buf.length);
-            return new PyBytes(buf);
+            return new PyBytes(str.codePoints(i, j));
         }
     }
 
@@ -0,0 +1,168 @@
+/* Copyright (c) Jython Developers */
+package org.python.modules.sre;
+
+import java.nio.ByteBuffer;
+
+import org.python.core.BufferProtocol;
+import org.python.core.Py;
+import org.python.core.PyBUF;
+import org.python.core.PyBuffer;
+import org.python.core.PyBytes;
+import org.python.core.PyObject;
+import org.python.core.PyUnicode;
+
+/**
+ * The string being matched, as seen by the engine in {@link SRE_STATE}: a sequence of code points
+ * (or of byte values) read in place from the Python object wherever possible.
+ * <p>
+ * A <code>bytes</code> object, or a <code>str</code> with only BMP characters, is read directly
+ * from its Java <code>String</code>, and any other object with the buffer protocol through its
+ * bytes. Only a <code>str</code> containing surrogate pairs needs the code points copied out to
+ * an <code>int[]</code>, which is then cached (see {@link SRE_STATE}).
+ */
+abstract class SRE_SUBJECT {
+
+    /** The code point (or byte value) at index <code>i</code>. */
+    abstract int charAt(int i);
+
+    /** Code points <code>[i, j)</code>, for building a slice of a buffer as <code>bytes</code>. */
+    int[] codePoints(int i, int j) {
+        int[] buf = new int[j - i];
+        for (int k = 0; k < buf.length; k++) {
+            buf[k] = charAt(i + k);
+        }
+        return buf;
+    }
+
+    /**
+     * The first index at or after <code>from</code> of the character <code>ch</code>, before
+     * <code>end</code>, or -1 if there is none.
+     */
+    int indexOf(int ch, int from, int end) {
+        for (int i = from; i < end; i++) {
+            if (charAt(i) == ch) {
+                return i;
+            }
+        }
+        return -1;
+    }
+
+    /**
+     * The first index at or after <code>from</code> of an occurrence of <code>literal</code>
+     * that ends by <code>end</code>, or -1 if there is none.
+     */
+    int indexOf(LiteralFilter.Literal literal, int from, int end) {
+        int[] cp = literal.codePoints;
+        int n = cp.length;
+        int first = cp[0];
+        for (int i = from, last = end - n; i <= last; i++) {
+            if (charAt(i) == first) {
+                int j = 1;
+                while (j < n && charAt(i + j) == cp[j]) {
+                    j++;
+                }
+                if (j == n) {
+                    return i;
+                }
+            }
+        }
+        return -1;
+    }
+
+    /**
+     * Choose the way to read <code>str</code>.
+     *
+     * @param str a <code>str</code>, <code>bytes</code> or bytes-like object
+     */
+    static SRE_SUBJECT of(PyObject str) {
+        if (str instanceof PyUnicode) {
+            PyUnicode u = (PyUnicode) str;
+            if (u.isBasicPlane()) {
+                return new CharSubject(u.getString());
+            }
+            return new CodePointSubject(SRE_STATE.toCodePoints(u));
+        } else if (str instanceof PyBytes) {
+            // Each char of a bytes object holds one byte value
+            return new CharSubject(((PyBytes) str).getString());
+        } else if (str instanceof BufferProtocol) {
+            /*
+             * The view of the storage stays readable once the buffer is released, and releasing
+             * it at once means a bytearray is not left locked against resizing after the match.
+             */
+            try (PyBuffer pyBuffer = ((BufferProtocol) str).getBuffer(PyBUF.SIMPLE)) {
+                return new ByteSubject(pyBuffer.getNIOByteBuffer());
+            }
+        }
+        throw Py.TypeError("expected string or bytes-like object");
+    }
+
+    /** A <code>String</code> whose chars are the code points (BMP <code>str</code>, or bytes). */
+    static final class CharSubject extends SRE_SUBJECT {
+
+        private final String s;
+
+        CharSubject(String s) {
+            this.s = s;
+        }
+
+        @Override
+        int charAt(int i) {
+            return s.charAt(i);
+        }
+
+        @Override
+        int indexOf(int ch, int from, int end) {
+            int i = s.indexOf(ch, from);
+            return i < end ? i : -1;
+        }
+
+        @Override
+        int indexOf(LiteralFilter.Literal literal, int from, int end) {
+            if (literal.string == null) {
+                // Supplementary characters cannot occur in a BMP-only str, or in bytes
+                return -1;
+            }
+            int i = s.indexOf(literal.string, from);
+            return i >= 0 && i + literal.string.length() <= end ? i : -1;
+        }
+    }
+
+    /** Bytes in a buffer, read as unsigned values. */
+    static final class ByteSubject extends SRE_SUBJECT {
+
+        private final ByteBuffer buf;
+        private final int offset;
+
+        ByteSubject(ByteBuffer buf) {
+            this.buf = buf;
+            this.offset = buf.position();
+        }
+
+        @Override
+        int charAt(int i) {
+            return buf.get(offset + i) & 0xFF;
+        }
+    }
+
+    /** Code points copied out of a <code>str</code> that contains surrogate pairs. */
+    static final class CodePointSubject extends SRE_SUBJECT {
+
+        private final int[] codePoints;
+
+        CodePointSubject(int[] codePoints) {
+            this.codePoints = codePoints;
+        }
+
+        @Override
+        int charAt(int i) {
+            return codePoints[i];
+        }
+
+        @Override
+        int[] codePoints(int i, int j) {
+            int[] buf = new int[j - i];
+            System.arraycopy(codePoints, i, buf, 0, buf.length);
+            return buf;
+        }
+    }
+}
@@ -8,7 +8,10 @@
 
 package org.python.modules;
 
+import org.python.core.BufferProtocol;
 import org.python.core.Py;
+import org.python.core.PyBUF;
+import org.python.core.PyBuffer;
 import org.python.core.PyBytes;
 import org.python.core.PyException;
 import org.python.core.PyFloat;
@@ -413,6 +416,19 @@ public class struct implements ClassDictInit {
 //            System.out.println("s.length()=" + s.length() + ",offset=" + offset + ",size=" + size + ",data=" + Arrays.toString(data));
         }
 
+        /**
+         * Read <code>size</code> bytes at <code>offset</code> in a buffer, copying only those
+         * (not the whole of the exporter's data, which may be a large mapped file).
+         */
+        ByteStream(PyBuffer buf, int offset, int size) {
+            data = new char[size];
+            for (int i = 0; i < size; i++) {
+                data[i] = (char)(buf.byteAt(offset + i) & 0xFF);
+            }
+            len = size;
+            pos = 0;
+        }
+
         int readByte() {
             return data[pos++] & 0xFF;
         }
@@ -1112,6 +1128,32 @@ public class struct implements ClassDictInit {
             throw StructError("unpack_from str size does not match format");
         return unpack(f, size, format, new ByteStream(string, offset));
     }
+
+    public static PyTuple unpack_from(String format, PyObject buffer) {
+        return unpack_from(format, buffer, 0);
+    }
+
+    /**
+     * Unpack from an object supporting the buffer protocol (such as an <code>mmap</code> or a
+     * <code>bytearray</code>), reading only the bytes the format needs.
+     */
+    public static PyTuple unpack_from(String format, PyObject buffer, int offset) {
+        FormatDef[] f = whichtable(format);
+        int size = calcsize(format, f);
+        return unpack_from(f, size, format, buffer, offset);
+    }
+
+    static PyTuple unpack_from(FormatDef[] f, int size, String format, PyObject buffer,
+            int offset) {
+        if (!(buffer instanceof BufferProtocol)) {
+            throw Py.TypeError("unpack_from requires a buffer argument");
+        }
+        try (PyBuffer buf = ((BufferProtocol)buffer).getBuffer(PyBUF.FULL_RO)) {
+            if (offset < 0 || size > buf.getLen() - offset)
+                throw StructError("unpack_from requires a buffer of at least " + size + " bytes");
+            return unpack(f, size, format, new ByteStream(buf, offset, size));
+        }
+    }
     
     static PyTuple unpack(FormatDef[] f, int size, String format, ByteStream str) {
         PyList res = new PyList();
@@ -320,6 +320,14 @@ public class PythonInterpreter implements AutoCloseable, Closeable {
         return Py.compile_flags(node, filename, CompileMode.eval, cflags);
     }
 
+    /**
+     * The compiler flags applied to source compiled by this interpreter (which may change as
+     * <code>from __future__</code> imports are executed).
+     */
+    public CompilerFlags getCompilerFlags() {
+        return cflags;
+    }
+
     public PyObject getLocals() {
         if (!useThreadLocalState) {
             return globals;
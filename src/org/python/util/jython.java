@@ -64,6 +64,7 @@ public class jython {
             + "-s       : don't add user site directory to sys.path;\n"
             // + "also PYTHONNOUSERSITE\n"
             + "-S       : don't imply 'import site' on initialization\n"
+            + "--snapshot : import the library from the precompiled startup archive\n"
             // + "-t       : issue warnings about inconsistent tab usage (-tt: issue errors)\n"
             + "-u       : unbuffered binary stdout and stderr\n"
             // + "(also PYTHONUNBUFFERED=x)\n"
@@ -587,6 +588,10 @@ class CommandLineOptions {
                 Options.importSite = false;
             } else if (arg.equals("-B")) {
                 Options.dont_write_bytecode = true;
+            } else if (arg.equals("--snapshot")) {
+                if (Options.startupArchive == null) {
+                    Options.startupArchive = Options.startupArchiveDefault;
+                }
             } else if (arg.startsWith("-c")) {
                 runCommand = true;
                 if (arg.length() > 2) {
@@ -32,6 +32,7 @@ def parse_launcher_args(args):
     parsed.help = False
     parsed.print_requested = False
     parsed.profile = False
+    parsed.snapshot = False
     parsed.jdb = None
 
     it = iter(args)
@@ -69,7 +70,7 @@ def parse_launcher_args(args):
             i += 1
         elif arg in ("-h", "--help"):
             parsed.help = True
-        elif arg in ("--boot", "--jdb", "--profile"):
+        elif arg in ("--boot", "--jdb", "--profile", "--snapshot"):
             setattr(parsed, arg[2:], True)
             i += 1
         elif arg == "--":
@@ -214,6 +215,10 @@ setting {envvar_specifier}JYTHON_HOME.""".format(
     def java_opts(self):
         return [self.java_mem, self.java_stack]
         
+    @property
+    def java_shared_archive(self):
+        return os.path.join(self.jython_home, "jython.jsa")
+
     @property
     def java_profile_agent(self):
         return os.path.join(self.jython_home, "javalib", "profile.jar")
@@ -273,11 +278,16 @@ setting {envvar_specifier}JYTHON_HOME.""".format(
         if self.args.profile:
             args.append("-XX:-UseSplitVerifier")
             args.append("-javaagent:%s" % self.convert_path(self.java_profile_agent))
+        if self.args.snapshot and os.path.exists(self.java_shared_archive):
+            args.append("-Xshare:auto")
+            args.append("-XX:SharedArchiveFile=%s" % self.convert_path(self.java_shared_archive))
         for k, v in self.args.properties.iteritems():
             args.append("-D%s=%s" % (self.convert(k), self.convert(v)))
         args.append("org.python.util.jython")
         if self.args.help:
             args.append("--help")
+        if self.args.snapshot:
+            args.append("--snapshot")
         args.extend(self.jython_args)
         return args
 
@@ -301,6 +311,7 @@ Jython launcher-specific options:
 --jdb    : run under JDB java debugger
 --print  : print the Java command with args for launching Jython instead of executing it
 --profile: run with the Java Interactive Profiler (http://jiprof.sf.net)
+--snapshot: start from the precompiled library and class data archive, if built
 --       : pass remaining arguments through to Jython
 Jython launcher environment variables:
 JAVA_MEM   : Java memory (sets via -Xmx)
@@ -0,0 +1,57 @@
+package org.python.core;
+
+import java.io.ByteArrayInputStream;
+
+import junit.framework.TestCase;
+
+import org.python.Version;
+
+public class BytecodeLoaderTest extends TestCase {
+
+    private boolean sharedModuleLoader;
+
+    @Override
+    protected void setUp() throws Exception {
+        PySystemState.initialize();
+        sharedModuleLoader = Options.sharedModuleLoader;
+    }
+
+    @Override
+    protected void tearDown() throws Exception {
+        Options.sharedModuleLoader = sharedModuleLoader;
+    }
+
+    private static PyCode compileModule(String name) {
+        byte[] bytes = imp.compileSource(name,
+                new ByteArrayInputStream("x = 1\n".getBytes()), name + ".py");
+        return BytecodeLoader.makeCode(name + Version.PY_CACHE_TAG, bytes, name + ".py");
+    }
+
+    private static ClassLoader loaderOf(PyCode code) {
+        return ((PyTableCode) code).funcs.getClass().getClassLoader();
+    }
+
+    public void testModulesShareLoader() {
+        Options.sharedModuleLoader = true;
+        ClassLoader a = loaderOf(compileModule("bytecodeloadertest_a"));
+        ClassLoader b = loaderOf(compileModule("bytecodeloadertest_b"));
+        assertSame(a, b);
+        assertSame(Py.getSystemState().getModuleLoader(), a);
+    }
+
+    public void testReloadedModuleGetsOwnLoader() {
+        Options.sharedModuleLoader = true;
+        PyCode first = compileModule("bytecodeloadertest_c");
+        PyCode second = compileModule("bytecodeloadertest_c");
+        assertNotSame(loaderOf(first), loaderOf(second));
+        assertNotSame(((PyTableCode) first).funcs.getClass(),
+                ((PyTableCode) second).funcs.getClass());
+    }
+
+    public void testSharingDisabled() {
+        Options.sharedModuleLoader = false;
+        ClassLoader a = loaderOf(compileModule("bytecodeloadertest_d"));
+        ClassLoader b = loaderOf(compileModule("bytecodeloadertest_e"));
+        assertNotSame(a, b);
+    }
+}
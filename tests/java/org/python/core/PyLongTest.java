@@ -0,0 +1,78 @@
+package org.python.core;
+
+import java.math.BigInteger;
+
+import junit.framework.TestCase;
+
+/**
+ * Tests for the primitive and BigInteger representations of PyLong.
+ */
+public class PyLongTest extends TestCase {
+
+    private static final BigInteger BIG_MAX = BigInteger.valueOf(Long.MAX_VALUE);
+
+    private static final BigInteger BIG_MIN = BigInteger.valueOf(Long.MIN_VALUE);
+
+    private static BigInteger big(PyObject o) {
+        return ((PyLong)o).getValue();
+    }
+
+    public void testSmallValuesAreShared() {
+        assertSame(Py.newInteger(-5), Py.newInteger(-5));
+        assertSame(Py.newInteger(1024), Py.newLong(1024L));
+        assertNotSame(Py.newInteger(1025), Py.newInteger(1025));
+        assertSame(Py.newInteger(7), Py.newLong(BigInteger.valueOf(7)));
+    }
+
+    public void testAddOverflowPromotes() {
+        PyObject r = Py.newLong(Long.MAX_VALUE).__add__(Py.newInteger(1));
+        assertEquals(BIG_MAX.add(BigInteger.ONE), big(r));
+        r = Py.newLong(Long.MIN_VALUE).__sub__(Py.newInteger(1));
+        assertEquals(BIG_MIN.subtract(BigInteger.ONE), big(r));
+        r = Py.newLong(Long.MAX_VALUE).__mul__(Py.newInteger(3));
+        assertEquals(BIG_MAX.multiply(BigInteger.valueOf(3)), big(r));
+    }
+
+    public void testLargeResultsDemote() {
+        PyObject r = Py.newLong(BIG_MAX.add(BigInteger.ONE)).__sub__(Py.newInteger(1));
+        assertEquals(Long.MAX_VALUE, r.asLong());
+        assertEquals(Py.newLong(Long.MAX_VALUE).hashCode(), r.hashCode());
+    }
+
+    public void testFloorDivisionAndModulo() {
+        assertEquals(-4, Py.newInteger(-7).__floordiv__(Py.newInteger(2)).asInt());
+        assertEquals(1, Py.newInteger(-7).__mod__(Py.newInteger(2)).asInt());
+        assertEquals(-1, Py.newInteger(7).__mod__(Py.newInteger(-2)).asInt());
+        PyObject r = Py.newLong(Long.MIN_VALUE).__floordiv__(Py.newInteger(-1));
+        assertEquals(BIG_MIN.negate(), big(r));
+    }
+
+    public void testPowAndShifts() {
+        assertEquals(1024, Py.newInteger(2).__pow__(Py.newInteger(10)).asInt());
+        assertEquals(BigInteger.valueOf(3).pow(50), big(Py.newInteger(3).__pow__(Py.newInteger(50))));
+        assertEquals(BigInteger.ONE.shiftLeft(70), big(Py.newInteger(1).__lshift__(Py.newInteger(70))));
+        assertEquals(-1, Py.newInteger(-5).__rshift__(Py.newInteger(100)).asInt());
+    }
+
+    public void testHashMatchesBigInteger() {
+        long[] values = {0, 1, -1, 42, Integer.MAX_VALUE, Integer.MIN_VALUE, 1L << 32,
+                -(1L << 40) + 17, Long.MAX_VALUE, Long.MIN_VALUE};
+        for (long v : values) {
+            assertEquals(BigInteger.valueOf(v).hashCode(), Py.newLong(v).hashCode());
+        }
+    }
+
+    public void testCompare() {
+        assertTrue(Py.newInteger(3).__lt__(Py.newInteger(4)).__bool__());
+        assertTrue(Py.newLong(Long.MAX_VALUE).__lt__(Py.newLong(BIG_MAX.add(BigInteger.ONE)))
+                .__bool__());
+        assertTrue(Py.newInteger(5).__eq__(Py.newLong(BigInteger.valueOf(5))).__bool__());
+    }
+
+    public void testBitLength() {
+        assertEquals(0, Py.newInteger(0).bit_length());
+        assertEquals(3, Py.newInteger(-7).bit_length());
+        assertEquals(64, Py.newLong(Long.MIN_VALUE).bit_length());
+        assertEquals(65, Py.newLong(BIG_MIN.subtract(BigInteger.ONE)).bit_length());
+    }
+}
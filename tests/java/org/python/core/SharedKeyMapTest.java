@@ -0,0 +1,155 @@
+package org.python.core;
+
+import java.util.Iterator;
+import java.util.Map;
+
+import junit.framework.TestCase;
+
+/**
+ * Tests for the shared-key tables of instance dicts.
+ */
+public class SharedKeyMapTest extends TestCase {
+
+    private SharedKeyMap.Keys root;
+
+    @Override
+    protected void setUp() throws Exception {
+        root = new SharedKeyMap.Keys();
+    }
+
+    public void testSharedLayout() {
+        SharedKeyMap a = new SharedKeyMap(root);
+        SharedKeyMap b = new SharedKeyMap(root);
+        a.put("x", Py.newInteger(1));
+        a.put("y", Py.newInteger(2));
+        b.put("x", Py.newInteger(3));
+        b.put("y", Py.newInteger(4));
+        assertEquals(Py.newInteger(1), a.get("x"));
+        assertEquals(Py.newInteger(4), b.get("y"));
+        assertNull(a.get("z"));
+        assertEquals(2, b.size());
+        // The layout reached by "x" then "y" is shared
+        assertSame(root.add("x").add("y"), root.add("x").add("y"));
+        SharedKeyMap c = new SharedKeyMap(root);
+        assertEquals(0, c.size());
+        c.put("y", Py.None);
+        assertEquals(Py.None, c.get("y"));
+        assertNull(c.get("x"));
+    }
+
+    public void testRemove() {
+        SharedKeyMap map = new SharedKeyMap(root);
+        map.put("x", Py.None);
+        map.put("y", Py.True);
+        assertEquals(Py.None, map.remove("x"));
+        assertNull(map.remove("x"));
+        assertFalse(map.containsKey("x"));
+        assertEquals(1, map.size());
+        map.put("x", Py.False);
+        assertEquals(Py.False, map.get("x"));
+        assertEquals(2, map.size());
+    }
+
+    public void testIteration() {
+        SharedKeyMap map = new SharedKeyMap(root);
+        map.put("a", Py.None);
+        map.put("b", Py.True);
+        map.put("c", Py.False);
+        map.remove("b");
+        Iterator<Map.Entry<Object, PyObject>> it = map.entrySet().iterator();
+        assertEquals("a", it.next().getKey());
+        it.remove();
+        Map.Entry<Object, PyObject> entry = it.next();
+        assertEquals("c", entry.getKey());
+        entry.setValue(Py.Ellipsis);
+        assertFalse(it.hasNext());
+        assertEquals(1, map.size());
+        assertEquals(Py.Ellipsis, map.get("c"));
+    }
+
+    public void testChangeToTable() {
+        SharedKeyMap map = new SharedKeyMap(root);
+        map.put("x", Py.None);
+        PyObject key = Py.newInteger(1);
+        map.put(key, Py.True);
+        assertEquals(Py.None, map.get("x"));
+        assertEquals(Py.True, map.get(key));
+        assertEquals(2, map.size());
+
+        map = new SharedKeyMap(root);
+        for (int i = 0; i <= SharedKeyMap.MAX_KEYS; i++) {
+            map.put(("k" + i).intern(), Py.newInteger(i));
+        }
+        assertEquals(SharedKeyMap.MAX_KEYS + 1, map.size());
+        assertEquals(Py.newInteger(0), map.get("k0"));
+        assertEquals(Py.newInteger(SharedKeyMap.MAX_KEYS), map.get("k" + SharedKeyMap.MAX_KEYS));
+    }
+
+    public void testLayoutsBounded() {
+        // Attributes set in every order of six names would need 1957 layouts
+        String[] names = {"a", "b", "c", "d", "e", "f"};
+        int orders = 0;
+        for (int[] order = {0, 1, 2, 3, 4, 5}; order != null; order = nextPermutation(order)) {
+            SharedKeyMap map = new SharedKeyMap(root);
+            for (int i : order) {
+                map.put(names[i], Py.newInteger(i));
+            }
+            assertEquals(names.length, map.size());
+            for (int i = 0; i < names.length; i++) {
+                assertEquals(Py.newInteger(i), map.get(names[i]));
+            }
+            orders++;
+        }
+        assertEquals(720, orders);
+        assertEquals(SharedKeyMap.MAX_LAYOUTS, root.layouts.get());
+        // Past the bound, a new sequence of additions has no layout
+        assertNull(root.add("z"));
+        assertNotNull(root.add("a"));
+    }
+
+    /** The next permutation in lexicographic order, made in place, or null after the last. */
+    private static int[] nextPermutation(int[] a) {
+        int i = a.length - 2;
+        while (i >= 0 && a[i] >= a[i + 1]) {
+            i--;
+        }
+        if (i < 0) {
+            return null;
+        }
+        int j = a.length - 1;
+        while (a[j] <= a[i]) {
+            j--;
+        }
+        int t = a[i];
+        a[i] = a[j];
+        a[j] = t;
+        for (int l = i + 1, r = a.length - 1; l < r; l++, r--) {
+            t = a[l];
+            a[l] = a[r];
+            a[r] = t;
+        }
+        return a;
+    }
+
+    public void testHint() {
+        SharedKeyMap a = new SharedKeyMap(root);
+        a.put("x", Py.None);
+        a.put("y", Py.True);
+        SharedKeyMap b = new SharedKeyMap(root);
+        b.put("y", Py.False);
+        SharedKeyMap.Hint hint = new SharedKeyMap.Hint();
+        assertEquals(Py.True, a.get("y", hint));
+        assertEquals(1, hint.index);
+        // A different layout, where the name is at another index
+        assertEquals(Py.False, b.get("y", hint));
+        assertEquals(0, hint.index);
+        assertNull(b.get("x", hint));
+    }
+
+    public void testNotInterned() {
+        SharedKeyMap map = new SharedKeyMap(root);
+        map.put(new String("name"), Py.None);
+        assertEquals(Py.None, map.get("name"));
+        assertEquals(Py.None, map.get(new String("name")));
+    }
+}
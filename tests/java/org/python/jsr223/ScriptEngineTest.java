@@ -80,6 +80,34 @@ public class ScriptEngineTest extends TestCase {
         assertEquals(Integer.valueOf(5), five.eval());
     }
 
+    public void testCompileCache() throws ScriptException {
+        PyScriptEngineFactory factory = new PyScriptEngineFactory();
+        ScriptEngine pythonEngine = factory.getScriptEngine();
+
+        pythonEngine.put("a", 1);
+        assertEquals(Integer.valueOf(2), pythonEngine.eval("a + 1"));
+        pythonEngine.put("a", 41);
+        assertEquals(Integer.valueOf(42), pythonEngine.eval("a + 1"));
+        assertEquals(1, factory.getCompileCacheSize());
+        assertEquals(1, factory.getCompileCacheMissCount());
+        assertEquals(1, factory.getCompileCacheHitCount());
+
+        // The same source under another file name is compiled separately
+        SimpleScriptContext scriptContext = new SimpleScriptContext();
+        scriptContext.setAttribute(ScriptEngine.FILENAME, "sample.py", ScriptContext.ENGINE_SCOPE);
+        scriptContext.setAttribute("a", 1, ScriptContext.ENGINE_SCOPE);
+        assertEquals(Integer.valueOf(2), pythonEngine.eval("a + 1", scriptContext));
+        assertEquals(2, factory.getCompileCacheSize());
+
+        // Opting out leaves the cache alone
+        pythonEngine.put(PyScriptEngine.COMPILE_CACHE, false);
+        assertEquals(Integer.valueOf(42), pythonEngine.eval("a + 1"));
+        assertEquals(1, factory.getCompileCacheHitCount());
+
+        factory.clearCompileCache();
+        assertEquals(0, factory.getCompileCacheSize());
+    }
+
     public void testEvalReader() throws ScriptException {
         ScriptEngineManager manager = new ScriptEngineManager();
         ScriptEngine pythonEngine = manager.getEngineByName("python");